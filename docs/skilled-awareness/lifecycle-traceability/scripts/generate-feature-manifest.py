@@ -18,6 +18,9 @@
     --git-log DAYS      Parse git log for last N days (default: 90)
     --beads-db PATH     Path to beads database (default: .beads/beads.db)
     --dry-run           Show what would be generated without writing
+    --incremental       Only process commits and files changed since the last run
+    --state FILE        Incremental state file (default: .chora/feature-manifest-state.json)
+    --delta FILE        Also write the manifest delta (incremental mode) to FILE
 
 Exit Codes:
     0 - Success
@@ -26,6 +29,7 @@
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
@@ -35,7 +39,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 try:
     import yaml
@@ -78,22 +82,107 @@ def to_manifest_entry(self) -> dict:
         }
 
 
+STATE_VERSION = 1
+DEFAULT_STATE_PATH = Path(".chora") / "feature-manifest-state.json"
+
+TEST_MARKER_PATTERN = re.compile(r'@pytest\.mark\.feature\(["\']?(FEAT-[A-Z0-9-]+)["\']?\)', re.IGNORECASE)
+
+
+def file_fingerprint(path: Path) -> Tuple[int, int]:
+    """Cheap change detector: (mtime_ns, size)."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def file_sha256(path: Path) -> str:
+    """Content hash, used to confirm a fingerprint change is a real change."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_state(state_path: Path) -> dict:
+    """Load incremental state (empty state if missing or incompatible)."""
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get("version") == STATE_VERSION:
+            return state
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return {"version": STATE_VERSION, "last_commit": None, "files": {}}
+
+
+def save_state(state_path: Path, state: dict):
+    """Write incremental state atomically."""
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = state_path.with_suffix(state_path.suffix + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, state_path)
+
+
 class ManifestGenerator:
     """Generator for feature-manifest.yaml from git/beads/tests/docs."""
 
     def __init__(self, project_root: Optional[Path] = None):
         self.project_root = project_root or Path.cwd()
         self.features: Dict[str, FeatureData] = {}
+        # Relative test/doc path → feature IDs it links to (from the last scan)
+        self.contributions: Dict[str, List[str]] = {}
+
+    def _feature(self, feature_id: str) -> FeatureData:
+        """Get or create the FeatureData for an ID."""
+        if feature_id not in self.features:
+            self.features[feature_id] = FeatureData(feature_id=feature_id)
+        return self.features[feature_id]
+
+    def _git(self, *args: str) -> str:
+        """Run a git command in the project root and return stdout."""
+        result = subprocess.run(
+            ["git", *args],
+            cwd=self.project_root,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return result.stdout.strip()
 
-    def scan_git_log(self, days: int = 90):
-        """Scan git log for feature references in commits."""
-        print(f"Scanning git log (last {days} days)...")
-
-        since_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    def head_commit(self) -> Optional[str]:
+        """Current HEAD commit, or None outside a git repository."""
+        try:
+            return self._git("rev-parse", "HEAD")
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+
+    def scan_git_log(self, days: int = 90, since_commit: Optional[str] = None):
+        """
+        Scan git log for feature references in commits.
+
+        With since_commit, only commits after it (since_commit..HEAD) are
+        read; the day window is used when since_commit is no longer an
+        ancestor of HEAD (e.g. after a force-push).
+        """
+        log_args = None
+        if since_commit:
+            try:
+                self._git("merge-base", "--is-ancestor", since_commit, "HEAD")
+                log_args = [f"{since_commit}..HEAD"]
+                print(f"Scanning git log (commits after {since_commit[:7]})...")
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                print(f"  Warning: {since_commit[:7]} is not an ancestor of HEAD, using {days}-day window",
+                      file=sys.stderr)
+
+        if log_args is None:
+            print(f"Scanning git log (last {days} days)...")
+            since_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+            log_args = [f"--since={since_date}"]
 
         try:
             result = subprocess.run(
-                ["git", "log", f"--since={since_date}", "--pretty=format:%H|%s"],
+                ["git", "log", *log_args, "--pretty=format:%H|%s"],
                 cwd=self.project_root,
                 capture_output=True,
                 text=True,
@@ -174,101 +263,263 @@ def scan_beads_tasks(self, beads_db: Optional[str] = None):
         except Exception as e:
             print(f"  Warning: Beads scanning failed: {e}", file=sys.stderr)
 
-    def scan_test_files(self):
-        """Scan test files for @pytest.mark.feature markers."""
-        print("Scanning test files...")
+    def find_test_files(self) -> List[Path]:
+        """All test files scanned for feature markers."""
+        return list(self.project_root.glob("tests/**/test_*.py"))
+
+    def find_doc_files(self) -> List[Path]:
+        """All documentation files scanned for feature frontmatter."""
+        return (
+            list(self.project_root.glob("docs/**/*.md")) +
+            list(self.project_root.glob("*.md"))
+        )
+
+    def scan_test_file(self, test_file: Path) -> Set[str]:
+        """Record one test file's @pytest.mark.feature markers; returns feature IDs."""
+        with open(test_file, 'r', encoding='utf-8') as f:
+            content = f.read()
 
-        test_files = list(self.project_root.glob("tests/**/test_*.py"))
+        # Extract feature markers
+        # Pattern: @pytest.mark.feature("FEAT-XXX")
         features_found = set()
+        rel_path = str(test_file.relative_to(self.project_root))
+        for feature_id in TEST_MARKER_PATTERN.findall(content):
+            feature_id = feature_id.upper()
+            self._feature(feature_id).test_files.add(rel_path)
+            features_found.add(feature_id)
+
+        return features_found
+
+    def scan_doc_file(self, doc_file: Path) -> Set[str]:
+        """Record one doc's frontmatter feature_id(s) and code_references; returns feature IDs."""
+        with open(doc_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        # Extract frontmatter
+        if not content.startswith("---"):
+            return set()
+
+        parts = content.split("---", 2)
+        if len(parts) < 3:
+            return set()
+
+        frontmatter = yaml.safe_load(parts[1])
+        if not frontmatter:
+            return set()
+
+        # Extract feature_id or feature_ids
+        feature_ids = []
+        if "feature_id" in frontmatter:
+            feature_ids.append(frontmatter["feature_id"])
+        if "feature_ids" in frontmatter:
+            feature_ids.extend(frontmatter["feature_ids"])
 
-        for test_file in test_files:
-            try:
-                with open(test_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+        features_found = set()
+        rel_path = str(doc_file.relative_to(self.project_root))
+        for feature_id in feature_ids:
+            feature_id = feature_id.upper()
+            feature = self._feature(feature_id)
 
-                # Extract feature markers
-                # Pattern: @pytest.mark.feature("FEAT-XXX")
-                pattern = r'@pytest\.mark\.feature\(["\']?(FEAT-[A-Z0-9-]+)["\']?\)'
-                matches = re.findall(pattern, content, re.IGNORECASE)
+            # Add doc file to feature
+            feature.doc_files.add(rel_path)
+            features_found.add(feature_id)
 
-                for feature_id in matches:
-                    feature_id = feature_id.upper()
-                    if feature_id not in self.features:
-                        self.features[feature_id] = FeatureData(feature_id=feature_id)
+            # Extract code_references from frontmatter
+            for code_ref in frontmatter.get("code_references", []):
+                feature.code_files.add(code_ref)
+
+        return features_found
+
+    def scan_test_files(self, test_files: Optional[List[Path]] = None) -> Dict[str, List[str]]:
+        """
+        Scan test files for @pytest.mark.feature markers.
+
+        Returns:
+            Mapping of relative test path → feature IDs it contributes to
+        """
+        print("Scanning test files...")
 
-                    # Add test file to feature
-                    rel_path = test_file.relative_to(self.project_root)
-                    self.features[feature_id].test_files.add(str(rel_path))
-                    features_found.add(feature_id)
+        if test_files is None:
+            test_files = self.find_test_files()
+        features_found = set()
+        contributions = {}
 
+        for test_file in test_files:
+            try:
+                found = self.scan_test_file(test_file)
+                contributions[str(test_file.relative_to(self.project_root))] = sorted(found)
+                features_found |= found
             except Exception as e:
                 print(f"  Warning: Failed to parse {test_file}: {e}", file=sys.stderr)
 
         print(f"  Found {len(features_found)} features in test markers")
+        return contributions
+
+    def scan_documentation(self, doc_files: Optional[List[Path]] = None) -> Dict[str, List[str]]:
+        """
+        Scan documentation for frontmatter feature_id.
 
-    def scan_documentation(self):
-        """Scan documentation for frontmatter feature_id."""
+        Returns:
+            Mapping of relative doc path → feature IDs it contributes to
+        """
         print("Scanning documentation...")
 
-        doc_files = (
-            list(self.project_root.glob("docs/**/*.md")) +
-            list(self.project_root.glob("*.md"))
-        )
+        if doc_files is None:
+            doc_files = self.find_doc_files()
         features_found = set()
+        contributions = {}
 
         for doc_file in doc_files:
             try:
-                with open(doc_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                # Extract frontmatter
-                if not content.startswith("---"):
-                    continue
-
-                parts = content.split("---", 2)
-                if len(parts) < 3:
-                    continue
-
-                frontmatter = yaml.safe_load(parts[1])
-                if not frontmatter:
-                    continue
-
-                # Extract feature_id or feature_ids
-                feature_ids = []
-                if "feature_id" in frontmatter:
-                    feature_ids.append(frontmatter["feature_id"])
-                if "feature_ids" in frontmatter:
-                    feature_ids.extend(frontmatter["feature_ids"])
-
-                for feature_id in feature_ids:
-                    feature_id = feature_id.upper()
-                    if feature_id not in self.features:
-                        self.features[feature_id] = FeatureData(feature_id=feature_id)
-
-                    # Add doc file to feature
-                    rel_path = doc_file.relative_to(self.project_root)
-                    self.features[feature_id].doc_files.add(str(rel_path))
-                    features_found.add(feature_id)
-
-                    # Extract code_references from frontmatter
-                    code_refs = frontmatter.get("code_references", [])
-                    for code_ref in code_refs:
-                        self.features[feature_id].code_files.add(code_ref)
-
+                found = self.scan_doc_file(doc_file)
+                contributions[str(doc_file.relative_to(self.project_root))] = sorted(found)
+                features_found |= found
             except Exception as e:
                 print(f"  Warning: Failed to parse frontmatter in {doc_file}: {e}", file=sys.stderr)
 
         print(f"  Found {len(features_found)} features in documentation frontmatter")
+        return contributions
 
     def scan_all(self, git_days: int = 90):
         """Run all scanners."""
         self.scan_git_log(days=git_days)
         self.scan_beads_tasks()
-        self.scan_test_files()
-        self.scan_documentation()
+        self.contributions = {
+            **self.scan_test_files(),
+            **self.scan_documentation()
+        }
 
         print(f"\nTotal features discovered: {len(self.features)}")
 
+    def detect_changed_files(self, state: dict) -> Tuple[Dict[str, List[Path]], List[str], Dict[str, dict]]:
+        """
+        Compare test/doc files against the fingerprints stored in state.
+
+        A file counts as changed when its (mtime, size) differs and its
+        content hash differs too; touched-but-identical files only refresh
+        their stored fingerprint. Changed files are not written to state
+        here: their new fingerprints are returned and only recorded once
+        the file has been scanned successfully.
+
+        Returns:
+            ({"tests": [...], "docs": [...]} of changed paths, removed relative paths,
+             relative path → new state entry (without "features") for each changed file)
+        """
+        known = state.get("files", {})
+        changed = {"tests": [], "docs": []}
+        pending = {}
+        seen = set()
+
+        for kind, files in (("tests", self.find_test_files()), ("docs", self.find_doc_files())):
+            for path in files:
+                rel_path = str(path.relative_to(self.project_root))
+                seen.add(rel_path)
+                entry = known.get(rel_path)
+                fingerprint = list(file_fingerprint(path))
+
+                if entry and entry.get("fingerprint") == fingerprint:
+                    continue
+
+                sha = file_sha256(path)
+                if entry and entry.get("sha256") == sha:
+                    entry["fingerprint"] = fingerprint
+                    continue
+
+                pending[rel_path] = {
+                    "kind": kind,
+                    "fingerprint": fingerprint,
+                    "sha256": sha
+                }
+                changed[kind].append(path)
+
+        removed = sorted(rel_path for rel_path in known if rel_path not in seen)
+        return changed, removed, pending
+
+    def scan_incremental(self, state: dict, git_days: int = 90) -> dict:
+        """
+        Scan only what changed since the state was recorded.
+
+        Populates self.features with the delta and updates state in place.
+
+        Returns:
+            Delta description: base/head commits, changed and removed files,
+            and per-file feature links that no longer hold ("unlinked").
+        """
+        base_commit = state.get("last_commit")
+        head = self.head_commit()
+
+        if head and head == base_commit:
+            print("Scanning git log... no new commits")
+        else:
+            self.scan_git_log(days=git_days, since_commit=base_commit)
+        self.scan_beads_tasks()
+
+        changed, removed, pending = self.detect_changed_files(state)
+        print(f"Changed files: {len(changed['tests'])} tests, {len(changed['docs'])} docs; "
+              f"removed: {len(removed)}")
+
+        contributions = {}
+        if changed["tests"]:
+            contributions.update(self.scan_test_files(changed["tests"]))
+        if changed["docs"]:
+            contributions.update(self.scan_documentation(changed["docs"]))
+
+        # Feature links dropped by edited or deleted files. Files whose scan
+        # failed keep their previous state entry (or none), so they are
+        # scanned again on the next run.
+        unlinked = {}
+        files = state.setdefault("files", {})
+        for rel_path, features in contributions.items():
+            previous = files.get(rel_path, {}).get("features", [])
+            dropped = sorted(set(previous) - set(features))
+            if dropped:
+                unlinked[rel_path] = dropped
+            files[rel_path] = {**pending[rel_path], "features": features}
+        for rel_path in removed:
+            if files[rel_path].get("features"):
+                unlinked[rel_path] = files[rel_path]["features"]
+            del files[rel_path]
+
+        state["last_commit"] = head or base_commit
+        print(f"\nFeatures in delta: {len(self.features)}")
+
+        return {
+            "base_commit": base_commit,
+            "head_commit": state["last_commit"],
+            "changed_files": sorted(contributions),
+            "removed_files": removed,
+            "unlinked": unlinked
+        }
+
+    def record_full_scan_state(self, state: dict, contributions: Dict[str, List[str]]):
+        """Seed incremental state from a full scan (files that failed to scan are left out)."""
+        files = {}
+        for kind, paths in (("tests", self.find_test_files()), ("docs", self.find_doc_files())):
+            for path in paths:
+                rel_path = str(path.relative_to(self.project_root))
+                if rel_path not in contributions:
+                    continue
+                files[rel_path] = {
+                    "kind": kind,
+                    "fingerprint": list(file_fingerprint(path)),
+                    "sha256": file_sha256(path),
+                    "features": contributions.get(rel_path, [])
+                }
+        state["files"] = files
+        state["last_commit"] = self.head_commit()
+
+    @staticmethod
+    def apply_unlinked(manifest: dict, unlinked: Dict[str, List[str]]) -> dict:
+        """Remove test/doc paths from features they no longer reference."""
+        for rel_path, feature_ids in unlinked.items():
+            for feature in manifest.get("features", []):
+                if feature.get("id") not in feature_ids:
+                    continue
+                for key in ("tests", "documentation"):
+                    if feature.get(key):
+                        feature[key] = [ref for ref in feature[key] if ref.get("path") != rel_path]
+        return manifest
+
     def generate_manifest(self, feature_filter: Optional[str] = None) -> dict:
         """Generate feature-manifest.yaml structure."""
         features_list = []
@@ -383,20 +634,64 @@ def main():
         action="store_true",
         help="Show what would be generated without writing"
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only process commits and files changed since the last run (implies --append)"
+    )
+    parser.add_argument(
+        "--state",
+        metavar="FILE",
+        default=str(DEFAULT_STATE_PATH),
+        help=f"Incremental state file (default: {DEFAULT_STATE_PATH})"
+    )
+    parser.add_argument(
+        "--delta",
+        metavar="FILE",
+        help="Write the manifest delta to FILE (incremental mode)"
+    )
 
     args = parser.parse_args()
 
-    # Generate manifest
+    output_path = Path(args.output)
+    state_path = Path(args.state)
     generator = ManifestGenerator()
-    generator.scan_all(git_days=args.git_log)
 
-    manifest = generator.generate_manifest(feature_filter=args.feature)
+    if args.incremental:
+        state = load_state(state_path)
+        first_run = state.get("last_commit") is None and not state.get("files")
+    else:
+        state, first_run = None, False
+
+    if args.incremental and not first_run:
+        # Process only new commits and changed files, then fold the delta
+        # into the existing manifest
+        delta = generator.scan_incremental(state, git_days=args.git_log)
+        delta_manifest = generator.generate_manifest(feature_filter=args.feature)
+        delta["features"] = delta_manifest["features"]
+
+        if args.delta:
+            with open(args.delta, 'w', encoding='utf-8') as f:
+                yaml.dump(delta, f, sort_keys=False, default_flow_style=False)
+            print(f"Delta written to {args.delta}")
+
+        manifest = delta_manifest
+        if output_path.exists():
+            print(f"\nApplying delta to existing manifest: {output_path}")
+            manifest = generator.merge_with_existing(output_path, delta_manifest)
+        manifest = generator.apply_unlinked(manifest, delta["unlinked"])
+    else:
+        # Generate manifest
+        generator.scan_all(git_days=args.git_log)
+        manifest = generator.generate_manifest(feature_filter=args.feature)
 
-    # Merge with existing if --append
-    output_path = Path(args.output)
-    if args.append and output_path.exists():
-        print(f"\nMerging with existing manifest: {output_path}")
-        manifest = generator.merge_with_existing(output_path, manifest)
+        # Merge with existing if --append
+        if (args.append or args.incremental) and output_path.exists():
+            print(f"\nMerging with existing manifest: {output_path}")
+            manifest = generator.merge_with_existing(output_path, manifest)
+
+        if args.incremental:
+            generator.record_full_scan_state(state, generator.contributions)
 
     # Output
     if args.dry_run:
@@ -408,6 +703,8 @@ def main():
         with open(output_path, 'w', encoding='utf-8') as f:
             yaml.dump(manifest, f, sort_keys=False, default_flow_style=False)
         print(f"\nManifest written to {output_path}")
+        if state is not None:
+            save_state(state_path, state)
         print(f"  Features: {len(manifest['features'])}")
         print(f"  Total code files: {sum(len(f.get('code', [])) for f in manifest['features'])}")
         print(f"  Total tests: {sum(len(f.get('tests', [])) for f in manifest['features'])}")
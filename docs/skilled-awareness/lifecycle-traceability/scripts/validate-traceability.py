@@ -23,6 +23,7 @@
     --output FILE       Write report to file (default: stdout)
     --schema PATH       Path to feature-manifest.schema.json
     --manifest PATH     Path to feature-manifest.yaml (default: ./feature-manifest.yaml)
+    --jobs N            Worker threads for the filesystem snapshot and rules (default: 8)
 
 Exit Codes:
     0 - All rules pass
@@ -35,6 +36,7 @@
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -105,11 +107,64 @@ def pass_rate(self) -> float:
         return (passed_rules / len(self.rules)) * 100.0
 
 
+@dataclass
+class ValidationContext:
+    """
+    Filesystem snapshot shared by all rules.
+
+    Built once per run so that no rule touches the disk: every referenced
+    path is stat'ed once and every documentation file is read once.
+    """
+    features: List[dict]
+    existing_paths: Set[str] = field(default_factory=set)
+    doc_frontmatter: Dict[str, dict] = field(default_factory=dict)
+    doc_code_refs: Dict[str, Optional[list]] = field(default_factory=dict)
+    doc_errors: Dict[str, str] = field(default_factory=dict)
+    code_to_docs: Dict[str, Set[str]] = field(default_factory=dict)
+
+    def exists(self, path: str) -> bool:
+        """Check a manifest-relative path against the snapshot."""
+        return path in self.existing_paths
+
+
+def _is_external_code_ref(code_ref: dict) -> bool:
+    """External dependencies are never checked on disk."""
+    code_path = code_ref.get("path") or ""
+    code_function = code_ref.get("function", "")
+    return (
+        "external dependency" in code_function.lower()
+        or code_path.startswith("C:/")
+        or code_path.startswith("/usr/")
+        or code_path.startswith("/opt/")
+    )
+
+
+def _parse_doc_frontmatter(full_doc_path: Path) -> Tuple[Optional[dict], Optional[list]]:
+    """
+    Read a documentation file and extract its frontmatter.
+
+    Returns:
+        (frontmatter, code_references), both None if the file has no frontmatter.
+        code_references is None if the field is present but null.
+        Raises on unreadable files or malformed frontmatter.
+    """
+    with open(full_doc_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if content.startswith("---"):
+        parts = content.split("---", 2)
+        if len(parts) >= 3:
+            frontmatter = yaml.safe_load(parts[1])
+            return frontmatter, frontmatter.get("code_references", [])
+    return None, None
+
+
 class TraceabilityValidator:
     """Validator for SAP-056 traceability rules."""
 
-    def __init__(self, manifest_path: str, schema_path: Optional[str] = None):
+    def __init__(self, manifest_path: str, schema_path: Optional[str] = None, jobs: int = 8):
         self.manifest_path = Path(manifest_path)
+        self.jobs = max(1, jobs)
         self.project_root = self.manifest_path.parent
         self.schema_path = Path(schema_path) if schema_path else self._find_schema()
 
@@ -151,8 +206,62 @@ def _classify(self, category: str, reason: str, auto_action: str, suggestion: st
             "suggestion": suggestion
         }
 
+    def build_context(self, features: List[dict]) -> ValidationContext:
+        """
+        Snapshot the filesystem state referenced by the features.
+
+        Collects every referenced path, stats each unique path once, parses
+        each existing documentation file once and builds the code→docs index.
+        """
+        ctx = ValidationContext(features=features)
+
+        referenced = set()
+        doc_paths = set()
+        for feature in features:
+            doc_list = [d.get("path") for d in (feature.get("documentation") or []) if d.get("path")]
+            doc_paths.update(doc_list)
+            referenced.update(doc_list)
+
+            for code_ref in (feature.get("code") or []):
+                code_path = code_ref.get("path")
+                if not code_path:
+                    continue
+                # Reverse index: code path → docs that claim it
+                ctx.code_to_docs.setdefault(code_path, set()).update(doc_list)
+                if not _is_external_code_ref(code_ref):
+                    referenced.add(code_path)
+
+            for test_ref in (feature.get("tests") or []):
+                test_path = test_ref.get("path")
+                if test_path and test_ref.get("type") != "manual" and test_path != "manual":
+                    referenced.add(test_path.split("::")[0])
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            ordered = sorted(referenced)
+            exists = executor.map(lambda p: (self.project_root / p).exists(), ordered)
+            ctx.existing_paths = {path for path, found in zip(ordered, exists) if found}
+
+            existing_docs = sorted(p for p in doc_paths if p in ctx.existing_paths)
+            for doc_path, parsed in zip(existing_docs, executor.map(self._safe_parse_doc, existing_docs)):
+                frontmatter, code_refs, error = parsed
+                if error is not None:
+                    ctx.doc_errors[doc_path] = error
+                elif frontmatter is not None:
+                    ctx.doc_frontmatter[doc_path] = frontmatter
+                    ctx.doc_code_refs[doc_path] = code_refs
+
+        return ctx
+
+    def _safe_parse_doc(self, doc_path: str) -> Tuple[Optional[dict], Optional[list], Optional[str]]:
+        """Parse doc frontmatter, capturing errors for Rule 2 warnings."""
+        try:
+            frontmatter, code_refs = _parse_doc_frontmatter(self.project_root / doc_path)
+            return frontmatter, code_refs, None
+        except Exception as e:
+            return None, None, str(e)
+
     def validate_all(self, feature_filter: Optional[str] = None) -> ValidationReport:
-        """Run all 10 validation rules."""
+        """Run all 10 validation rules against a shared filesystem snapshot."""
         features = self.manifest.get("features", [])
 
         # Apply feature filter
@@ -166,22 +275,30 @@ def validate_all(self, feature_filter: Optional[str] = None) -> ValidationReport
             total_features=len(features)
         )
 
-        # Run each rule
-        report.rules.append(self.rule_1_forward_linkage(features))
-        report.rules.append(self.rule_2_bidirectional_linkage(features))
-        report.rules.append(self.rule_3_evidence_requirement(features))
-        report.rules.append(self.rule_4_closed_loop(features))
-        report.rules.append(self.rule_5_orphan_detection(features))
-        report.rules.append(self.rule_6_schema_compliance())
-        report.rules.append(self.rule_7_reference_integrity(features))
-        report.rules.append(self.rule_8_requirement_coverage(features))
-        report.rules.append(self.rule_9_documentation_coverage(features))
-        report.rules.append(self.rule_10_event_correlation(features))
+        ctx = self.build_context(features)
+
+        # Rules only read the snapshot, so they can run concurrently;
+        # results are collected in rule order
+        rules = [
+            self.rule_1_forward_linkage,
+            self.rule_2_bidirectional_linkage,
+            self.rule_3_evidence_requirement,
+            self.rule_4_closed_loop,
+            self.rule_5_orphan_detection,
+            lambda _ctx: self.rule_6_schema_compliance(),
+            self.rule_7_reference_integrity,
+            self.rule_8_requirement_coverage,
+            self.rule_9_documentation_coverage,
+            self.rule_10_event_correlation,
+        ]
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(rules))) as executor:
+            report.rules.extend(executor.map(lambda rule: rule(ctx), rules))
 
         return report
 
-    def rule_1_forward_linkage(self, features: List[dict]) -> ValidationResult:
+    def rule_1_forward_linkage(self, ctx: ValidationContext) -> ValidationResult:
         """Rule 1: Every vision outcome → ≥1 feature."""
+        features = ctx.features
         passed_items = 0
         failures = []
         classifications = []
@@ -217,76 +334,60 @@ def rule_1_forward_linkage(self, features: List[dict]) -> ValidationResult:
             classifications=classifications
         )
 
-    def rule_2_bidirectional_linkage(self, features: List[dict]) -> ValidationResult:
+    def rule_2_bidirectional_linkage(self, ctx: ValidationContext) -> ValidationResult:
         """Rule 2: If doc references code, code manifest lists doc."""
         passed_items = 0
         failures = []
         warnings = []
         classifications = []
 
-        # Build code→docs mapping from manifest
-        code_to_docs = {}
-        for feature in features:
-            for code_ref in (feature.get("code") or []):
-                code_path = code_ref.get("path")
-                if code_path:
-                    if code_path not in code_to_docs:
-                        code_to_docs[code_path] = set()
-                    for doc_ref in (feature.get("documentation") or []):
-                        doc_path = doc_ref.get("path")
-                        if doc_path:
-                            code_to_docs[code_path].add(doc_path)
+        features = ctx.features
+        code_to_docs = ctx.code_to_docs
 
         # Check docs with frontmatter for code_references
         docs_checked = 0
         for feature in features:
             for doc_ref in (feature.get("documentation") or []):
                 doc_path = doc_ref.get("path")
-                if not doc_path:
+                if not doc_path or not ctx.exists(doc_path):
                     continue
 
-                full_doc_path = self.project_root / doc_path
-                if not full_doc_path.exists():
+                if doc_path in ctx.doc_errors:
+                    warnings.append(f"Failed to parse frontmatter in {doc_path}: {ctx.doc_errors[doc_path]}")
+                    continue
+
+                if doc_path not in ctx.doc_frontmatter:
+                    continue
+
+                docs_checked += 1
+
+                code_refs = ctx.doc_code_refs[doc_path]
+                if code_refs is None:
+                    warnings.append(f"Failed to parse frontmatter in {doc_path}: code_references is null")
                     continue
 
-                # Parse frontmatter
-                try:
-                    with open(full_doc_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    # Extract frontmatter
-                    if content.startswith("---"):
-                        parts = content.split("---", 2)
-                        if len(parts) >= 3:
-                            frontmatter = yaml.safe_load(parts[1])
-                            code_refs = frontmatter.get("code_references", [])
-
-                            docs_checked += 1
-
-                            # Check bidirectionality
-                            bidirectional = True
-                            for code_ref in code_refs:
-                                if code_ref not in code_to_docs or doc_path not in code_to_docs[code_ref]:
-                                    failures.append(f"{doc_path} references {code_ref}, but manifest doesn't list this linkage")
-                                    bidirectional = False
-
-                                    # SAP-054 L1: Classify bidirectional linkage as investigation
-                                    classifications.append({
-                                        "doc_path": doc_path,
-                                        "code_ref": code_ref,
-                                        "violation": "Bidirectional linkage broken",
-                                        "classification": self._classify(
-                                            category="investigation",
-                                            reason="Requires manual manifest update to link doc and code",
-                                            auto_action="none",
-                                            suggestion=f"Add {doc_path} to manifest code reference for {code_ref}"
-                                        )
-                                    })
-
-                            if bidirectional and code_refs:
-                                passed_items += 1
-                except Exception as e:
-                    warnings.append(f"Failed to parse frontmatter in {doc_path}: {e}")
+                # Check bidirectionality
+                bidirectional = True
+                for code_ref in code_refs:
+                    if code_ref not in code_to_docs or doc_path not in code_to_docs[code_ref]:
+                        failures.append(f"{doc_path} references {code_ref}, but manifest doesn't list this linkage")
+                        bidirectional = False
+
+                        # SAP-054 L1: Classify bidirectional linkage as investigation
+                        classifications.append({
+                            "doc_path": doc_path,
+                            "code_ref": code_ref,
+                            "violation": "Bidirectional linkage broken",
+                            "classification": self._classify(
+                                category="investigation",
+                                reason="Requires manual manifest update to link doc and code",
+                                auto_action="none",
+                                suggestion=f"Add {doc_path} to manifest code reference for {code_ref}"
+                            )
+                        })
+
+                if bidirectional and code_refs:
+                    passed_items += 1
 
         if docs_checked == 0:
             warnings.append("No documentation with frontmatter found (Rule 2 not applicable)")
@@ -302,8 +403,9 @@ def rule_2_bidirectional_linkage(self, features: List[dict]) -> ValidationResult
             classifications=classifications
         )
 
-    def rule_3_evidence_requirement(self, features: List[dict]) -> ValidationResult:
+    def rule_3_evidence_requirement(self, ctx: ValidationContext) -> ValidationResult:
         """Rule 3: Every feature → ≥1 test AND ≥1 doc."""
+        features = ctx.features
         passed_items = 0
         failures = []
         classifications = []
@@ -361,7 +463,7 @@ def rule_3_evidence_requirement(self, features: List[dict]) -> ValidationResult:
             classifications=classifications
         )
 
-    def rule_4_closed_loop(self, features: List[dict]) -> ValidationResult:
+    def rule_4_closed_loop(self, ctx: ValidationContext) -> ValidationResult:
         """Rule 4: Every git commit closing task → links to feature."""
         # This rule requires git log parsing - simplified implementation
         warnings = ["Rule 4 (Closed Loop) requires git log parsing - not fully implemented"]
@@ -375,8 +477,9 @@ def rule_4_closed_loop(self, features: List[dict]) -> ValidationResult:
             warnings=warnings
         )
 
-    def rule_5_orphan_detection(self, features: List[dict]) -> ValidationResult:
+    def rule_5_orphan_detection(self, ctx: ValidationContext) -> ValidationResult:
         """Rule 5: No artifact without parent linkage."""
+        features = ctx.features
         failures = []
         classifications = []
 
@@ -454,8 +557,9 @@ def rule_6_schema_compliance(self) -> ValidationResult:
                 classifications=classifications
             )
 
-    def rule_7_reference_integrity(self, features: List[dict]) -> ValidationResult:
+    def rule_7_reference_integrity(self, ctx: ValidationContext) -> ValidationResult:
         """Rule 7: All vision_ref/code/docs/tests paths exist."""
+        features = ctx.features
         total_refs = 0
         passed_refs = 0
         failures = []
@@ -467,15 +571,13 @@ def rule_7_reference_integrity(self, features: List[dict]) -> ValidationResult:
             # Check code paths
             for code_ref in (feature.get("code") or []):
                 code_path = code_ref.get("path")
-                code_function = code_ref.get("function", "")
                 if code_path:
                     total_refs += 1
                     # Skip file existence check for external dependencies
-                    if "external dependency" in code_function.lower() or code_path.startswith("C:/") or code_path.startswith("/usr/") or code_path.startswith("/opt/"):
+                    if _is_external_code_ref(code_ref):
                         passed_refs += 1
                     else:
-                        full_path = self.project_root / code_path
-                        if full_path.exists():
+                        if ctx.exists(code_path):
                             passed_refs += 1
                         else:
                             failures.append(f"{feature_id}: Code file not found: {code_path}")
@@ -505,8 +607,7 @@ def rule_7_reference_integrity(self, features: List[dict]) -> ValidationResult:
                     else:
                         # Extract file path (before ::)
                         file_path = test_path.split("::")[0]
-                        full_path = self.project_root / file_path
-                        if full_path.exists():
+                        if ctx.exists(file_path):
                             passed_refs += 1
                         else:
                             failures.append(f"{feature_id}: Test file not found: {file_path}")
@@ -528,8 +629,7 @@ def rule_7_reference_integrity(self, features: List[dict]) -> ValidationResult:
                 doc_path = doc_ref.get("path")
                 if doc_path:
                     total_refs += 1
-                    full_path = self.project_root / doc_path
-                    if full_path.exists():
+                    if ctx.exists(doc_path):
                         passed_refs += 1
                     else:
                         failures.append(f"{feature_id}: Documentation file not found: {doc_path}")
@@ -556,8 +656,9 @@ def rule_7_reference_integrity(self, features: List[dict]) -> ValidationResult:
             classifications=classifications
         )
 
-    def rule_8_requirement_coverage(self, features: List[dict]) -> ValidationResult:
+    def rule_8_requirement_coverage(self, ctx: ValidationContext) -> ValidationResult:
         """Rule 8: Every requirement → ≥1 test with marker."""
+        features = ctx.features
         total_reqs = 0
         passed_reqs = 0
         failures = []
@@ -603,8 +704,9 @@ def rule_8_requirement_coverage(self, features: List[dict]) -> ValidationResult:
             classifications=classifications
         )
 
-    def rule_9_documentation_coverage(self, features: List[dict]) -> ValidationResult:
+    def rule_9_documentation_coverage(self, ctx: ValidationContext) -> ValidationResult:
         """Rule 9: Every feature → ≥1 doc in frontmatter."""
+        features = ctx.features
         # This is equivalent to Rule 3 (docs part), but checks frontmatter
         passed_items = 0
         failures = []
@@ -641,7 +743,7 @@ def rule_9_documentation_coverage(self, features: List[dict]) -> ValidationResul
             classifications=classifications
         )
 
-    def rule_10_event_correlation(self, features: List[dict]) -> ValidationResult:
+    def rule_10_event_correlation(self, ctx: ValidationContext) -> ValidationResult:
         """Rule 10: Every task completion → A-MEM event with feature_id."""
         # This rule requires A-MEM event log parsing - simplified implementation
         warnings = ["Rule 10 (Event Correlation) requires A-MEM event log parsing - not fully implemented"]
@@ -800,11 +902,18 @@ def main():
         default="feature-manifest.yaml",
         help="Path to feature-manifest.yaml (default: ./feature-manifest.yaml)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=8,
+        metavar="N",
+        help="Worker threads for the filesystem snapshot and rules (default: 8)"
+    )
 
     args = parser.parse_args()
 
     # Validate
-    validator = TraceabilityValidator(args.manifest, args.schema)
+    validator = TraceabilityValidator(args.manifest, args.schema, jobs=args.jobs)
     report = validator.validate_all(feature_filter=args.feature)
 
     # Format output
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+A-MEM Columnar Event Compaction
+
+Converts event logs into compact monthly columnar partitions (see
+event_columns.py) so metrics dashboards aggregate years of events without
+re-parsing JSONL. Safe to run repeatedly (e.g. from cron or a git hook):
+only events appended since the previous run are converted.
+
+Usage:
+    python scripts/a-mem-columnar.py               # Compact all event logs
+    python scripts/a-mem-columnar.py --rebuild     # Rebuild from scratch
+    python scripts/a-mem-columnar.py --json        # JSON output
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from event_columns import ColumnarStore
+
+
+# Configure UTF-8 output for Windows console compatibility
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+
+def find_event_logs(events_dir: Path) -> list:
+    """Event logs: flat *.jsonl files and monthly YYYY-MM/events.jsonl partitions"""
+    return sorted(events_dir.glob("*.jsonl")) + sorted(events_dir.glob("*/events.jsonl"))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="A-MEM columnar event compaction"
+    )
+    parser.add_argument(
+        "--memory-dir",
+        default=".chora/memory",
+        help="A-MEM directory (default: .chora/memory)"
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Discard existing columnar partitions and rebuild them"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output stats as JSON"
+    )
+
+    args = parser.parse_args()
+
+    events_dir = Path(args.memory_dir) / "events"
+
+    if not events_dir.exists():
+        print(f"⚠️  Events directory not found: {events_dir}", file=sys.stderr)
+        return 1
+
+    results = [ColumnarStore(log_path).compact(rebuild=args.rebuild) for log_path in find_event_logs(events_dir)]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print("🗂️  A-MEM Columnar Compaction\n")
+
+    for result in results:
+        status = " (rebuilt)" if result["rebuilt"] else ""
+        print(f"📄 {result['log']}{status}")
+        print(f"   New events: {result['events']}")
+        print(f"   Partitions written: {result['partitions']}")
+        print(f"   Total events: {result.get('total_events', 0)}")
+        if result["skipped"]:
+            print(f"   Skipped malformed lines: {result['skipped']}")
+        print()
+
+    print("✅ Summary:")
+    print(f"   Logs: {len(results)}")
+    print(f"   New events compacted: {sum(r['events'] for r in results)}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,9 @@
 A-MEM Event Log Compression
 
 Compresses old event logs to save disk space and improve query performance.
+Old events are appended to <log>-archive.jsonl.gz as month-bounded gzip
+segments with a sidecar index (see event_archive.py), so archived history
+stays queryable by time range without decompressing all of it.
 
 Usage:
     python scripts/a-mem-compress.py --age 30        # Compress events older than 30 days
@@ -11,14 +14,16 @@
 """
 
 import argparse
-import gzip
 import json
-import shutil
+import os
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Optional
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from event_archive import SegmentWriter, archive_path_for
 
 
 # Configure UTF-8 output for Windows console compatibility
@@ -43,37 +48,32 @@ def compress_event_log(
     dry_run: bool = False
 ) -> dict:
     """
-    Compress events older than threshold to .gz file.
+    Move events older than threshold into the log's segmented .gz archive.
+
+    Streams the log line by line: old events are appended to the archive as
+    new month-bounded gzip segments (existing segments are never rewritten)
+    and recent events are written to a temp file that replaces the log.
 
     Returns stats about compression.
     """
     if not log_path.exists():
         return {"compressed": 0, "kept": 0, "error": "Log file not found"}
 
-    # Read all events
-    events = []
-    with open(log_path, "r", encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                events.append(json.loads(line))
-
-    # Split into old and recent
-    old_events = []
-    recent_events = []
-
-    for event in events:
-        age_days = get_event_age_days(event)
-        if age_days >= age_threshold_days:
-            old_events.append(event)
-        else:
-            recent_events.append(event)
-
-    # Calculate compression stats
     original_size = log_path.stat().st_size
-    compressed_count = len(old_events)
-    kept_count = len(recent_events)
+    archive_path = archive_path_for(log_path)
+    compressed_count = 0
+    kept_count = 0
 
     if dry_run:
+        with open(log_path, "r", encoding='utf-8') as f:
+            for line in f:
+                event = _parse_event(line)
+                if event is None:
+                    kept_count += 1 if line.strip() else 0
+                elif get_event_age_days(event) >= age_threshold_days:
+                    compressed_count += 1
+                else:
+                    kept_count += 1
         return {
             "log": log_path.name,
             "compressed": compressed_count,
@@ -82,28 +82,36 @@ def compress_event_log(
             "dry_run": True
         }
 
-    # Write compressed archive
-    if old_events:
-        archive_path = log_path.parent / f"{log_path.stem}-archive.jsonl.gz"
-
-        # Append to existing archive if it exists
-        if archive_path.exists():
-            # Read existing archive
-            with gzip.open(archive_path, "rt") as f:
-                existing_events = [json.loads(line) for line in f if line.strip()]
-            old_events = existing_events + old_events
-
-        # Write compressed archive
-        with gzip.open(archive_path, "wt") as f:
-            for event in old_events:
-                f.write(json.dumps(event) + "\n")
-
-        compressed_size = archive_path.stat().st_size
-
-    # Overwrite log with recent events only
-    with open(log_path, "w", encoding='utf-8') as f:
-        for event in recent_events:
-            f.write(json.dumps(event) + "\n")
+    tmp_path = log_path.with_name(log_path.name + ".tmp")
+    try:
+        with open(log_path, "r", encoding='utf-8') as src, \
+                open(tmp_path, "w", encoding='utf-8') as kept, \
+                SegmentWriter(archive_path) as archive:
+            for line in src:
+                if not line.strip():
+                    continue
+                line = line.rstrip("\n")
+                event = _parse_event(line)
+                # Unparseable lines stay in the live log untouched
+                if event is not None and get_event_age_days(event) >= age_threshold_days:
+                    archive.add(line.strip(), event)
+                    compressed_count += 1
+                else:
+                    kept.write(line + "\n")
+                    kept_count += 1
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    # Counted after close(), which finishes the last segment
+    segments = len(archive.segments)
+
+    # Archive and index are synced before the log is replaced, so an
+    # interruption never loses events (at worst they are archived again)
+    if compressed_count:
+        os.replace(tmp_path, log_path)
+    else:
+        tmp_path.unlink()
 
     new_size = log_path.stat().st_size
 
@@ -111,13 +119,26 @@ def compress_event_log(
         "log": log_path.name,
         "compressed": compressed_count,
         "kept": kept_count,
+        "segments": segments,
         "original_size_kb": original_size / 1024,
         "new_size_kb": new_size / 1024,
-        "compressed_size_kb": compressed_size / 1024 if old_events else 0,
+        "compressed_size_kb": archive_path.stat().st_size / 1024 if archive_path.exists() else 0,
         "space_saved_kb": (original_size - new_size) / 1024
     }
 
 
+def _parse_event(line: str) -> Optional[dict]:
+    """Parse one JSONL line into an event dict (None if blank or invalid)."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        event = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return event if isinstance(event, dict) else None
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="A-MEM event log compression"
@@ -154,8 +175,8 @@ def main():
         print(f"⚠️  Events directory not found: {events_dir}", file=sys.stderr)
         return 1
 
-    # Get all event logs
-    event_logs = list(events_dir.glob("*.jsonl"))
+    # Get all event logs (flat logs and monthly YYYY-MM/events.jsonl partitions)
+    event_logs = sorted(events_dir.glob("*.jsonl")) + sorted(events_dir.glob("*/events.jsonl"))
 
     if not event_logs:
         print(f"ℹ️  No event logs found in {events_dir}")
@@ -179,7 +200,10 @@ def main():
 
         if not args.dry_run:
             print(f"   New size: {result['new_size_kb']:.1f} KB")
-            print(f"   Compressed archive: {result['compressed_size_kb']:.1f} KB")
+            print(
+                f"   Compressed archive: {result['compressed_size_kb']:.1f} KB "
+                f"({result['segments']} segments)"
+            )
             print(f"   Space saved: {result['space_saved_kb']:.1f} KB")
 
         total_compressed += result['compressed']
@@ -8,15 +8,22 @@
     python scripts/a-mem-index.py                    # Generate both indexes
     python scripts/a-mem-index.py --links-only       # Generate links.json only
     python scripts/a-mem-index.py --tags-only        # Generate tags.json only
+    python scripts/a-mem-index.py --watch            # Keep both indexes live (daemon)
 """
 
 import argparse
 import json
+import os
 import re
 import sys
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fs_watch import DirectoryWatcher, RESYNC
 
 
 # Configure UTF-8 output for Windows console compatibility
@@ -78,7 +85,7 @@ def generate_links_json(knowledge_dir: Path) -> Dict:
 
     for note_path in knowledge_dir.glob("*.md"):
         note_id = note_path.name
-        content = note_path.read_text()
+        content = note_path.read_text(encoding='utf-8')
         frontmatter = parse_frontmatter(content)
 
         # Get linked_to field
@@ -128,7 +135,7 @@ def generate_tags_json(knowledge_dir: Path) -> Dict:
 
     for note_path in knowledge_dir.glob("*.md"):
         note_id = note_path.name
-        content = note_path.read_text()
+        content = note_path.read_text(encoding='utf-8')
         frontmatter = parse_frontmatter(content)
 
         # Get tags field
@@ -154,6 +161,249 @@ def generate_tags_json(knowledge_dir: Path) -> Dict:
     }
 
 
+def write_json_atomic(path: Path, data: Dict):
+    """Write JSON via a temp file + rename so readers never see partial files."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "w", encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+class KnowledgeIndex:
+    """
+    Incrementally maintained links/tags indexes for a knowledge directory.
+
+    Keeps per-note (mtime, size, linked_to, tags) so that a created, modified
+    or deleted note only touches its own entries in the forward maps,
+    backlinks and tag index. The per-note state is persisted next to the
+    indexes, so restarts only re-read notes that changed meanwhile.
+    """
+
+    STATE_FILE = ".index-state.json"
+
+    def __init__(self, knowledge_dir: Path):
+        self.knowledge_dir = knowledge_dir
+        self.notes: Dict[str, Dict] = {}
+        self.backlinks: Dict[str, List[str]] = {}
+        self.tags_to_notes: Dict[str, List[str]] = {}
+
+    @property
+    def state_path(self) -> Path:
+        return self.knowledge_dir / self.STATE_FILE
+
+    def load_state(self):
+        """Restore per-note state from the previous run (if any)."""
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                notes = json.load(f).get("notes", {})
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        for note_id, entry in notes.items():
+            self._apply(note_id, entry)
+
+    def save_state(self):
+        write_json_atomic(self.state_path, {"notes": self.notes})
+
+    @staticmethod
+    def _read_note(note_path: Path) -> Tuple[List[str], List[str]]:
+        """Return (linked_to, tags) from a note's frontmatter."""
+        frontmatter = parse_frontmatter(note_path.read_text(encoding='utf-8'))
+
+        linked_to = frontmatter.get("linked_to", [])
+        if isinstance(linked_to, str):
+            linked_to = [linked_to] if linked_to else []
+
+        tags = frontmatter.get("tags", [])
+        if isinstance(tags, str):
+            tags = [tags] if tags else []
+
+        return linked_to, tags
+
+    def _detach(self, note_id: str):
+        """Remove a note's contributions from backlinks and the tag index."""
+        entry = self.notes.pop(note_id, None)
+        if not entry:
+            return
+        for target in entry["linked_to"]:
+            sources = self.backlinks.get(target, [])
+            if note_id in sources:
+                sources.remove(note_id)
+            if not sources:
+                self.backlinks.pop(target, None)
+        for tag in entry["tags"]:
+            notes = self.tags_to_notes.get(tag, [])
+            if note_id in notes:
+                notes.remove(note_id)
+            if not notes:
+                self.tags_to_notes.pop(tag, None)
+
+    def _apply(self, note_id: str, entry: Dict):
+        """Add a note's contributions to backlinks and the tag index."""
+        self.notes[note_id] = entry
+        for target in entry["linked_to"]:
+            sources = self.backlinks.setdefault(target, [])
+            if note_id not in sources:
+                sources.append(note_id)
+        for tag in entry["tags"]:
+            notes = self.tags_to_notes.setdefault(tag, [])
+            if note_id not in notes:
+                notes.append(note_id)
+
+    def _remove(self, note_id: str) -> bool:
+        """Drop a deleted note; True if it was indexed."""
+        existed = note_id in self.notes
+        self._detach(note_id)
+        return existed
+
+    def update_note(self, note_id: str) -> bool:
+        """
+        Re-index a single note after a create, modify or delete.
+
+        Returns:
+            True if the indexes changed
+        """
+        note_path = self.knowledge_dir / note_id
+        try:
+            stat = note_path.stat()
+        except FileNotFoundError:
+            return self._remove(note_id)
+
+        fingerprint = [stat.st_mtime_ns, stat.st_size]
+        previous = self.notes.get(note_id)
+        if previous and previous["fingerprint"] == fingerprint:
+            return False
+
+        try:
+            linked_to, tags = self._read_note(note_path)
+        except FileNotFoundError:
+            # Deleted or renamed since the stat
+            return self._remove(note_id)
+        self._detach(note_id)
+        self._apply(note_id, {"fingerprint": fingerprint, "linked_to": linked_to, "tags": tags})
+        return (
+            previous is None
+            or previous["linked_to"] != linked_to
+            or previous["tags"] != tags
+        )
+
+    def sync(self) -> int:
+        """
+        Reconcile with the directory (startup, or after lost events).
+
+        Only notes whose (mtime, size) changed are re-read.
+
+        Returns:
+            Number of notes whose index entries changed
+        """
+        present = {path.name for path in self.knowledge_dir.glob("*.md")}
+        changed = 0
+        for note_id in sorted(present | set(self.notes)):
+            if self.update_note(note_id):
+                changed += 1
+        return changed
+
+    def links_data(self) -> Dict:
+        """links.json payload (same shape as generate_links_json)."""
+        links = {note_id: entry["linked_to"] for note_id, entry in sorted(self.notes.items())}
+        return {
+            "notes": links,
+            "backlinks": self.backlinks,
+            "total_notes": len(links),
+            "total_links": sum(len(v) for v in links.values()),
+            "generated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        }
+
+    def tags_data(self) -> Dict:
+        """tags.json payload (same shape as generate_tags_json)."""
+        notes_to_tags = {note_id: entry["tags"] for note_id, entry in sorted(self.notes.items())}
+        return {
+            "tags": self.tags_to_notes,
+            "notes": notes_to_tags,
+            "total_tags": len(self.tags_to_notes),
+            "total_notes": len(notes_to_tags),
+            "generated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        }
+
+    def write(self, links: bool = True, tags: bool = True):
+        """Atomically write the requested indexes plus per-note state."""
+        if links:
+            write_json_atomic(self.knowledge_dir / "links.json", self.links_data())
+        if tags:
+            write_json_atomic(self.knowledge_dir / "tags.json", self.tags_data())
+        self.save_state()
+
+
+def watch(
+    knowledge_dir: Path,
+    links: bool = True,
+    tags: bool = True,
+    debounce: float = 0.5,
+    interval: float = 2.0,
+    use_inotify: bool = True,
+    max_cycles: Optional[int] = None
+):
+    """
+    Keep links.json and tags.json live until interrupted.
+
+    Changes are collected until the directory has been quiet for `debounce`
+    seconds, then applied per note and written once.
+
+    Args:
+        knowledge_dir: Knowledge notes directory
+        links: Maintain links.json
+        tags: Maintain tags.json
+        debounce: Quiet period before writing (seconds)
+        interval: Polling interval when inotify is unavailable (seconds)
+        use_inotify: Prefer inotify over polling
+        max_cycles: Stop after this many poll cycles (for tests)
+    """
+    index = KnowledgeIndex(knowledge_dir)
+    index.load_state()
+    changed = index.sync()
+    index.write(links=links, tags=tags)
+    print(f"✅ Indexed {len(index.notes)} notes ({changed} re-read)")
+
+    pending: Set[str] = set()
+    quiet_deadline = 0.0
+    cycles = 0
+
+    with DirectoryWatcher(knowledge_dir, suffixes=(".md",), interval=interval,
+                          use_inotify=use_inotify) as watcher:
+        print(f"👀 Watching {knowledge_dir} ({watcher.backend}); Ctrl+C to stop")
+        try:
+            while max_cycles is None or cycles < max_cycles:
+                cycles += 1
+                events = watcher.poll(timeout=debounce if pending else interval)
+                if events:
+                    pending |= events
+                    quiet_deadline = time.monotonic() + debounce
+                    continue
+                if not pending or time.monotonic() < quiet_deadline:
+                    continue
+
+                if RESYNC in pending:
+                    updated = index.sync()
+                else:
+                    updated = sum(1 for note_id in sorted(pending) if index.update_note(note_id))
+                pending.clear()
+
+                if updated:
+                    index.write(links=links, tags=tags)
+                    print(f"🔄 Updated {updated} note(s); {len(index.notes)} indexed")
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
+
+    if pending:
+        if RESYNC in pending:
+            index.sync()
+        else:
+            for note_id in pending:
+                index.update_note(note_id)
+        index.write(links=links, tags=tags)
+
+    return index
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="A-MEM knowledge graph auto-indexer"
@@ -178,6 +428,28 @@ def main():
         action="store_true",
         help="Show what would be generated without writing files"
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Run as a daemon that keeps the indexes live (inotify, polling fallback)"
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.5,
+        help="Watch mode: seconds of quiet before writing (default: 0.5)"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=2.0,
+        help="Watch mode: polling interval without inotify (default: 2.0)"
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Watch mode: force polling instead of inotify"
+    )
 
     args = parser.parse_args()
 
@@ -190,6 +462,17 @@ def main():
         print(f"   Creating directory...", file=sys.stderr)
         knowledge_dir.mkdir(parents=True, exist_ok=True)
 
+    if args.watch:
+        watch(
+            knowledge_dir,
+            links=not args.tags_only,
+            tags=not args.links_only,
+            debounce=args.debounce,
+            interval=args.interval,
+            use_inotify=not args.poll
+        )
+        return 0
+
     # Generate links.json
     if not args.tags_only:
         links_data = generate_links_json(knowledge_dir)
@@ -13,10 +13,12 @@
 import argparse
 import json
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from event_columns import EventTable, load_event_table
 
 
 # Configure UTF-8 output for Windows console compatibility
@@ -24,20 +26,9 @@
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
-def load_events(events_dir: Path, event_log: str) -> List[dict]:
-    """Load events from a JSONL file"""
-    log_path = events_dir / event_log
-
-    if not log_path.exists():
-        return []
-
-    events = []
-    with open(log_path, "r", encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                events.append(json.loads(line))
-
-    return events
+def load_events(events_dir: Path, event_log: str) -> EventTable:
+    """Load an event log as a columnar table (compacted partitions + new events)"""
+    return load_event_table(events_dir / event_log)
 
 
 def calculate_query_metrics(events_dir: Path) -> dict:
@@ -53,12 +44,7 @@ def calculate_query_metrics(events_dir: Path) -> dict:
         }
 
     # Group by session
-    sessions = {}
-    for event in events:
-        session_id = event.get("session_id", "unknown")
-        if session_id not in sessions:
-            sessions[session_id] = 0
-        sessions[session_id] += 1
+    sessions = events.count_by("session_id", missing="unknown")
 
     avg_queries = sum(sessions.values()) / len(sessions) if sessions else 0.0
 
@@ -86,8 +72,8 @@ def calculate_reuse_metrics(knowledge_dir: Path, events_dir: Path) -> dict:
 
     events = load_events(events_dir, "knowledge-reuse.jsonl")
 
-    reused_note_ids = set(event.get("note_id") for event in events)
-    total_time_saved = sum(event.get("time_saved_minutes", 0) for event in events)
+    reused_note_ids = set(events.values("note_id"))
+    total_time_saved = events.sum("time_saved_minutes")
 
     reuse_percentage = (len(reused_note_ids) / total_notes * 100) if total_notes > 0 else 0.0
 
@@ -113,15 +99,6 @@ def calculate_mistake_metrics(events_dir: Path) -> dict:
             "meets_target": False
         }
 
-    # Parse timestamps
-    for event in events:
-        try:
-            event["datetime"] = datetime.fromisoformat(event["timestamp"].replace("Z", "+00:00"))
-        except Exception:
-            event["datetime"] = datetime.now()
-
-    events.sort(key=lambda e: e["datetime"])
-
     if len(events) < 2:
         return {
             "total_mistakes": len(events),
@@ -130,18 +107,24 @@ def calculate_mistake_metrics(events_dir: Path) -> dict:
             "meets_target": False
         }
 
-    # Split into baseline and recent
-    latest = events[-1]["datetime"]
+    # Split into baseline and recent (events without a timestamp count as now)
+    _, latest = events.time_range()
+    if latest is None or events.count(events.where_time()) < len(events):
+        latest = datetime.now(timezone.utc)
     midpoint = latest - timedelta(days=30)
 
-    baseline_mistakes = [e for e in events if e["datetime"] < midpoint]
-    recent_mistakes = [e for e in events if e["datetime"] >= midpoint]
+    baseline_mistakes = events.where_time(until=midpoint - timedelta(microseconds=1))
+    baseline_count = events.count(baseline_mistakes)
+    recent_count = len(events) - baseline_count
+
+    def is_repeated(recurrence) -> bool:
+        return recurrence > 1
 
-    baseline_repeated = sum(1 for e in baseline_mistakes if e.get("recurrence", 0) > 1)
-    recent_repeated = sum(1 for e in recent_mistakes if e.get("recurrence", 0) > 1)
+    baseline_repeated = events.count(events.where("recurrence", is_repeated, rows=baseline_mistakes, default=0))
+    recent_repeated = events.count(events.where("recurrence", is_repeated, default=0)) - baseline_repeated
 
-    baseline_rate = (baseline_repeated / len(baseline_mistakes) * 100) if baseline_mistakes else 0
-    recent_rate = (recent_repeated / len(recent_mistakes) * 100) if recent_mistakes else 0
+    baseline_rate = (baseline_repeated / baseline_count * 100) if baseline_count else 0
+    recent_rate = (recent_repeated / recent_count * 100) if recent_count else 0
 
     reduction = baseline_rate - recent_rate
 
@@ -167,28 +150,30 @@ def calculate_restoration_metrics(events_dir: Path) -> dict:
             "meets_target": False
         }
 
-    starts = [e for e in events if e.get("action") == "start"]
-    with_memory = [e for e in starts if e.get("context_restored_from_memory")]
-    baseline = [e for e in starts if not e.get("context_restored_from_memory")]
+    starts = events.where_eq("action", "start")
+    with_memory = events.where("context_restored_from_memory", bool, rows=starts)
+    baseline = events.where("context_restored_from_memory", lambda value: not value, rows=starts)
+    with_memory_count = events.count(with_memory)
+    baseline_count = events.count(baseline)
 
     avg_with_memory = (
-        sum(e.get("restoration_time_seconds", 0) for e in with_memory) / len(with_memory)
-        if with_memory else 0.0
+        events.sum("restoration_time_seconds", rows=with_memory) / with_memory_count
+        if with_memory_count else 0.0
     )
 
     avg_baseline = (
-        sum(e.get("manual_context_baseline_seconds", 0) for e in baseline) / len(baseline)
-        if baseline else 180.0
+        events.sum("manual_context_baseline_seconds", rows=baseline) / baseline_count
+        if baseline_count else 180.0
     )
 
-    if not baseline and with_memory:
-        avg_baseline = with_memory[0].get("manual_context_baseline_seconds", 180.0)
+    if not baseline_count and with_memory_count:
+        avg_baseline = events.values("manual_context_baseline_seconds", rows=with_memory, default=180.0)[0]
 
     time_saved_pct = ((avg_baseline - avg_with_memory) / avg_baseline * 100) if avg_baseline > 0 else 0.0
 
     return {
-        "total_sessions": len(starts),
-        "with_memory_sessions": len(with_memory),
+        "total_sessions": events.count(starts),
+        "with_memory_sessions": with_memory_count,
         "avg_restoration_with_memory_seconds": avg_with_memory,
         "avg_restoration_baseline_seconds": avg_baseline,
         "time_saved_percentage": time_saved_pct,
@@ -4,10 +4,26 @@
 
 Focus on documentation completeness, clarity, and structural quality
 rather than adoption metrics.
+
+Each artifact is analyzed on its own (checks use the precompiled patterns
+below), so a sweep fans artifacts out across worker processes. Results are
+cached per artifact in .chora/cache/sap-quality.json, keyed by a hash of
+the artifact's content: a re-run only analyzes artifacts that changed.
+
+Usage:
+    python scripts/analyze_sap_quality.py              # Non-React SAPs, 4 workers
+    python scripts/analyze_sap_quality.py --all        # Every SAP in the catalog
+    python scripts/analyze_sap_quality.py --jobs 1     # Sequential
+    python scripts/analyze_sap_quality.py --no-cache   # Re-analyze every artifact
 """
 
+import argparse
+import hashlib
 import json
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import Optional
@@ -18,6 +34,127 @@
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
+# utils/ lives at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.evaluation_cache import EvaluationCache
+
+# Default cache location, relative to the repository root
+CACHE_PATH = Path(".chora") / "cache" / "sap-quality.json"
+
+# Part of every cache fingerprint: bump when a check or its scoring changes
+RULES_VERSION = 1
+
+# Worker processes for artifact analysis
+DEFAULT_JOBS = 4
+
+# Required artifacts and the checks that apply to them
+ARTIFACTS = {
+    "capability-charter.md": "charter",
+    "protocol-spec.md": "protocol",
+    "awareness-guide.md": "awareness",
+    "adoption-blueprint.md": "adoption",
+    "ledger.md": "ledger"
+}
+
+# Artifact checks
+H1_RE = re.compile(r'^#\s+', re.MULTILINE)
+CHARTER_SECTIONS = [
+    ("problem", re.compile("Problem Statement|Problem|What Problem", re.IGNORECASE)),
+    ("scope", re.compile("Scope|What's Included", re.IGNORECASE)),
+    ("outcome", re.compile("Outcomes|Success Criteria|Expected Results", re.IGNORECASE)),
+    ("stakeholder", re.compile("Stakeholders|Who|Users", re.IGNORECASE))
+]
+CODE_EXAMPLE_RE = re.compile(r'```|`\w+`')
+PROTOCOL_TECHNICAL_RE = re.compile(r'```|class |def |interface |type ')
+PROTOCOL_MODEL_RE = re.compile(r'@dataclass|interface|schema|model', re.IGNORECASE)
+PROTOCOL_VALIDATION_RE = re.compile(r'validation|verify|test|check', re.IGNORECASE)
+AWARENESS_TOOLS = ["Read", "Write", "Edit", "Bash", "Grep", "Glob"]
+AWARENESS_STEP_RE = re.compile(r'^\d+\.|^- Step|^\d+\)', re.MULTILINE)
+ADOPTION_PREREQUISITE_RE = re.compile(r'prerequisite|requirement|before you begin|dependencies', re.IGNORECASE)
+ADOPTION_STEP_RE = re.compile(r'^\d+\.|^## Step \d+', re.MULTILINE)
+ADOPTION_VALIDATION_RE = re.compile(r'validation|verify|test|confirm', re.IGNORECASE)
+ADOPTION_AWARENESS_RE = re.compile(r'post-install.*awareness|awareness.*enablement', re.IGNORECASE)
+LEDGER_HISTORY_RE = re.compile(r'version|changelog|history', re.IGNORECASE)
+LEDGER_ADOPTION_RE = re.compile(r'project|adopter|installation|usage', re.IGNORECASE)
+TABLE_RE = re.compile(r'\|.*\|.*\|')
+
+# Diataxis checks per artifact: (pattern, required, issue, penalty). A required
+# pattern must match; any other pattern must not.
+DIATAXIS_RULES = {
+    # Explanation (why, context, rationale)
+    "capability-charter.md": {
+        "category": "Explanation",
+        "strength": "capability-charter.md: Good Explanation adherence (context, rationale)",
+        "checks": [
+            (re.compile(r'\b(why|rationale|motivation|problem|context|background)\b', re.IGNORECASE), True,
+             "Missing WHY/rationale - doesn't explain context", 30),
+            (re.compile(r'\b(trade-?off|decision|choice|approach|alternative)\b', re.IGNORECASE), True,
+             "Missing trade-offs or design decisions", 20),
+            (re.compile(r'step \d|1\.|2\.|3\.|first.*second.*third', re.IGNORECASE), False,
+             "Contains tutorial content (belongs in adoption-blueprint)", 25),
+            (re.compile(r'```(json|yaml|python|typescript)|interface \{|type \{'), False,
+             "Contains technical specs (belongs in protocol-spec)", 15),
+        ],
+    },
+    # Reference (specs, APIs, contracts)
+    "protocol-spec.md": {
+        "category": "Reference",
+        "strength": "protocol-spec.md: Good Reference adherence (technical specs)",
+        "checks": [
+            (re.compile(r'```|schema|interface|api|contract|guarantee', re.IGNORECASE), True,
+             "Missing technical specifications", 30),
+            (re.compile(r"let's|we'll|you'll learn|follow these steps", re.IGNORECASE), False,
+             "Contains tutorial language (belongs in adoption-blueprint)", 25),
+            (re.compile(r'problem:.*solution:|if you need to|to solve this', re.IGNORECASE), False,
+             "Contains how-to content (belongs in awareness-guide)", 15),
+        ],
+    },
+    # How-To (task-oriented, problem-solving); should also reference 2+ doc domains
+    "awareness-guide.md": {
+        "category": "How-To Guide",
+        "strength": "awareness-guide.md: Good How-To adherence (task-oriented)",
+        "checks": [
+            (re.compile(r'problem|task|workflow|how to|common|scenario|use case', re.IGNORECASE), True,
+             "Missing task-oriented content", 25),
+            (re.compile(r'```|example|instance|case', re.IGNORECASE), True,
+             "Missing concrete examples", 20),
+            (re.compile(r"what you'll learn|learning objective|lesson \d", re.IGNORECASE), False,
+             "Contains tutorial content (belongs in adoption-blueprint)", 20),
+        ],
+        "domains": ["dev-docs/", "project-docs/", "user-docs/", "skilled-awareness/"],
+    },
+    # Tutorial (learning journey, step-by-step)
+    "adoption-blueprint.md": {
+        "category": "Tutorial",
+        "strength": "adoption-blueprint.md: Good Tutorial adherence (learning journey)",
+        "checks": [
+            (re.compile(r'step|install|setup|prerequisite|getting started', re.IGNORECASE), True,
+             "Missing learning journey structure", 25),
+            (re.compile(r'step \d|^\d+\.|first|next|then|finally', re.MULTILINE | re.IGNORECASE), True,
+             "Missing sequential steps", 20),
+            (re.compile(r'validat|verif|check|confirm|expect|should see', re.IGNORECASE), True,
+             "Missing validation checkpoints", 15),
+            (re.compile(r'problem:.*solution:|troubleshoot|fix|debug', re.IGNORECASE), False,
+             "Contains how-to content (problem-solving belongs in awareness-guide)", 15),
+            (re.compile(r'```(json|yaml) schema|interface definition|api specification', re.IGNORECASE), False,
+             "Contains reference content (specs belong in protocol-spec)", 10),
+        ],
+    },
+    # Reference (factual records); issues are never more than informational
+    "ledger.md": {
+        "category": "Reference",
+        "strength": "ledger.md: Good Reference adherence (factual records)",
+        "checks": [
+            (re.compile(r'version|date|adopter|status', re.IGNORECASE), True,
+             "Missing factual records (version, dates, adopters)", 30),
+            (re.compile(r"let's|we'll|you should|why|rationale", re.IGNORECASE), False,
+             "Contains explanatory content (should be purely factual)", 20),
+        ],
+        "severity": "info",
+    },
+}
+
 @dataclass
 class QualityIssue:
     """A quality issue found in SAP documentation"""
@@ -49,12 +186,366 @@ def to_dict(self):
         }
 
 
+def _score_artifact(content: str, artifact_type: str, filename: str):
+    """Completeness/structure checks for a single artifact"""
+    issues = []
+    strengths = []
+    score = 100.0
+
+    lines = content.split('\n')
+    line_count = len(lines)
+    word_count = len(content.split())
+
+    # Check for emptiness
+    if line_count < 10:
+        issues.append(QualityIssue(
+            severity="critical",
+            category="completeness",
+            artifact=filename,
+            description=f"File is too short ({line_count} lines) - likely a stub"
+        ))
+        return 20.0, issues, strengths
+
+    # Artifact-specific checks
+    if artifact_type == "charter":
+        score, charter_issues, charter_strengths = _check_charter(content, filename)
+        issues.extend(charter_issues)
+        strengths.extend(charter_strengths)
+
+    elif artifact_type == "protocol":
+        score, protocol_issues, protocol_strengths = _check_protocol(content, filename)
+        issues.extend(protocol_issues)
+        strengths.extend(protocol_strengths)
+
+    elif artifact_type == "awareness":
+        score, awareness_issues, awareness_strengths = _check_awareness(content, filename)
+        issues.extend(awareness_issues)
+        strengths.extend(awareness_strengths)
+
+    elif artifact_type == "adoption":
+        score, adoption_issues, adoption_strengths = _check_adoption(content, filename)
+        issues.extend(adoption_issues)
+        strengths.extend(adoption_strengths)
+
+    elif artifact_type == "ledger":
+        score, ledger_issues, ledger_strengths = _check_ledger(content, filename)
+        issues.extend(ledger_issues)
+        strengths.extend(ledger_strengths)
+
+    # Check for basic markdown structure
+    if not H1_RE.search(content):
+        issues.append(QualityIssue(
+            severity="warning",
+            category="structure",
+            artifact=filename,
+            description="No H1 heading found - should have a main title"
+        ))
+        score -= 5
+
+    # Check for reasonable length (not too short or too long)
+    if word_count < 200:
+        issues.append(QualityIssue(
+            severity="warning",
+            category="completeness",
+            artifact=filename,
+            description=f"Very short content ({word_count} words) - may lack detail"
+        ))
+        score -= 10
+    elif word_count > 5000:
+        issues.append(QualityIssue(
+            severity="info",
+            category="clarity",
+            artifact=filename,
+            description=f"Very long content ({word_count} words) - consider splitting"
+        ))
+
+    return max(0, score), issues, strengths
+
+def _check_charter(content: str, filename: str):
+    """Check capability charter quality"""
+    issues = []
+    strengths = []
+    score = 100.0
+
+    # Expected sections
+    for section_id, pattern in CHARTER_SECTIONS:
+        if not pattern.search(content):
+            issues.append(QualityIssue(
+                severity="warning",
+                category="completeness",
+                artifact=filename,
+                description=f"Missing or unclear {section_id} section"
+            ))
+            score -= 15
+
+    # Check for concrete examples
+    if CODE_EXAMPLE_RE.search(content):
+        strengths.append(f"{filename}: Includes code examples")
+
+    return score, issues, strengths
+
+def _check_protocol(content: str, filename: str):
+    """Check protocol specification quality"""
+    issues = []
+    strengths = []
+    score = 100.0
+
+    # Should have technical details
+    if not PROTOCOL_TECHNICAL_RE.search(content):
+        issues.append(QualityIssue(
+            severity="warning",
+            category="completeness",
+            artifact=filename,
+            description="No code blocks or technical definitions found"
+        ))
+        score -= 20
+    else:
+        strengths.append(f"{filename}: Contains technical specifications")
+
+    # Should have data models or schemas
+    if PROTOCOL_MODEL_RE.search(content):
+        strengths.append(f"{filename}: Defines data models")
+    else:
+        issues.append(QualityIssue(
+            severity="info",
+            category="completeness",
+            artifact=filename,
+            description="No explicit data models defined"
+        ))
+        score -= 10
+
+    # Should have validation commands
+    if PROTOCOL_VALIDATION_RE.search(content):
+        strengths.append(f"{filename}: Includes validation guidance")
+    else:
+        issues.append(QualityIssue(
+            severity="warning",
+            category="completeness",
+            artifact=filename,
+            description="No validation commands specified"
+        ))
+        score -= 15
+
+    return score, issues, strengths
+
+def _check_awareness(content: str, filename: str):
+    """Check awareness guide quality"""
+    issues = []
+    strengths = []
+    score = 100.0
+
+    # Should mention tools (Read, Write, Edit, Bash, etc.)
+    tool_mentions = sum(1 for tool in AWARENESS_TOOLS if tool in content)
+
+    if tool_mentions == 0:
+        issues.append(QualityIssue(
+            severity="critical",
+            category="clarity",
+            artifact=filename,
+            description="No tool usage instructions (Read, Write, Edit, etc.)"
+        ))
+        score -= 30
+    elif tool_mentions >= 3:
+        strengths.append(f"{filename}: Clear tool usage instructions")
+
+    # Should have step-by-step instructions
+    numbered_steps = len(AWARENESS_STEP_RE.findall(content))
+    if numbered_steps == 0:
+        issues.append(QualityIssue(
+            severity="warning",
+            category="clarity",
+            artifact=filename,
+            description="No numbered steps or structured procedures"
+        ))
+        score -= 20
+    elif numbered_steps >= 5:
+        strengths.append(f"{filename}: Detailed step-by-step instructions")
+
+    return score, issues, strengths
+
+def _check_adoption(content: str, filename: str):
+    """Check adoption blueprint quality"""
+    issues = []
+    strengths = []
+    score = 100.0
+
+    # Should have prerequisites
+    if not ADOPTION_PREREQUISITE_RE.search(content):
+        issues.append(QualityIssue(
+            severity="warning",
+            category="completeness",
+            artifact=filename,
+            description="No prerequisites section"
+        ))
+        score -= 15
+    else:
+        strengths.append(f"{filename}: Lists prerequisites")
+
+    # Should have numbered installation steps
+    numbered_steps = len(ADOPTION_STEP_RE.findall(content))
+    if numbered_steps < 3:
+        issues.append(QualityIssue(
+            severity="warning",
+            category="clarity",
+            artifact=filename,
+            description=f"Only {numbered_steps} installation steps - may be incomplete"
+        ))
+        score -= 15
+    elif numbered_steps >= 5:
+        strengths.append(f"{filename}: Detailed installation steps")
+
+    # Should have validation
+    if not ADOPTION_VALIDATION_RE.search(content):
+        issues.append(QualityIssue(
+            severity="warning",
+            category="completeness",
+            artifact=filename,
+            description="No validation/verification instructions"
+        ))
+        score -= 15
+
+    # Should have post-install awareness section (Wave 2 requirement)
+    if not ADOPTION_AWARENESS_RE.search(content):
+        issues.append(QualityIssue(
+            severity="info",
+            category="completeness",
+            artifact=filename,
+            description="No post-install awareness enablement section"
+        ))
+        score -= 10
+    else:
+        strengths.append(f"{filename}: Includes post-install awareness enablement")
+
+    return score, issues, strengths
+
+def _check_ledger(content: str, filename: str):
+    """Check ledger quality"""
+    issues = []
+    strengths = []
+    score = 100.0
+
+    # Should have version history
+    if not LEDGER_HISTORY_RE.search(content):
+        issues.append(QualityIssue(
+            severity="warning",
+            category="completeness",
+            artifact=filename,
+            description="No version history section"
+        ))
+        score -= 20
+    else:
+        strengths.append(f"{filename}: Maintains version history")
+
+    # Should track adopters
+    if not LEDGER_ADOPTION_RE.search(content):
+        issues.append(QualityIssue(
+            severity="info",
+            category="completeness",
+            artifact=filename,
+            description="No adoption tracking"
+        ))
+        score -= 10
+    else:
+        strengths.append(f"{filename}: Tracks adoption")
+
+    # Should have table format
+    if '|' in content and TABLE_RE.search(content):
+        strengths.append(f"{filename}: Uses structured table format")
+    else:
+        issues.append(QualityIssue(
+            severity="info",
+            category="structure",
+            artifact=filename,
+            description="No markdown tables found"
+        ))
+        score -= 5
+
+    return score, issues, strengths
+
+
+def _assess_diataxis(content: str, filename: str):
+    """
+    Check an artifact against its Diataxis category (DIATAXIS_RULES)
+
+    Returns:
+        (compliance entry, strengths, issues)
+    """
+    rules = DIATAXIS_RULES[filename]
+    score = 100.0
+    problems = []
+
+    for pattern, required, problem, penalty in rules["checks"]:
+        if bool(pattern.search(content)) != required:
+            problems.append(problem)
+            score -= penalty
+
+    if "domains" in rules:
+        domain_count = sum(1 for domain in rules["domains"] if domain in content)
+        if domain_count < 2:
+            problems.append("Weak cross-domain references (should reference 2+ domains)")
+            score -= 15
+
+    compliance = {
+        'category': rules["category"],
+        'score': max(0, score),
+        'status': 'pass' if score >= 75 else ('partial' if score >= 50 else 'fail'),
+        'issues': problems
+    }
+
+    strengths = []
+    issues = []
+    if score >= 75:
+        strengths.append(rules["strength"])
+    else:
+        severity = rules.get("severity") or ("warning" if score < 50 else "info")
+        for problem in problems:
+            issues.append(QualityIssue(
+                severity=severity,
+                category="diataxis",
+                artifact=filename,
+                description=f"Diataxis: {problem}"
+            ))
+
+    return compliance, strengths, issues
+
+
+def analyze_artifact_content(content: str, artifact_type: str, filename: str) -> dict:
+    """
+    Run every check for one artifact (process pool work unit)
+
+    Returns:
+        JSON-serializable result: artifact score, issues and strengths, and
+        the artifact's Diataxis assessment
+    """
+    score, issues, strengths = _score_artifact(content, artifact_type, filename)
+    compliance, diataxis_strengths, diataxis_issues = _assess_diataxis(content, filename)
+    return {
+        "score": score,
+        "issues": [asdict(i) for i in issues],
+        "strengths": strengths,
+        "diataxis": {
+            "compliance": compliance,
+            "issues": [asdict(i) for i in diataxis_issues],
+            "strengths": diataxis_strengths
+        }
+    }
+
+
 class SAPQualityAnalyzer:
     """Analyzes intrinsic SAP documentation quality"""
 
-    def __init__(self, repo_root: Path):
+    def __init__(self, repo_root: Path, use_cache: bool = True):
+        """
+        Initialize analyzer.
+
+        Args:
+            repo_root: Repository root (holds sap-catalog.json)
+            use_cache: Reuse per-artifact results from .chora/cache/sap-quality.json
+        """
         self.repo_root = repo_root
         self.catalog = self.load_catalog()
+        self.cache = EvaluationCache(repo_root / CACHE_PATH) if use_cache else None
+        self._results: dict[Path, dict] = {}  # Artifact results of this run
 
     def load_catalog(self) -> dict:
         """Load SAP catalog"""
@@ -85,17 +576,10 @@ def analyze_sap(self, sap_id: str) -> SAPQualityReport:
         strengths = []
 
         # Check each required artifact
-        artifacts = {
-            "capability-charter.md": "charter",
-            "protocol-spec.md": "protocol",
-            "awareness-guide.md": "awareness",
-            "adoption-blueprint.md": "adoption",
-            "ledger.md": "ledger"
-        }
-
         artifact_scores = {}
+        results = {}
 
-        for filename, artifact_type in artifacts.items():
+        for filename, artifact_type in ARTIFACTS.items():
             file_path = sap_dir / filename
             if not file_path.exists():
                 issues.append(QualityIssue(
@@ -106,12 +590,10 @@ def analyze_sap(self, sap_id: str) -> SAPQualityReport:
                 ))
                 artifact_scores[artifact_type] = 0
             else:
-                score, file_issues, file_strengths = self._analyze_artifact(
-                    file_path, artifact_type, filename
-                )
-                artifact_scores[artifact_type] = score
-                issues.extend(file_issues)
-                strengths.extend(file_strengths)
+                result = results[filename] = self._artifact_result(file_path, artifact_type, filename)
+                artifact_scores[artifact_type] = result["score"]
+                issues.extend(QualityIssue(**i) for i in result["issues"])
+                strengths.extend(result["strengths"])
 
         # Calculate scores
         completeness_score = self._calculate_completeness_score(artifact_scores)
@@ -120,7 +602,7 @@ def analyze_sap(self, sap_id: str) -> SAPQualityReport:
         structure_score = self._calculate_structure_score(issues)
 
         # Calculate Diataxis compliance score
-        diataxis_score, diataxis_compliance = self._calculate_diataxis_score(sap_dir, issues, strengths)
+        diataxis_score, diataxis_compliance = self._calculate_diataxis_score(results, issues, strengths)
 
         overall_score = (
             completeness_score * 0.30 +
@@ -144,290 +626,83 @@ def analyze_sap(self, sap_id: str) -> SAPQualityReport:
             diataxis_compliance=diataxis_compliance
         )
 
-    def _analyze_artifact(self, file_path: Path, artifact_type: str, filename: str):
-        """Analyze a single artifact file"""
-        issues = []
-        strengths = []
-        score = 100.0
-
-        content = file_path.read_text()
-        lines = content.split('\n')
-        line_count = len(lines)
-        word_count = len(content.split())
-
-        # Check for emptiness
-        if line_count < 10:
-            issues.append(QualityIssue(
-                severity="critical",
-                category="completeness",
-                artifact=filename,
-                description=f"File is too short ({line_count} lines) - likely a stub"
-            ))
-            return 20.0, issues, strengths
-
-        # Artifact-specific checks
-        if artifact_type == "charter":
-            score, charter_issues, charter_strengths = self._check_charter(content, filename)
-            issues.extend(charter_issues)
-            strengths.extend(charter_strengths)
-
-        elif artifact_type == "protocol":
-            score, protocol_issues, protocol_strengths = self._check_protocol(content, filename)
-            issues.extend(protocol_issues)
-            strengths.extend(protocol_strengths)
-
-        elif artifact_type == "awareness":
-            score, awareness_issues, awareness_strengths = self._check_awareness(content, filename)
-            issues.extend(awareness_issues)
-            strengths.extend(awareness_strengths)
-
-        elif artifact_type == "adoption":
-            score, adoption_issues, adoption_strengths = self._check_adoption(content, filename)
-            issues.extend(adoption_issues)
-            strengths.extend(adoption_strengths)
-
-        elif artifact_type == "ledger":
-            score, ledger_issues, ledger_strengths = self._check_ledger(content, filename)
-            issues.extend(ledger_issues)
-            strengths.extend(ledger_strengths)
-
-        # Check for basic markdown structure
-        if not re.search(r'^#\s+', content, re.MULTILINE):
-            issues.append(QualityIssue(
-                severity="warning",
-                category="structure",
-                artifact=filename,
-                description="No H1 heading found - should have a main title"
-            ))
-            score -= 5
-
-        # Check for reasonable length (not too short or too long)
-        if word_count < 200:
-            issues.append(QualityIssue(
-                severity="warning",
-                category="completeness",
-                artifact=filename,
-                description=f"Very short content ({word_count} words) - may lack detail"
-            ))
-            score -= 10
-        elif word_count > 5000:
-            issues.append(QualityIssue(
-                severity="info",
-                category="clarity",
-                artifact=filename,
-                description=f"Very long content ({word_count} words) - consider splitting"
-            ))
-
-        return max(0, score), issues, strengths
-
-    def _check_charter(self, content: str, filename: str):
-        """Check capability charter quality"""
-        issues = []
-        strengths = []
-        score = 100.0
-
-        # Expected sections
-        expected_sections = [
-            ("problem", "Problem Statement|Problem|What Problem"),
-            ("scope", "Scope|What's Included"),
-            ("outcome", "Outcomes|Success Criteria|Expected Results"),
-            ("stakeholder", "Stakeholders|Who|Users")
-        ]
-
-        for section_id, patterns in expected_sections:
-            if not re.search(patterns, content, re.IGNORECASE):
-                issues.append(QualityIssue(
-                    severity="warning",
-                    category="completeness",
-                    artifact=filename,
-                    description=f"Missing or unclear {section_id} section"
-                ))
-                score -= 15
-
-        # Check for concrete examples
-        if re.search(r'```|`\w+`', content):
-            strengths.append(f"{filename}: Includes code examples")
-
-        return score, issues, strengths
-
-    def _check_protocol(self, content: str, filename: str):
-        """Check protocol specification quality"""
-        issues = []
-        strengths = []
-        score = 100.0
-
-        # Should have technical details
-        if not re.search(r'```|class |def |interface |type ', content):
-            issues.append(QualityIssue(
-                severity="warning",
-                category="completeness",
-                artifact=filename,
-                description="No code blocks or technical definitions found"
-            ))
-            score -= 20
-        else:
-            strengths.append(f"{filename}: Contains technical specifications")
-
-        # Should have data models or schemas
-        if re.search(r'@dataclass|interface|schema|model', content, re.IGNORECASE):
-            strengths.append(f"{filename}: Defines data models")
-        else:
-            issues.append(QualityIssue(
-                severity="info",
-                category="completeness",
-                artifact=filename,
-                description="No explicit data models defined"
-            ))
-            score -= 10
-
-        # Should have validation commands
-        if re.search(r'validation|verify|test|check', content, re.IGNORECASE):
-            strengths.append(f"{filename}: Includes validation guidance")
-        else:
-            issues.append(QualityIssue(
-                severity="warning",
-                category="completeness",
-                artifact=filename,
-                description="No validation commands specified"
-            ))
-            score -= 15
-
-        return score, issues, strengths
-
-    def _check_awareness(self, content: str, filename: str):
-        """Check awareness guide quality"""
-        issues = []
-        strengths = []
-        score = 100.0
-
-        # Should mention tools (Read, Write, Edit, Bash, etc.)
-        tools = ["Read", "Write", "Edit", "Bash", "Grep", "Glob"]
-        tool_mentions = sum(1 for tool in tools if tool in content)
-
-        if tool_mentions == 0:
-            issues.append(QualityIssue(
-                severity="critical",
-                category="clarity",
-                artifact=filename,
-                description="No tool usage instructions (Read, Write, Edit, etc.)"
-            ))
-            score -= 30
-        elif tool_mentions >= 3:
-            strengths.append(f"{filename}: Clear tool usage instructions")
-
-        # Should have step-by-step instructions
-        numbered_steps = len(re.findall(r'^\d+\.|^- Step|^\d+\)', content, re.MULTILINE))
-        if numbered_steps == 0:
-            issues.append(QualityIssue(
-                severity="warning",
-                category="clarity",
-                artifact=filename,
-                description="No numbered steps or structured procedures"
-            ))
-            score -= 20
-        elif numbered_steps >= 5:
-            strengths.append(f"{filename}: Detailed step-by-step instructions")
+    def analyze_saps(self, sap_ids: list[str], jobs: int = 1) -> list[SAPQualityReport]:
+        """
+        Analyze several SAPs, running uncached artifact checks in parallel
 
-        return score, issues, strengths
+        Args:
+            sap_ids: SAPs to analyze (reports keep this order)
+            jobs: Worker processes (1 = sequential, 0 = one per CPU core)
 
-    def _check_adoption(self, content: str, filename: str):
-        """Check adoption blueprint quality"""
-        issues = []
-        strengths = []
-        score = 100.0
-
-        # Should have prerequisites
-        if not re.search(r'prerequisite|requirement|before you begin|dependencies', content, re.IGNORECASE):
-            issues.append(QualityIssue(
-                severity="warning",
-                category="completeness",
-                artifact=filename,
-                description="No prerequisites section"
-            ))
-            score -= 15
+        Returns:
+            Reports identical to analyze_sap() for each SAP
+        """
+        pending = {}
+        for sap_id in sap_ids:
+            location = (self.catalog.get(sap_id) or {}).get("location")
+            if not location or not (self.repo_root / location).exists():
+                continue
+            for filename, artifact_type in ARTIFACTS.items():
+                file_path = self.repo_root / location / filename
+                if file_path in self._results or file_path in pending or not file_path.exists():
+                    continue
+                content = file_path.read_text()
+                fingerprint = self._fingerprint(content)
+                cached = self.cache.get(self._cache_key(file_path), fingerprint) if self.cache else None
+                if cached is not None:
+                    self._results[file_path] = cached
+                else:
+                    pending[file_path] = (content, artifact_type, filename, fingerprint)
+
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+        tasks = list(pending.values())
+        contents, artifact_types, filenames, _ = zip(*tasks) if tasks else ((), (), (), ())
+        if jobs == 1 or len(tasks) < 2:
+            results = list(map(analyze_artifact_content, contents, artifact_types, filenames))
         else:
-            strengths.append(f"{filename}: Lists prerequisites")
-
-        # Should have numbered installation steps
-        numbered_steps = len(re.findall(r'^\d+\.|^## Step \d+', content, re.MULTILINE))
-        if numbered_steps < 3:
-            issues.append(QualityIssue(
-                severity="warning",
-                category="clarity",
-                artifact=filename,
-                description=f"Only {numbered_steps} installation steps - may be incomplete"
-            ))
-            score -= 15
-        elif numbered_steps >= 5:
-            strengths.append(f"{filename}: Detailed installation steps")
-
-        # Should have validation
-        if not re.search(r'validation|verify|test|confirm', content, re.IGNORECASE):
-            issues.append(QualityIssue(
-                severity="warning",
-                category="completeness",
-                artifact=filename,
-                description="No validation/verification instructions"
-            ))
-            score -= 15
+            with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+                chunksize = max(1, len(tasks) // (jobs * 4))
+                results = list(executor.map(analyze_artifact_content, contents, artifact_types, filenames,
+                                            chunksize=chunksize))
 
-        # Should have post-install awareness section (Wave 2 requirement)
-        if not re.search(r'post-install.*awareness|awareness.*enablement', content, re.IGNORECASE):
-            issues.append(QualityIssue(
-                severity="info",
-                category="completeness",
-                artifact=filename,
-                description="No post-install awareness enablement section"
-            ))
-            score -= 10
-        else:
-            strengths.append(f"{filename}: Includes post-install awareness enablement")
+        for (file_path, (_, _, _, fingerprint)), result in zip(pending.items(), results):
+            self._store(file_path, fingerprint, result)
+        if self.cache:
+            self.cache.save()
 
-        return score, issues, strengths
+        return [self.analyze_sap(sap_id) for sap_id in sap_ids]
 
-    def _check_ledger(self, content: str, filename: str):
-        """Check ledger quality"""
-        issues = []
-        strengths = []
-        score = 100.0
+    def _artifact_result(self, file_path: Path, artifact_type: str, filename: str) -> dict:
+        """Result of analyze_artifact_content() for an artifact, cached by content"""
+        if file_path in self._results:
+            return self._results[file_path]
 
-        # Should have version history
-        if not re.search(r'version|changelog|history', content, re.IGNORECASE):
-            issues.append(QualityIssue(
-                severity="warning",
-                category="completeness",
-                artifact=filename,
-                description="No version history section"
-            ))
-            score -= 20
+        content = file_path.read_text()
+        fingerprint = self._fingerprint(content)
+        result = self.cache.get(self._cache_key(file_path), fingerprint) if self.cache else None
+        if result is None:
+            result = analyze_artifact_content(content, artifact_type, filename)
+            self._store(file_path, fingerprint, result)
         else:
-            strengths.append(f"{filename}: Maintains version history")
+            self._results[file_path] = result
+        return result
 
-        # Should track adopters
-        if not re.search(r'project|adopter|installation|usage', content, re.IGNORECASE):
-            issues.append(QualityIssue(
-                severity="info",
-                category="completeness",
-                artifact=filename,
-                description="No adoption tracking"
-            ))
-            score -= 10
-        else:
-            strengths.append(f"{filename}: Tracks adoption")
+    def _store(self, file_path: Path, fingerprint: str, result: dict) -> None:
+        self._results[file_path] = result
+        if self.cache:
+            self.cache.put(self._cache_key(file_path), fingerprint, result)
 
-        # Should have table format
-        if '|' in content and re.search(r'\|.*\|.*\|', content):
-            strengths.append(f"{filename}: Uses structured table format")
-        else:
-            issues.append(QualityIssue(
-                severity="info",
-                category="structure",
-                artifact=filename,
-                description="No markdown tables found"
-            ))
-            score -= 5
+    def _cache_key(self, file_path: Path) -> str:
+        try:
+            return file_path.relative_to(self.repo_root).as_posix()
+        except ValueError:
+            return file_path.as_posix()
 
-        return score, issues, strengths
+    @staticmethod
+    def _fingerprint(content: str) -> str:
+        digest = hashlib.sha256(content.encode("utf-8", "surrogateescape")).hexdigest()
+        return f"{RULES_VERSION}:{digest}"
 
     def _calculate_completeness_score(self, artifact_scores: dict) -> float:
         """Calculate completeness score from artifact scores"""
@@ -474,7 +749,7 @@ def _calculate_structure_score(self, issues: list) -> float:
 
         return max(0, score)
 
-    def _calculate_diataxis_score(self, sap_dir: Path, issues: list, strengths: list) -> tuple[float, dict]:
+    def _calculate_diataxis_score(self, results: dict, issues: list, strengths: list) -> tuple[float, dict]:
         """
         Calculate Diataxis framework compliance score
 
@@ -484,241 +759,22 @@ def _calculate_diataxis_score(self, sap_dir: Path, issues: list, strengths: list
         - awareness-guide.md = How-To (task-oriented, problem-solving)
         - adoption-blueprint.md = Tutorial (learning journey, step-by-step)
         - ledger.md = Reference (factual records)
+
+        Args:
+            results: Artifact results (analyze_artifact_content) by filename
         """
         compliance = {}
-        artifact_scores = {}
 
-        # Charter - Explanation
-        charter_path = sap_dir / "capability-charter.md"
-        if charter_path.exists():
-            content = charter_path.read_text()
-            score = 100.0
-            charter_issues = []
-
-            # Should explain WHY (not just WHAT)
-            if not re.search(r'\b(why|rationale|motivation|problem|context|background)\b', content, re.IGNORECASE):
-                charter_issues.append("Missing WHY/rationale - doesn't explain context")
-                score -= 30
-
-            # Should discuss trade-offs or design decisions
-            if not re.search(r'\b(trade-?off|decision|choice|approach|alternative)\b', content, re.IGNORECASE):
-                charter_issues.append("Missing trade-offs or design decisions")
-                score -= 20
-
-            # Should NOT have step-by-step instructions (belongs in blueprint)
-            if re.search(r'step \d|1\.|2\.|3\.|first.*second.*third', content, re.IGNORECASE):
-                charter_issues.append("Contains tutorial content (belongs in adoption-blueprint)")
-                score -= 25
-
-            # Should NOT have API specs (belongs in protocol-spec)
-            if re.search(r'```(json|yaml|python|typescript)|interface \{|type \{', content):
-                charter_issues.append("Contains technical specs (belongs in protocol-spec)")
-                score -= 15
-
-            artifact_scores['charter'] = max(0, score)
-            compliance['capability-charter.md'] = {
-                'category': 'Explanation',
-                'score': artifact_scores['charter'],
-                'status': 'pass' if score >= 75 else ('partial' if score >= 50 else 'fail'),
-                'issues': charter_issues
-            }
-
-            if score >= 75:
-                strengths.append("capability-charter.md: Good Explanation adherence (context, rationale)")
-            elif charter_issues:
-                for issue in charter_issues:
-                    issues.append(QualityIssue(
-                        severity="warning" if score < 50 else "info",
-                        category="diataxis",
-                        artifact="capability-charter.md",
-                        description=f"Diataxis: {issue}"
-                    ))
-
-        # Protocol-spec - Reference
-        protocol_path = sap_dir / "protocol-spec.md"
-        if protocol_path.exists():
-            content = protocol_path.read_text()
-            score = 100.0
-            protocol_issues = []
-
-            # Should have technical specifications
-            if not re.search(r'```|schema|interface|api|contract|guarantee', content, re.IGNORECASE):
-                protocol_issues.append("Missing technical specifications")
-                score -= 30
-
-            # Should NOT have tutorial patterns
-            if re.search(r"let's|we'll|you'll learn|follow these steps", content, re.IGNORECASE):
-                protocol_issues.append("Contains tutorial language (belongs in adoption-blueprint)")
-                score -= 25
-
-            # Should NOT have problem-solving patterns
-            if re.search(r'problem:.*solution:|if you need to|to solve this', content, re.IGNORECASE):
-                protocol_issues.append("Contains how-to content (belongs in awareness-guide)")
-                score -= 15
-
-            artifact_scores['protocol'] = max(0, score)
-            compliance['protocol-spec.md'] = {
-                'category': 'Reference',
-                'score': artifact_scores['protocol'],
-                'status': 'pass' if score >= 75 else ('partial' if score >= 50 else 'fail'),
-                'issues': protocol_issues
-            }
-
-            if score >= 75:
-                strengths.append("protocol-spec.md: Good Reference adherence (technical specs)")
-            elif protocol_issues:
-                for issue in protocol_issues:
-                    issues.append(QualityIssue(
-                        severity="warning" if score < 50 else "info",
-                        category="diataxis",
-                        artifact="protocol-spec.md",
-                        description=f"Diataxis: {issue}"
-                    ))
-
-        # Awareness-guide - How-To
-        awareness_path = sap_dir / "awareness-guide.md"
-        if awareness_path.exists():
-            content = awareness_path.read_text()
-            score = 100.0
-            awareness_issues = []
-
-            # Should be task-oriented (problem → solution)
-            if not re.search(r'problem|task|workflow|how to|common|scenario|use case', content, re.IGNORECASE):
-                awareness_issues.append("Missing task-oriented content")
-                score -= 25
-
-            # Should have concrete examples
-            if not re.search(r'```|example|instance|case', content, re.IGNORECASE):
-                awareness_issues.append("Missing concrete examples")
-                score -= 20
-
-            # Should NOT teach fundamentals step-by-step (belongs in tutorial)
-            if re.search(r"what you'll learn|learning objective|lesson \d", content, re.IGNORECASE):
-                awareness_issues.append("Contains tutorial content (belongs in adoption-blueprint)")
-                score -= 20
-
-            # Should have cross-domain references (2+ domains)
-            domain_count = 0
-            if re.search(r'dev-docs/', content): domain_count += 1
-            if re.search(r'project-docs/', content): domain_count += 1
-            if re.search(r'user-docs/', content): domain_count += 1
-            if re.search(r'skilled-awareness/', content): domain_count += 1
-
-            if domain_count < 2:
-                awareness_issues.append("Weak cross-domain references (should reference 2+ domains)")
-                score -= 15
-
-            artifact_scores['awareness'] = max(0, score)
-            compliance['awareness-guide.md'] = {
-                'category': 'How-To Guide',
-                'score': artifact_scores['awareness'],
-                'status': 'pass' if score >= 75 else ('partial' if score >= 50 else 'fail'),
-                'issues': awareness_issues
-            }
-
-            if score >= 75:
-                strengths.append("awareness-guide.md: Good How-To adherence (task-oriented)")
-            elif awareness_issues:
-                for issue in awareness_issues:
-                    issues.append(QualityIssue(
-                        severity="warning" if score < 50 else "info",
-                        category="diataxis",
-                        artifact="awareness-guide.md",
-                        description=f"Diataxis: {issue}"
-                    ))
-
-        # Adoption-blueprint - Tutorial
-        blueprint_path = sap_dir / "adoption-blueprint.md"
-        if blueprint_path.exists():
-            content = blueprint_path.read_text()
-            score = 100.0
-            blueprint_issues = []
-
-            # Should be learning-oriented
-            if not re.search(r'step|install|setup|prerequisite|getting started', content, re.IGNORECASE):
-                blueprint_issues.append("Missing learning journey structure")
-                score -= 25
-
-            # Should have sequential steps
-            if not re.search(r'step \d|^\d+\.|first|next|then|finally', content, re.MULTILINE | re.IGNORECASE):
-                blueprint_issues.append("Missing sequential steps")
-                score -= 20
-
-            # Should have validation/checkpoints
-            if not re.search(r'validat|verif|check|confirm|expect|should see', content, re.IGNORECASE):
-                blueprint_issues.append("Missing validation checkpoints")
-                score -= 15
-
-            # Should NOT be problem-focused (that's how-to)
-            if re.search(r'problem:.*solution:|troubleshoot|fix|debug', content, re.IGNORECASE):
-                blueprint_issues.append("Contains how-to content (problem-solving belongs in awareness-guide)")
-                score -= 15
-
-            # Should NOT have detailed API specs (that's reference)
-            if re.search(r'```(json|yaml) schema|interface definition|api specification', content, re.IGNORECASE):
-                blueprint_issues.append("Contains reference content (specs belong in protocol-spec)")
-                score -= 10
-
-            artifact_scores['blueprint'] = max(0, score)
-            compliance['adoption-blueprint.md'] = {
-                'category': 'Tutorial',
-                'score': artifact_scores['blueprint'],
-                'status': 'pass' if score >= 75 else ('partial' if score >= 50 else 'fail'),
-                'issues': blueprint_issues
-            }
-
-            if score >= 75:
-                strengths.append("adoption-blueprint.md: Good Tutorial adherence (learning journey)")
-            elif blueprint_issues:
-                for issue in blueprint_issues:
-                    issues.append(QualityIssue(
-                        severity="warning" if score < 50 else "info",
-                        category="diataxis",
-                        artifact="adoption-blueprint.md",
-                        description=f"Diataxis: {issue}"
-                    ))
-
-        # Ledger - Reference (simple check)
-        ledger_path = sap_dir / "ledger.md"
-        if ledger_path.exists():
-            content = ledger_path.read_text()
-            score = 100.0
-            ledger_issues = []
-
-            # Should be factual records
-            if re.search(r'version|date|adopter|status', content, re.IGNORECASE):
-                pass  # Good
-            else:
-                ledger_issues.append("Missing factual records (version, dates, adopters)")
-                score -= 30
-
-            # Should NOT have explanatory content
-            if re.search(r"let's|we'll|you should|why|rationale", content, re.IGNORECASE):
-                ledger_issues.append("Contains explanatory content (should be purely factual)")
-                score -= 20
-
-            artifact_scores['ledger'] = max(0, score)
-            compliance['ledger.md'] = {
-                'category': 'Reference',
-                'score': artifact_scores['ledger'],
-                'status': 'pass' if score >= 75 else ('partial' if score >= 50 else 'fail'),
-                'issues': ledger_issues
-            }
-
-            if score >= 75:
-                strengths.append("ledger.md: Good Reference adherence (factual records)")
-            elif ledger_issues:
-                for issue in ledger_issues:
-                    issues.append(QualityIssue(
-                        severity="info",
-                        category="diataxis",
-                        artifact="ledger.md",
-                        description=f"Diataxis: {issue}"
-                    ))
+        for filename, result in results.items():
+            diataxis = result["diataxis"]
+            entry = diataxis["compliance"]
+            compliance[filename] = {**entry, 'issues': list(entry['issues'])}
+            strengths.extend(diataxis["strengths"])
+            issues.extend(QualityIssue(**i) for i in diataxis["issues"])
 
         # Calculate overall Diataxis score
-        if artifact_scores:
-            overall_diataxis = sum(artifact_scores.values()) / len(artifact_scores)
+        if compliance:
+            overall_diataxis = sum(entry['score'] for entry in compliance.values()) / len(compliance)
         else:
             overall_diataxis = 0.0
 
@@ -755,18 +811,27 @@ def _create_missing_sap_report(self, sap_id: str, sap_name: str = "unknown") ->
 
 def main():
     """Analyze all non-React SAPs"""
+    parser = argparse.ArgumentParser(description="Analyze intrinsic SAP documentation quality")
+    parser.add_argument("--all", action="store_true",
+                        help="Analyze every SAP in the catalog (default: non-React SAPs)")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"Worker processes (1 = sequential, 0 = one per CPU core; default: {DEFAULT_JOBS})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-analyze every artifact instead of reusing cached results")
+    args = parser.parse_args()
+
     repo_root = Path(__file__).parent.parent
-    analyzer = SAPQualityAnalyzer(repo_root)
+    analyzer = SAPQualityAnalyzer(repo_root, use_cache=not args.no_cache)
 
-    # Non-React SAPs (SAP-000 through SAP-019, excluding SAP-015 reserved)
-    non_react_saps = [f"SAP-{i:03d}" for i in range(20) if i != 15]
+    if args.all:
+        sap_ids = list(analyzer.catalog)
+    else:
+        # Non-React SAPs (SAP-000 through SAP-019, excluding SAP-015 reserved)
+        sap_ids = [f"SAP-{i:03d}" for i in range(20) if i != 15]
 
-    reports = []
-    for sap_id in non_react_saps:
-        print(f"Analyzing {sap_id}...", end=" ")
-        report = analyzer.analyze_sap(sap_id)
-        reports.append(report)
-        print(f"Score: {report.overall_score:.1f}/100")
+    reports = analyzer.analyze_saps(sap_ids, jobs=args.jobs)
+    for report in reports:
+        print(f"Analyzing {report.sap_id}... Score: {report.overall_score:.1f}/100")
 
     # Output JSON
     output = {
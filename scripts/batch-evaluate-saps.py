@@ -5,8 +5,11 @@
 Runs deep dive evaluations on all SAPs and generates a comprehensive gap report.
 Focuses on awareness file coverage and strategic priorities.
 
+SAPs are evaluated concurrently; SAPs whose files are unchanged since the
+last run are served from the evaluation cache (.chora/cache/).
+
 Usage:
-    python scripts/batch-evaluate-saps.py [--output results.json]
+    python scripts/batch-evaluate-saps.py [--output results.json] [--jobs N] [--no-cache]
 """
 
 import argparse
@@ -19,7 +22,8 @@
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.sap_evaluation import SAPEvaluator
+from utils.sap_catalog import load_sap_catalog as load_catalog_file
+from utils.sap_evaluation import DEFAULT_JOBS, SAPEvaluator
 
 
 
@@ -36,15 +40,12 @@ def load_sap_catalog(repo_root: Path) -> List[Dict[str, Any]]:
         print(f"Error: SAP catalog not found at {catalog_path}")
         sys.exit(1)
 
-    with open(catalog_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    return data.get("saps", [])
+    return load_catalog_file(catalog_path).saps
 
 
-def evaluate_all_saps(repo_root: Path) -> Dict[str, Any]:
+def evaluate_all_saps(repo_root: Path, jobs: int = DEFAULT_JOBS, use_cache: bool = True) -> Dict[str, Any]:
     """Run deep dive evaluation on all SAPs"""
-    evaluator = SAPEvaluator(repo_root)
+    evaluator = SAPEvaluator(repo_root, jobs=jobs, use_cache=use_cache)
     catalog = load_sap_catalog(repo_root)
 
     results = {
@@ -68,17 +69,17 @@ def evaluate_all_saps(repo_root: Path) -> Dict[str, Any]:
         }
     }
 
-    for sap in catalog:
-        sap_id = sap.get("id", "")
-        location = sap.get("location", "")
+    saps = [sap for sap in catalog if sap.get("id", "") and sap.get("location", "")]
 
-        if not sap_id or not location:
-            continue
+    # Run deep dives concurrently
+    print(f"Evaluating {len(saps)} SAPs ({evaluator.jobs} workers)...\n", flush=True)
+    eval_results = evaluator.evaluate_many([sap["id"] for sap in saps], mode="deep")
 
-        print(f"Evaluating {sap_id}...", end=" ", flush=True)
+    for sap, eval_result in zip(saps, eval_results):
+        sap_id = sap["id"]
+        location = sap["location"]
 
-        # Run deep dive
-        eval_result = evaluator.deep_dive(sap_id)
+        print(f"Evaluating {sap_id}...", end=" ")
 
         # Check awareness files
         sap_dir = repo_root / location
@@ -216,6 +217,17 @@ def main():
         type=str,
         help="Output JSON file path (optional)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"SAPs evaluated concurrently (default: {DEFAULT_JOBS})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-evaluate every SAP instead of reusing cached results"
+    )
     args = parser.parse_args()
 
     # Determine repo root
@@ -226,7 +238,7 @@ def main():
     print(f"Starting batch evaluation...\n")
 
     # Run evaluations
-    results = evaluate_all_saps(repo_root)
+    results = evaluate_all_saps(repo_root, jobs=args.jobs, use_cache=not args.no_cache)
 
     # Print summary
     print_summary(results)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+benchmark-usage-tracking.py - Microbenchmark of @track_usage overhead
+
+Times a trivial function called bare, wrapped by the previous synchronous
+tracker (mkdir + open + append inside every call), and wrapped by the
+current buffered @track_usage (event queued, written by the background
+sink). Logs go to a temporary directory; the repository's usage log is
+not touched.
+
+Usage:
+    python scripts/benchmark-usage-tracking.py
+    python scripts/benchmark-usage-tracking.py --calls 20000 --repeat 5
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Dict
+
+# Windows UTF-8 console support (chora-base cross-platform requirement)
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import event_sink
+import usage_tracker
+
+
+def track_usage_sync(log_path: Path) -> Callable:
+    """The previous tracker: the log is opened and appended to inside the call."""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            script_name = Path(sys.argv[0]).name
+            start_time = datetime.now()
+            event = {
+                "event_id": f"script-{script_name}-{start_time.strftime('%Y%m%d-%H%M%S')}",
+                "timestamp": start_time.isoformat(),
+                "actor": "automation-script",
+                "action": f"script_invocation_{script_name}",
+                "metadata": {"script": script_name, "arguments": sys.argv[1:], "cwd": str(Path.cwd())},
+            }
+            result = func(*args, **kwargs)
+            event["outcome"] = "success"
+            event["duration_seconds"] = round((datetime.now() - start_time).total_seconds(), 2)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            with log_path.open("a") as f:
+                f.write(json.dumps(event) + "\n")
+            return result
+        return wrapper
+    return decorator
+
+
+def work() -> int:
+    return 42
+
+
+def time_calls(func: Callable, calls: int, repeat: int) -> float:
+    """Best-of-repeat microseconds per call."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e6
+
+
+def run_benchmark(calls: int, repeat: int) -> Dict[str, float]:
+    """Per-call microseconds for bare, synchronous and buffered tracking."""
+    with tempfile.TemporaryDirectory() as tmp:
+        sync_log = Path(tmp) / "sync" / "script-usage.jsonl"
+        buffered_log = Path(tmp) / "buffered" / "script-usage.jsonl"
+
+        original_path = usage_tracker.USAGE_LOG_PATH
+        usage_tracker.USAGE_LOG_PATH = buffered_log
+        try:
+            results = {
+                "bare": time_calls(work, calls, repeat),
+                "synchronous": time_calls(track_usage_sync(sync_log)(work), calls, repeat),
+                "buffered": time_calls(usage_tracker.track_usage(work), calls, repeat),
+            }
+            flush_start = time.perf_counter()
+            event_sink.flush()
+            results["final flush (ms)"] = (time.perf_counter() - flush_start) * 1e3
+        finally:
+            usage_tracker.USAGE_LOG_PATH = original_path
+
+        expected = calls * repeat
+        for log in (sync_log, buffered_log):
+            written = sum(1 for _ in log.open(encoding="utf-8"))
+            if written != expected:
+                raise RuntimeError(f"{log}: expected {expected} events, found {written}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark @track_usage overhead")
+    parser.add_argument("--calls", type=int, default=5000, help="Calls per timing run (default: 5000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs, best is reported (default: 3)")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.calls, args.repeat)
+    bare = results["bare"]
+
+    print(f"@track_usage overhead ({args.calls} calls, best of {args.repeat})")
+    print("=" * 60)
+    for name in ("bare", "synchronous", "buffered"):
+        overhead = results[name] - bare
+        print(f"  {name:<12} {results[name]:9.2f} µs/call   overhead {overhead:9.2f} µs")
+    print(f"  {'flush':<12} {results['final flush (ms)']:9.2f} ms (events still buffered at the end)")
+    speedup = (results["synchronous"] - bare) / max(results["buffered"] - bare, 1e-9)
+    print(f"\nBuffered tracking overhead is {speedup:.1f}x lower than synchronous appends")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
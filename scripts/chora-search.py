@@ -13,122 +13,44 @@
 """
 
 import argparse
-import difflib
-from dataclasses import dataclass
+import sys
 from pathlib import Path
 from typing import Optional
 
-
-
-
 # Configure UTF-8 output for Windows console compatibility
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
-@dataclass
-class GlossaryEntry:
-    """Represents a single glossary entry."""
+sys.path.insert(0, str(Path(__file__).parent))
 
-    term: str
-    definition: str
-    category: str
-    aliases: list[str]
-    related_terms: list[str]
-    sap_reference: Optional[str]
-    file_reference: Optional[str]
-    examples: list[str]
+from glossary_index import GlossaryEntry, GlossaryIndex
 
 
 class GlossarySearch:
     """Search and navigate chora-base ecosystem terminology."""
 
-    def __init__(self, glossary_file: Path):
-        """Initialize search with glossary database."""
+    def __init__(self, glossary_file: Path, cache_file: Optional[Path] = None,
+                 use_cache: bool = True):
+        """
+        Initialize search with glossary database.
+
+        Args:
+            glossary_file: Markdown glossary
+            cache_file: Compiled index (default: .chora/cache/glossary-index.json),
+                rebuilt when the glossary changes
+            use_cache: Read and write the compiled index
+        """
         self.glossary_file = glossary_file
-        self.entries = self._load_glossary()
+        self.index = self._load_index(cache_file, use_cache)
+        self.entries = self.index.entries
 
-    def _load_glossary(self) -> list[GlossaryEntry]:
-        """Load glossary from markdown file."""
+    def _load_index(self, cache_file: Optional[Path], use_cache: bool) -> GlossaryIndex:
+        """Load the compiled glossary index."""
         if not self.glossary_file.exists():
             print(f"⚠️  Glossary not found at {self.glossary_file}")
-            return []
-
-        with open(self.glossary_file, encoding='utf-8') as f:
-            content = f.read()
-
-        # Parse markdown glossary structure
-        entries = []
-        current_category = "General"
-
-        # Pattern: ## Category or ### Term
-        lines = content.split("\n")
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # Category header
-            if line.startswith("## ") and not line.startswith("###"):
-                current_category = line[3:].strip()
-                i += 1
-                continue
-
-            # Term entry
-            if line.startswith("### "):
-                term = line[4:].strip()
-                definition_lines = []
-                aliases = []
-                related = []
-                sap_ref = None
-                file_ref = None
-                examples = []
-
-                i += 1
-                # Collect definition and metadata
-                while i < len(lines) and not lines[i].startswith("###"):
-                    metadata_line = lines[i].strip()
-
-                    if metadata_line.startswith("**Aliases:**"):
-                        aliases = [
-                            a.strip()
-                            for a in metadata_line.split("**Aliases:**")[1].split(",")
-                        ]
-                    elif metadata_line.startswith("**Related:**"):
-                        related = [
-                            r.strip()
-                            for r in metadata_line.split("**Related:**")[1].split(",")
-                        ]
-                    elif metadata_line.startswith("**SAP:**"):
-                        sap_ref = metadata_line.split("**SAP:**")[1].strip()
-                    elif metadata_line.startswith("**File:**"):
-                        file_ref = metadata_line.split("**File:**")[1].strip()
-                    elif metadata_line.startswith("**Example:**"):
-                        examples.append(metadata_line.split("**Example:**")[1].strip())
-                    elif metadata_line and not metadata_line.startswith("**"):
-                        definition_lines.append(metadata_line)
-
-                    i += 1
-
-                definition = " ".join(definition_lines)
-
-                if definition:  # Only add if has definition
-                    entries.append(
-                        GlossaryEntry(
-                            term=term,
-                            definition=definition,
-                            category=current_category,
-                            aliases=aliases,
-                            related_terms=related,
-                            sap_reference=sap_ref,
-                            file_reference=file_ref,
-                            examples=examples,
-                        )
-                    )
-                continue
-
-            i += 1
-
-        return entries
+            return GlossaryIndex([])
+        return GlossaryIndex.load(self.glossary_file, cache_file, use_cache)
 
     def search(self, query: str, fuzzy: bool = False) -> list[tuple[GlossaryEntry, float]]:
         """
@@ -136,41 +58,8 @@ def search(self, query: str, fuzzy: bool = False) -> list[tuple[GlossaryEntry, f
 
         Returns list of (entry, relevance_score) tuples sorted by relevance.
         """
-        query_lower = query.lower()
-        results = []
-
-        for entry in self.entries:
-            score = 0.0
-
-            # Exact term match: 1.0
-            if entry.term.lower() == query_lower:
-                score = 1.0
-            # Exact alias match: 1.0
-            elif any(alias.lower() == query_lower for alias in entry.aliases):
-                score = 1.0
-            # Term contains query: 0.8
-            elif query_lower in entry.term.lower():
-                score = 0.8
-            # Alias contains query: 0.7
-            elif any(query_lower in alias.lower() for alias in entry.aliases):
-                score = 0.7
-            # Definition contains query: 0.6
-            elif query_lower in entry.definition.lower():
-                score = 0.6
-            # Fuzzy match on term: 0.4-0.6
-            elif fuzzy:
-                similarity = difflib.SequenceMatcher(
-                    None, query_lower, entry.term.lower()
-                ).ratio()
-                if similarity > 0.6:
-                    score = 0.4 + (similarity - 0.6) * 0.5
-
-            if score > 0:
-                results.append((entry, score))
-
-        # Sort by relevance descending
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results
+        return [(self.entries[entry_id], score)
+                for entry_id, score in self.index.search(query, fuzzy=fuzzy)]
 
     def reverse_search(self, description: str) -> list[tuple[GlossaryEntry, float]]:
         """
@@ -178,35 +67,8 @@ def reverse_search(self, description: str) -> list[tuple[GlossaryEntry, float]]:
 
         Example: "I want to suggest a big change" → "Strategic Proposal"
         """
-        desc_lower = description.lower()
-        results = []
-
-        for entry in self.entries:
-            score = 0.0
-
-            # Check if description matches definition
-            desc_words = set(desc_lower.split())
-            def_words = set(entry.definition.lower().split())
-
-            # Calculate word overlap
-            overlap = len(desc_words & def_words)
-            if len(desc_words) > 0:
-                overlap_ratio = overlap / len(desc_words)
-                score = overlap_ratio
-
-            # Boost if examples match
-            for example in entry.examples:
-                example_words = set(example.lower().split())
-                example_overlap = len(desc_words & example_words)
-                if len(desc_words) > 0:
-                    example_ratio = example_overlap / len(desc_words)
-                    score = max(score, example_ratio * 1.2)  # Boost examples
-
-            if score > 0.2:  # Threshold for reverse search
-                results.append((entry, score))
-
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results
+        return [(self.entries[entry_id], score)
+                for entry_id, score in self.index.reverse_search(description)]
 
     def get_related(self, term: str) -> list[GlossaryEntry]:
         """Find terms related to given term."""
@@ -304,11 +166,16 @@ def main():
         action="store_true",
         help="List all categories",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse the glossary instead of using the compiled index",
+    )
 
     args = parser.parse_args()
 
     # Create search instance
-    search = GlossarySearch(args.glossary)
+    search = GlossarySearch(args.glossary, use_cache=not args.no_cache)
 
     if not search.entries:
         print("❌ No glossary entries loaded")
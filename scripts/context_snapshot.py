@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Cached, concurrently collected project context signals.
+
+suggest-next derives its suggestions from signals that range from cheap
+(inbox directory listings) to slow (pytest, ruff and mypy runs). This module
+keeps the last value of each signal in .chora/cache/suggest-context.json and
+re-collects a signal only when it is stale:
+
+- its TTL has expired, or
+- a file it depends on changed (inputs are fingerprinted by mtime/size)
+
+Stale signals are collected concurrently. Signals that share a group run
+one after another in the same worker (e.g. two pytest runs that must not
+overlap). A collector that runs past its timeout is abandoned and the
+signal falls back to its last cached value (or default).
+
+Usage:
+    from context_snapshot import ContextSignal, ContextSnapshot
+
+    snapshot = ContextSnapshot(project_root, [
+        ContextSignal("active_work", list_active_work, ttl=3600, inputs=("inbox/active",)),
+        ContextSignal("lint_clean", run_ruff, ttl=600, inputs=("src",), default=False),
+    ])
+    values = snapshot.collect()        # {"active_work": [...], "lint_clean": True}
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# utils/ lives at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.evaluation_cache import fingerprint_paths
+
+SNAPSHOT_VERSION = 1
+
+# Default cache location, relative to the project root
+CACHE_PATH = Path(".chora") / "cache" / "suggest-context.json"
+
+# Concurrent collector groups
+DEFAULT_JOBS = 4
+
+# Seconds a collector may run before its signal falls back
+DEFAULT_TIMEOUT = 120.0
+
+
+class SignalUnavailable(Exception):
+    """Raised by a collector when a signal can't be measured right now.
+
+    The last cached value (or the signal's default) is used instead, and
+    nothing is cached.
+    """
+
+
+@dataclass
+class ContextSignal:
+    """A named piece of project context and how to collect it."""
+
+    name: str
+    collect: Callable[[], Any]
+    ttl: float                      # Seconds a collected value stays fresh
+    inputs: Tuple[str, ...] = ()    # Files/directories (relative) that invalidate it
+    group: Optional[str] = None     # Signals in the same group never run concurrently
+    default: Any = None             # Value when unavailable and never collected
+    timeout: Optional[float] = None  # Seconds before falling back (default: snapshot's)
+
+
+class ContextSnapshot:
+    """Signal values cached on disk with TTL and file-change invalidation."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        signals: Iterable[ContextSignal],
+        cache_file: Optional[Path] = None,
+        jobs: int = DEFAULT_JOBS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """
+        Initialize snapshot.
+
+        Args:
+            project_root: Root that signal inputs are relative to
+            signals: Signals this snapshot serves
+            cache_file: Persisted values (default: .chora/cache/suggest-context.json)
+            jobs: Maximum collector groups run concurrently
+            timeout: Seconds a collector may run unless its signal sets one
+        """
+        self.project_root = project_root
+        self.signals: Dict[str, ContextSignal] = {signal.name: signal for signal in signals}
+        self.cache_file = cache_file or project_root / CACHE_PATH
+        self.jobs = max(1, jobs)
+        self.timeout = timeout
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+        self.collected: List[str] = []  # Signals re-collected by the last collect()
+        self.timed_out: List[str] = []  # Signals abandoned by the last collect()
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load persisted signal values, if compatible."""
+        try:
+            with open(self.cache_file, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(state, dict) or state.get("version") != SNAPSHOT_VERSION:
+            return {}
+        return state.get("signals", {})
+
+    def _save(self):
+        """Persist signal values atomically (best effort; read-only checkouts still work)."""
+        state = {"version": SNAPSHOT_VERSION, "signals": self.entries}
+        tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, separators=(',', ':'), default=str)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass
+
+    def fingerprint(self, signal: ContextSignal) -> str:
+        """Fingerprint of a signal's input files."""
+        return fingerprint_paths(self.project_root, signal.inputs) if signal.inputs else ""
+
+    def is_fresh(self, name: str, fingerprint: Optional[str] = None) -> bool:
+        """Whether the cached value of a signal can be used as is."""
+        entry = self.entries.get(name)
+        if entry is None:
+            return False
+        signal = self.signals[name]
+        if time.time() - entry.get("collected_at", 0) >= signal.ttl:
+            return False
+        if fingerprint is None:
+            fingerprint = self.fingerprint(signal)
+        return entry.get("fingerprint") == fingerprint
+
+    def _cached_or_default(self, name: str) -> Any:
+        entry = self.entries.get(name)
+        return entry["value"] if entry else self.signals[name].default
+
+    @staticmethod
+    def _start(signal: ContextSignal) -> Future:
+        """Run a collector in a daemon thread so a hung one can't block exit."""
+        future: Future = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(signal.collect())
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name=f"collect-{signal.name}", daemon=True).start()
+        return future
+
+    def _run_group(self, items: List[Tuple[ContextSignal, str]]) -> Dict[str, Any]:
+        """
+        Collect a group's signals in order, caching each value.
+
+        Once a collector times out it may still be running, so the rest of
+        the group falls back too rather than overlapping with it.
+        """
+        values = {}
+        abandoned = False
+        for signal, fingerprint in items:
+            if abandoned:
+                with self._lock:
+                    values[signal.name] = self._cached_or_default(signal.name)
+                continue
+            timeout = signal.timeout if signal.timeout is not None else self.timeout
+            try:
+                value = self._start(signal).result(timeout=timeout)
+            except SignalUnavailable:
+                with self._lock:
+                    values[signal.name] = self._cached_or_default(signal.name)
+                continue
+            except FutureTimeout:
+                abandoned = True
+                with self._lock:
+                    values[signal.name] = self._cached_or_default(signal.name)
+                    self.timed_out.append(signal.name)
+                continue
+            values[signal.name] = value
+            with self._lock:
+                self.entries[signal.name] = {
+                    "value": value,
+                    "collected_at": time.time(),
+                    "fingerprint": fingerprint,
+                }
+                self.collected.append(signal.name)
+        return values
+
+    def collect(self, names: Optional[Iterable[str]] = None, allow_stale: bool = False) -> Dict[str, Any]:
+        """
+        Current values of signals, re-collecting stale ones concurrently.
+
+        Args:
+            names: Signals to return (default: all)
+            allow_stale: Use any cached value regardless of TTL and inputs;
+                only signals never collected are run
+
+        Returns:
+            signal name -> value
+        """
+        names = list(self.signals) if names is None else list(names)
+        self.collected = []
+        self.timed_out = []
+        values: Dict[str, Any] = {}
+        groups: Dict[str, List[Tuple[ContextSignal, str]]] = {}
+
+        for name in names:
+            signal = self.signals[name]
+            if allow_stale and name in self.entries:
+                values[name] = self.entries[name]["value"]
+                continue
+            fingerprint = self.fingerprint(signal)
+            if self.is_fresh(name, fingerprint):
+                values[name] = self.entries[name]["value"]
+                continue
+            groups.setdefault(signal.group or name, []).append((signal, fingerprint))
+
+        if not groups:
+            return values
+
+        workers = min(self.jobs, len(groups))
+        if workers == 1:
+            for items in groups.values():
+                values.update(self._run_group(items))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for group_values in pool.map(self._run_group, groups.values()):
+                    values.update(group_values)
+
+        if self.collected:
+            self._save()
+        return values
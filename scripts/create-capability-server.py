@@ -50,19 +50,39 @@
         --github alice-smith \\
         --output ~/projects/task-manager
 
+    # Batch: one server per manifest entry (JSON or YAML list of option dicts)
+    python scripts/create-capability-server.py --manifest servers.json --jobs 8
+
+PIPELINE:
+Independent phases run concurrently and each server reports per-phase timings:
+
+    directories ─┬─ templates (rendered + written on a thread pool) ──┬─ git ──────┬─ validation
+                 └─ static files ─ beads ─ inbox ─ memory ────────────┴─ py checks ┘
+
+Generated Python files are checked (unsubstituted variables, syntax) on a
+process pool. Phase output is buffered and printed in the order above, so
+logs read the same as a sequential run.
+
 NOTE: This replaces the legacy SAP-014 (mcp-server-development) approach.
       For capability servers, always use SAP-047 patterns (this script).
 """
 
 import argparse
+import functools
+import io
 import json
 import re
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Configure UTF-8 output for Windows console compatibility
 if sys.platform == 'win32':
@@ -111,6 +131,23 @@
     "include_docker": True,  # Docker deployment
 }
 
+# Threads rendering templates, processes checking generated Python, and
+# servers built at once from a manifest
+DEFAULT_JOBS = 4
+
+# Phases in the order their output is printed
+PHASE_ORDER = [
+    "directories",
+    "static files",
+    "templates",
+    "beads",
+    "inbox",
+    "memory",
+    "git",
+    "python checks",
+    "validation",
+]
+
 DECISION_PROFILES = {
     "minimal": {
         "description": "CLI + REST only, no optional features",
@@ -368,20 +405,25 @@ def copy_static_template(chora_base_dir: Path, output_dir: Path, config: Dict[st
 # TEMPLATE RENDERING
 # ============================================================================
 
-def render_templates(chora_base_dir: Path, output_dir: Path, variables: Dict[str, Any]) -> None:
-    """Render all Jinja2 templates with provided variables."""
-    template_dir = chora_base_dir / "static-template" / "capability-server-templates"
+def get_template_dir(chora_base_dir: Path) -> Path:
+    """Directory holding the capability server templates."""
+    return chora_base_dir / "static-template" / "capability-server-templates"
 
-    if not template_dir.exists():
-        print(f"❌ Error: Template directory not found: {template_dir}")
-        sys.exit(1)
 
-    # Set up Jinja2 environment
-    env = Environment(
+def create_template_environment(template_dir: Path) -> Environment:
+    """Jinja2 environment for the capability server templates.
+
+    Compiled templates are cached on the environment, so one environment
+    serves every server generated by a run (rendering is thread-safe).
+    """
+    return Environment(
         loader=FileSystemLoader(str(template_dir)),
         undefined=StrictUndefined,  # Fail on undefined variables
     )
 
+
+def get_template_mappings(variables: Dict[str, Any]) -> Dict[str, str]:
+    """Templates to render for a project: template_name -> output_path."""
     package_name = variables['package_name']
 
     # Template mapping: template_name -> output_path
@@ -505,6 +547,13 @@ def render_templates(chora_base_dir: Path, output_dir: Path, variables: Dict[str
             ".github/dependabot.yml.template": ".github/dependabot.yml",
         })
 
+    return template_mappings
+
+
+def get_init_files(variables: Dict[str, Any]) -> Dict[str, str]:
+    """Package __init__.py files written directly: file_path -> content."""
+    package_name = variables['package_name']
+
     # ========================================================================
     # Package __init__.py files (simple content, no templates needed)
     # ========================================================================
@@ -519,34 +568,82 @@ def render_templates(chora_base_dir: Path, output_dir: Path, variables: Dict[str
     if any([variables.get('enable_registry'), variables.get('enable_bootstrap'), variables.get('enable_composition')]):
         init_files["tests/infrastructure/__init__.py"] = '"""Infrastructure tests."""\n'
 
+    return init_files
+
+
+def _render_template_file(env: Environment, template_name: str, output_file: Path,
+                          variables: Dict[str, Any]) -> str:
+    """Render one template and write it (thread pool work unit)."""
+    output = env.get_template(template_name).render(**variables)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_text(output, encoding='utf-8')
+    return output
+
+
+def render_templates(chora_base_dir: Path, output_dir: Path, variables: Dict[str, Any],
+                     executor: Optional[ThreadPoolExecutor] = None,
+                     env: Optional[Environment] = None) -> None:
+    """Render all Jinja2 templates with provided variables.
+
+    Args:
+        chora_base_dir: chora-base checkout holding the templates
+        output_dir: Project directory
+        variables: Template variables
+        executor: Thread pool to render and write templates on (default: sequential)
+        env: Shared template environment (default: a new one)
+    """
+    template_dir = get_template_dir(chora_base_dir)
+
+    if not template_dir.exists():
+        print(f"❌ Error: Template directory not found: {template_dir}")
+        sys.exit(1)
+
+    # Set up Jinja2 environment
+    if env is None:
+        env = create_template_environment(template_dir)
+
+    template_mappings = get_template_mappings(variables)
+    init_files = get_init_files(variables)
+
     # ========================================================================
     # Render all templates
     # ========================================================================
     print(f"\nRendering templates ({len(template_mappings)} files)...")
+    templates = sorted(template_mappings.items())
+    futures = []
+    if executor is None:
+        # Rendered one at a time as results are reported
+        renders = [
+            functools.partial(_render_template_file, env, name, output_dir / path, variables)
+            for name, path in templates
+        ]
+    else:
+        futures = [
+            executor.submit(_render_template_file, env, name, output_dir / path, variables)
+            for name, path in templates
+        ]
+        renders = [future.result for future in futures]
+
+    # Report in sorted order (stopping at the first failure, like a sequential run)
     rendered_count = 0
-    for template_name, output_path in sorted(template_mappings.items()):
+    for (template_name, output_path), render in zip(templates, renders):
         try:
-            template = env.get_template(template_name)
-            output = template.render(**variables)
-
-            # Write rendered content
-            output_file = output_dir / output_path
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            output_file.write_text(output, encoding='utf-8')
-
-            # Check for unsubstituted variables
-            if '{{' in output or '}}' in output:
-                print(f"  ⚠️  {output_path} - Warning: Unsubstituted variables found")
-            else:
-                rendered_count += 1
-                print(f"  ✓ Rendered {output_path}")
-
+            output = render()
         except Exception as e:
             print(f"  ❌ Error rendering {template_name}: {e}")
             import traceback
             traceback.print_exc()
+            for future in futures:
+                future.cancel()
             sys.exit(1)
 
+        # Check for unsubstituted variables
+        if '{{' in output or '}}' in output:
+            print(f"  ⚠️  {output_path} - Warning: Unsubstituted variables found")
+        else:
+            rendered_count += 1
+            print(f"  ✓ Rendered {output_path}")
+
     # Write __init__.py files
     print(f"\nCreating __init__.py files ({len(init_files)} files)...")
     for file_path, content in sorted(init_files.items()):
@@ -824,8 +921,70 @@ def initialize_git(output_dir: Path, variables: Dict[str, Any]) -> None:
 # VALIDATION
 # ============================================================================
 
-def validate_generated_project(output_dir: Path, variables: Dict[str, Any]) -> bool:
-    """Validate the generated project meets capability server requirements (SAP-047)."""
+@dataclass
+class PythonCheckResult:
+    """Findings from checking a project's generated Python files."""
+    unsubstituted_files: List[str] = field(default_factory=list)
+    syntax_errors: List[str] = field(default_factory=list)  # "path:line: message"
+
+
+def _check_python_chunk(output_dir: str, relative_paths: List[str]) -> List[Tuple[str, bool, Optional[str]]]:
+    """Check a chunk of generated Python files (process pool work unit).
+
+    Returns:
+        (relative path, has unsubstituted variables, syntax error or None) per file
+    """
+    results = []
+    for relative_path in relative_paths:
+        content = (Path(output_dir) / relative_path).read_text(encoding='utf-8')
+        # Check for {{ }} but exclude Jinja2 raw blocks and comments
+        unsubstituted = ('{{' in content or '}}' in content) and 'Jinja2' not in content
+        try:
+            compile(content, relative_path, 'exec', dont_inherit=True)
+            error = None
+        except SyntaxError as e:
+            error = f"{relative_path}:{e.lineno}: {e.msg}"
+        results.append((relative_path, unsubstituted, error))
+    return results
+
+
+def check_generated_python(output_dir: Path, executor: Optional[ProcessPoolExecutor] = None,
+                           jobs: int = 1) -> PythonCheckResult:
+    """Check every generated .py file for unsubstituted variables and syntax errors.
+
+    Args:
+        output_dir: Project directory
+        executor: Process pool to check files on (default: in this process)
+        jobs: Workers in the pool (files are split into several chunks per worker)
+    """
+    relative_paths = [str(path.relative_to(output_dir)) for path in output_dir.rglob("*.py")]
+
+    if executor is None or len(relative_paths) < 2:
+        chunk_results = [_check_python_chunk(str(output_dir), relative_paths)]
+    else:
+        chunk_size = max(1, len(relative_paths) // (max(1, jobs) * 4))
+        chunks = [relative_paths[i:i + chunk_size] for i in range(0, len(relative_paths), chunk_size)]
+        chunk_results = executor.map(_check_python_chunk, [str(output_dir)] * len(chunks), chunks)
+
+    result = PythonCheckResult()
+    for chunk in chunk_results:
+        for relative_path, unsubstituted, error in chunk:
+            if unsubstituted:
+                result.unsubstituted_files.append(relative_path)
+            if error:
+                result.syntax_errors.append(error)
+    return result
+
+
+def validate_generated_project(output_dir: Path, variables: Dict[str, Any],
+                               python_checks: Optional[PythonCheckResult] = None) -> bool:
+    """Validate the generated project meets capability server requirements (SAP-047).
+
+    Args:
+        output_dir: Project directory
+        variables: Template variables
+        python_checks: check_generated_python() result (default: checked here)
+    """
     print("\nValidating generated project...")
 
     checks = []
@@ -922,13 +1081,11 @@ def validate_generated_project(output_dir: Path, variables: Dict[str, Any]) -> b
     # ========================================================================
     # Template Variable Substitution Check
     # ========================================================================
-    unsubstituted_files = []
-    for py_file in output_dir.rglob("*.py"):
-        content = py_file.read_text(encoding='utf-8')
-        # Check for {{ }} but exclude Jinja2 raw blocks and comments
-        if ('{{' in content or '}}' in content) and 'Jinja2' not in content:
-            unsubstituted_files.append(str(py_file.relative_to(output_dir)))
+    if python_checks is None:
+        python_checks = check_generated_python(output_dir)
+    unsubstituted_files = python_checks.unsubstituted_files
     checks.append(("No unsubstituted variables", len(unsubstituted_files) == 0))
+    checks.append(("Generated Python compiles", len(python_checks.syntax_errors) == 0))
 
     # ========================================================================
     # Print Results
@@ -945,14 +1102,251 @@ def validate_generated_project(output_dir: Path, variables: Dict[str, Any]) -> b
         for file_path in unsubstituted_files:
             print(f"     - {file_path}")
 
+    if python_checks.syntax_errors:
+        print("\n  ⚠️  Files with syntax errors:")
+        for error in python_checks.syntax_errors:
+            print(f"     - {error}")
+
     return all_passed
 
 
+# ============================================================================
+# PIPELINED SCAFFOLDING
+# ============================================================================
+
+class _OutputRouter(io.TextIOBase):
+    """sys.stdout stand-in that sends a capturing thread's prints to its own buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self.stream).write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    @contextmanager
+    def capture(self):
+        """Buffer everything this thread prints inside the block."""
+        previous = getattr(self._local, 'buffer', None)
+        self._local.buffer = io.StringIO()
+        try:
+            yield self._local.buffer
+        finally:
+            self._local.buffer = previous
+
+
+@dataclass
+class PhaseResult:
+    """Outcome of one scaffolding phase."""
+    name: str
+    seconds: float
+    output: str = ""
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class ScaffoldResult:
+    """Outcome of scaffolding one capability server."""
+    output_dir: Path
+    timings: Dict[str, float]
+    total_seconds: float
+    validation_passed: Optional[bool] = None  # None when validation was skipped
+
+
+class ScaffoldEngine:
+    """Pipelined scaffolding of one or more capability servers.
+
+    Phases of a server start as soon as their inputs exist (see PIPELINE in
+    the module docstring). Template rendering and the generated-Python
+    checks share one thread pool and one process pool across every server
+    the engine creates. Each phase's output is buffered and printed in
+    PHASE_ORDER when the server is done.
+
+    Usage:
+        with ScaffoldEngine(chora_base_dir, jobs=8) as engine:
+            result = engine.create(output_dir, variables)
+    """
+
+    def __init__(self, chora_base_dir: Path, jobs: int = DEFAULT_JOBS):
+        self.chora_base_dir = chora_base_dir
+        self.jobs = max(1, jobs)
+        self.env = create_template_environment(get_template_dir(chora_base_dir))
+        self._render_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._router: Optional[_OutputRouter] = None
+
+    def __enter__(self):
+        if isinstance(sys.stdout, _OutputRouter):
+            self._router = sys.stdout
+        else:
+            self._router = _OutputRouter(sys.stdout)
+            sys.stdout = self._router
+        if self.jobs > 1:
+            # Start the worker processes now, before any thread exists: a
+            # process forked while another thread holds a lock can deadlock
+            self._process_pool = ProcessPoolExecutor(max_workers=self.jobs)
+            self._process_pool.submit(int).result()
+            self._render_pool = ThreadPoolExecutor(max_workers=self.jobs)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self) -> None:
+        if self._render_pool is not None:
+            self._render_pool.shutdown()
+            self._render_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+        if self._router is not None and sys.stdout is self._router:
+            sys.stdout = self._router.stream
+        self._router = None
+
+    @contextmanager
+    def capture(self):
+        """Buffer this thread's prints (see _OutputRouter.capture)."""
+        with self._router.capture() as buffer:
+            yield buffer
+
+    def _run_phase(self, name: str, func: Callable, *args, **kwargs) -> PhaseResult:
+        """Run a phase in this thread, buffering its output."""
+        start = time.perf_counter()
+        with self.capture() as buffer:
+            try:
+                value = func(*args, **kwargs)
+                error = None
+            except BaseException as e:  # Includes sys.exit() from a failed phase
+                value, error = None, e
+        return PhaseResult(name, time.perf_counter() - start, buffer.getvalue(), value, error)
+
+    def _run_chain(self, phases: List[Tuple[str, Callable, tuple]]) -> List[PhaseResult]:
+        """Run phases one after another, stopping at the first failure."""
+        results = []
+        for name, func, args in phases:
+            results.append(self._run_phase(name, func, *args))
+            if results[-1].error is not None:
+                break
+        return results
+
+    def create(self, output_dir: Path, variables: Dict[str, Any],
+               skip_git: bool = False, skip_validation: bool = False) -> ScaffoldResult:
+        """Scaffold a capability server into output_dir (which must not exist).
+
+        Raises:
+            The first phase failure (e.g. SystemExit from a template error),
+            after printing the output of every phase that ran
+        """
+        start = time.perf_counter()
+        package_name = variables['package_name']
+        results: Dict[str, PhaseResult] = {}
+
+        def create_directories():
+            print(f"📁 Creating project at: {output_dir}")
+            output_dir.mkdir(parents=True, exist_ok=True)
+            print("\n📂 Creating directory structure...")
+            create_directory_structure(output_dir, package_name, variables)
+
+        def copy_static():
+            print("\n📋 Copying static files...")
+            copy_static_template(self.chora_base_dir, output_dir, variables)
+
+        results["directories"] = self._run_phase("directories", create_directories)
+        try:
+            if results["directories"].error is None:
+                # Static files and SAP initialization write .beads/, .chora/ and
+                # inbox/, disjoint from the rendered templates
+                file_phases = [("static files", copy_static, ())]
+                for name, key, func in (
+                    ("beads", "include_beads", initialize_beads),
+                    ("inbox", "include_inbox", initialize_inbox),
+                    ("memory", "include_memory", initialize_memory),
+                ):
+                    if variables.get(key):
+                        file_phases.append((name, func, (output_dir, variables)))
+
+                with ThreadPoolExecutor(max_workers=2) as phase_pool:
+                    chain = phase_pool.submit(self._run_chain, file_phases)
+                    results["templates"] = self._run_phase(
+                        "templates", render_templates, self.chora_base_dir, output_dir, variables,
+                        executor=self._render_pool, env=self.env
+                    )
+                    for result in chain.result():
+                        results[result.name] = result
+                    self._raise_first_error(results)
+
+                    # git only reads the tree, so the Python checks overlap it
+                    checks = None
+                    if not skip_validation:
+                        checks = phase_pool.submit(
+                            self._run_phase, "python checks", check_generated_python,
+                            output_dir, self._process_pool, self.jobs
+                        )
+                    if not skip_git:
+                        results["git"] = self._run_phase("git", initialize_git, output_dir, variables)
+                    if checks is not None:
+                        results["python checks"] = checks.result()
+                        self._raise_first_error(results)
+                        results["validation"] = self._run_phase(
+                            "validation", validate_generated_project, output_dir, variables,
+                            results["python checks"].value
+                        )
+            self._raise_first_error(results)
+        finally:
+            for name in PHASE_ORDER:
+                if name in results:
+                    sys.stdout.write(results[name].output)
+
+        validation = results.get("validation")
+        return ScaffoldResult(
+            output_dir=output_dir,
+            timings={name: results[name].seconds for name in PHASE_ORDER if name in results},
+            total_seconds=time.perf_counter() - start,
+            validation_passed=validation.value if validation else None,
+        )
+
+    @staticmethod
+    def _raise_first_error(results: Dict[str, PhaseResult]) -> None:
+        for name in PHASE_ORDER:
+            if name in results and results[name].error is not None:
+                raise results[name].error
+
+
+def print_phase_timings(result: ScaffoldResult) -> None:
+    """Print how long each phase of a server took."""
+    print("\n⏱️  Phase timings:")
+    for name, seconds in result.timings.items():
+        print(f"   {name:<15} {seconds * 1000:8.1f} ms")
+    print(f"   {'total':<15} {result.total_seconds * 1000:8.1f} ms  (phases overlap)")
+
+
 # ============================================================================
 # MAIN SCRIPT
 # ============================================================================
 
-def main():
+@functools.lru_cache(maxsize=None)
+def git_config(key: str) -> str:
+    """Value of a git config key (looked up once per run).
+
+    Raises:
+        subprocess.CalledProcessError: If the key is not set
+    """
+    result = subprocess.run(
+        ["git", "config", key],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line options (also used to parse manifest entries)."""
     parser = argparse.ArgumentParser(
         description="Create a capability server with multi-interface support (SAP-047)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -962,16 +1356,29 @@ def main():
     # Required arguments
     parser.add_argument(
         "--name",
-        required=True,
         help="Capability name (e.g., 'Task Manager', 'Weather Service')",
     )
     parser.add_argument(
         "--output",
-        required=True,
         type=Path,
         help="Output directory for the new project",
     )
 
+    # Batch generation
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="Create one server per entry of a JSON/YAML list of option dicts "
+             "(e.g. {\"name\": \"Task Manager\", \"output\": \"out/tasks\", \"enable_mcp\": true})",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Threads rendering templates, processes checking generated Python and "
+             f"servers built at once from a manifest (default: {DEFAULT_JOBS}, 1 = sequential)",
+    )
+
     # Namespace (used for MCP if enabled, also for CLI/API naming)
     parser.add_argument(
         "--namespace",
@@ -1064,28 +1471,17 @@ def main():
         action="store_true",
         help="Skip git initialization",
     )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print per-phase timings",
+    )
 
-    args = parser.parse_args()
-
-    # Print header
-    print("=" * 80)
-    print(f"Create Capability Server v{VERSION} (SAP-047)")
-    print(f"Chora-Base v{CHORA_BASE_VERSION}")
-    print("=" * 80)
-    print()
-
-    # Validate chora-base directory
-    if not args.chora_base_dir.exists():
-        print(f"❌ Error: chora-base directory not found: {args.chora_base_dir}")
-        sys.exit(1)
+    return parser
 
-    template_dir = args.chora_base_dir / "static-template" / "capability-server-templates"
-    if not template_dir.exists():
-        print(f"❌ Error: Template directory not found: {template_dir}")
-        print("   Make sure you're running from chora-base directory")
-        print("   Expected: static-template/capability-server-templates/")
-        sys.exit(1)
 
+def resolve_variables(args: argparse.Namespace) -> Dict[str, Any]:
+    """Template variables for a server from its options (exits on invalid input)."""
     # Load decision profile
     profile_config = DEFAULT_CONFIG.copy()
     if args.profile in DECISION_PROFILES:
@@ -1132,13 +1528,7 @@ def main():
 
     if not author_name:
         try:
-            result = subprocess.run(
-                ["git", "config", "user.name"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            author_name = result.stdout.strip()
+            author_name = git_config("user.name")
             print(f"   Auto-detected author: {author_name} (from git config)")
         except subprocess.CalledProcessError:
             print("❌ Error: --author required (git config user.name not set)")
@@ -1146,13 +1536,7 @@ def main():
 
     if not author_email:
         try:
-            result = subprocess.run(
-                ["git", "config", "user.email"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            author_email = result.stdout.strip()
+            author_email = git_config("user.email")
             print(f"   Auto-detected email: {author_email} (from git config)")
         except subprocess.CalledProcessError:
             print("❌ Error: --email required (git config user.email not set)")
@@ -1168,13 +1552,7 @@ def main():
     if not github_username:
         # Try to derive from git remote
         try:
-            result = subprocess.run(
-                ["git", "config", "remote.origin.url"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            remote_url = result.stdout.strip()
+            remote_url = git_config("remote.origin.url")
             # Extract username from git@github.com:username/repo.git or https://github.com/username/repo.git
             match = re.search(r'github\.com[:/]([^/]+)', remote_url)
             if match:
@@ -1220,6 +1598,11 @@ def main():
         "current_date": datetime.now().strftime("%Y-%m-%d"),
     }
 
+    return variables
+
+
+def print_configuration(variables: Dict[str, Any], profile: str) -> None:
+    """Print the project configuration summary."""
     # Print summary
     print("\n📦 Project Configuration")
     print("─" * 80)
@@ -1231,7 +1614,7 @@ def main():
     print(f"  GitHub:           {variables['github_username']}")
     print(f"  Python Version:   {variables['python_version']}")
     print(f"  License:          {variables['license']}")
-    print(f"  Profile:          {args.profile}")
+    print(f"  Profile:          {profile}")
     print()
     print("  Interfaces:")
     print("    ✅ CLI (Click)")
@@ -1251,59 +1634,22 @@ def main():
     print("─" * 80)
     print()
 
-    # Check if output directory exists
-    if args.output.exists():
-        print(f"❌ Error: Output directory already exists: {args.output}")
-        print("   Choose a different location or remove the existing directory")
-        sys.exit(1)
-
-    # Create output directory
-    print(f"📁 Creating project at: {args.output}")
-    args.output.mkdir(parents=True, exist_ok=True)
 
-    # Create directory structure
-    print("\n📂 Creating directory structure...")
-    create_directory_structure(args.output, package_name, variables)
-
-    # Copy static template files
-    print("\n📋 Copying static files...")
-    copy_static_template(args.chora_base_dir, args.output, variables)
-
-    # Render Jinja2 templates
-    render_templates(args.chora_base_dir, args.output, variables)
-
-    # Initialize SAPs
-    if variables.get('include_beads'):
-        initialize_beads(args.output, variables)
-
-    if variables.get('include_inbox'):
-        initialize_inbox(args.output, variables)
-
-    if variables.get('include_memory'):
-        initialize_memory(args.output, variables)
-
-    # Initialize git
-    if not args.skip_git:
-        initialize_git(args.output, variables)
-
-    # Validate generated project
-    if not args.skip_validation:
-        validation_passed = validate_generated_project(args.output, variables)
-        if not validation_passed:
-            print("\n⚠️  Some validation checks failed (see above)")
-            print("   Project generated but may need manual fixes")
+def print_next_steps(output_dir: Path, variables: Dict[str, Any]) -> None:
+    """Print the success message and next steps."""
+    package_name = variables['package_name']
 
     # Print success message
     print("\n" + "=" * 80)
     print("✅ Capability Server Created Successfully!")
     print("=" * 80)
     print()
-    print(f"📁 Location: {args.output.absolute()}")
+    print(f"📁 Location: {output_dir.absolute()}")
     print()
     print("📝 Next Steps:")
     print()
     print("1. Navigate to project:")
-    print(f"   cd {args.output}")
+    print(f"   cd {output_dir}")
     print()
     print("2. Create virtual environment:")
     print("   python -m venv venv")
@@ -1335,7 +1681,7 @@ def main():
           "{variables['namespace']}": {{
             "command": "python",
             "args": ["-m", "{package_name}.interfaces.mcp"],
-            "cwd": "{args.output.absolute()}"
+            "cwd": "{output_dir.absolute()}"
           }}
         }}
       }}
@@ -1351,11 +1697,11 @@ def main():
         print()
 
     print("📚 Documentation:")
-    print(f"   README:        {args.output}/README.md")
-    print(f"   AGENTS.md:     {args.output}/AGENTS.md")
-    print(f"   CLI.md:        {args.output}/CLI.md")
-    print(f"   API.md:        {args.output}/API.md")
-    print(f"   ARCHITECTURE:  {args.output}/ARCHITECTURE.md")
+    print(f"   README:        {output_dir}/README.md")
+    print(f"   AGENTS.md:     {output_dir}/AGENTS.md")
+    print(f"   CLI.md:        {output_dir}/CLI.md")
+    print(f"   API.md:        {output_dir}/API.md")
+    print(f"   ARCHITECTURE:  {output_dir}/ARCHITECTURE.md")
     print()
 
     if variables.get('include_beads'):
@@ -1368,5 +1714,159 @@ def main():
     print()
 
 
+def manifest_entry_argv(entry: Dict[str, Any]) -> List[str]:
+    """Command-line arguments for a manifest entry.
+
+    Keys are option names with dashes or underscores; true booleans become
+    flags, false/null values are left out.
+
+    Example:
+        {"name": "Task Manager", "enable_mcp": true} -> ["--name", "Task Manager", "--enable-mcp"]
+    """
+    argv = []
+    for key, value in entry.items():
+        flag = "--" + key.replace("_", "-")
+        if value is True:
+            argv.append(flag)
+        elif value is not None and value is not False:
+            argv.extend([flag, str(value)])
+    return argv
+
+
+def load_manifest(manifest_path: Path) -> List[Dict[str, Any]]:
+    """Server entries from a JSON or YAML manifest (a list, or {"servers": [...]})."""
+    text = manifest_path.read_text(encoding='utf-8')
+    if manifest_path.suffix in ('.yaml', '.yml'):
+        import yaml
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+    if isinstance(data, dict):
+        data = data.get('servers', [])
+    if not isinstance(data, list) or not all(isinstance(entry, dict) for entry in data):
+        raise ValueError(f"{manifest_path}: expected a list of server option dicts")
+    return data
+
+
+def create_from_manifest(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """Create every server in a manifest, up to args.jobs at once.
+
+    Each server's output is printed as a block, in manifest order, followed
+    by a summary with per-server timings.
+
+    Returns:
+        Exit code (0 if every server was created and validated)
+    """
+    try:
+        entries = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: Could not load manifest: {e}")
+        return 1
+
+    specs = []
+    for index, entry in enumerate(entries, start=1):
+        entry_args = parser.parse_args(manifest_entry_argv(entry))
+        if not entry_args.name or not entry_args.output:
+            print(f"❌ Error: Manifest entry {index} needs 'name' and 'output'")
+            return 1
+        if entry_args.output.exists():
+            print(f"❌ Error: Output directory already exists: {entry_args.output}")
+            return 1
+        specs.append(entry_args)
+
+    print("=" * 80)
+    print(f"Create Capability Server v{VERSION} (SAP-047) - {len(specs)} servers from {args.manifest}")
+    print("=" * 80)
+
+    batch_start = time.perf_counter()
+    with ScaffoldEngine(args.chora_base_dir, jobs=args.jobs) as engine:
+
+        def create_one(entry_args: argparse.Namespace):
+            with engine.capture() as buffer:
+                try:
+                    print(f"\n{'─' * 80}\n🏗️  {entry_args.name} → {entry_args.output}\n{'─' * 80}")
+                    variables = resolve_variables(entry_args)
+                    result = engine.create(entry_args.output, variables,
+                                           skip_git=entry_args.skip_git,
+                                           skip_validation=entry_args.skip_validation)
+                    print_phase_timings(result)
+                except SystemExit:
+                    result = None
+            return result, buffer.getvalue()
+
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as server_pool:
+            outcomes = []
+            for result, output in server_pool.map(create_one, specs):
+                sys.stdout.write(output)
+                outcomes.append(result)
+
+    print("\n" + "=" * 80)
+    print("📦 Batch Summary")
+    print("=" * 80)
+    failed = 0
+    for entry_args, result in zip(specs, outcomes):
+        if result is None:
+            status, seconds = "❌ failed", ""
+        elif result.validation_passed is False:
+            status, seconds = "⚠️  validation", f"{result.total_seconds:.2f}s"
+        else:
+            status, seconds = "✅ created", f"{result.total_seconds:.2f}s"
+        failed += result is None or result.validation_passed is False
+        print(f"  {status:<15} {seconds:>7}  {entry_args.output}")
+    print(f"\n  {len(specs) - failed}/{len(specs)} servers created in {time.perf_counter() - batch_start:.2f}s")
+    return 1 if failed else 0
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if args.manifest:
+        sys.exit(create_from_manifest(parser, args))
+    if not args.name or not args.output:
+        parser.error("--name and --output are required (or use --manifest)")
+
+    # Print header
+    print("=" * 80)
+    print(f"Create Capability Server v{VERSION} (SAP-047)")
+    print(f"Chora-Base v{CHORA_BASE_VERSION}")
+    print("=" * 80)
+    print()
+
+    # Validate chora-base directory
+    if not args.chora_base_dir.exists():
+        print(f"❌ Error: chora-base directory not found: {args.chora_base_dir}")
+        sys.exit(1)
+
+    template_dir = args.chora_base_dir / "static-template" / "capability-server-templates"
+    if not template_dir.exists():
+        print(f"❌ Error: Template directory not found: {template_dir}")
+        print("   Make sure you're running from chora-base directory")
+        print("   Expected: static-template/capability-server-templates/")
+        sys.exit(1)
+
+    variables = resolve_variables(args)
+    print_configuration(variables, args.profile)
+
+    # Check if output directory exists
+    if args.output.exists():
+        print(f"❌ Error: Output directory already exists: {args.output}")
+        print("   Choose a different location or remove the existing directory")
+        sys.exit(1)
+
+    # Scaffold: directories, static files, templates, SAPs, git, validation
+    with ScaffoldEngine(args.chora_base_dir, jobs=args.jobs) as engine:
+        result = engine.create(args.output, variables,
+                               skip_git=args.skip_git, skip_validation=args.skip_validation)
+
+    if result.validation_passed is False:
+        print("\n⚠️  Some validation checks failed (see above)")
+        print("   Project generated but may need manual fixes")
+
+    if args.timings:
+        print_phase_timings(result)
+
+    print_next_steps(args.output, variables)
+
 if __name__ == "__main__":
     main()
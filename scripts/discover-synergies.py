@@ -15,17 +15,19 @@
     python scripts/discover-synergies.py --visualize       # Show dependency graph (TODO)
 """
 
-import json
 import sys
 from pathlib import Path
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.sap_catalog import load_sap_catalog
 
 class SynergyDiscovery:
     def __init__(self, catalog_path: Path):
-        with open(catalog_path, 'r', encoding='utf-8') as f:
-            self.catalog = json.load(f)
+        self.catalog = load_sap_catalog(catalog_path)
 
-        self.saps = {sap['id']: sap for sap in self.catalog['saps']}
+        self.saps = self.catalog.by_id
         self.synergies = self.catalog.get('synergies', [])
         self.anti_patterns = self.catalog.get('anti_patterns', [])
 
@@ -35,19 +37,11 @@ def get_sap(self, sap_id: str) -> Dict[str, Any]:
 
     def find_synergies_for(self, sap_id: str) -> List[Dict]:
         """Find all synergies involving a SAP."""
-        result = []
-        for synergy in self.synergies:
-            if sap_id in synergy['saps']:
-                result.append(synergy)
-        return result
+        return self.catalog.members_of('synergies', sap_id)
 
     def find_anti_patterns_for(self, sap_id: str) -> List[Dict]:
         """Find anti-patterns involving a SAP."""
-        result = []
-        for anti_pattern in self.anti_patterns:
-            if sap_id in anti_pattern['saps']:
-                result.append(anti_pattern)
-        return result
+        return self.catalog.members_of('anti_patterns', sap_id)
 
     def get_impact_analysis(self, sap_id: str) -> Dict:
         """Analyze what depends on this SAP."""
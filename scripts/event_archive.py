@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""Append-only segmented archives for A-MEM event logs.
+
+An archive (``<log-stem>-archive.jsonl.gz``) is a sequence of independent
+gzip members ("segments"), each holding events from a single calendar month.
+Plain ``gzip.open`` still reads the whole file, while a small sidecar index
+(``<log-stem>-archive.idx.json``) records for each segment its byte range,
+event count, min/max timestamp and event type counts. Compaction appends new
+segments without touching existing ones, and readers seek straight to the
+segments overlapping a time range.
+
+Usage:
+    from event_archive import SegmentWriter, iter_archived_events
+
+    with SegmentWriter(archive_path) as writer:
+        for event in old_events:
+            writer.add(json.dumps(event), event)
+
+    for event in iter_archived_events(archive_path, since=since):
+        ...
+"""
+
+import gzip
+import io
+import json
+import os
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+INDEX_VERSION = 1
+
+# Upper bound on events per segment (keeps seeks fine-grained for busy months)
+MAX_SEGMENT_EVENTS = 5000
+
+
+def archive_path_for(log_path: Path) -> Path:
+    """Archive file for an event log (events.jsonl -> events-archive.jsonl.gz)."""
+    return log_path.parent / f"{log_path.stem}-archive.jsonl.gz"
+
+
+def index_path_for(archive_path: Path) -> Path:
+    """Sidecar segment index for an archive."""
+    name = archive_path.name
+    if name.endswith(".jsonl.gz"):
+        name = name[:-len(".jsonl.gz")]
+    return archive_path.parent / f"{name}.idx.json"
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an event timestamp as an aware UTC datetime (None if invalid)."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _new_segment() -> Dict[str, Any]:
+    return {
+        "offset": 0,
+        "length": 0,
+        "count": 0,
+        "undated": 0,
+        "min_ts": None,
+        "max_ts": None,
+        "event_types": Counter(),
+    }
+
+
+def _record(segment: Dict[str, Any], event: Dict[str, Any]):
+    """Update segment summary with one event."""
+    segment["count"] += 1
+    segment["event_types"][str(event.get("event_type", "unknown"))] += 1
+    timestamp = parse_timestamp(event.get("timestamp"))
+    if timestamp is None:
+        segment["undated"] += 1
+        return
+    if segment["min_ts"] is None or timestamp < segment["min_ts"]:
+        segment["min_ts"] = timestamp
+    if segment["max_ts"] is None or timestamp > segment["max_ts"]:
+        segment["max_ts"] = timestamp
+
+
+def _finish(segment: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a segment summary to its JSON index form."""
+    for key in ("min_ts", "max_ts"):
+        if segment[key] is not None:
+            segment[key] = segment[key].isoformat()
+    segment["event_types"] = dict(sorted(segment["event_types"].items()))
+    return segment
+
+
+def load_index(archive_path: Path) -> Optional[List[Dict[str, Any]]]:
+    """
+    Load the segment index for an archive.
+
+    Returns:
+        Segments in file order, or None if the index is missing, stale or
+        doesn't cover the archive exactly
+    """
+    try:
+        with open(index_path_for(archive_path), encoding="utf-8") as f:
+            index = json.load(f)
+        size = archive_path.stat().st_size
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if index.get("version") != INDEX_VERSION:
+        return None
+    segments = index.get("segments", [])
+    end = segments[-1]["offset"] + segments[-1]["length"] if segments else 0
+    return segments if end <= size else None
+
+
+def save_index(archive_path: Path, segments: List[Dict[str, Any]]):
+    """Write the segment index atomically."""
+    index_path = index_path_for(archive_path)
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": INDEX_VERSION, "archive": archive_path.name, "segments": segments}, f, indent=2)
+    os.replace(tmp_path, index_path)
+
+
+def build_index(archive_path: Path) -> List[Dict[str, Any]]:
+    """
+    Index an archive with no (valid) sidecar, e.g. one written before
+    segmenting existed. The whole file becomes a single segment.
+    """
+    size = archive_path.stat().st_size
+    if size == 0:
+        return []
+    segment = _new_segment()
+    segment["length"] = size
+    with gzip.open(archive_path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(event, dict):
+                _record(segment, event)
+    return [_finish(segment)]
+
+
+def _segment_key(event: Dict[str, Any]) -> Optional[str]:
+    """Calendar month (UTC) an event belongs to."""
+    timestamp = parse_timestamp(event.get("timestamp"))
+    return timestamp.strftime("%Y-%m") if timestamp else None
+
+
+class SegmentWriter:
+    """Append events to an archive as new month-bounded gzip members."""
+
+    def __init__(self, archive_path: Path, max_events: int = MAX_SEGMENT_EVENTS):
+        """
+        Initialize writer.
+
+        Args:
+            archive_path: Archive to append to (created if missing)
+            max_events: Start a new segment after this many events
+        """
+        self.archive_path = archive_path
+        self.max_events = max_events
+        self.added = 0
+        self._file = None
+        self._member = None
+        self._segment: Optional[Dict[str, Any]] = None
+        self._segment_key: Optional[str] = None
+        self._segments: List[Dict[str, Any]] = []
+        self._reindexed = False
+
+    def __enter__(self) -> "SegmentWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def open(self):
+        """Load the segment index, indexing legacy archives first."""
+        if self.archive_path.exists():
+            segments = load_index(self.archive_path)
+            if segments is None:
+                segments = build_index(self.archive_path)
+                self._reindexed = True
+            self._segments = segments
+
+    def _open_file(self):
+        """Open the archive for appending (on first event, so no-ops leave no files)."""
+        end = self._segments[-1]["offset"] + self._segments[-1]["length"] if self._segments else 0
+        self._file = open(self.archive_path, "ab")
+        # Drop bytes past the indexed end: left over from an interrupted
+        # compaction whose events are still in the live log
+        if self._file.tell() > end:
+            self._file.truncate(end)
+            self._file.seek(end)
+
+    def add(self, line: str, event: Dict[str, Any]):
+        """
+        Append one event.
+
+        Args:
+            line: Serialized event (a single JSON line, without newline)
+            event: The parsed event, used for the segment summary
+        """
+        if self._file is None:
+            self._open_file()
+        key = _segment_key(event)
+        if self._member is not None and (key != self._segment_key or self._segment["count"] >= self.max_events):
+            self._close_segment()
+        if self._member is None:
+            self._segment = _new_segment()
+            self._segment["offset"] = self._file.tell()
+            self._segment_key = key
+            self._member = gzip.GzipFile(fileobj=self._file, mode="wb")
+        self._member.write(line.encode("utf-8") + b"\n")
+        _record(self._segment, event)
+        self.added += 1
+
+    def _close_segment(self):
+        self._member.close()  # flushes the gzip trailer, leaves the file open
+        self._segment["length"] = self._file.tell() - self._segment["offset"]
+        self._segments.append(_finish(self._segment))
+        self._member = None
+        self._segment = None
+
+    @property
+    def segments(self) -> List[Dict[str, Any]]:
+        """All segments written so far (existing and new)."""
+        return list(self._segments)
+
+    def close(self):
+        """Finish the open segment, sync the archive and save the index."""
+        if self._file is None:
+            if self._reindexed:
+                save_index(self.archive_path, self._segments)
+            return
+        if self._member is not None:
+            self._close_segment()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        save_index(self.archive_path, self._segments)
+
+    def abort(self):
+        """Close without indexing new segments (they are dropped on next open)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def segment_overlaps(
+    segment: Dict[str, Any],
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> bool:
+    """Whether a segment may hold dated events within [since, until]."""
+    if since is None and until is None:
+        return True
+    if segment.get("min_ts") is None and "count" in segment:
+        return False  # only undated events, which time-bounded reads skip
+    if since is not None and segment.get("max_ts") and parse_timestamp(segment["max_ts"]) < since:
+        return False
+    if until is not None and segment.get("min_ts") and parse_timestamp(segment["min_ts"]) > until:
+        return False
+    return True
+
+
+def _normalize_bound(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def iter_archived_events(
+    archive_path: Path,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield archived events, optionally limited to a time range.
+
+    Only segments overlapping [since, until] are decompressed. When a range
+    is given, events without a parseable timestamp are skipped.
+
+    Args:
+        archive_path: Archive file (*-archive.jsonl.gz)
+        since: Start of time range (inclusive, naive = UTC)
+        until: End of time range (inclusive, naive = UTC)
+    """
+    if not archive_path.exists():
+        return
+    since = _normalize_bound(since)
+    until = _normalize_bound(until)
+    bounded = since is not None or until is not None
+
+    segments = load_index(archive_path)
+    if segments is None:
+        segments = [{"offset": 0, "length": archive_path.stat().st_size}]
+
+    with open(archive_path, "rb") as f:
+        for segment in segments:
+            if bounded and not segment_overlaps(segment, since, until):
+                continue
+            f.seek(segment["offset"])
+            data = f.read(segment["length"])
+            with gzip.GzipFile(fileobj=io.BytesIO(data)) as member:
+                for line in member:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if not isinstance(event, dict):
+                        continue
+                    if bounded:
+                        timestamp = parse_timestamp(event.get("timestamp"))
+                        if timestamp is None:
+                            continue
+                        if since is not None and timestamp < since:
+                            continue
+                        if until is not None and timestamp > until:
+                            continue
+                    yield event
@@ -0,0 +1,801 @@
+#!/usr/bin/env python3
+"""Columnar storage and aggregation for A-MEM event logs.
+
+Dashboards (a-mem-metrics, sap015-metrics, work-context-metrics,
+query-events-by-tag --count-by-tag) only ever group, count and sum a few
+fields, yet used to json.loads every line of every log on each run. This
+module keeps a compact columnar copy of each log next to it:
+
+    events/development.jsonl
+    events/.columnar/development/manifest.json   # consumed offset, partitions
+    events/.columnar/development/2025-10.evcol   # one file per calendar month
+    events/.columnar/development/2025-11.evcol
+
+Every event field (nested dicts flattened to dotted names, e.g.
+"metadata.tags") becomes a column: strings and string lists are
+dictionary-encoded into int32 codes, numbers and booleans are stored as
+typed arrays, and timestamps as int64 microseconds since the epoch. Closed
+months are written once; only the current month's partition (and late
+events) are ever appended to. Events appended to the log after the last
+compaction are parsed on load, so results are always current.
+
+Usage:
+    from event_columns import load_event_table
+
+    table = load_event_table(Path(".chora/memory/events/sessions.jsonl"))
+    starts = table.where_eq("action", "start")
+    table.count_by("session_id", missing="unknown")
+    table.mean("restoration_time_seconds", rows=starts)
+    table.percentiles("duration_ms", qs=(50, 90))
+    table.time_buckets("week")
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import struct
+import sys
+from array import array
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+FORMAT_VERSION = 1
+MAGIC = b"EVCOL1\n"
+STORE_DIRNAME = ".columnar"
+
+# Leading bytes of the log fingerprinted to detect rewrites (e.g. a-mem-compress)
+PREFIX_BYTES = 4096
+
+MISSING_TS = -(2 ** 63)
+UNDATED = "undated"
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+DAY_MICROS = 86400 * 1_000_000
+
+NUMERIC_KINDS = ("bool", "int", "float")
+
+# Row selection: one entry per chunk, None meaning all of the chunk's rows
+Selection = List[Optional[List[int]]]
+
+
+def timestamp_micros(value: Any) -> int:
+    """Parse an ISO timestamp to UTC microseconds (MISSING_TS if invalid)."""
+    if not isinstance(value, str) or not value:
+        return MISSING_TS
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return MISSING_TS
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    delta = parsed - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def micros_to_datetime(micros: int) -> datetime:
+    """Inverse of timestamp_micros (aware UTC datetime)."""
+    return EPOCH + timedelta(microseconds=micros)
+
+
+def month_key(micros: int) -> str:
+    """Partition key for a timestamp ("YYYY-MM", or "undated")."""
+    if micros == MISSING_TS:
+        return UNDATED
+    moment = micros_to_datetime(micros)
+    return f"{moment.year:04d}-{moment.month:02d}"
+
+
+_SCALAR_KINDS = {bool: "bool", int: "int", float: "float", str: "str"}
+
+
+def _values_kinds(values: Iterable[Any]) -> Set[str]:
+    """Kinds of the non-missing values ("json" for anything not scalar or a string list)."""
+    kinds = set()
+    for value_type in set(map(type, values)):
+        if value_type is type(None):
+            continue
+        kind = _SCALAR_KINDS.get(value_type)
+        if kind is None and value_type is list:
+            lists = (v for v in values if type(v) is list)
+            kind = "list" if all(isinstance(item, str) for v in lists for item in v) else "json"
+        kinds.add(kind or "json")
+    return kinds
+
+
+def _common_kind(kinds: Iterable[str]) -> str:
+    """Narrowest kind able to hold values of all the given kinds."""
+    kinds = set(kinds)
+    if not kinds:
+        return "str"
+    if len(kinds) == 1:
+        return next(iter(kinds))
+    if kinds <= {"bool", "int"}:
+        return "int"
+    if kinds <= set(NUMERIC_KINDS):
+        return "float"
+    return "json"
+
+
+def _flatten(event: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """Yield (dotted.name, value) for every non-dict leaf of an event."""
+    for key, value in event.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from _flatten(value, name + ".")
+        else:
+            yield name, value
+
+
+class Column:
+    """A single column of an event chunk.
+
+    String kinds ("str", "list", "json") hold a dictionary of distinct values
+    and int32 codes into it (-1 = missing); "list" columns add row offsets
+    into the code array. Numeric kinds hold a typed value array plus a
+    presence mask.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        dictionary: Optional[List[str]] = None,
+        codes: Optional[array] = None,
+        offsets: Optional[array] = None,
+        values: Optional[array] = None,
+        present: Optional[bytearray] = None
+    ):
+        self.kind = kind
+        self.dictionary = dictionary
+        self.codes = codes
+        self.offsets = offsets
+        self.values = values
+        self.present = present
+        self._lookup: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        if self.kind in NUMERIC_KINDS:
+            return len(self.values)
+        if self.kind == "list":
+            return len(self.offsets) - 1
+        return len(self.codes)
+
+    @property
+    def is_empty(self) -> bool:
+        """True if no row has a value."""
+        if self.kind in NUMERIC_KINDS:
+            return not any(self.present)
+        if self.kind == "list":
+            return not self.codes
+        return not self.dictionary
+
+    @classmethod
+    def from_values(cls, values: List[Any]) -> "Column":
+        """Encode raw Python values (None = missing)."""
+        kind = _common_kind(_values_kinds(values))
+
+        if kind in NUMERIC_KINDS:
+            return cls(
+                kind,
+                values=array("d" if kind == "float" else "q", (0 if v is None else v for v in values)),
+                present=bytearray(v is not None for v in values)
+            )
+
+        dictionary: List[str] = []
+        lookup: Dict[str, int] = {}
+
+        def encode(item: str) -> int:
+            code = lookup.get(item)
+            if code is None:
+                code = lookup[item] = len(dictionary)
+                dictionary.append(item)
+            return code
+
+        if kind == "list":
+            codes = array("i")
+            offsets = array("q", [0])
+            for value in values:
+                codes.extend(encode(item) for item in value or ())
+                offsets.append(len(codes))
+            return cls(kind, dictionary=dictionary, codes=codes, offsets=offsets)
+
+        if kind == "json":
+            values = [None if v is None else json.dumps(v, sort_keys=True) for v in values]
+        return cls(kind, dictionary=dictionary, codes=array("i", (-1 if v is None else encode(v) for v in values)))
+
+    @classmethod
+    def missing(cls, kind: str, n: int) -> "Column":
+        """A column of the given kind with n missing values."""
+        if kind in NUMERIC_KINDS:
+            return cls(kind, values=array("d" if kind == "float" else "q", bytes(8 * n)), present=bytearray(n))
+        if kind == "list":
+            return cls(kind, dictionary=[], codes=array("i"), offsets=array("q", bytes(8 * (n + 1))))
+        return cls(kind, dictionary=[], codes=array("i", [-1]) * n)
+
+    @property
+    def lookup(self) -> Dict[str, int]:
+        """Dictionary value -> code."""
+        if self._lookup is None:
+            self._lookup = {value: code for code, value in enumerate(self.dictionary)}
+        return self._lookup
+
+    def decode_entry(self, code: int) -> Any:
+        """Decoded dictionary entry."""
+        value = self.dictionary[code]
+        return json.loads(value) if self.kind == "json" else value
+
+    def get(self, row: int, default: Any = None) -> Any:
+        """Decoded value of one row."""
+        if self.kind in NUMERIC_KINDS:
+            if not self.present[row]:
+                return default
+            value = self.values[row]
+            return bool(value) if self.kind == "bool" else value
+        if self.kind == "list":
+            return [self.dictionary[c] for c in self.codes[self.offsets[row]:self.offsets[row + 1]]]
+        code = self.codes[row]
+        return default if code < 0 else self.decode_entry(code)
+
+    def concat(self, other: "Column") -> "Column":
+        """Rows of self followed by rows of other."""
+        left, right = self, other
+        if left.is_empty and left.kind != right.kind:
+            left = Column.missing(right.kind, len(left))
+        elif right.is_empty and left.kind != right.kind:
+            right = Column.missing(left.kind, len(right))
+
+        if left.kind in NUMERIC_KINDS and right.kind in NUMERIC_KINDS:
+            kind = _common_kind((left.kind, right.kind))
+            typecode = "d" if kind == "float" else "q"
+            values = array(typecode, left.values)
+            values.extend(right.values if right.values.typecode == typecode else array(typecode, right.values))
+            return Column(kind, values=values, present=left.present + right.present)
+
+        if left.kind != right.kind:
+            # Incompatible kinds (rare): re-encode from decoded values
+            decoded = [left.get(i) for i in range(len(left))] + [right.get(i) for i in range(len(right))]
+            return Column.from_values(decoded)
+
+        # Same string kind: merge dictionaries and remap the right-hand codes
+        dictionary = list(left.dictionary)
+        lookup = dict(left.lookup)
+        remap = []
+        for value in right.dictionary:
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(dictionary)
+                dictionary.append(value)
+            remap.append(code)
+        remap.append(-1)  # remap[-1] keeps missing rows missing
+
+        codes = array("i", left.codes)
+        codes.extend(array("i", map(remap.__getitem__, right.codes)))
+        if left.kind != "list":
+            return Column(left.kind, dictionary=dictionary, codes=codes)
+
+        shift = len(left.codes)
+        offsets = array("q", left.offsets)
+        offsets.extend(array("q", (offset + shift for offset in right.offsets[1:])))
+        return Column(left.kind, dictionary=dictionary, codes=codes, offsets=offsets)
+
+    def arrays(self) -> Dict[str, Any]:
+        """Named binary arrays for serialization."""
+        if self.kind in NUMERIC_KINDS:
+            return {"values": self.values, "present": self.present}
+        if self.kind == "list":
+            return {"codes": self.codes, "offsets": self.offsets}
+        return {"codes": self.codes}
+
+
+class EventChunk:
+    """A batch of events stored column by column."""
+
+    def __init__(self, timestamps: array, columns: Dict[str, Column]):
+        self.timestamps = timestamps
+        self.columns = columns
+
+    @property
+    def n(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_events(cls, events: Iterable[Dict[str, Any]]) -> "EventChunk":
+        """Encode parsed events (the top-level "timestamp" becomes the time axis)."""
+        timestamps = array("q")
+        raw: Dict[str, List[Any]] = {}
+
+        for row, event in enumerate(events):
+            timestamps.append(timestamp_micros(event.get("timestamp")))
+            for name, value in _flatten(event):
+                if name == "timestamp" or value is None:
+                    continue
+                column = raw.get(name)
+                if column is None:
+                    column = raw[name] = []
+                if len(column) < row:
+                    column.extend([None] * (row - len(column)))
+                column.append(value)
+
+        n = len(timestamps)
+        columns = {}
+        for name, values in raw.items():
+            values.extend([None] * (n - len(values)))
+            columns[name] = Column.from_values(values)
+        return cls(timestamps, columns)
+
+    def concat(self, other: "EventChunk") -> "EventChunk":
+        """Rows of self followed by rows of other."""
+        timestamps = array("q", self.timestamps)
+        timestamps.extend(other.timestamps)
+        columns = {}
+        for name in list(self.columns) + [name for name in other.columns if name not in self.columns]:
+            left = self.columns.get(name)
+            right = other.columns.get(name)
+            if left is None:
+                left = Column.missing(right.kind, self.n)
+            if right is None:
+                right = Column.missing(left.kind, other.n)
+            columns[name] = left.concat(right)
+        return EventChunk(timestamps, columns)
+
+    def save(self, path: Path):
+        """Write the chunk atomically (JSON header followed by raw arrays)."""
+        blobs: List[bytes] = []
+        position = 0
+
+        def add(data) -> Dict[str, Any]:
+            nonlocal position
+            raw = data.tobytes() if isinstance(data, array) else bytes(data)
+            entry = {"typecode": data.typecode if isinstance(data, array) else "B",
+                     "offset": position, "length": len(raw)}
+            blobs.append(raw)
+            position += len(raw)
+            return entry
+
+        header = {
+            "version": FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "rows": self.n,
+            "timestamps": add(self.timestamps),
+            "columns": {
+                name: {
+                    "kind": column.kind,
+                    "dictionary": column.dictionary,
+                    "arrays": {key: add(data) for key, data in column.arrays().items()},
+                }
+                for name, column in self.columns.items()
+            },
+        }
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<Q", len(header_bytes)))
+            f.write(header_bytes)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "EventChunk":
+        """Read a chunk written by save()."""
+        data = path.read_bytes()
+        if not data.startswith(MAGIC):
+            raise ValueError(f"Not a columnar event file: {path}")
+        start = len(MAGIC)
+        (header_length,) = struct.unpack_from("<Q", data, start)
+        start += 8
+        header = json.loads(data[start:start + header_length])
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported columnar format version in {path}")
+        base = start + header_length
+        swap = header["byteorder"] != sys.byteorder
+
+        def read(entry: Dict[str, Any]):
+            raw = data[base + entry["offset"]:base + entry["offset"] + entry["length"]]
+            if entry["typecode"] == "B":
+                return bytearray(raw)
+            values = array(entry["typecode"])
+            values.frombytes(raw)
+            if swap:
+                values.byteswap()
+            return values
+
+        columns = {}
+        for name, spec in header["columns"].items():
+            arrays = {key: read(entry) for key, entry in spec["arrays"].items()}
+            columns[name] = Column(spec["kind"], dictionary=spec["dictionary"], **arrays)
+        return cls(read(header["timestamps"]), columns)
+
+
+class EventTable:
+    """Read-only view over event chunks with grouped aggregations.
+
+    Filters return a Selection that can be passed as rows= to any other
+    method; rows=None means every event.
+    """
+
+    def __init__(self, chunks: Sequence[EventChunk] = ()):
+        self.chunks = [chunk for chunk in chunks if chunk.n]
+
+    def __len__(self) -> int:
+        return sum(chunk.n for chunk in self.chunks)
+
+    @classmethod
+    def from_events(cls, events: Iterable[Dict[str, Any]]) -> "EventTable":
+        return cls([EventChunk.from_events(events)])
+
+    def _selected(self, rows: Optional[Selection]) -> Iterator[Tuple[EventChunk, Optional[List[int]]]]:
+        if rows is None:
+            rows = [None] * len(self.chunks)
+        for chunk, indices in zip(self.chunks, rows):
+            if indices is None or indices:
+                yield chunk, indices
+
+    def count(self, rows: Optional[Selection] = None) -> int:
+        """Number of selected events."""
+        return sum(chunk.n if indices is None else len(indices) for chunk, indices in self._selected(rows))
+
+    # Filters
+
+    def _filter(self, rows: Optional[Selection], accept: Callable[[EventChunk, Iterable[int]], List[int]]) -> Selection:
+        if rows is None:
+            rows = [None] * len(self.chunks)
+        return [
+            [] if indices == [] else accept(chunk, range(chunk.n) if indices is None else indices)
+            for chunk, indices in zip(self.chunks, rows)
+        ]
+
+    def where_eq(self, column: str, value: Any, rows: Optional[Selection] = None) -> Selection:
+        """Events whose column equals value (list columns: contains value)."""
+        def accept(chunk: EventChunk, indices: Iterable[int]) -> List[int]:
+            col = chunk.columns.get(column)
+            if col is None:
+                return list(indices) if value is None else []
+            if col.kind in NUMERIC_KINDS:
+                if value is None:
+                    return [i for i in indices if not col.present[i]]
+                return [i for i in indices if col.present[i] and col.values[i] == value]
+            key = json.dumps(value, sort_keys=True) if col.kind == "json" and value is not None else value
+            code = -1 if key is None else col.lookup.get(key)
+            if code is None:
+                return []
+            if col.kind == "list":
+                codes, offsets = col.codes, col.offsets
+                return [i for i in indices if code in codes[offsets[i]:offsets[i + 1]]]
+            codes = col.codes
+            return [i for i in indices if codes[i] == code]
+        return self._filter(rows, accept)
+
+    def where(
+        self,
+        column: str,
+        predicate: Callable[[Any], bool],
+        rows: Optional[Selection] = None,
+        default: Any = None
+    ) -> Selection:
+        """Events whose decoded column value (default if missing) satisfies predicate.
+
+        For dictionary-encoded columns the predicate runs once per distinct
+        value rather than once per event.
+        """
+        def accept(chunk: EventChunk, indices: Iterable[int]) -> List[int]:
+            col = chunk.columns.get(column)
+            if col is None:
+                return list(indices) if predicate(default) else []
+            if col.kind in NUMERIC_KINDS or col.kind == "list":
+                return [i for i in indices if predicate(col.get(i, default))]
+            accepted = {code for code in range(len(col.dictionary)) if predicate(col.decode_entry(code))}
+            if predicate(default):
+                accepted.add(-1)
+            codes = col.codes
+            return [i for i in indices if codes[i] in accepted]
+        return self._filter(rows, accept)
+
+    def where_time(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        rows: Optional[Selection] = None
+    ) -> Selection:
+        """Events timestamped within [since, until] (naive bounds are UTC)."""
+        low = MISSING_TS + 1 if since is None else timestamp_micros(since.isoformat())
+        high = 2 ** 63 - 1 if until is None else timestamp_micros(until.isoformat())
+
+        def accept(chunk: EventChunk, indices: Iterable[int]) -> List[int]:
+            timestamps = chunk.timestamps
+            return [i for i in indices if low <= timestamps[i] <= high]
+        return self._filter(rows, accept)
+
+    # Aggregations
+
+    def values(self, column: str, rows: Optional[Selection] = None, default: Any = None) -> List[Any]:
+        """Decoded column values of the selected events, in order."""
+        result: List[Any] = []
+        for chunk, indices in self._selected(rows):
+            col = chunk.columns.get(column)
+            indices = range(chunk.n) if indices is None else indices
+            if col is None:
+                result.extend([default] * len(indices))
+            elif col.kind in ("str", "json"):
+                table = [col.decode_entry(code) for code in range(len(col.dictionary))] + [default]
+                codes = col.codes
+                result.extend(table[codes[i]] for i in indices)
+            else:
+                result.extend(col.get(i, default) for i in indices)
+        return result
+
+    def count_by(self, column: str, rows: Optional[Selection] = None, missing: Any = None) -> Counter:
+        """Events per distinct value (list columns count every element).
+
+        Events without the column are counted under missing, or skipped if
+        missing is None.
+        """
+        counts: Counter = Counter()
+        for chunk, indices in self._selected(rows):
+            col = chunk.columns.get(column)
+            selected = chunk.n if indices is None else len(indices)
+            if col is None:
+                if missing is not None:
+                    counts[missing] += selected
+                continue
+
+            if col.kind in NUMERIC_KINDS:
+                for i in range(chunk.n) if indices is None else indices:
+                    value = col.get(i, missing)
+                    if value is not None:
+                        counts[value] += 1
+                continue
+
+            if col.kind == "list":
+                if indices is None:
+                    code_counts = Counter(col.codes)
+                else:
+                    codes, offsets = col.codes, col.offsets
+                    code_counts = Counter(itertools.chain.from_iterable(
+                        codes[offsets[i]:offsets[i + 1]] for i in indices))
+            else:
+                codes = col.codes
+                code_counts = Counter(codes if indices is None else (codes[i] for i in indices))
+
+            for code, count in code_counts.items():
+                key = missing if code < 0 else col.dictionary[code]
+                if key is not None:
+                    counts[key] += count
+        return counts
+
+    def _numbers(self, column: str, rows: Optional[Selection]) -> Iterator[Any]:
+        for chunk, indices in self._selected(rows):
+            col = chunk.columns.get(column)
+            if col is None or col.is_empty:
+                continue
+            if col.kind not in NUMERIC_KINDS:
+                raise TypeError(f"Column {column!r} is not numeric ({col.kind})")
+            values, present = col.values, col.present
+            if indices is None:
+                yield from (values if all(present) else itertools.compress(values, present))
+            else:
+                yield from (values[i] for i in indices if present[i])
+
+    def sum(self, column: str, rows: Optional[Selection] = None) -> Any:
+        """Sum of present values (0 if none)."""
+        return sum(self._numbers(column, rows))
+
+    def mean(self, column: str, rows: Optional[Selection] = None) -> float:
+        """Mean of present values (0.0 if none)."""
+        values = list(self._numbers(column, rows))
+        return sum(values) / len(values) if values else 0.0
+
+    def percentiles(
+        self,
+        column: str,
+        qs: Sequence[float] = (50, 90, 99),
+        rows: Optional[Selection] = None
+    ) -> Dict[float, Optional[float]]:
+        """Linearly interpolated percentiles of present values (None if no values)."""
+        values = sorted(self._numbers(column, rows))
+        result: Dict[float, Optional[float]] = {}
+        for q in qs:
+            if not values:
+                result[q] = None
+                continue
+            position = (len(values) - 1) * q / 100
+            low = int(position)
+            high = min(low + 1, len(values) - 1)
+            result[q] = values[low] + (values[high] - values[low]) * (position - low)
+        return result
+
+    def time_range(self, rows: Optional[Selection] = None) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Earliest and latest timestamp of the selected events."""
+        low = high = None
+        for chunk, indices in self._selected(rows):
+            timestamps = chunk.timestamps
+            dated = [t for t in (timestamps if indices is None else (timestamps[i] for i in indices)) if t != MISSING_TS]
+            if dated:
+                low = min(dated) if low is None else min(low, min(dated))
+                high = max(dated) if high is None else max(high, max(dated))
+        if low is None:
+            return None, None
+        return micros_to_datetime(low), micros_to_datetime(high)
+
+    def time_buckets(self, bucket: str = "day", rows: Optional[Selection] = None) -> Dict[str, int]:
+        """Event counts per UTC day ("YYYY-MM-DD"), ISO week ("YYYY-Www") or month ("YYYY-MM")."""
+        if bucket not in ("day", "week", "month"):
+            raise ValueError(f"Unknown bucket: {bucket}")
+
+        days: Counter = Counter()
+        for chunk, indices in self._selected(rows):
+            timestamps = chunk.timestamps
+            selected = timestamps if indices is None else (timestamps[i] for i in indices)
+            days.update(t // DAY_MICROS for t in selected if t != MISSING_TS)
+
+        buckets: Counter = Counter()
+        for day, count in days.items():
+            date = (EPOCH + timedelta(days=day)).date()
+            if bucket == "day":
+                key = date.isoformat()
+            elif bucket == "week":
+                year, week, _ = date.isocalendar()
+                key = f"{year}-W{week:02d}"
+            else:
+                key = f"{date.year}-{date.month:02d}"
+            buckets[key] += count
+        return dict(sorted(buckets.items()))
+
+
+def store_dir_for(log_path: Path) -> Path:
+    """Columnar store directory for an event log."""
+    return log_path.parent / STORE_DIRNAME / log_path.stem
+
+
+def _parse_lines(data: bytes) -> Tuple[List[Dict[str, Any]], int]:
+    """Parse JSONL bytes into events; returns (events, skipped lines)."""
+    events = []
+    skipped = 0
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            skipped += 1
+            continue
+        if isinstance(event, dict):
+            events.append(event)
+        else:
+            skipped += 1
+    return events, skipped
+
+
+class ColumnarStore:
+    """Monthly columnar partitions of one append-only JSONL event log."""
+
+    def __init__(self, log_path: Path):
+        self.log_path = log_path
+        self.store_dir = store_dir_for(log_path)
+        self.manifest_path = self.store_dir / "manifest.json"
+
+    def _load_manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return manifest if manifest.get("version") == FORMAT_VERSION else None
+
+    def _save_manifest(self, manifest: Dict[str, Any]):
+        manifest["partitions"] = dict(sorted(manifest["partitions"].items()))
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    @staticmethod
+    def _prefix_digest(f, offset: int) -> str:
+        f.seek(0)
+        return hashlib.sha256(f.read(min(offset, PREFIX_BYTES))).hexdigest()
+
+    def _matches(self, manifest: Optional[Dict[str, Any]], f, size: int) -> bool:
+        """Whether the manifest describes a prefix of the current log."""
+        if manifest is None or size < manifest["offset"]:
+            return False
+        return self._prefix_digest(f, manifest["offset"]) == manifest["prefix_digest"]
+
+    def _load_partitions(self, manifest: Dict[str, Any]) -> Optional[List[EventChunk]]:
+        chunks = []
+        for month, rows in sorted(manifest["partitions"].items()):
+            try:
+                chunk = EventChunk.load(self.store_dir / f"{month}.evcol")
+            except (OSError, ValueError):
+                return None
+            if chunk.n != rows:
+                return None  # interrupted compaction; rebuild
+            chunks.append(chunk)
+        return chunks
+
+    def compact(self, rebuild: bool = False) -> Dict[str, Any]:
+        """
+        Move complete events appended since the last compaction into
+        monthly partitions.
+
+        The whole store is rebuilt if the log was rewritten (shrank or its
+        leading bytes changed) or a partition doesn't match the manifest.
+
+        Returns:
+            Stats: events added, lines skipped, partitions written, rebuilt
+        """
+        stats = {"log": self.log_path.name, "events": 0, "skipped": 0, "partitions": 0, "rebuilt": False}
+        if not self.log_path.exists():
+            if self.store_dir.exists():
+                shutil.rmtree(self.store_dir)
+            return stats
+
+        manifest = self._load_manifest()
+        size = self.log_path.stat().st_size
+        with open(self.log_path, "rb") as f:
+            current = not rebuild and self._matches(manifest, f, size)
+            existing = self._load_partitions(manifest) if current else None
+            if existing is None:
+                stats["rebuilt"] = manifest is not None or rebuild
+                if self.store_dir.exists():
+                    shutil.rmtree(self.store_dir)
+                manifest = {"version": FORMAT_VERSION, "log": self.log_path.name,
+                            "offset": 0, "prefix_digest": "", "skipped": 0, "partitions": {}}
+                existing = []
+
+            f.seek(manifest["offset"])
+            data = f.read(size - manifest["offset"])
+            end = data.rfind(b"\n") + 1
+            events, skipped = _parse_lines(data[:end])
+
+            partitions = dict(zip(sorted(manifest["partitions"]), existing))
+            by_month: Dict[str, List[Dict[str, Any]]] = {}
+            for event in events:
+                by_month.setdefault(month_key(timestamp_micros(event.get("timestamp"))), []).append(event)
+
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            for month, month_events in by_month.items():
+                chunk = EventChunk.from_events(month_events)
+                if month in partitions:
+                    chunk = partitions[month].concat(chunk)
+                chunk.save(self.store_dir / f"{month}.evcol")
+                manifest["partitions"][month] = chunk.n
+
+            previous_offset = manifest["offset"]
+            manifest["offset"] += end
+            manifest["skipped"] += skipped
+            if previous_offset < PREFIX_BYTES:
+                manifest["prefix_digest"] = self._prefix_digest(f, manifest["offset"])
+
+        self._save_manifest(manifest)
+        stats.update(events=len(events), skipped=skipped, partitions=len(by_month),
+                     total_events=sum(manifest["partitions"].values()))
+        return stats
+
+    def load(self) -> EventTable:
+        """
+        Table of every event in the log: compacted partitions plus any
+        events appended since (the whole log is parsed if the store is
+        missing or stale).
+        """
+        if not self.log_path.exists():
+            return EventTable()
+
+        manifest = self._load_manifest()
+        size = self.log_path.stat().st_size
+        with open(self.log_path, "rb") as f:
+            chunks = self._load_partitions(manifest) if self._matches(manifest, f, size) else None
+            offset = manifest["offset"] if chunks is not None else 0
+            f.seek(offset)
+            tail = f.read(size - offset)
+
+        events, _ = _parse_lines(tail)
+        return EventTable((chunks or []) + [EventChunk.from_events(events)])
+
+
+def load_event_table(log_path: Path) -> EventTable:
+    """Load an event log as an EventTable (empty if the log doesn't exist)."""
+    return ColumnarStore(log_path).load()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Buffered, non-blocking JSONL event sink.
+
+Usage tracking and event helpers used to open their log and append a line
+inside the call being tracked. This module moves that work off the hot
+path: emit() only appends the event to an in-process buffer, and a
+background thread writes buffered events in batches:
+
+- when max_batch events are waiting (size-based), or
+- flush_interval seconds after the first event of a batch (time-based)
+
+Each batch opens every log it touches once, serializes its events and
+appends them in emit order. Pending events are also written by flush() and by
+an atexit hook, which runs after an unhandled exception ends the script
+too; callers can flush() on their own error paths before re-raising. Only
+a hard kill (SIGKILL, os._exit) can lose the last batch.
+
+Events must not be mutated after they are emitted; they are serialized by
+the writer thread.
+
+Usage:
+    from event_sink import emit, flush
+
+    emit(Path(".chora/memory/events/script-usage.jsonl"), {"action": "..."})
+    flush()   # Before reading the log back in the same process
+"""
+
+import atexit
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Events buffered before the writer is woken
+DEFAULT_MAX_BATCH = 256
+
+# Seconds an event may wait in the buffer
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+
+class EventSink:
+    """In-process event buffer with a background batch writer."""
+
+    def __init__(self, max_batch: int = DEFAULT_MAX_BATCH,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        """
+        Initialize sink (the writer thread starts on the first emit).
+
+        Args:
+            max_batch: Pending events that trigger an immediate write
+            flush_interval: Maximum seconds an event waits before being written
+        """
+        self.max_batch = max(1, max_batch)
+        self.flush_interval = flush_interval
+        self.batches_written = 0
+        self._pending: List[Tuple[Path, Dict[str, Any]]] = []
+        self._lock = threading.Lock()            # Guards _pending
+        self._write_lock = threading.Lock()      # Serializes batches (keeps emit order)
+        self._wake = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def emit(self, path: Path, event: Dict[str, Any]) -> None:
+        """Queue an event for appending to a JSONL log (never blocks on I/O).
+
+        After close() (e.g. from another atexit hook) events are written
+        immediately instead.
+        """
+        with self._lock:
+            self._pending.append((path, event))
+            closed = self._closed
+            if not closed:
+                if self._thread is None:
+                    self._start()
+                # Wake the writer to start the interval timer, or to
+                # write a full batch now
+                if len(self._pending) == 1 or len(self._pending) >= self.max_batch:
+                    self._wake.notify()
+        if closed:
+            self.flush()
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="event-sink", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        """Writer thread: wait for a full batch or the flush interval, then write."""
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._wake.wait()
+                if self._closed:
+                    return
+                deadline = time.monotonic() + self.flush_interval
+                while len(self._pending) < self.max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wake.wait(remaining)
+            try:
+                self.flush()
+            except OSError:
+                pass  # Unwritable log: its events are dropped, other logs were written
+
+    def flush(self) -> int:
+        """
+        Write every pending event now, in this thread.
+
+        Returns:
+            Number of events written
+        """
+        with self._write_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if batch:
+                self._write(batch)
+                self.batches_written += 1
+            return len(batch)
+
+    @staticmethod
+    def _write(batch: List[Tuple[Path, Dict[str, Any]]]) -> None:
+        """Append a batch to its logs; an unwritable log doesn't stop the others.
+
+        Raises:
+            OSError: The first log that couldn't be written (after the rest are)
+        """
+        lines_by_path: Dict[Path, List[str]] = {}
+        for path, event in batch:
+            lines_by_path.setdefault(path, []).append(json.dumps(event, default=str) + "\n")
+        error: Optional[OSError] = None
+        for path, lines in lines_by_path.items():
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("".join(lines))
+            except OSError as e:
+                error = error or e
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """Flush pending events and stop the writer thread."""
+        with self._lock:
+            self._closed = True
+            self._wake.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval + 1)
+        self.flush()
+
+
+_default_sink: Optional[EventSink] = None
+_default_lock = threading.Lock()
+
+
+def get_sink() -> EventSink:
+    """The process-wide sink shared by usage tracking and event helpers."""
+    global _default_sink
+    if _default_sink is None:
+        with _default_lock:
+            if _default_sink is None:
+                _default_sink = EventSink()
+    return _default_sink
+
+
+def emit(path: Path, event: Dict[str, Any]) -> None:
+    """Queue an event on the shared sink."""
+    get_sink().emit(path, event)
+
+
+def flush() -> int:
+    """Write the shared sink's pending events now."""
+    return get_sink().flush() if _default_sink is not None else 0
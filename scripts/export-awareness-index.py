@@ -13,19 +13,23 @@
     python scripts/export-awareness-index.py --output custom.json  # Custom output path
     python scripts/export-awareness-index.py --format yaml      # Export as YAML
     python scripts/export-awareness-index.py --extract-metadata # Extract frontmatter metadata
+    python scripts/export-awareness-index.py --jobs 8           # Scan files across 8 worker processes
 """
 
 import json
 import yaml
 import os
-import re
 import glob
 import argparse
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set, Any, Optional
 from datetime import datetime, timezone, date
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.markdown_structure import read_markdown
+
 # Configure UTF-8 output for Windows console compatibility
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
@@ -48,26 +52,7 @@ def extract_yaml_frontmatter(file_path: str) -> Optional[Dict[str, Any]]:
         Dict of frontmatter fields, or None if no frontmatter found
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Check for YAML frontmatter (--- at start and end)
-        if not content.startswith('---\n'):
-            return None
-
-        # Find the closing ---
-        end_marker = content.find('\n---\n', 4)
-        if end_marker == -1:
-            return None
-
-        # Extract frontmatter
-        frontmatter_text = content[4:end_marker]
-
-        # Parse YAML
-        frontmatter = yaml.safe_load(frontmatter_text)
-
-        return frontmatter if isinstance(frontmatter, dict) else None
-
+        return read_markdown(Path(file_path)).frontmatter
     except Exception as e:
         print(f"Warning: Could not extract frontmatter from {file_path}: {e}")
         return None
@@ -81,25 +66,16 @@ def extract_first_heading(file_path: str) -> Optional[str]:
         The heading text without the # symbols
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        for line in lines:
-            # Skip frontmatter
-            if line.strip() == '---':
-                continue
-
-            # Find first heading
-            match = re.match(r'^#{1,2}\s+(.+)$', line.strip())
-            if match:
-                return match.group(1).strip()
-
-        return None
-
+        headings = read_markdown(Path(file_path)).headings
     except Exception as e:
         print(f"Warning: Could not extract heading from {file_path}: {e}")
         return None
 
+    for heading in headings:
+        if heading.level <= 2:
+            return heading.title
+    return None
+
 
 def estimate_token_count(file_path: str) -> int:
     """
@@ -109,12 +85,7 @@ def estimate_token_count(file_path: str) -> int:
         Estimated token count
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Rough approximation: 4 characters = 1 token
-        return len(content) // 4
-
+        return read_markdown(Path(file_path)).token_estimate
     except Exception as e:
         print(f"Warning: Could not estimate tokens for {file_path}: {e}")
         return 0
@@ -190,10 +161,103 @@ def find_awareness_files(
     return sorted(awareness_files)
 
 
+def scan_awareness_file(file_path: str, extract_metadata: bool = False) -> Dict[str, Any]:
+    """
+    Build the index entry for a single awareness file.
+
+    Kept free of shared state so it can run inside a worker process.
+
+    Returns:
+        File entry dict (path, type, category, heading, token_estimate, metadata)
+    """
+    # Categorize
+    category = categorize_awareness_file(file_path)
+    file_type = 'agents' if file_path.endswith('AGENTS.md') else 'claude'
+
+    # Extract metadata
+    frontmatter = extract_yaml_frontmatter(file_path) if extract_metadata else None
+    heading = extract_first_heading(file_path)
+    token_estimate = estimate_token_count(file_path)
+
+    # Build file entry
+    file_entry = {
+        'path': file_path,
+        'type': file_type,
+        'category': category,
+        'heading': heading,
+        'token_estimate': token_estimate
+    }
+
+    # Add frontmatter if extracted
+    if frontmatter:
+        file_entry['metadata'] = frontmatter
+
+        # Extract progressive loading hints if present
+        if 'progressive_loading' in frontmatter:
+            file_entry['progressive_loading'] = frontmatter['progressive_loading']
+
+        # Extract SAP ID if present
+        if 'sap_id' in frontmatter:
+            file_entry['sap_id'] = frontmatter['sap_id']
+
+        # Extract complexity if present
+        if 'complexity' in frontmatter:
+            file_entry['complexity'] = frontmatter['complexity']
+
+    return file_entry
+
+
+def _scan_chunk(chunk: List[str], extract_metadata: bool) -> List[Dict[str, Any]]:
+    """Scan a chunk of awareness files (process pool work unit)."""
+    return [scan_awareness_file(file_path, extract_metadata) for file_path in chunk]
+
+
+def scan_awareness_files(
+    awareness_files: List[str],
+    extract_metadata: bool = False,
+    jobs: int = 1
+) -> List[Dict[str, Any]]:
+    """
+    Scan awareness files, optionally across a process pool.
+
+    Files are split into contiguous chunks, and chunk results are collected
+    in submission order, so the output matches a sequential scan exactly.
+
+    Args:
+        awareness_files: Files to scan (order is preserved in the result)
+        extract_metadata: Whether to extract frontmatter metadata
+        jobs: Worker processes (1 = sequential, 0 = one per CPU core)
+
+    Returns:
+        List of file entries in the same order as awareness_files
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+
+    if jobs == 1 or len(awareness_files) < 2:
+        return [scan_awareness_file(file_path, extract_metadata) for file_path in awareness_files]
+
+    # Several chunks per worker keeps the pool balanced without paying
+    # per-file IPC overhead
+    chunk_size = max(1, len(awareness_files) // (jobs * 4))
+    chunks = [
+        awareness_files[i:i + chunk_size]
+        for i in range(0, len(awareness_files), chunk_size)
+    ]
+
+    entries = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for chunk_entries in executor.map(_scan_chunk, chunks, [extract_metadata] * len(chunks)):
+            entries.extend(chunk_entries)
+
+    return entries
+
+
 def build_awareness_index(
     paths: List[str] = None,
     extract_metadata: bool = False,
-    exclude_patterns: List[str] = None
+    exclude_patterns: List[str] = None,
+    jobs: int = 1
 ) -> Dict[str, Any]:
     """
     Build a complete awareness index from AGENTS.md and CLAUDE.md files.
@@ -202,6 +266,7 @@ def build_awareness_index(
         paths: List of paths to search
         extract_metadata: Whether to extract frontmatter metadata
         exclude_patterns: Patterns to exclude
+        jobs: Worker processes for file scanning (1 = sequential, 0 = all cores)
 
     Returns:
         Dict with awareness files, hierarchy, and statistics
@@ -223,48 +288,17 @@ def build_awareness_index(
     agents_count = 0
     claude_count = 0
 
-    for file_path in awareness_files:
-        # Categorize
-        category = categorize_awareness_file(file_path)
-        file_type = 'agents' if file_path.endswith('AGENTS.md') else 'claude'
-
-        # Extract metadata
-        frontmatter = extract_yaml_frontmatter(file_path) if extract_metadata else None
-        heading = extract_first_heading(file_path)
-        token_estimate = estimate_token_count(file_path)
+    for file_entry in scan_awareness_files(awareness_files, extract_metadata=extract_metadata, jobs=jobs):
+        file_path = file_entry['path']
+        category = file_entry['category']
 
-        total_tokens += token_estimate
+        total_tokens += file_entry['token_estimate']
 
-        if file_type == 'agents':
+        if file_entry['type'] == 'agents':
             agents_count += 1
         else:
             claude_count += 1
 
-        # Build file entry
-        file_entry = {
-            'path': file_path,
-            'type': file_type,
-            'category': category,
-            'heading': heading,
-            'token_estimate': token_estimate
-        }
-
-        # Add frontmatter if extracted
-        if frontmatter:
-            file_entry['metadata'] = frontmatter
-
-            # Extract progressive loading hints if present
-            if 'progressive_loading' in frontmatter:
-                file_entry['progressive_loading'] = frontmatter['progressive_loading']
-
-            # Extract SAP ID if present
-            if 'sap_id' in frontmatter:
-                file_entry['sap_id'] = frontmatter['sap_id']
-
-            # Extract complexity if present
-            if 'complexity' in frontmatter:
-                file_entry['complexity'] = frontmatter['complexity']
-
         files.append(file_entry)
         hierarchy[category].append(file_path)
 
@@ -334,13 +368,14 @@ def export_awareness_index(
     output_path: str = "scripts/awareness-index.json",
     format: str = "json",
     extract_metadata: bool = False,
-    paths: List[str] = None
+    paths: List[str] = None,
+    jobs: int = 1
 ):
     """
     Generate and export awareness index.
     """
     print(f"🔍 Scanning awareness files (AGENTS.md, CLAUDE.md)...")
-    index = build_awareness_index(paths=paths, extract_metadata=extract_metadata)
+    index = build_awareness_index(paths=paths, extract_metadata=extract_metadata, jobs=jobs)
 
     # Create output directory if needed
     os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
@@ -407,6 +442,12 @@ def main():
         nargs="+",
         help="Custom paths to scan (default: entire repo)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for file scanning (default: 1, 0 = one per CPU core)"
+    )
 
     args = parser.parse_args()
 
@@ -414,7 +455,8 @@ def main():
         output_path=args.output,
         format=args.format,
         extract_metadata=args.extract_metadata,
-        paths=args.paths
+        paths=args.paths,
+        jobs=args.jobs
     )
 
 
@@ -12,7 +12,9 @@
     python scripts/export-link-graph.py                    # Export to scripts/link-graph.json
     python scripts/export-link-graph.py --output custom.json  # Custom output path
     python scripts/export-link-graph.py --format yaml      # Export as YAML
+    python scripts/export-link-graph.py --format jsonl     # Stream to indexed JSON Lines (link_graph_store.py)
     python scripts/export-link-graph.py --validate         # Include broken link detection
+    python scripts/export-link-graph.py --jobs 8           # Scan files across 8 worker processes
 """
 
 import json
@@ -22,8 +24,9 @@
 import glob
 import argparse
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Any, Optional, Tuple
+from typing import Dict, Iterator, List, Set, Any, Optional, Tuple
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
@@ -32,6 +35,21 @@
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from link_graph_store import LinkGraphReader, LinkGraphWriter, summarize_nodes
+
+DEFAULT_PATHS = [
+    'docs/',
+    'README.md',
+    'CLAUDE.md',
+    'AGENTS.md',
+    'inbox/',
+    '.chora/'
+]
+
+DEFAULT_EXCLUDE_PATTERNS = ['node_modules', '.git', 'venv', '__pycache__', '.beads']
+
 
 def is_external_link(link: str) -> bool:
     """Check if a link is external (http/https)."""
@@ -167,36 +185,143 @@ def validate_internal_link(link: str, source_file: str) -> Tuple[bool, Optional[
     return (False, f"File not found: {normalized}")
 
 
-def build_link_graph(
-    paths: List[str] = None,
+def scan_markdown_file(md_file: str, validate: bool = False) -> Dict[str, Any]:
+    """
+    Scan a single markdown file into its node, edges and broken links.
+
+    Kept free of shared state so it can run inside a worker process.
+
+    Returns:
+        Dict with keys: node, edges, broken_links
+    """
+    links = extract_links_from_markdown(md_file)
+
+    node = {
+        'path': md_file,
+        'outbound_links': len(links),
+        'inbound_links': 0,  # Will be calculated after merge
+        'external_links': 0,
+        'internal_links': 0,
+        'anchor_links': 0,
+        'broken_links': 0
+    }
+    edges = []
+    broken_links = []
+
+    for link_info in links:
+        url = link_info['url']
+        category = categorize_link(url)
+
+        # Update counts
+        if category == 'external':
+            node['external_links'] += 1
+        elif category == 'internal':
+            node['internal_links'] += 1
+        elif category == 'anchor':
+            node['anchor_links'] += 1
+
+        # Normalize internal links
+        if category == 'internal':
+            normalized_target = normalize_path(url, md_file)
+
+            # Validate if requested
+            is_valid = True
+            error_msg = None
+            if validate:
+                is_valid, error_msg = validate_internal_link(url, md_file)
+                if not is_valid:
+                    node['broken_links'] += 1
+                    broken_links.append({
+                        'source': md_file,
+                        'target': url,
+                        'normalized_target': normalized_target,
+                        'line_number': link_info['line_number'],
+                        'error': error_msg
+                    })
+
+            # Add edge
+            edges.append({
+                'source': md_file,
+                'target': normalized_target,
+                'link_text': link_info['text'],
+                'line_number': link_info['line_number'],
+                'valid': is_valid,
+                'error': error_msg
+            })
+        elif category == 'external':
+            # Add external link edge
+            edges.append({
+                'source': md_file,
+                'target': url,
+                'link_text': link_info['text'],
+                'line_number': link_info['line_number'],
+                'external': True
+            })
+
+    return {'node': node, 'edges': edges, 'broken_links': broken_links}
+
+
+def _scan_chunk(chunk: List[str], validate: bool) -> List[Dict[str, Any]]:
+    """Scan a chunk of markdown files (process pool work unit)."""
+    return [scan_markdown_file(md_file, validate) for md_file in chunk]
+
+
+def iter_scan_results(
+    markdown_files: List[str],
     validate: bool = False,
-    exclude_patterns: List[str] = None
-) -> Dict[str, Any]:
+    jobs: int = 1
+) -> Iterator[Dict[str, Any]]:
     """
-    Build a complete link graph from markdown files.
+    Scan markdown files, optionally across a process pool, yielding results.
+
+    Files are split into contiguous chunks, and chunk results are yielded
+    in submission order, so the output matches a sequential scan exactly.
 
     Args:
-        paths: List of paths to search (defaults to common doc directories)
+        markdown_files: Files to scan (order is preserved in the result)
         validate: Whether to validate internal links
-        exclude_patterns: Patterns to exclude (e.g., ['node_modules', '.git'])
+        jobs: Worker processes (1 = sequential, 0 = one per CPU core)
+
+    Yields:
+        Scan results in the same order as markdown_files
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+
+    if jobs == 1 or len(markdown_files) < 2:
+        for md_file in markdown_files:
+            yield scan_markdown_file(md_file, validate)
+        return
+
+    # Several chunks per worker keeps the pool balanced without paying
+    # per-file IPC overhead
+    chunk_size = max(1, len(markdown_files) // (jobs * 4))
+    chunks = [
+        markdown_files[i:i + chunk_size]
+        for i in range(0, len(markdown_files), chunk_size)
+    ]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for chunk_results in executor.map(_scan_chunk, chunks, [validate] * len(chunks)):
+            yield from chunk_results
+
+
+def scan_markdown_files(
+    markdown_files: List[str],
+    validate: bool = False,
+    jobs: int = 1
+) -> List[Dict[str, Any]]:
+    """
+    Scan markdown files, optionally across a process pool.
 
     Returns:
-        Dict with nodes (files) and edges (links)
+        List of scan results in the same order as markdown_files
     """
-    if paths is None:
-        paths = [
-            'docs/',
-            'README.md',
-            'CLAUDE.md',
-            'AGENTS.md',
-            'inbox/',
-            '.chora/'
-        ]
+    return list(iter_scan_results(markdown_files, validate=validate, jobs=jobs))
 
-    if exclude_patterns is None:
-        exclude_patterns = ['node_modules', '.git', 'venv', '__pycache__', '.beads']
 
-    # Find all markdown files
+def find_markdown_files(paths: List[str], exclude_patterns: List[str]) -> List[str]:
+    """Markdown files under the given paths, in sorted order."""
     markdown_files = []
     for path in paths:
         if os.path.isfile(path) and path.endswith('.md'):
@@ -211,75 +336,54 @@ def build_link_graph(
                         file_path = os.path.join(root, file)
                         markdown_files.append(file_path)
 
-    # Build graph
+    return sorted(markdown_files)
+
+
+def graph_metadata(validate: bool, paths: List[str], exclude_patterns: List[str]) -> Dict[str, Any]:
+    """Metadata block shared by all export formats."""
+    return {
+        'generated': datetime.now(timezone.utc).isoformat(),
+        'validation_enabled': validate,
+        'paths_scanned': paths,
+        'exclude_patterns': exclude_patterns
+    }
+
+
+def build_link_graph(
+    paths: List[str] = None,
+    validate: bool = False,
+    exclude_patterns: List[str] = None,
+    jobs: int = 1
+) -> Dict[str, Any]:
+    """
+    Build a complete link graph from markdown files.
+
+    Args:
+        paths: List of paths to search (defaults to common doc directories)
+        validate: Whether to validate internal links
+        exclude_patterns: Patterns to exclude (e.g., ['node_modules', '.git'])
+        jobs: Worker processes for file scanning (1 = sequential, 0 = all cores)
+
+    Returns:
+        Dict with nodes (files) and edges (links)
+    """
+    if paths is None:
+        paths = list(DEFAULT_PATHS)
+
+    if exclude_patterns is None:
+        exclude_patterns = list(DEFAULT_EXCLUDE_PATTERNS)
+
+    markdown_files = find_markdown_files(paths, exclude_patterns)
+
+    # Build graph (scan per file, then merge in sorted path order)
     nodes = {}
     edges = []
     broken_links = []
 
-    for md_file in sorted(markdown_files):
-        links = extract_links_from_markdown(md_file)
-
-        # Add node for this file
-        nodes[md_file] = {
-            'path': md_file,
-            'outbound_links': len(links),
-            'inbound_links': 0,  # Will be calculated later
-            'external_links': 0,
-            'internal_links': 0,
-            'anchor_links': 0,
-            'broken_links': 0
-        }
-
-        # Process each link
-        for link_info in links:
-            url = link_info['url']
-            category = categorize_link(url)
-
-            # Update counts
-            if category == 'external':
-                nodes[md_file]['external_links'] += 1
-            elif category == 'internal':
-                nodes[md_file]['internal_links'] += 1
-            elif category == 'anchor':
-                nodes[md_file]['anchor_links'] += 1
-
-            # Normalize internal links
-            if category == 'internal':
-                normalized_target = normalize_path(url, md_file)
-
-                # Validate if requested
-                is_valid = True
-                error_msg = None
-                if validate:
-                    is_valid, error_msg = validate_internal_link(url, md_file)
-                    if not is_valid:
-                        nodes[md_file]['broken_links'] += 1
-                        broken_links.append({
-                            'source': md_file,
-                            'target': url,
-                            'normalized_target': normalized_target,
-                            'line_number': link_info['line_number'],
-                            'error': error_msg
-                        })
-
-                # Add edge
-                edges.append({
-                    'source': md_file,
-                    'target': normalized_target,
-                    'link_text': link_info['text'],
-                    'line_number': link_info['line_number'],
-                    'valid': is_valid,
-                    'error': error_msg
-                })
-            elif category == 'external':
-                # Add external link edge
-                edges.append({
-                    'source': md_file,
-                    'target': url,
-                    'link_text': link_info['text'],
-                    'line_number': link_info['line_number'],
-                    'external': True
-                })
+    for result in iter_scan_results(markdown_files, validate=validate, jobs=jobs):
+        nodes[result['node']['path']] = result['node']
+        edges.extend(result['edges'])
+        broken_links.extend(result['broken_links'])
 
     # Calculate inbound link counts
     for edge in edges:
@@ -295,22 +399,11 @@ def build_link_graph(
     internal_edges = [e for e in edges if not e.get('external', False)]
     external_edges = [e for e in edges if e.get('external', False)]
 
-    # Find orphaned files (no inbound links)
-    orphaned = [path for path, node in nodes.items() if node['inbound_links'] == 0]
-
-    # Find hub files (high inbound links)
-    hubs = sorted(
-        [(path, node['inbound_links']) for path, node in nodes.items()],
-        key=lambda x: -x[1]
-    )[:10]
+    # Find orphaned files (no inbound links) and hub files (high inbound links)
+    orphaned, top_hubs = summarize_nodes(nodes)
 
     return {
-        'metadata': {
-            'generated': datetime.now(timezone.utc).isoformat(),
-            'validation_enabled': validate,
-            'paths_scanned': paths,
-            'exclude_patterns': exclude_patterns
-        },
+        'metadata': graph_metadata(validate, paths, exclude_patterns),
         'statistics': {
             'total_files': total_nodes,
             'total_links': total_edges,
@@ -323,25 +416,79 @@ def build_link_graph(
         'edges': edges,
         'broken_links': broken_links if validate else None,
         'orphaned_files': orphaned,
-        'top_hubs': [{'path': path, 'inbound_links': count} for path, count in hubs]
+        'top_hubs': top_hubs
     }
 
 
+def stream_link_graph(
+    output_path: str,
+    paths: List[str] = None,
+    validate: bool = False,
+    exclude_patterns: List[str] = None,
+    jobs: int = 1
+) -> Dict[str, Any]:
+    """
+    Scan markdown files straight into an indexed JSON Lines graph.
+
+    Edges are written as each file is scanned, so the full graph is never
+    held in memory. Query the result with link_graph_store.LinkGraphReader.
+
+    Returns:
+        Dict with statistics, the first broken links (None without validation),
+        orphaned files and top hubs
+    """
+    if paths is None:
+        paths = list(DEFAULT_PATHS)
+
+    if exclude_patterns is None:
+        exclude_patterns = list(DEFAULT_EXCLUDE_PATTERNS)
+
+    markdown_files = find_markdown_files(paths, exclude_patterns)
+    with LinkGraphWriter(output_path, graph_metadata(validate, paths, exclude_patterns)) as writer:
+        for result in iter_scan_results(markdown_files, validate=validate, jobs=jobs):
+            writer.add_file(result)
+
+    with LinkGraphReader(output_path) as graph:
+        summary = graph.summary
+        broken_links = None
+        if validate:
+            broken = graph.broken_links()
+            broken_links = [next(broken) for _ in range(min(5, summary['statistics']['broken_links']))]
+        return {
+            'statistics': summary['statistics'],
+            'broken_links': broken_links,
+            'orphaned_files': summary['orphaned_files'],
+            'top_hubs': summary['top_hubs']
+        }
+
+
 def export_link_graph(
     output_path: str = "scripts/link-graph.json",
     format: str = "json",
     validate: bool = False,
-    paths: List[str] = None
+    paths: List[str] = None,
+    jobs: int = 1
 ):
     """
     Generate and export link graph.
+
+    Returns:
+        The graph (for jsonl, only statistics, first broken links, orphans and hubs)
     """
     print(f"🔍 Scanning markdown files...")
-    graph = build_link_graph(paths=paths, validate=validate)
 
     # Create output directory if needed
     os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
 
+    # Streamed export never builds the full graph
+    if format == "jsonl":
+        if output_path.endswith('.json'):
+            output_path = output_path[:-len('.json')] + '.jsonl'
+        graph = stream_link_graph(output_path, paths=paths, validate=validate, jobs=jobs)
+        print(f"✅ Link graph exported to {output_path}")
+    else:
+        graph = build_link_graph(paths=paths, validate=validate, jobs=jobs)
+
     # Export
     if format == "json":
         with open(output_path, 'w', encoding='utf-8') as f:
@@ -394,9 +541,9 @@ def main():
     )
     parser.add_argument(
         "--format",
-        choices=["json", "yaml"],
+        choices=["json", "yaml", "jsonl"],
         default="json",
-        help="Output format (default: json)"
+        help="Output format (default: json; jsonl streams an indexed graph for large repos)"
     )
     parser.add_argument(
         "--validate",
@@ -408,6 +555,12 @@ def main():
         nargs="+",
         help="Custom paths to scan (default: docs/, README.md, CLAUDE.md, inbox/)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for file scanning (default: 1, 0 = one per CPU core)"
+    )
 
     args = parser.parse_args()
 
@@ -415,7 +568,8 @@ def main():
         output_path=args.output,
         format=args.format,
         validate=args.validate,
-        paths=args.paths
+        paths=args.paths,
+        jobs=args.jobs
     )
 
 
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Lightweight directory change watcher for long-running indexers.
+
+Uses Linux inotify (via ctypes, no extra dependencies) when available and
+falls back to mtime/size polling everywhere else. Watches a single
+directory (non-recursive) and reports changed file names filtered by suffix.
+
+Usage:
+    from fs_watch import DirectoryWatcher
+
+    watcher = DirectoryWatcher(Path(".chora/memory/knowledge"), suffixes=(".md",))
+    while True:
+        changed = watcher.poll(timeout=1.0)   # {"note.md", ...}
+        ...
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+# inotify event masks (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Reported instead of file names when events were lost (inotify overflow);
+# callers should rescan the whole directory
+RESYNC = "*"
+
+
+def _load_inotify():
+    """Return libc with inotify symbols, or None if unsupported."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        # Probe symbols; raises AttributeError where inotify is unavailable
+        libc.inotify_init1
+        libc.inotify_add_watch
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class DirectoryWatcher:
+    """Report files created, modified or deleted in a directory."""
+
+    def __init__(
+        self,
+        directory: Path,
+        suffixes: Iterable[str] = (),
+        interval: float = 2.0,
+        use_inotify: bool = True
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            directory: Directory to watch (non-recursive)
+            suffixes: Only report names ending with one of these (empty = all)
+            interval: Polling interval in seconds (polling backend)
+            use_inotify: Try inotify before falling back to polling
+        """
+        self.directory = Path(directory)
+        self.suffixes = tuple(suffixes)
+        self.interval = interval
+        self._fd: Optional[int] = None
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+
+        libc = _load_inotify() if use_inotify else None
+        if libc is not None:
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd >= 0 and libc.inotify_add_watch(fd, os.fsencode(self.directory), WATCH_MASK) >= 0:
+                self._fd = fd
+            elif fd >= 0:
+                os.close(fd)
+
+        if self._fd is None:
+            self._snapshot = self._scan()
+
+    @property
+    def backend(self) -> str:
+        """Active backend: "inotify" or "polling"."""
+        return "inotify" if self._fd is not None else "polling"
+
+    def _matches(self, name: str) -> bool:
+        return not self.suffixes or name.endswith(self.suffixes)
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Snapshot of (mtime_ns, size) per matching file."""
+        snapshot = {}
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and self._matches(entry.name):
+                        stat = entry.stat()
+                        snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            pass
+        return snapshot
+
+    def poll(self, timeout: Optional[float] = None) -> Set[str]:
+        """
+        Wait up to timeout seconds for changes.
+
+        Returns:
+            Names of files changed since the previous call (may be empty).
+            Contains RESYNC if events were lost.
+        """
+        if timeout is None:
+            timeout = self.interval
+
+        if self._fd is None:
+            time.sleep(timeout)
+            current = self._scan()
+            changed = {
+                name for name in set(current) | set(self._snapshot)
+                if current.get(name) != self._snapshot.get(name)
+            }
+            self._snapshot = current
+            return changed
+
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed = set()
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                _wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(errors="surrogateescape")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    changed.add(RESYNC)
+                elif name and self._matches(name):
+                    changed.add(name)
+        return changed
+
+    def close(self):
+        """Release the inotify descriptor."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "DirectoryWatcher":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
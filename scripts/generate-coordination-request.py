@@ -18,6 +18,9 @@
 
     # Preview only (no file written):
     python3 scripts/generate-coordination-request.py --context context.json --preview
+
+    # Generate AI-augmented fields one at a time:
+    python3 scripts/generate-coordination-request.py --context context.json --concurrency 1
 """
 
 import argparse
@@ -30,7 +33,12 @@
 sys.path.insert(0, str(Path(__file__).parent))
 
 from inbox_generator.core.config_loader import ConfigLoader
-from inbox_generator.core.assembler import ArtifactAssembler
+from inbox_generator.core.assembler import ArtifactAssembler, DEFAULT_CONCURRENCY
+
+# Configure UTF-8 output for Windows console compatibility
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 
 def load_context_from_args(args) -> Dict[str, Any]:
@@ -138,6 +146,13 @@ def main():
         help='AI model for augmented generation (default: claude-sonnet-4-5-20250929)'
     )
 
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f'Maximum fields generated at the same time (default: {DEFAULT_CONCURRENCY}, 1 = one by one)'
+    )
+
     # Processing
     parser.add_argument(
         '--post-process',
@@ -185,7 +200,8 @@ def main():
     # Initialize assembler
     assembler = ArtifactAssembler(
         config_loader=config_loader,
-        ai_model=args.ai_model
+        ai_model=args.ai_model,
+        concurrency=args.concurrency
     )
 
     try:
@@ -232,11 +248,6 @@ def main():
         if args.verbose:
             import traceback
 
-# Configure UTF-8 output for Windows console compatibility
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
-    sys.stderr.reconfigure(encoding='utf-8')
-
             traceback.print_exc()
         sys.exit(1)
 
@@ -4,47 +4,165 @@
 This script generates all 5 SAP artifacts (capability-charter, protocol-spec,
 awareness-guide, adoption-blueprint, ledger) from a SAP entry in sap-catalog.json.
 
+Several SAPs (or the whole catalog with --all) can be generated in one run:
+templates are compiled once into a bytecode cache shared by all runs, SAPs
+are rendered across a pool of worker processes, and INDEX.md is updated
+once for the whole batch.
+
 Usage:
     python scripts/generate-sap.py SAP-029
     python scripts/generate-sap.py SAP-029 --dry-run
     python scripts/generate-sap.py SAP-029 --force
+    python scripts/generate-sap.py SAP-027 SAP-028 SAP-029
+    python scripts/generate-sap.py --all --force --jobs 8
 """
 
-import json
+import copy
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 # Configure UTF-8 output for Windows console compatibility
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
+# Add repo root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.sap_catalog import SAPCatalog, load_sap_catalog
+
+TEMPLATE_DIR = 'templates/sap'
+
+# Compiled templates, shared by every run (relative to the working directory)
+BYTECODE_CACHE_DIR = Path('.chora') / 'cache' / 'jinja-sap'
+
+# Worker processes used to render several SAPs
+DEFAULT_JOBS = 4
+
+# (template, output file) for each SAP artifact
+ARTIFACTS = [
+    ('capability-charter.j2', 'capability-charter.md'),
+    ('protocol-spec.j2', 'protocol-spec.md'),
+    ('awareness-guide.j2', 'awareness-guide.md'),
+    ('adoption-blueprint.j2', 'adoption-blueprint.md'),
+    ('ledger.j2', 'ledger.md'),
+]
+
+# Environments per (template dir, bytecode cache dir), one per process
+_environments = {}
+
 
 def load_catalog(catalog_path='sap-catalog.json'):
-    """Load sap-catalog.json"""
-    with open(catalog_path, encoding='utf-8') as f:
-        return json.load(f)
+    """Load sap-catalog.json (shared, indexed by SAP ID; treat as read-only)"""
+    return load_sap_catalog(Path(catalog_path))
 
 
 def get_sap_entry(catalog, sap_id):
-    """Find SAP entry by ID in catalog"""
-    for sap in catalog['saps']:
-        if sap['id'] == sap_id:
-            return sap
-    raise ValueError(f"SAP {sap_id} not found in catalog")
+    """Find SAP entry by ID in catalog (returns a copy that is safe to modify)"""
+    if not isinstance(catalog, SAPCatalog):
+        catalog = SAPCatalog(catalog)
+    sap = catalog.get_sap(sap_id)
+    if sap is None:
+        raise ValueError(f"SAP {sap_id} not found in catalog")
+    return copy.deepcopy(sap)
+
+
+def prepare_sap_data(sap):
+    """Template data for a SAP entry"""
+    sap_data = copy.deepcopy(sap)
+
+    # Merge generation fields into top-level for template access
+    if 'generation' in sap_data:
+        sap_data.update(sap_data['generation'])
+    return sap_data
 
 
-def render_template(template_name, data):
+def get_environment(template_dir=TEMPLATE_DIR, cache_dir=BYTECODE_CACHE_DIR):
+    """Jinja2 environment for the SAP templates, created once per process
+
+    Compiled templates are kept in a bytecode cache on disk, so worker
+    processes and later runs skip compilation (Jinja2 recompiles a template
+    whenever its source changes). Without a writable cache directory the
+    environment still works, compiling in memory.
+    """
+    key = (str(template_dir), str(cache_dir) if cache_dir else None)
+    env = _environments.get(key)
+    if env is None:
+        bytecode_cache = None
+        if cache_dir:
+            try:
+                Path(cache_dir).mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+            except OSError:
+                pass
+        env = Environment(loader=FileSystemLoader(str(template_dir)), bytecode_cache=bytecode_cache)
+        _environments[key] = env
+    return env
+
+
+def render_template(template_name, data, env=None):
     """Render Jinja2 template with data"""
-    env = Environment(loader=FileSystemLoader('templates/sap'))
-    template = env.get_template(template_name)
+    template = (env or get_environment()).get_template(template_name)
     return template.render(**data)
 
 
+def render_artifacts(sap_data, template_dir=TEMPLATE_DIR, cache_dir=BYTECODE_CACHE_DIR):
+    """Render all artifacts of a SAP (process pool work unit)
+
+    Returns:
+        List of (template name, output name, content, error) in ARTIFACTS
+        order; content is None and error the message if rendering failed
+    """
+    env = get_environment(template_dir, cache_dir)
+    rendered = []
+    for template_name, output_name in ARTIFACTS:
+        try:
+            rendered.append((template_name, output_name, render_template(template_name, sap_data, env), None))
+        except Exception as e:
+            rendered.append((template_name, output_name, None, str(e)))
+    return rendered
+
+
+def iter_rendered_saps(sap_datas, jobs=1, template_dir=TEMPLATE_DIR, cache_dir=BYTECODE_CACHE_DIR):
+    """Render SAPs, optionally across a process pool
+
+    Args:
+        sap_datas: Template data per SAP (prepare_sap_data() output)
+        jobs: Worker processes (1 = sequential, 0 = one per CPU core)
+
+    Yields:
+        render_artifacts() results in the same order as sap_datas
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+
+    if jobs == 1 or len(sap_datas) < 2:
+        for sap_data in sap_datas:
+            yield render_artifacts(sap_data, template_dir, cache_dir)
+        return
+
+    # Compile every template once up front so workers load bytecode
+    env = get_environment(template_dir, cache_dir)
+    for template_name, _ in ARTIFACTS:
+        try:
+            env.get_template(template_name)
+        except Exception:
+            pass  # Reported per SAP by render_artifacts()
+
+    count = len(sap_datas)
+    with ProcessPoolExecutor(max_workers=min(jobs, count)) as executor:
+        yield from executor.map(
+            render_artifacts, sap_datas, [template_dir] * count, [cache_dir] * count,
+            chunksize=max(1, count // (jobs * 4))
+        )
+
+
 def run_validation(sap_id, dry_run=False):
     """Run sap-evaluator.py --quick validation
 
@@ -111,6 +229,20 @@ def update_index(sap_data, index_path='docs/skilled-awareness/INDEX.md', dry_run
     Returns:
         Boolean indicating success
     """
+    return update_index_batch([sap_data], index_path=index_path, dry_run=dry_run)
+
+
+def update_index_batch(saps, index_path='docs/skilled-awareness/INDEX.md', dry_run=False):
+    """Update INDEX.md with several new SAP entries in a single write
+
+    Args:
+        saps: SAP metadata dictionaries, in the order rows are added
+        index_path: Path to INDEX.md file
+        dry_run: If True, show what would be updated without writing
+
+    Returns:
+        Boolean indicating whether any SAP was added
+    """
     index_file = Path(index_path)
 
     if not index_file.exists():
@@ -120,27 +252,35 @@ def update_index(sap_data, index_path='docs/skilled-awareness/INDEX.md', dry_run
     # Read current INDEX.md
     content = index_file.read_text(encoding='utf-8')
 
-    # Check if SAP already exists in index
-    sap_id = sap_data['id']
-    if f"| {sap_id} |" in content:
-        print(f"ℹ️  {sap_id} already in INDEX.md, skipping index update")
+    # Skip SAPs already in the index
+    new_saps = []
+    for sap_data in saps:
+        sap_id = sap_data['id']
+        if f"| {sap_id} |" in content or any(sap['id'] == sap_id for sap in new_saps):
+            print(f"ℹ️  {sap_id} already in INDEX.md, skipping index update")
+            continue
+        new_saps.append(sap_data)
+
+    if not new_saps:
         return False
 
-    # Extract location for relative path (remove docs/skilled-awareness/ prefix)
-    location = sap_data['location'].replace('docs/skilled-awareness/', '')
+    new_rows = []
+    for sap_data in new_saps:
+        # Extract location for relative path (remove docs/skilled-awareness/ prefix)
+        location = sap_data['location'].replace('docs/skilled-awareness/', '')
 
-    # Format dependencies
-    deps = sap_data.get('dependencies', [])
-    if deps:
-        deps_str = ', '.join(deps)
-    else:
-        deps_str = "None (foundational)"
+        # Format dependencies
+        deps = sap_data.get('dependencies', [])
+        if deps:
+            deps_str = ', '.join(deps)
+        else:
+            deps_str = "None (foundational)"
 
-    # Determine awareness score (default to pending for new SAPs)
-    awareness = "-"
+        # Determine awareness score (default to pending for new SAPs)
+        awareness = "-"
 
-    # Create new table row
-    new_row = f"| {sap_id} | {sap_data['name']} | {sap_data['version']} | {sap_data['status'].title()} | {sap_data.get('phase', 'Pilot')} | {awareness} | [{location}/]({location}/) | {deps_str} |"
+        # Create new table row
+        new_rows.append(f"| {sap_data['id']} | {sap_data['name']} | {sap_data['version']} | {sap_data['status'].title()} | {sap_data.get('phase', 'Pilot')} | {awareness} | [{location}/]({location}/) | {deps_str} |")
 
     # Find the Active SAPs table and insert before the closing marker
     # Insert after the last SAP row (before the blank line after the table)
@@ -148,8 +288,8 @@ def update_index(sap_data, index_path='docs/skilled-awareness/INDEX.md', dry_run
 
     match = re.search(table_pattern, content)
     if match:
-        # Insert new row after the last SAP row
-        updated_content = content[:match.end(1)] + new_row + '\n' + content[match.end(1):]
+        # Insert new rows after the last SAP row
+        updated_content = content[:match.end(1)] + ''.join(row + '\n' for row in new_rows) + content[match.end(1):]
 
         # Update coverage count
         # Find "Current Coverage": 26/28 SAPs (93%)
@@ -159,8 +299,8 @@ def update_index(sap_data, index_path='docs/skilled-awareness/INDEX.md', dry_run
         if coverage_match:
             current = int(coverage_match.group(1))
             total = int(coverage_match.group(2))
-            new_current = current + 1
-            new_total = total + 1  # Increment total since this is a new capability
+            new_current = current + len(new_saps)
+            new_total = total + len(new_saps)  # Increment total since these are new capabilities
             new_percentage = round((new_current / new_total) * 100)
 
             updated_content = re.sub(
@@ -185,30 +325,42 @@ def update_index(sap_data, index_path='docs/skilled-awareness/INDEX.md', dry_run
             updated_content
         )
 
-        # Add changelog entry
-        changelog_entry = f"| {today} | {sap_id} ({sap_data['name']}) generated - {sap_data.get('description', 'New capability')} | Claude Code |"
+        # Add changelog entries
+        changelog_entries = [
+            f"| {today} | {sap_data['id']} ({sap_data['name']}) generated - {sap_data.get('description', 'New capability')} | Claude Code |"
+            for sap_data in new_saps
+        ]
 
         # Find changelog table and insert at the top (after header row)
         changelog_pattern = r'(## Changelog\n\n\| Date \| Change \| Author \|\n\|------|--------|--------\|\n)'
         changelog_match = re.search(changelog_pattern, updated_content)
 
         if changelog_match:
-            updated_content = updated_content[:changelog_match.end()] + changelog_entry + '\n' + updated_content[changelog_match.end():]
+            updated_content = (
+                updated_content[:changelog_match.end()]
+                + ''.join(entry + '\n' for entry in changelog_entries)
+                + updated_content[changelog_match.end():]
+            )
 
         if dry_run:
             print(f"\n📝 INDEX.md update preview:")
-            print(f"   Would add row: {new_row}")
-            print(f"   Would update coverage: {current}/{total} → {new_current}/{new_total} ({new_percentage}%)")
-            print(f"   Would update capabilities: {total} → {new_total}")
-            print(f"   Would add changelog: {changelog_entry}")
+            for new_row in new_rows:
+                print(f"   Would add row: {new_row}")
+            if coverage_match:
+                print(f"   Would update coverage: {current}/{total} → {new_current}/{new_total} ({new_percentage}%)")
+                print(f"   Would update capabilities: {total} → {new_total}")
+            for changelog_entry in changelog_entries:
+                print(f"   Would add changelog: {changelog_entry}")
         else:
             # Write updated INDEX.md
             index_file.write_text(updated_content, encoding='utf-8')
             print(f"\n📝 Updated INDEX.md:")
-            print(f"   ✅ Added {sap_id} to Active SAPs table")
-            print(f"   ✅ Updated coverage: {current}/{total} → {new_current}/{new_total} ({new_percentage}%)")
-            print(f"   ✅ Updated capabilities: {total} → {new_total}")
-            print(f"   ✅ Added changelog entry")
+            for sap_data in new_saps:
+                print(f"   ✅ Added {sap_data['id']} to Active SAPs table")
+            if coverage_match:
+                print(f"   ✅ Updated coverage: {current}/{total} → {new_current}/{new_total} ({new_percentage}%)")
+                print(f"   ✅ Updated capabilities: {total} → {new_total}")
+            print(f"   ✅ Added {len(changelog_entries)} changelog entr{'y' if len(changelog_entries) == 1 else 'ies'}")
 
         return True
     else:
@@ -216,36 +368,19 @@ def update_index(sap_data, index_path='docs/skilled-awareness/INDEX.md', dry_run
         return False
 
 
-def generate_sap(sap_id, dry_run=False, force=False, catalog_path='sap-catalog.json', skip_index=False, skip_validation=False):
-    """Generate all 5 artifacts for a SAP
+def write_artifacts(sap_data, rendered, dry_run=False, force=False):
+    """Write a SAP's rendered artifacts to its location
 
     Args:
-        sap_id: SAP ID (e.g., 'SAP-029')
+        sap_data: SAP template data
+        rendered: render_artifacts() result for the SAP
         dry_run: If True, print what would be generated without writing files
         force: If True, overwrite existing files
-        catalog_path: Path to catalog JSON file
-        skip_index: If True, skip INDEX.md auto-update
-        skip_validation: If True, skip sap-evaluator.py validation
 
     Returns:
         List of generated file paths
     """
-    # Load catalog and get SAP entry
-    catalog = load_catalog(catalog_path)
-    sap_data = get_sap_entry(catalog, sap_id)
-
-    # Merge generation fields into top-level for template access
-    if 'generation' in sap_data:
-        sap_data.update(sap_data['generation'])
-
-    # Define artifacts to generate
-    artifacts = [
-        ('capability-charter.j2', 'capability-charter.md'),
-        ('protocol-spec.j2', 'protocol-spec.md'),
-        ('awareness-guide.j2', 'awareness-guide.md'),
-        ('adoption-blueprint.j2', 'adoption-blueprint.md'),
-        ('ledger.j2', 'ledger.md'),
-    ]
+    sap_id = sap_data['id']
 
     # Determine output directory
     output_dir = Path(sap_data['location'])
@@ -261,8 +396,8 @@ def generate_sap(sap_id, dry_run=False, force=False, catalog_path='sap-catalog.j
 
     generated_files = []
 
-    # Generate each artifact
-    for template_name, output_name in artifacts:
+    # Write each artifact
+    for template_name, output_name, content, error in rendered:
         output_path = output_dir / output_name
 
         # Check if file exists and force not specified
@@ -270,11 +405,8 @@ def generate_sap(sap_id, dry_run=False, force=False, catalog_path='sap-catalog.j
             print(f"⚠️  Skipping {output_path} (already exists, use --force to overwrite)")
             continue
 
-        # Render template
-        try:
-            content = render_template(template_name, sap_data)
-        except Exception as e:
-            print(f"❌ Error rendering {template_name}: {e}")
+        if error is not None:
+            print(f"❌ Error rendering {template_name}: {error}")
             continue
 
         if dry_run:
@@ -291,26 +423,100 @@ def generate_sap(sap_id, dry_run=False, force=False, catalog_path='sap-catalog.j
     if not dry_run and generated_files:
         print(f"\n✅ Successfully generated {len(generated_files)} artifacts for {sap_id}")
         print(f"📁 Location: {output_dir}")
+    elif dry_run:
+        print(f"🔍 DRY RUN COMPLETE: {len(rendered)} artifacts would be generated")
 
-        # Update INDEX.md (unless skipped or using test catalog)
-        if not skip_index and catalog_path == 'sap-catalog.json':
-            update_index(sap_data, dry_run=False)
+    return generated_files
 
-        # Run validation (unless skipped)
-        if not skip_validation:
-            run_validation(sap_id, dry_run=False)
-    elif dry_run:
-        print(f"🔍 DRY RUN COMPLETE: {len(artifacts)} artifacts would be generated")
 
-        # Show INDEX.md update preview
-        if not skip_index and catalog_path == 'sap-catalog.json':
-            update_index(sap_data, dry_run=True)
+def generate_saps(sap_ids, dry_run=False, force=False, catalog_path='sap-catalog.json',
+                  skip_index=False, skip_validation=False, jobs=DEFAULT_JOBS):
+    """Generate all 5 artifacts for several SAPs
 
-        # Show validation preview
-        if not skip_validation:
-            run_validation(sap_id, dry_run=True)
+    SAPs are rendered across up to `jobs` worker processes; files are
+    written, INDEX.md is updated (once, for every SAP that got artifacts)
+    and validation runs in this process.
 
-    return generated_files
+    Args:
+        sap_ids: SAP IDs (e.g., ['SAP-027', 'SAP-029'])
+        dry_run: If True, print what would be generated without writing files
+        force: If True, overwrite existing files
+        catalog_path: Path to catalog JSON file
+        skip_index: If True, skip INDEX.md auto-update
+        skip_validation: If True, skip sap-evaluator.py validation
+        jobs: Worker processes (1 = sequential, 0 = one per CPU core)
+
+    Returns:
+        Dict of SAP ID -> list of generated file paths
+
+    Raises:
+        ValueError: If a SAP ID is not in the catalog (nothing is generated)
+    """
+    # Load catalog and get SAP entries
+    catalog = load_catalog(catalog_path)
+    sap_datas = [prepare_sap_data(get_sap_entry(catalog, sap_id)) for sap_id in sap_ids]
+
+    # Skip rendering SAPs whose artifacts all exist and would be kept
+    to_render = [
+        sap_data for sap_data in sap_datas
+        if force or dry_run or not all(
+            (Path(sap_data['location']) / output_name).exists() for _, output_name in ARTIFACTS
+        )
+    ]
+    rendered_by_id = {
+        sap_data['id']: rendered
+        for sap_data, rendered in zip(to_render, iter_rendered_saps(to_render, jobs=jobs))
+    }
+
+    results = {}
+    for sap_data in sap_datas:
+        rendered = rendered_by_id.get(sap_data['id'])
+        if rendered is None:
+            rendered = [(template_name, output_name, None, None) for template_name, output_name in ARTIFACTS]
+        results[sap_data['id']] = write_artifacts(sap_data, rendered, dry_run=dry_run, force=force)
+        if len(sap_datas) > 1:
+            print()
+
+    generated_saps = [sap_data for sap_data in sap_datas if results[sap_data['id']]]
+    update_saps = sap_datas if dry_run else generated_saps
+
+    # Update INDEX.md (unless skipped or using test catalog)
+    if update_saps and not skip_index and catalog_path == 'sap-catalog.json':
+        update_index_batch(update_saps, dry_run=dry_run)
+
+    # Run validation (unless skipped): one evaluator run for a batch
+    if update_saps and not skip_validation:
+        validate_id = update_saps[0]['id'] if len(update_saps) == 1 else 'all'
+        run_validation(validate_id, dry_run=dry_run)
+
+    if len(sap_datas) > 1:
+        verb = "would be generated" if dry_run else "generated"
+        if dry_run:
+            total = len(ARTIFACTS) * len(sap_datas)
+        else:
+            total = sum(len(files) for files in results.values())
+        print(f"\n📦 Batch complete: {total} artifacts {verb} for {len(update_saps)}/{len(sap_datas)} SAPs")
+
+    return results
+
+
+def generate_sap(sap_id, dry_run=False, force=False, catalog_path='sap-catalog.json', skip_index=False, skip_validation=False):
+    """Generate all 5 artifacts for a SAP
+
+    Args:
+        sap_id: SAP ID (e.g., 'SAP-029')
+        dry_run: If True, print what would be generated without writing files
+        force: If True, overwrite existing files
+        catalog_path: Path to catalog JSON file
+        skip_index: If True, skip INDEX.md auto-update
+        skip_validation: If True, skip sap-evaluator.py validation
+
+    Returns:
+        List of generated file paths
+    """
+    results = generate_saps([sap_id], dry_run=dry_run, force=force, catalog_path=catalog_path,
+                            skip_index=skip_index, skip_validation=skip_validation, jobs=1)
+    return results[sap_id]
 
 
 def main():
@@ -329,9 +535,14 @@ def main():
   python scripts/generate-sap.py SAP-029
   python scripts/generate-sap.py SAP-029 --dry-run
   python scripts/generate-sap.py SAP-029 --force
+  python scripts/generate-sap.py SAP-027 SAP-028 SAP-029
+  python scripts/generate-sap.py --all --force --jobs 8
         """
     )
-    parser.add_argument('sap_id', help='SAP ID to generate (e.g., SAP-029)')
+    parser.add_argument('sap_ids', nargs='*', metavar='sap_id',
+                       help='SAP ID(s) to generate (e.g., SAP-029)')
+    parser.add_argument('--all', action='store_true',
+                       help='Generate artifacts for every SAP in the catalog')
     parser.add_argument('--dry-run', action='store_true',
                        help='Show what would be generated without writing files')
     parser.add_argument('--force', action='store_true',
@@ -342,13 +553,28 @@ def main():
                        help='Skip INDEX.md auto-update')
     parser.add_argument('--skip-validation', action='store_true',
                        help='Skip sap-evaluator.py validation')
+    parser.add_argument('--jobs', type=int, default=DEFAULT_JOBS,
+                       help=f'Worker processes rendering SAPs (default: {DEFAULT_JOBS}, 0 = one per CPU core)')
 
     args = parser.parse_args()
 
+    if args.all == bool(args.sap_ids):
+        parser.error('give SAP IDs or --all (not both)')
+
     try:
-        generate_sap(args.sap_id, dry_run=args.dry_run, force=args.force,
-                    catalog_path=args.catalog, skip_index=args.skip_index,
-                    skip_validation=args.skip_validation)
+        if args.all:
+            sap_ids = [sap['id'] for sap in load_catalog(args.catalog).saps if 'id' in sap]
+        else:
+            sap_ids = list(dict.fromkeys(args.sap_ids))
+
+        if len(sap_ids) == 1:
+            generate_sap(sap_ids[0], dry_run=args.dry_run, force=args.force,
+                        catalog_path=args.catalog, skip_index=args.skip_index,
+                        skip_validation=args.skip_validation)
+        else:
+            generate_saps(sap_ids, dry_run=args.dry_run, force=args.force,
+                         catalog_path=args.catalog, skip_index=args.skip_index,
+                         skip_validation=args.skip_validation, jobs=args.jobs)
     except ValueError as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
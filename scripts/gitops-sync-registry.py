@@ -3,12 +3,15 @@
 GitOps Registry Sync Service
 
 Watches capabilities/ directory and syncs YAML manifests to etcd registry.
-Runs on configurable interval (default: 60 seconds).
+Syncs whenever a manifest changes (inotify, or polling every 60 seconds).
 
 Features:
 - Watches capabilities/ directory for changes
 - Parses and validates YAML manifests
-- Syncs to etcd with proper schema
+- Syncs to etcd with proper schema, batched into transactions
+  (one round trip per 25 changed capabilities)
+- Prunes keys of capabilities whose manifests were deleted (only
+  capabilities this service wrote; other tools' keys are left alone)
 - Handles both Service-type and Pattern-type capabilities
 - Dry-run mode for testing
 - Comprehensive error handling and logging
@@ -18,15 +21,16 @@
   /chora/capabilities/{namespace}/type        - "service" or "pattern"
   /chora/capabilities/{namespace}/version     - SemVer string
   /chora/capabilities/{namespace}/dependencies - JSON array
+  /chora/capabilities/{namespace}/managed_by  - "gitops-sync" (marks keys this service owns)
 
 Usage:
     # Sync once
     python scripts/gitops-sync-registry.py --capabilities capabilities/
 
-    # Watch mode (continuous sync every 60s)
+    # Watch mode (sync on change; inotify with polling fallback)
     python scripts/gitops-sync-registry.py --capabilities capabilities/ --watch
 
-    # Custom interval
+    # Custom polling interval (used when inotify is unavailable or with --poll)
     python scripts/gitops-sync-registry.py --capabilities capabilities/ --watch --interval 30
 
     # Dry-run (no etcd writes)
@@ -38,22 +42,36 @@
 import json
 import logging
 import sys
-import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
-
-try:
-    import yaml
-except ImportError:
-    print("ERROR: PyYAML not installed. Run: pip install PyYAML", file=sys.stderr)
-    sys.exit(2)
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 try:
     import etcd3
 except ImportError:
-    print("ERROR: etcd3 not installed. Run: pip install etcd3", file=sys.stderr)
-    sys.exit(2)
+    etcd3 = None  # Required unless --dry-run (checked in main)
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fs_watch import RESYNC, DirectoryWatcher
+from registry_snapshot import RegistrySnapshot, normalize_requires
+
+KEY_PREFIX = "/chora/capabilities/"
+
+# Keys written per capability; prune deletes exactly these
+CAPABILITY_KEYS = ("metadata", "type", "version", "dependencies", "managed_by")
+
+# Value of the managed_by key: capabilities without it belong to other tools
+MANAGED_BY = "gitops-sync"
+
+# etcd rejects transactions with more operations than --max-txn-ops
+# (default 128); each capability is one op per key
+MAX_TXN_OPS = 128
+KEYS_PER_CAPABILITY = len(CAPABILITY_KEYS)
+DEFAULT_BATCH_SIZE = MAX_TXN_OPS // KEYS_PER_CAPABILITY
+
+# Quiet period before a watch-mode sync, so bursts of writes sync once
+WATCH_DEBOUNCE = 0.5
 
 # Configure logging
 logging.basicConfig(
@@ -72,20 +90,29 @@ def __init__(
         etcd_host: str = 'localhost',
         etcd_port: int = 2379,
         dry_run: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        prune: bool = True,
     ):
         self.capabilities_dir = capabilities_dir
         self.etcd_host = etcd_host
         self.etcd_port = etcd_port
         self.dry_run = dry_run
+        self.batch_size = max(1, min(batch_size, DEFAULT_BATCH_SIZE))
+        self.prune_enabled = prune
         self.etcd = None
         self.stats = {
             'total_files': 0,
             'synced': 0,
             'skipped': 0,
             'errors': 0,
+            'pruned': 0,
+            'transactions': 0,
             'last_sync': None,
         }
         self.file_hashes: Dict[str, str] = {}  # Track file changes
+        self.file_namespaces: Dict[str, str] = {}  # Namespace each file last synced as
+        self.pending: List[Tuple[str, str, Dict]] = []  # (file, hash, capability) awaiting a batch
+        self.snapshot = RegistrySnapshot(capabilities_dir)  # Parsed manifests, refreshed per sync
 
     def connect_etcd(self) -> bool:
         """Connect to etcd cluster"""
@@ -110,9 +137,16 @@ def get_file_hash(self, file_path: Path) -> str:
 
     def parse_manifest(self, file_path: Path) -> Optional[Dict]:
         """Parse YAML manifest and extract metadata"""
+        entry = self.snapshot.entry(file_path)
+        if entry['error']:
+            if entry['error']['kind'] == 'yaml':
+                logger.error(f"Failed to parse {file_path.name}: {entry['error']['message']}")
+            else:
+                logger.error(f"Error processing {file_path.name}: {entry['error']['message']}")
+            return None
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                manifest = yaml.safe_load(f)
+            manifest = entry['manifest']
 
             if not manifest or 'metadata' not in manifest:
                 logger.warning(f"Invalid manifest (missing metadata): {file_path.name}")
@@ -135,23 +169,7 @@ def parse_manifest(self, file_path: Path) -> Optional[Dict]:
                 return None
 
             # Extract dependencies
-            dc_relation = manifest.get('dc_relation', {})
-            requires = dc_relation.get('requires', [])
-
-            dependencies = []
-            for dep in requires:
-                if isinstance(dep, dict):
-                    dependencies.append({
-                        'capability': dep.get('capability'),
-                        'relationship': dep.get('relationship', 'prerequisite'),
-                        'version': dep.get('version', '*'),
-                    })
-                elif isinstance(dep, str):
-                    dependencies.append({
-                        'capability': dep,
-                        'relationship': 'prerequisite',
-                        'version': '*',
-                    })
+            dependencies = [dep for dep in normalize_requires(manifest) if 'invalid' not in dep]
 
             # Build capability data
             capability = {
@@ -167,50 +185,58 @@ def parse_manifest(self, file_path: Path) -> Optional[Dict]:
 
             return capability
 
-        except yaml.YAMLError as e:
-            logger.error(f"Failed to parse {file_path.name}: {e}")
-            return None
         except Exception as e:
             logger.error(f"Error processing {file_path.name}: {e}")
             return None
 
-    def sync_to_etcd(self, capability: Dict) -> bool:
-        """Sync capability to etcd"""
-        namespace = capability['namespace']
-        base_key = f"/chora/capabilities/{namespace}"
-
+    def capability_items(self, capability: Dict) -> List[Tuple[str, str]]:
+        """etcd (key, value) pairs for a capability"""
+        base_key = f"{KEY_PREFIX}{capability['namespace']}"
+        return [
+            # Full capability data as JSON
+            (f"{base_key}/metadata", json.dumps(capability['metadata'])),
+            (f"{base_key}/type", capability['type']),
+            (f"{base_key}/version", capability['version']),
+            (f"{base_key}/dependencies", json.dumps(capability['dependencies'])),
+            (f"{base_key}/managed_by", MANAGED_BY),
+        ]
+
+    def commit(self, puts: Sequence[Tuple[str, str]] = (), deletes: Sequence[str] = ()):
+        """Apply puts and deletes atomically in one etcd transaction"""
+        ops = [self.etcd.transactions.put(key, value) for key, value in puts]
+        ops += [self.etcd.transactions.delete(key) for key in deletes]
+        succeeded, _ = self.etcd.transaction(compare=[], success=ops, failure=[])
+        self.stats['transactions'] += 1
+        if not succeeded:
+            raise RuntimeError("etcd transaction failed")
+
+    def sync_batch(self, capabilities: List[Dict]) -> bool:
+        """Sync capabilities to etcd in a single transaction"""
         try:
             if self.dry_run:
-                logger.info(f"[DRY-RUN] Would sync: {namespace}")
+                for capability in capabilities:
+                    logger.info(f"[DRY-RUN] Would sync: {capability['namespace']}")
                 return True
 
-            # Write metadata (full capability data as JSON)
-            metadata_key = f"{base_key}/metadata"
-            self.etcd.put(metadata_key, json.dumps(capability['metadata']))
-
-            # Write type
-            type_key = f"{base_key}/type"
-            self.etcd.put(type_key, capability['type'])
-
-            # Write version
-            version_key = f"{base_key}/version"
-            self.etcd.put(version_key, capability['version'])
-
-            # Write dependencies
-            deps_key = f"{base_key}/dependencies"
-            self.etcd.put(deps_key, json.dumps(capability['dependencies']))
+            self.commit(puts=[item for capability in capabilities for item in self.capability_items(capability)])
 
-            logger.info(f"Synced: {namespace} ({capability['type']})")
+            for capability in capabilities:
+                logger.info(f"Synced: {capability['namespace']} ({capability['type']})")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to sync {namespace} to etcd: {e}")
+            namespaces = ", ".join(capability['namespace'] for capability in capabilities)
+            logger.error(f"Failed to sync {namespaces} to etcd: {e}")
             return False
 
-    def sync_file(self, file_path: Path) -> bool:
-        """Sync a single capability file to etcd"""
+    def sync_to_etcd(self, capability: Dict) -> bool:
+        """Sync capability to etcd"""
+        return self.sync_batch([capability])
+
+    def queue_file(self, file_path: Path) -> bool:
+        """Queue a capability file for the next batch (unchanged files are skipped)"""
         # Check if file changed
-        current_hash = self.get_file_hash(file_path)
+        current_hash = self.snapshot.entry(file_path)['sha256'] or self.get_file_hash(file_path)
         previous_hash = self.file_hashes.get(str(file_path))
 
         if previous_hash == current_hash:
@@ -224,25 +250,69 @@ def sync_file(self, file_path: Path) -> bool:
             self.stats['errors'] += 1
             return False
 
-        # Sync to etcd
-        success = self.sync_to_etcd(capability)
-
-        if success:
-            self.file_hashes[str(file_path)] = current_hash
-            self.stats['synced'] += 1
-        else:
-            self.stats['errors'] += 1
+        self.pending.append((str(file_path), current_hash, capability))
+        return True
+
+    def flush(self) -> bool:
+        """Write queued capabilities to etcd, batch_size per transaction"""
+        pending, self.pending = self.pending, []
+        success = True
+
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            if self.sync_batch([capability for _, _, capability in batch]):
+                for file_key, file_hash, capability in batch:
+                    self.file_hashes[file_key] = file_hash
+                    self.file_namespaces[file_key] = capability['namespace']
+                self.stats['synced'] += len(batch)
+            else:
+                self.stats['errors'] += len(batch)
+                success = False
 
         return success
 
+    def sync_file(self, file_path: Path) -> bool:
+        """Sync a single capability file to etcd"""
+        return self.queue_file(file_path) and self.flush()
+
+    def prune(self, live_namespaces: Set[str]) -> int:
+        """
+        Delete etcd keys of capabilities no manifest defines anymore
+
+        Only capabilities marked managed_by this service are pruned, and
+        only the keys it writes, so keys from other tools (e.g. the
+        heartbeat's /health) survive.
+        """
+        if self.dry_run:
+            return 0
+
+        stale = [namespace for namespace in self.owned_capabilities() if namespace not in live_namespaces]
+        chunk_size = MAX_TXN_OPS // KEYS_PER_CAPABILITY
+        for start in range(0, len(stale), chunk_size):
+            chunk = stale[start:start + chunk_size]
+            try:
+                self.commit(deletes=[
+                    f"{KEY_PREFIX}{namespace}/{key}" for namespace in chunk for key in CAPABILITY_KEYS
+                ])
+            except Exception as e:
+                logger.error(f"Failed to prune {', '.join(chunk)} from etcd: {e}")
+                self.stats['errors'] += len(chunk)
+                continue
+            for namespace in chunk:
+                logger.info(f"Pruned: {namespace} (manifest removed)")
+            self.stats['pruned'] += len(chunk)
+
+        return self.stats['pruned']
+
     def sync_all(self) -> bool:
         """Sync all capability manifests to etcd"""
         if not self.capabilities_dir.exists():
             logger.error(f"Capabilities directory not found: {self.capabilities_dir}")
             return False
 
-        # Find all YAML files
-        yaml_files = list(self.capabilities_dir.glob("chora.*.yaml"))
+        # Find all YAML files (re-parses only manifests changed since last sync)
+        self.snapshot.refresh()
+        yaml_files = self.snapshot.paths("chora.*.yaml")
 
         if not yaml_files:
             logger.warning(f"No capability manifests found in {self.capabilities_dir}")
@@ -255,10 +325,23 @@ def sync_all(self) -> bool:
         self.stats['synced'] = 0
         self.stats['skipped'] = 0
         self.stats['errors'] = 0
+        self.stats['pruned'] = 0
+        self.stats['transactions'] = 0
 
-        # Sync each file
+        # Queue changed files, then write them in batched transactions
         for yaml_file in sorted(yaml_files):
-            self.sync_file(yaml_file)
+            self.queue_file(yaml_file)
+        self.flush()
+
+        # Forget files that were deleted
+        current = {str(yaml_file) for yaml_file in yaml_files}
+        self.file_hashes = {key: value for key, value in self.file_hashes.items() if key in current}
+        self.file_namespaces = {key: value for key, value in self.file_namespaces.items() if key in current}
+
+        # Prune only after a clean sync, so a manifest that fails to parse
+        # never has its keys removed
+        if self.prune_enabled and self.stats['errors'] == 0:
+            self.prune(set(self.file_namespaces.values()))
 
         # Update last sync time
         self.stats['last_sync'] = datetime.utcnow().isoformat()
@@ -267,36 +350,57 @@ def sync_all(self) -> bool:
         logger.info(
             f"Sync complete: {self.stats['synced']} synced, "
             f"{self.stats['skipped']} skipped, "
-            f"{self.stats['errors']} errors"
+            f"{self.stats['pruned']} pruned, "
+            f"{self.stats['errors']} errors "
+            f"({self.stats['transactions']} etcd transaction(s))"
         )
 
         return self.stats['errors'] == 0
 
-    def watch(self, interval: int = 60):
-        """Watch mode: sync on interval"""
-        logger.info(f"Starting watch mode (interval: {interval}s)")
-        logger.info(f"Watching: {self.capabilities_dir}")
-        logger.info(f"Press Ctrl+C to stop")
-
-        try:
-            while True:
-                logger.info("--- Sync cycle starting ---")
-                self.sync_all()
-                logger.info(f"--- Sync cycle complete. Next sync in {interval}s ---")
-                time.sleep(interval)
-
-        except KeyboardInterrupt:
-            logger.info("Watch mode stopped by user")
-
-    def list_capabilities(self) -> List[str]:
-        """List all capabilities in etcd"""
+    def watch(self, interval: int = 60, use_inotify: bool = True, max_cycles: Optional[int] = None):
+        """Watch mode: sync whenever a manifest changes"""
+        # Start watching before the initial sync, so changes made while it
+        # runs are picked up by the first cycle
+        with DirectoryWatcher(self.capabilities_dir, suffixes=('.yaml', '.yml'), interval=interval,
+                              use_inotify=use_inotify) as watcher:
+            logger.info(f"Starting watch mode ({watcher.backend}, interval: {interval}s)")
+            logger.info(f"Watching: {self.capabilities_dir}")
+            logger.info(f"Press Ctrl+C to stop")
+
+            self.sync_all()
+
+            cycles = 0
+            try:
+                while max_cycles is None or cycles < max_cycles:
+                    cycles += 1
+                    changed = watcher.poll(timeout=interval)
+                    if not changed:
+                        continue
+
+                    # Wait for the burst of writes to finish
+                    while True:
+                        more = watcher.poll(timeout=WATCH_DEBOUNCE)
+                        if not more:
+                            break
+                        changed |= more
+
+                    if RESYNC in changed:
+                        logger.info("--- Change events lost; full sync ---")
+                    else:
+                        logger.info(f"--- {len(changed)} manifest(s) changed; sync cycle starting ---")
+                    self.sync_all()
+
+            except KeyboardInterrupt:
+                logger.info("Watch mode stopped by user")
+
+    def list_capabilities(self, owned_only: bool = False) -> List[str]:
+        """List all capabilities in etcd (owned_only: just those this service wrote)"""
         if self.dry_run:
             logger.info("[DRY-RUN] Would list capabilities from etcd")
             return []
 
         try:
-            prefix = "/chora/capabilities/"
-            results = self.etcd.get_prefix(prefix, keys_only=True)
+            results = self.etcd.get_prefix(KEY_PREFIX, keys_only=True)
 
             # Extract unique namespaces
             namespaces = set()
@@ -304,7 +408,7 @@ def list_capabilities(self) -> List[str]:
                 key_str = key.decode('utf-8')
                 # Extract namespace from key like /chora/capabilities/{namespace}/metadata
                 parts = key_str.split('/')
-                if len(parts) >= 4:
+                if len(parts) >= 4 and (not owned_only or parts[4:] == ['managed_by']):
                     namespaces.add(parts[3])
 
             return sorted(namespaces)
@@ -313,6 +417,10 @@ def list_capabilities(self) -> List[str]:
             logger.error(f"Failed to list capabilities: {e}")
             return []
 
+    def owned_capabilities(self) -> List[str]:
+        """List capabilities in etcd marked managed_by this service"""
+        return self.list_capabilities(owned_only=True)
+
     def print_stats(self):
         """Print sync statistics"""
         print("\n" + "=" * 80)
@@ -321,7 +429,9 @@ def print_stats(self):
         print(f"Total files: {self.stats['total_files']}")
         print(f"Synced: {self.stats['synced']}")
         print(f"Skipped (unchanged): {self.stats['skipped']}")
+        print(f"Pruned (manifest removed): {self.stats['pruned']}")
         print(f"Errors: {self.stats['errors']}")
+        print(f"etcd transactions: {self.stats['transactions']}")
         if self.stats['last_sync']:
             print(f"Last sync: {self.stats['last_sync']}")
         print("=" * 80 + "\n")
@@ -357,13 +467,29 @@ def main():
     parser.add_argument(
         '--watch',
         action='store_true',
-        help='Watch mode: continuous sync on interval',
+        help='Watch mode: sync whenever a manifest changes',
     )
     parser.add_argument(
         '--interval',
         type=int,
         default=60,
-        help='Sync interval in seconds (default: 60)',
+        help='Watch mode: polling interval without inotify (default: 60)',
+    )
+    parser.add_argument(
+        '--poll',
+        action='store_true',
+        help='Watch mode: force polling instead of inotify',
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f'Capabilities written per etcd transaction (default and max: {DEFAULT_BATCH_SIZE})',
+    )
+    parser.add_argument(
+        '--no-prune',
+        action='store_true',
+        help='Keep etcd keys of capabilities whose manifests were deleted',
     )
     parser.add_argument(
         '--dry-run',
@@ -380,12 +506,18 @@ def main():
 
     args = parser.parse_args()
 
+    if etcd3 is None and not args.dry_run:
+        print("ERROR: etcd3 not installed. Run: pip install etcd3", file=sys.stderr)
+        sys.exit(2)
+
     # Initialize sync service
     sync = GitOpsSync(
         capabilities_dir=args.capabilities,
         etcd_host=args.etcd_host,
         etcd_port=args.etcd_port,
         dry_run=args.dry_run,
+        batch_size=args.batch_size,
+        prune=not args.no_prune,
     )
 
     # Connect to etcd
@@ -404,7 +536,7 @@ def main():
 
     # Watch mode
     if args.watch:
-        sync.watch(interval=args.interval)
+        sync.watch(interval=args.interval, use_inotify=not args.poll)
         sys.exit(0)
 
     # Single sync
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""Compiled glossary index for chora-search.
+
+chora-search used to re-parse docs/GLOSSARY.md on every start and score a
+query against every entry (difflib for fuzzy matches, word overlap against
+every definition and example for reverse lookup). This module parses the
+glossary once into a JSON index (.chora/cache/glossary-index.json) that is
+rebuilt only when the glossary file changes (mtime/size fingerprint):
+
+- exact term/alias lookups are a dict lookup
+- substring matches on terms, aliases and definitions intersect trigram
+  postings and verify only the surviving candidates
+- fuzzy matches run difflib only on terms sharing a padded trigram with
+  the query (typo tolerance without comparing against every term)
+- reverse lookup counts word overlap through an inverted index of
+  definition and example words, and ranks equal scores by TF-IDF cosine
+  similarity of the description and the definition
+
+Scores are the same as scoring every entry, except that fuzzy matching
+only considers terms sharing a trigram with the query.
+
+Usage:
+    from glossary_index import GlossaryIndex
+
+    index = GlossaryIndex.load(Path("docs/GLOSSARY.md"))
+    index.search("coordenation", fuzzy=True)       # [(entry id, score), ...]
+    index.reverse_search("suggest a big change")   # [(entry id, score), ...]
+    index.entries[entry_id].term
+"""
+
+import difflib
+import json
+import math
+import os
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# utils/ lives at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.evaluation_cache import fingerprint_paths
+
+INDEX_VERSION = 1
+
+# Default index location, relative to the working directory
+CACHE_PATH = Path(".chora") / "cache" / "glossary-index.json"
+
+# Forward search scores by match kind (fuzzy term matches score 0.4-0.6)
+EXACT_SCORE = 1.0
+TERM_CONTAINS_SCORE = 0.8
+ALIAS_CONTAINS_SCORE = 0.7
+DEFINITION_CONTAINS_SCORE = 0.6
+FUZZY_THRESHOLD = 0.6
+
+# Reverse search: minimum word overlap ratio, and boost for example matches
+REVERSE_THRESHOLD = 0.2
+EXAMPLE_BOOST = 1.2
+
+
+@dataclass
+class GlossaryEntry:
+    """Represents a single glossary entry."""
+
+    term: str
+    definition: str
+    category: str
+    aliases: list[str]
+    related_terms: list[str]
+    sap_reference: Optional[str]
+    file_reference: Optional[str]
+    examples: list[str]
+
+
+def parse_glossary(content: str) -> List[GlossaryEntry]:
+    """Parse the markdown glossary (## Category, ### Term, **Key:** metadata)."""
+    entries = []
+    current_category = "General"
+
+    lines = content.split("\n")
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+
+        # Category header
+        if line.startswith("## ") and not line.startswith("###"):
+            current_category = line[3:].strip()
+            i += 1
+            continue
+
+        # Term entry
+        if line.startswith("### "):
+            term = line[4:].strip()
+            definition_lines = []
+            aliases = []
+            related = []
+            sap_ref = None
+            file_ref = None
+            examples = []
+
+            i += 1
+            # Collect definition and metadata
+            while i < len(lines) and not lines[i].startswith("###"):
+                metadata_line = lines[i].strip()
+
+                if metadata_line.startswith("**Aliases:**"):
+                    aliases = [
+                        a.strip()
+                        for a in metadata_line.split("**Aliases:**")[1].split(",")
+                    ]
+                elif metadata_line.startswith("**Related:**"):
+                    related = [
+                        r.strip()
+                        for r in metadata_line.split("**Related:**")[1].split(",")
+                    ]
+                elif metadata_line.startswith("**SAP:**"):
+                    sap_ref = metadata_line.split("**SAP:**")[1].strip()
+                elif metadata_line.startswith("**File:**"):
+                    file_ref = metadata_line.split("**File:**")[1].strip()
+                elif metadata_line.startswith("**Example:**"):
+                    examples.append(metadata_line.split("**Example:**")[1].strip())
+                elif metadata_line and not metadata_line.startswith("**"):
+                    definition_lines.append(metadata_line)
+
+                i += 1
+
+            definition = " ".join(definition_lines)
+
+            if definition:  # Only add if has definition
+                entries.append(
+                    GlossaryEntry(
+                        term=term,
+                        definition=definition,
+                        category=current_category,
+                        aliases=aliases,
+                        related_terms=related,
+                        sap_reference=sap_ref,
+                        file_reference=file_ref,
+                        examples=examples,
+                    )
+                )
+            continue
+
+        i += 1
+
+    return entries
+
+
+def trigrams(text: str, padded: bool = False) -> Set[str]:
+    """
+    Character trigrams of text.
+
+    Padded trigrams include the word edges ("  c", " co", ..., "st "), so short
+    or misspelled words still share trigrams with the intended term.
+    """
+    if padded:
+        text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _add_postings(postings: Dict[str, List[int]], keys: Iterable[str], entry_id: int) -> None:
+    for key in keys:
+        ids = postings.setdefault(key, [])
+        if not ids or ids[-1] != entry_id:
+            ids.append(entry_id)
+
+
+class GlossaryIndex:
+    """Lookup structures over parsed glossary entries."""
+
+    def __init__(self, entries: List[GlossaryEntry]):
+        """
+        Compile the index.
+
+        Args:
+            entries: Glossary entries in glossary order (ids are list positions)
+        """
+        self.entries = entries
+        self.fingerprint = ""
+        self.exact: Dict[str, List[int]] = {}               # lowercased term/alias -> ids
+        self.term_trigrams: Dict[str, List[int]] = {}       # trigram -> ids (substring candidates)
+        self.alias_trigrams: Dict[str, List[int]] = {}
+        self.definition_trigrams: Dict[str, List[int]] = {}
+        self.fuzzy_trigrams: Dict[str, List[int]] = {}      # padded term trigram -> ids
+        self.definition_words: Dict[str, List[int]] = {}    # word -> ids (reverse lookup)
+        self.example_words: Dict[str, List[List[int]]] = {}  # word -> [id, example number]
+        self.tfidf: Dict[str, List[List[float]]] = {}       # word -> [id, weight] (definitions)
+        self.tfidf_norms: List[float] = []
+        self.document_frequency: Dict[str, int] = {}        # word -> definitions containing it
+
+        document_frequency = self.document_frequency
+        term_counts: List[Dict[str, int]] = []
+
+        for entry_id, entry in enumerate(entries):
+            term = entry.term.lower()
+            aliases = [alias.lower() for alias in entry.aliases]
+            definition = entry.definition.lower()
+
+            for name in [term, *aliases]:
+                ids = self.exact.setdefault(name, [])
+                if entry_id not in ids:
+                    ids.append(entry_id)
+            _add_postings(self.term_trigrams, trigrams(term), entry_id)
+            _add_postings(self.alias_trigrams, set().union(*map(trigrams, aliases)), entry_id)
+            _add_postings(self.definition_trigrams, trigrams(definition), entry_id)
+            _add_postings(self.fuzzy_trigrams, trigrams(term, padded=True), entry_id)
+
+            words = definition.split()
+            _add_postings(self.definition_words, set(words), entry_id)
+            for example_number, example in enumerate(entry.examples):
+                for word in set(example.lower().split()):
+                    self.example_words.setdefault(word, []).append([entry_id, example_number])
+
+            counts: Dict[str, int] = {}
+            for word in words:
+                counts[word] = counts.get(word, 0) + 1
+            term_counts.append(counts)
+            for word in counts:
+                document_frequency[word] = document_frequency.get(word, 0) + 1
+
+        # Smoothed IDF; TF is the word's share of the definition
+        for entry_id, counts in enumerate(term_counts):
+            total = sum(counts.values())
+            norm = 0.0
+            for word, count in counts.items():
+                weight = (count / total) * self.idf(document_frequency[word])
+                self.tfidf.setdefault(word, []).append([entry_id, weight])
+                norm += weight * weight
+            self.tfidf_norms.append(math.sqrt(norm))
+
+    def idf(self, document_frequency: int) -> float:
+        return math.log((1 + len(self.entries)) / (1 + document_frequency)) + 1
+
+    @classmethod
+    def build(cls, glossary_file: Path) -> "GlossaryIndex":
+        """Parse a glossary file and compile its index."""
+        with open(glossary_file, encoding='utf-8') as f:
+            index = cls(parse_glossary(f.read()))
+        index.fingerprint = glossary_fingerprint(glossary_file)
+        return index
+
+    @classmethod
+    def load(cls, glossary_file: Path, cache_file: Optional[Path] = None,
+             use_cache: bool = True) -> "GlossaryIndex":
+        """
+        Index for a glossary file, from the cache when the glossary is unchanged.
+
+        A stale or missing index is rebuilt and saved.
+
+        Args:
+            glossary_file: Markdown glossary (must exist)
+            cache_file: Persisted index (default: .chora/cache/glossary-index.json)
+            use_cache: Read and write the persisted index
+        """
+        if not use_cache:
+            return cls.build(glossary_file)
+
+        cache_file = cache_file or CACHE_PATH
+        fingerprint = glossary_fingerprint(glossary_file)
+        try:
+            with open(cache_file, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            state = None
+        if (isinstance(state, dict) and state.get("version") == INDEX_VERSION
+                and state.get("fingerprint") == fingerprint):
+            return cls.from_dict(state)
+
+        index = cls.build(glossary_file)
+        index.save(cache_file)
+        return index
+
+    def to_dict(self) -> dict:
+        return {
+            "version": INDEX_VERSION,
+            "fingerprint": self.fingerprint,
+            "entries": [asdict(entry) for entry in self.entries],
+            "exact": self.exact,
+            "term_trigrams": self.term_trigrams,
+            "alias_trigrams": self.alias_trigrams,
+            "definition_trigrams": self.definition_trigrams,
+            "fuzzy_trigrams": self.fuzzy_trigrams,
+            "definition_words": self.definition_words,
+            "example_words": self.example_words,
+            "document_frequency": self.document_frequency,
+            "tfidf": self.tfidf,
+            "tfidf_norms": self.tfidf_norms,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "GlossaryIndex":
+        index = cls.__new__(cls)
+        index.entries = [GlossaryEntry(**entry) for entry in state["entries"]]
+        for name in ("fingerprint", "exact", "term_trigrams", "alias_trigrams",
+                     "definition_trigrams", "fuzzy_trigrams", "definition_words",
+                     "example_words", "document_frequency", "tfidf", "tfidf_norms"):
+            setattr(index, name, state[name])
+        return index
+
+    def save(self, cache_file: Path) -> None:
+        """Persist the index atomically (best effort; read-only checkouts still work)."""
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, separators=(',', ':'))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
+    def _containing(self, postings: Dict[str, List[int]], texts, query: str) -> Iterable[int]:
+        """Ids whose text (texts(id) -> strings) contains query, via trigram candidates."""
+        if len(query) < 3:
+            candidates: Iterable[int] = range(len(self.entries))
+        else:
+            lists = sorted((postings.get(gram, ()) for gram in trigrams(query)), key=len)
+            candidates = set(lists[0]).intersection(*lists[1:])
+        return [entry_id for entry_id in candidates
+                if any(query in text for text in texts(self.entries[entry_id]))]
+
+    def search(self, query: str, fuzzy: bool = False) -> List[Tuple[int, float]]:
+        """
+        Forward search.
+
+        Scores: exact term/alias 1.0, term contains query 0.8, alias contains
+        query 0.7, definition contains query 0.6, fuzzy term match 0.4-0.6.
+
+        Returns:
+            (entry id, score) sorted by score, then glossary order
+        """
+        query_lower = query.lower()
+        scores: Dict[int, float] = {}
+
+        def score(entry_ids: Iterable[int], value: float) -> None:
+            for entry_id in entry_ids:
+                if value > scores.get(entry_id, 0.0):
+                    scores[entry_id] = value
+
+        score(self.exact.get(query_lower, ()), EXACT_SCORE)
+        score(self._containing(self.term_trigrams, lambda e: [e.term.lower()], query_lower),
+              TERM_CONTAINS_SCORE)
+        score(self._containing(self.alias_trigrams, lambda e: [a.lower() for a in e.aliases], query_lower),
+              ALIAS_CONTAINS_SCORE)
+        score(self._containing(self.definition_trigrams, lambda e: [e.definition.lower()], query_lower),
+              DEFINITION_CONTAINS_SCORE)
+
+        if fuzzy:
+            candidates = set()
+            for gram in trigrams(query_lower, padded=True):
+                candidates.update(self.fuzzy_trigrams.get(gram, ()))
+            matcher = difflib.SequenceMatcher(None, query_lower)
+            for entry_id in candidates:
+                if entry_id in scores:
+                    continue
+                matcher.set_seq2(self.entries[entry_id].term.lower())
+                # Cheap upper bounds first, as in difflib.get_close_matches()
+                if matcher.real_quick_ratio() <= FUZZY_THRESHOLD or matcher.quick_ratio() <= FUZZY_THRESHOLD:
+                    continue
+                similarity = matcher.ratio()
+                if similarity > FUZZY_THRESHOLD:
+                    scores[entry_id] = 0.4 + (similarity - FUZZY_THRESHOLD) * 0.5
+
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def reverse_search(self, description: str) -> List[Tuple[int, float]]:
+        """
+        Reverse lookup: entries whose definition or examples share words with a description.
+
+        Score is the fraction of description words found in the definition,
+        or 1.2x the fraction found in an example, whichever is higher.
+
+        Returns:
+            (entry id, score) above 0.2, sorted by score, then TF-IDF similarity
+        """
+        desc_words = set(description.lower().split())
+        if not desc_words:
+            return []
+
+        overlaps: Dict[int, int] = {}
+        example_overlaps: Dict[Tuple[int, int], int] = {}
+        for word in desc_words:
+            for entry_id in self.definition_words.get(word, ()):
+                overlaps[entry_id] = overlaps.get(entry_id, 0) + 1
+            for entry_id, example_number in self.example_words.get(word, ()):
+                key = (entry_id, example_number)
+                example_overlaps[key] = example_overlaps.get(key, 0) + 1
+
+        scores = {entry_id: overlap / len(desc_words) for entry_id, overlap in overlaps.items()}
+        for (entry_id, _), overlap in example_overlaps.items():
+            scores[entry_id] = max(scores.get(entry_id, 0.0), overlap / len(desc_words) * EXAMPLE_BOOST)
+
+        similarity = self.similarity(desc_words)
+        results = [(entry_id, score) for entry_id, score in scores.items() if score > REVERSE_THRESHOLD]
+        results.sort(key=lambda item: (-item[1], -similarity.get(item[0], 0.0), item[0]))
+        return results
+
+    def similarity(self, words: Set[str]) -> Dict[int, float]:
+        """TF-IDF cosine similarity of a word set to each definition sharing a word."""
+        dot: Dict[int, float] = {}
+        query_norm = 0.0
+        for word in words:
+            if word not in self.document_frequency:
+                continue
+            query_weight = self.idf(self.document_frequency[word]) / len(words)
+            query_norm += query_weight * query_weight
+            for entry_id, weight in self.tfidf[word]:
+                dot[entry_id] = dot.get(entry_id, 0.0) + query_weight * weight
+        if not query_norm:
+            return {}
+        query_norm = math.sqrt(query_norm)
+        return {entry_id: value / (query_norm * self.tfidf_norms[entry_id])
+                for entry_id, value in dot.items()}
+
+
+def glossary_fingerprint(glossary_file: Path) -> str:
+    """Fingerprint of a glossary file (path, mtime and size)."""
+    glossary_file = glossary_file.resolve()
+    return fingerprint_paths(glossary_file.parent, [glossary_file.name], extra=str(glossary_file))
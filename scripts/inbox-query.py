@@ -38,6 +38,7 @@
 sys.path.insert(0, str(repo_root / "scripts"))
 
 from usage_tracker import track_usage
+from inbox_state_index import InboxStateIndex
 
 # Version
 VERSION = "1.0.0"
@@ -56,6 +57,8 @@ def __init__(self, inbox_path: Path, verbose: bool = False):
         """
         self.inbox_path = inbox_path
         self.verbose = verbose
+        # Folded view of coordination/events.jsonl (refreshed incrementally)
+        self.state_index = InboxStateIndex.for_inbox(inbox_path)
 
     def log(self, message: str):
         """Log if verbose."""
@@ -263,53 +266,20 @@ def _is_acknowledged(self, item_id: str) -> bool:
             return True
 
         # Check events log for acknowledgment
-        events_file = self.inbox_path / "coordination" / "events.jsonl"
-        if events_file.exists():
-            try:
-                with open(events_file, encoding='utf-8') as f:
-                    for line in f:
-                        event = json.loads(line)
-                        if event.get("request_id") == item_id and \
-                           event.get("event_type") in ["acknowledged", "accepted", "declined"]:
-                            return True
-            except Exception as e:
-                self.log(f"Error reading events: {e}")
+        try:
+            return self.state_index.is_acknowledged(item_id)
+        except Exception as e:
+            self.log(f"Error reading events: {e}")
 
         return False
 
     def _get_status_from_events(self, item_id: str) -> str:
         """Get latest status from event log."""
-        events_file = self.inbox_path / "coordination" / "events.jsonl"
-        if not events_file.exists():
-            return "unknown"
-
-        latest_status = "unknown"
         try:
-            with open(events_file, encoding='utf-8') as f:
-                for line in f:
-                    event = json.loads(line)
-                    if event.get("request_id") == item_id:
-                        # Update status based on event type
-                        event_type = event.get("event_type")
-                        if event_type == "coordination_request_created":
-                            latest_status = "created"
-                        elif event_type == "acknowledged":
-                            latest_status = "acknowledged"
-                        elif event_type == "accepted":
-                            latest_status = "accepted"
-                        elif event_type == "declined":
-                            latest_status = "declined"
-                        elif event_type == "in_progress":
-                            latest_status = "in_progress"
-                        elif event_type == "completed":
-                            latest_status = "completed"
-                        elif event_type == "blocked":
-                            latest_status = "blocked"
-
+            return self.state_index.get_status(item_id)
         except Exception as e:
             self.log(f"Error reading events: {e}")
-
-        return latest_status
+            return "unknown"
 
     def _matches_age_filter(self, age_hours: float, age_filter: str) -> bool:
         """
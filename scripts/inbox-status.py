@@ -25,6 +25,9 @@
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from inbox_state_index import InboxStateIndex
 
 # Configure UTF-8 output for Windows console compatibility
 if sys.platform == 'win32':
@@ -68,11 +71,24 @@ def load_json_file(filepath: Path) -> Optional[Dict]:
         return None
 
 def load_events(last_n: Optional[int] = None, last_days: Optional[int] = None) -> List[Dict]:
-    """Load events from events.jsonl"""
+    """Load events from events.jsonl
+
+    The newest events are served from the inbox state index, which only
+    reads events appended since its last refresh. A full scan is used when
+    more events are requested than the index retains.
+    """
     events_file = INBOX_DIR / 'coordination' / 'events.jsonl'
     if not events_file.exists():
         return []
 
+    if last_n:
+        events = InboxStateIndex(events_file).recent_events(last_n=last_n)
+        if events is not None:
+            if last_days:
+                cutoff = datetime.now() - timedelta(days=last_days)
+                events = [e for e in events if parse_timestamp(e.get('timestamp', '')) > cutoff]
+            return events
+
     events = []
     try:
         with open(events_file, 'r', encoding='utf-8') as f:
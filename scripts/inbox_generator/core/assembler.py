@@ -2,13 +2,42 @@
 Artifact Assembler - Assembles final artifacts from content configs
 
 Combines all content elements into a complete coordination request JSON.
+
+Elements are generated concurrently (AI-augmented fields are network bound,
+so a request with several of them takes about as long as the slowest one).
+An element whose template or prompt template reads another element's field
+name (one not supplied in the user context) waits for that element and sees
+its generated value.
 """
 
+import asyncio
 import json
+import sys
+from dataclasses import dataclass, field
+from datetime import date
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-from .config_loader import ConfigLoader, ArtifactConfig, ContentConfig
-from ..generators import get_generator
+from jinja2 import TemplateSyntaxError
+from .config_loader import ConfigLoader, ArtifactConfig, ContentConfig, ContentElement
+from ..generators import BaseGenerator, get_generator, template_variables
+
+# Configure UTF-8 output for Windows console compatibility
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+# Maximum elements generated at the same time
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass
+class PlannedElement:
+    """A content element ready to generate, with the elements it waits for"""
+    element: ContentElement
+    field_name: str
+    generator: BaseGenerator
+    metadata: Dict[str, Any]
+    dependencies: List[int] = field(default_factory=list)  # Indexes into the plan
 
 
 class ArtifactAssembler:
@@ -18,8 +47,8 @@ class ArtifactAssembler:
     Workflow:
     1. Load artifact config
     2. Load all referenced content configs
-    3. Generate each content element using appropriate generator
-    4. Combine elements into final artifact structure
+    3. Generate content elements concurrently, after the elements they depend on
+    4. Combine elements into final artifact structure (in config order)
     5. Write to output file
     """
 
@@ -27,7 +56,9 @@ def __init__(
         self,
         config_loader: ConfigLoader,
         ai_model: str = "claude-3-5-sonnet-20241022",
-        ai_api_key: Optional[str] = None
+        ai_api_key: Optional[str] = None,
+        ai_base_url: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY
     ):
         """
         Initialize assembler.
@@ -36,10 +67,14 @@ def __init__(
             config_loader: ConfigLoader instance
             ai_model: Model to use for AI-augmented generation
             ai_api_key: API key for AI (defaults to env var)
+            ai_base_url: API endpoint override for AI (defaults to the provider's)
+            concurrency: Maximum elements generated at the same time (1 = one by one)
         """
         self.config_loader = config_loader
         self.ai_model = ai_model
         self.ai_api_key = ai_api_key
+        self.ai_base_url = ai_base_url
+        self.concurrency = max(1, concurrency)
         self._generator_cache = {}
 
     def assemble(
@@ -47,7 +82,8 @@ def assemble(
         artifact_id: str,
         context: Dict[str, Any],
         output_path: Optional[Path] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        concurrency: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Assemble an artifact from configs and context.
@@ -57,14 +93,29 @@ def assemble(
             context: User-provided context data
             output_path: Override output path (uses artifact config default if None)
             dry_run: If True, return artifact without writing to disk
+            concurrency: Override the assembler's concurrency limit
 
         Returns:
             The assembled artifact as a dictionary
 
         Raises:
-            ValueError: If config is invalid or context is missing
+            ValueError: If config is invalid, context is missing or elements
+                        depend on each other in a cycle
             RuntimeError: If generation fails
         """
+        return asyncio.run(
+            self.assemble_async(artifact_id, context, output_path, dry_run, concurrency)
+        )
+
+    async def assemble_async(
+        self,
+        artifact_id: str,
+        context: Dict[str, Any],
+        output_path: Optional[Path] = None,
+        dry_run: bool = False,
+        concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Async variant of assemble() for callers already running an event loop"""
         # Load artifact config
         artifact_config = self.config_loader.load_artifact_config(artifact_id)
 
@@ -72,75 +123,181 @@ def assemble(
         content_configs = self.config_loader.load_all_content_for_artifact(artifact_id)
 
         # Generate all content elements
+        plan = self._plan_elements(content_configs, context)
+        values = await self._generate_all(plan, context, concurrency or self.concurrency)
+
+        # Combine in config order, whatever order elements finished in
         artifact_data = {}
+        for index, planned in enumerate(plan):
+            if index in values:
+                # Handle nested fields (e.g., context.background)
+                self._set_nested_field(artifact_data, planned.field_name, values[index])
 
+        # Write to output file (unless dry run)
+        if not dry_run:
+            output_file = output_path or Path(artifact_config.output_file)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(artifact_data, f, indent=2)
+
+            print(f"✓ Artifact written to: {output_file}")
+
+        return artifact_data
+
+    def _plan_elements(
+        self,
+        content_configs: List[ContentConfig],
+        context: Dict[str, Any]
+    ) -> List[PlannedElement]:
+        """
+        List the elements to generate and resolve their dependencies.
+
+        An element depends on another when its template/prompt template reads
+        a variable that is the other element's (top-level) field name and the
+        user context doesn't supply it.
+
+        Raises:
+            ValueError: If elements depend on each other in a cycle
+        """
         # Add today's date to metadata for timestamp generation
-        from datetime import date
         today_date = date.today().isoformat()
 
+        plan = []
         for content_config in content_configs:
-            # Generate each element in the content config
+            metadata = content_config.metadata.copy() if content_config.metadata else {}
+            metadata['today'] = today_date
+
             for element in content_config.elements:
-                # Get appropriate generator
                 generator = self._get_generator(
                     element.generation_pattern,
                     model=self.ai_model,
-                    api_key=self.ai_api_key
+                    api_key=self.ai_api_key,
+                    base_url=self.ai_base_url
                 )
+                plan.append(PlannedElement(
+                    element=element,
+                    # Determine field name from element ID
+                    field_name=self._extract_field_name(element.id),
+                    generator=generator,
+                    metadata=metadata
+                ))
+
+        providers = {}
+        for index, planned in enumerate(plan):
+            if '.' not in planned.field_name:
+                providers.setdefault(planned.field_name, index)
+
+        for index, planned in enumerate(plan):
+            source = {
+                'template_fill': planned.element.template,
+                'ai_augmented': planned.element.prompt_template,
+            }.get(planned.element.generation_pattern)
+            if not source:
+                continue
+            try:
+                variables = template_variables(source)
+            except TemplateSyntaxError:
+                continue  # Reported by the generator
+            planned.dependencies = sorted({
+                providers[name] for name in variables
+                if name in providers and name not in context and providers[name] != index
+            })
+
+        self._check_acyclic(plan)
+        return plan
+
+    def _check_acyclic(self, plan: List[PlannedElement]) -> None:
+        """Raise ValueError if element dependencies form a cycle."""
+        remaining = {index: set(planned.dependencies) for index, planned in enumerate(plan)}
+        ready = [index for index, deps in remaining.items() if not deps]
+        while ready:
+            done = ready.pop()
+            del remaining[done]
+            for index, deps in remaining.items():
+                if done in deps:
+                    deps.discard(done)
+                    if not deps:
+                        ready.append(index)
+        if remaining:
+            cycle = sorted(plan[index].element.id for index in remaining)
+            raise ValueError(f"Circular dependencies between elements: {cycle}")
+
+    async def _generate_all(
+        self,
+        plan: List[PlannedElement],
+        context: Dict[str, Any],
+        concurrency: int
+    ) -> Dict[int, Any]:
+        """
+        Generate planned elements, at most `concurrency` at a time.
 
-                # Generate content
+        Returns:
+            plan index -> value, for every element that was generated
+            (optional elements that failed are left out)
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        values: Dict[int, Any] = {}
+        tasks: Dict[int, asyncio.Future] = {}
+
+        async def run(index: int) -> None:
+            planned = plan[index]
+            element_context = context
+            if planned.dependencies:
+                await asyncio.gather(*(tasks[dep] for dep in planned.dependencies))
+                element_context = {
+                    **{plan[dep].field_name: values[dep] for dep in planned.dependencies if dep in values},
+                    **context
+                }
+
+            async with semaphore:
                 try:
-                    # Add today to metadata
-                    metadata = content_config.metadata.copy() if content_config.metadata else {}
-                    metadata['today'] = today_date
-
-                    value = generator.generate(
-                        element,
-                        context,
-                        metadata
+                    values[index] = await asyncio.to_thread(
+                        self._generate_element, planned, element_context
                     )
-
-                    # Parse JSON if element expects structured data
-                    if element.example_output and (
-                        element.example_output.startswith('[') or
-                        element.example_output.startswith('{')
-                    ):
-                        try:
-                            value = json.loads(value)
-                        except json.JSONDecodeError:
-                            # Keep as string if JSON parsing fails
-                            pass
-
-                    # Determine field name from element ID
-                    field_name = self._extract_field_name(element.id)
-
-                    # Handle nested fields (e.g., context.background)
-                    self._set_nested_field(artifact_data, field_name, value)
-
                 except Exception as e:
-                    if element.required:
+                    if planned.element.required:
                         raise RuntimeError(
-                            f"Failed to generate required element '{element.id}': {e}"
+                            f"Failed to generate required element '{planned.element.id}': {e}"
                         )
                     # Optional element failed, log and continue
-                    print(f"Warning: Failed to generate optional element '{element.id}': {e}")
-
-        # Write to output file (unless dry run)
-        if not dry_run:
-            output_file = output_path or Path(artifact_config.output_file)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(artifact_data, f, indent=2)
-
-            print(f"✓ Artifact written to: {output_file}")
-
-        return artifact_data
+                    print(f"Warning: Failed to generate optional element '{planned.element.id}': {e}")
+
+        for index in range(len(plan)):
+            tasks[index] = asyncio.ensure_future(run(index))
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return values
+
+    def _generate_element(self, planned: PlannedElement, context: Dict[str, Any]) -> Any:
+        """Generate one element's value (runs on a worker thread)."""
+        element = planned.element
+        value = planned.generator.generate(element, context, planned.metadata)
+
+        # Parse JSON if element expects structured data
+        if element.example_output and (
+            element.example_output.startswith('[') or
+            element.example_output.startswith('{')
+        ):
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                # Keep as string if JSON parsing fails
+                pass
+
+        return value
 
     def _get_generator(self, generation_pattern: str, **kwargs):
         """
         Get or create generator instance (with caching).
 
+        Generators keep no per-element state, so one instance per pattern is
+        shared by all elements (the AI generator also shares its API client).
+
         Args:
             generation_pattern: The generation pattern
             **kwargs: Arguments for generator constructor
@@ -148,17 +305,6 @@ def _get_generator(self, generation_pattern: str, **kwargs):
         Returns:
             Generator instance
         """
-        # Cache generators except AI generators (which may have per-element prompts)
-        if generation_pattern == 'ai_augmented':
-            from ..generators.ai_augmented import AIAugmentedGenerator
-
-# Configure UTF-8 output for Windows console compatibility
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
-    sys.stderr.reconfigure(encoding='utf-8')
-
-            return AIAugmentedGenerator(model=kwargs.get('model'), api_key=kwargs.get('api_key'))
-
         if generation_pattern not in self._generator_cache:
             self._generator_cache[generation_pattern] = get_generator(generation_pattern, **kwargs)
 
@@ -9,6 +9,7 @@
 from .user_input import UserInputGenerator
 from .template import TemplateGenerator
 from .ai_augmented import AIAugmentedGenerator
+from .template_cache import compile_template, template_variables, clear_template_cache
 
 
 def get_generator(generation_pattern: str, **kwargs) -> BaseGenerator:
@@ -59,4 +60,7 @@ def get_generator(generation_pattern: str, **kwargs) -> BaseGenerator:
     'TemplateGenerator',
     'AIAugmentedGenerator',
     'get_generator',
+    'compile_template',
+    'template_variables',
+    'clear_template_cache',
 ]
@@ -6,8 +6,10 @@
 
 import os
 import json
+import threading
 from typing import Any, Dict, Optional
 from .base import BaseGenerator
+from .template_cache import compile_template
 from ..core.config_loader import ContentElement
 
 
@@ -24,16 +26,29 @@ class AIAugmentedGenerator(BaseGenerator):
         -> Returns: AI-generated acceptance criteria list
     """
 
-    def __init__(self, model: str = "claude-sonnet-4-5-20250929", api_key: Optional[str] = None):
+    def __init__(
+        self,
+        model: str = "claude-sonnet-4-5-20250929",
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None
+    ):
         """
         Initialize AI generator.
 
+        One API client is created on first use and shared by every element
+        this generator produces (clients are safe to use from many threads).
+
         Args:
             model: Model to use (claude-sonnet-4-5-20250929 or gpt-4, etc.)
             api_key: API key (defaults to ANTHROPIC_API_KEY or OPENAI_API_KEY env var)
+            base_url: API endpoint override (defaults to the provider SDK's own
+                      default, which also honours ANTHROPIC_BASE_URL/OPENAI_BASE_URL)
         """
         self.model = model
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY') or os.getenv('OPENAI_API_KEY')
+        self.base_url = base_url
+        self._client = None
+        self._client_lock = threading.Lock()
 
         if not self.api_key:
             raise ValueError(
@@ -75,8 +90,7 @@ def generate(
             )
 
         # Render prompt template with context
-        from jinja2 import Template
-        prompt_template = Template(element.prompt_template)
+        prompt_template = compile_template(element.prompt_template)
         template_context = context.copy()
         if config_metadata:
             template_context['metadata'] = config_metadata
@@ -91,6 +105,27 @@ def generate(
         else:
             raise RuntimeError(f"Unknown provider: {self.provider}")
 
+    def _get_client(self):
+        """
+        Get the shared API client, creating it on first use.
+
+        Returns:
+            anthropic.Anthropic or openai.OpenAI client
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    kwargs = {'api_key': self.api_key}
+                    if self.base_url:
+                        kwargs['base_url'] = self.base_url
+                    if self.provider == 'anthropic':
+                        import anthropic
+                        self._client = anthropic.Anthropic(**kwargs)
+                    else:
+                        import openai
+                        self._client = openai.OpenAI(**kwargs)
+        return self._client
+
     def _generate_anthropic(self, prompt: str, element: ContentElement) -> str:
         """
         Generate content using Anthropic Claude API.
@@ -106,9 +141,7 @@ def _generate_anthropic(self, prompt: str, element: ContentElement) -> str:
             RuntimeError: If API call fails
         """
         try:
-            import anthropic
-
-            client = anthropic.Anthropic(api_key=self.api_key)
+            client = self._get_client()
 
             message = client.messages.create(
                 model=self.model,
@@ -154,9 +187,7 @@ def _generate_openai(self, prompt: str, element: ContentElement) -> str:
             RuntimeError: If API call fails
         """
         try:
-            import openai
-
-            client = openai.OpenAI(api_key=self.api_key)
+            client = self._get_client()
 
             response = client.chat.completions.create(
                 model=self.model,
@@ -5,8 +5,9 @@
 """
 
 from typing import Any, Dict, Optional
-from jinja2 import Template, TemplateSyntaxError, UndefinedError
+from jinja2 import TemplateSyntaxError, UndefinedError
 from .base import BaseGenerator
+from .template_cache import compile_template
 from ..core.config_loader import ContentElement
 
 
@@ -47,8 +48,8 @@ def generate(
             )
 
         try:
-            # Create Jinja2 template
-            template = Template(element.template)
+            # Compiled once per template text
+            template = compile_template(element.template)
 
             # Prepare template context
             template_context = context.copy()
@@ -84,7 +85,7 @@ def validate_template(self, template_str: str) -> bool:
             True if valid, False otherwise
         """
         try:
-            Template(template_str)
+            compile_template(template_str)
             return True
         except TemplateSyntaxError:
             return False
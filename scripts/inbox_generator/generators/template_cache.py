@@ -0,0 +1,63 @@
+"""
+Template Cache - Compiled Jinja2 templates shared by all generators
+
+Template and AI-augmented generators render the same template strings for
+every element of every request. Compiling a template is far more expensive
+than rendering it, so each distinct template text is compiled once per
+process and reused (compiled templates are safe to render from many threads).
+"""
+
+import threading
+from typing import Dict, FrozenSet
+from jinja2 import Environment, Template, meta
+
+_lock = threading.Lock()
+_templates: Dict[str, Template] = {}
+_variables: Dict[str, FrozenSet[str]] = {}
+_parse_env = Environment()
+
+
+def compile_template(source: str) -> Template:
+    """
+    Get the compiled template for a template string.
+
+    Args:
+        source: The Jinja2 template string
+
+    Returns:
+        Compiled Template (same as Template(source), cached by text)
+
+    Raises:
+        TemplateSyntaxError: If the template is invalid (never cached)
+    """
+    template = _templates.get(source)
+    if template is None:
+        template = Template(source)
+        with _lock:
+            template = _templates.setdefault(source, template)
+    return template
+
+
+def template_variables(source: str) -> FrozenSet[str]:
+    """
+    Get the context variables a template string reads.
+
+    Example:
+        "{% set now = metadata.today %}{{ title }} {{ now }}" -> {"metadata", "title"}
+
+    Raises:
+        TemplateSyntaxError: If the template is invalid
+    """
+    variables = _variables.get(source)
+    if variables is None:
+        variables = frozenset(meta.find_undeclared_variables(_parse_env.parse(source)))
+        with _lock:
+            _variables[source] = variables
+    return variables
+
+
+def clear_template_cache() -> None:
+    """Drop all compiled templates (e.g. after content configs are edited)."""
+    with _lock:
+        _templates.clear()
+        _variables.clear()
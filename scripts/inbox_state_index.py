@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Materialized inbox state index folded from coordination events.
+
+The coordination event log (inbox/coordination/events.jsonl) is append-only.
+Instead of rescanning it for every inbox item, this module folds it into a
+small projection keyed by request ID (latest status, acknowledgment) and
+remembers the byte offset it has consumed. Each refresh reads only the
+events appended since the last one.
+
+Usage:
+    from inbox_state_index import InboxStateIndex
+
+    index = InboxStateIndex.for_inbox(Path("inbox"))
+    index.get_status("COORD-2025-006")      # "in_progress"
+    index.is_acknowledged("COORD-2025-006")  # True
+    index.recent_events(last_n=20)           # newest first
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+INDEX_VERSION = 1
+
+# Event types that set an item's status (event_type -> status)
+STATUS_EVENTS = {
+    "coordination_request_created": "created",
+    "acknowledged": "acknowledged",
+    "accepted": "accepted",
+    "declined": "declined",
+    "in_progress": "in_progress",
+    "completed": "completed",
+    "blocked": "blocked",
+}
+
+# Event types that count as acknowledging an item
+ACK_EVENTS = {"acknowledged", "accepted", "declined"}
+
+# Leading bytes of the log fingerprinted to detect rewrites/rotation
+PREFIX_BYTES = 4096
+
+# Newest events retained for dashboards (inbox-status recent activity)
+RECENT_EVENTS_LIMIT = 100
+
+
+class InboxStateIndex:
+    """Incrementally maintained item_id -> status/ack projection of events.jsonl."""
+
+    def __init__(self, events_file: Path, index_file: Optional[Path] = None):
+        """
+        Initialize index.
+
+        Args:
+            events_file: Path to coordination events.jsonl
+            index_file: Path to persisted index (default: .events-index.json
+                next to the events file)
+        """
+        self.events_file = events_file
+        self.index_file = index_file or events_file.parent / ".events-index.json"
+        self.offset = 0
+        self.prefix_digest = ""
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.recent: List[Dict[str, Any]] = []
+        self.total_events = 0
+        self._loaded = False
+
+    @classmethod
+    def for_inbox(cls, inbox_path: Path) -> "InboxStateIndex":
+        """Create the index for an inbox directory."""
+        return cls(inbox_path / "coordination" / "events.jsonl")
+
+    def _reset(self):
+        self.offset = 0
+        self.prefix_digest = ""
+        self.items = {}
+        self.recent = []
+        self.total_events = 0
+
+    def _load(self):
+        """Load persisted index state, if compatible."""
+        self._reset()
+        try:
+            with open(self.index_file, encoding='utf-8') as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+
+        if state.get("version") != INDEX_VERSION:
+            return
+
+        self.offset = state.get("offset", 0)
+        self.prefix_digest = state.get("prefix_digest", "")
+        self.items = state.get("items", {})
+        self.recent = state.get("recent", [])
+        self.total_events = state.get("total_events", 0)
+
+    def _save(self):
+        """Persist index atomically (best effort; read-only inboxes still work)."""
+        state = {
+            "version": INDEX_VERSION,
+            "events_file": self.events_file.name,
+            "offset": self.offset,
+            "prefix_digest": self.prefix_digest,
+            "total_events": self.total_events,
+            "items": self.items,
+            "recent": self.recent,
+        }
+        tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, separators=(',', ':'))
+            os.replace(tmp_file, self.index_file)
+        except OSError:
+            pass
+
+    def apply_event(self, event: Dict[str, Any]):
+        """Fold a single event into the projection."""
+        self.total_events += 1
+
+        request_id = event.get("request_id")
+        if request_id:
+            item = self.items.setdefault(request_id, {
+                "status": "unknown",
+                "acknowledged": False,
+                "event_count": 0,
+            })
+            event_type = event.get("event_type")
+            item["event_count"] += 1
+            item["last_event_type"] = event_type
+            item["last_timestamp"] = event.get("timestamp", "")
+            if event_type in STATUS_EVENTS:
+                item["status"] = STATUS_EVENTS[event_type]
+            if event_type in ACK_EVENTS:
+                item["acknowledged"] = True
+
+        # Keep the newest events by timestamp (stable for equal timestamps)
+        timestamp = event.get("timestamp", "")
+        if len(self.recent) < RECENT_EVENTS_LIMIT or timestamp >= self.recent[-1].get("timestamp", ""):
+            position = len(self.recent)
+            while position > 0 and self.recent[position - 1].get("timestamp", "") < timestamp:
+                position -= 1
+            self.recent.insert(position, event)
+            del self.recent[RECENT_EVENTS_LIMIT:]
+
+    def refresh(self) -> int:
+        """
+        Bring the index up to date with the event log.
+
+        Reads only bytes appended since the last refresh. If the log shrank
+        or its leading bytes changed (rotated or rewritten), the index is
+        rebuilt from the start.
+
+        Returns:
+            Number of new events applied
+        """
+        if not self._loaded:
+            self._load()
+            self._loaded = True
+
+        try:
+            size = self.events_file.stat().st_size
+        except FileNotFoundError:
+            if self.offset or self.items:
+                self._reset()
+            return 0
+
+        with open(self.events_file, 'rb') as f:
+            if size < self.offset or (self.offset and self._prefix_digest(f) != self.prefix_digest):
+                self._reset()
+            if size == self.offset:
+                return 0
+
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+
+        # Only consume complete lines; a partially written event is picked
+        # up on the next refresh
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            return 0
+
+        applied = 0
+        for line in data[:end].splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(event, dict):
+                self.apply_event(event)
+                applied += 1
+
+        consumed_prefix = self.offset < PREFIX_BYTES
+        self.offset += end
+        if consumed_prefix:
+            # The fingerprinted prefix grew; re-digest it at the new offset
+            with open(self.events_file, 'rb') as f:
+                self.prefix_digest = self._prefix_digest(f)
+        self._save()
+        return applied
+
+    def _prefix_digest(self, f) -> str:
+        """Digest of the consumed part of the log's first PREFIX_BYTES."""
+        f.seek(0)
+        return hashlib.sha256(f.read(min(self.offset, PREFIX_BYTES))).hexdigest()
+
+    def get_item(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """Folded state for an item, or None if no events reference it."""
+        self.refresh()
+        return self.items.get(item_id)
+
+    def get_status(self, item_id: str) -> str:
+        """Latest status for an item ("unknown" if never reported)."""
+        item = self.get_item(item_id)
+        return item["status"] if item else "unknown"
+
+    def is_acknowledged(self, item_id: str) -> bool:
+        """Whether any acknowledged/accepted/declined event exists for the item."""
+        item = self.get_item(item_id)
+        return bool(item and item["acknowledged"])
+
+    def recent_events(self, last_n: int = 20) -> Optional[List[Dict[str, Any]]]:
+        """
+        Newest events first.
+
+        Returns:
+            Up to last_n events, or None if last_n exceeds what the index
+            retains (callers should fall back to reading the log)
+        """
+        self.refresh()
+        if last_n > RECENT_EVENTS_LIMIT and self.total_events > len(self.recent):
+            return None
+        return self.recent[:last_n]
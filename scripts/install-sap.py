@@ -24,6 +24,9 @@
     python scripts/install-sap.py SAP-004 --dry-run
     python scripts/install-sap.py --set ecosystem --configure --dry-run
 
+    # Limit concurrent installs (dependency levels are installed in parallel)
+    python scripts/install-sap.py --set ecosystem --jobs 1
+
 Exit codes:
     0 - Success
     1 - Error (validation, installation failure)
@@ -35,7 +38,9 @@
 import shutil
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -47,8 +52,10 @@
 # Add repo root to path for imports
 repo_root = Path(__file__).parent.parent
 sys.path.insert(0, str(repo_root / "scripts"))
+sys.path.insert(0, str(repo_root))
 
 from usage_tracker import track_usage
+from utils.sap_catalog import SAPCatalog, load_sap_catalog
 
 try:
     import yaml
@@ -77,9 +84,21 @@ def __init__(self):
         self.start_time = None
         self.current_sap_index = 0
         self.total_saps = 0
+        self._lock = threading.Lock()
+
+    def add(self, counter: str, amount: int = 1) -> None:
+        """Increment a counter (safe to call from install worker threads)"""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
 
 stats = InstallStats()
 
+# Default number of SAPs installed concurrently within a dependency level
+DEFAULT_JOBS = 4
+
+# System files are shared between SAPs; copy them one SAP at a time
+_system_files_lock = threading.Lock()
+
 #############################################################################
 # Helper Functions
 #############################################################################
@@ -98,12 +117,12 @@ def print_success(text: str) -> None:
 def print_warning(text: str) -> None:
     """Print warning message"""
     print(f"{Colors.YELLOW}⚠{Colors.NC} {text}")
-    stats.warnings += 1
+    stats.add('warnings')
 
 def print_error(text: str) -> None:
     """Print error message"""
     print(f"{Colors.RED}✗{Colors.NC} {text}")
-    stats.errors += 1
+    stats.add('errors')
 
 def print_info(text: str) -> None:
     """Print info message"""
@@ -164,8 +183,7 @@ def load_catalog(source_dir: Path) -> Dict:
         sys.exit(1)
 
     try:
-        with open(catalog_file, 'r', encoding='utf-8') as f:
-            catalog = json.load(f)
+        catalog = load_sap_catalog(catalog_file)
         print_success(f"Loaded catalog (v{catalog.get('version', 'unknown')}, {catalog.get('total_saps', 0)} SAPs)")
         return catalog
     except json.JSONDecodeError as e:
@@ -174,6 +192,9 @@ def load_catalog(source_dir: Path) -> Dict:
 
 def get_sap(sap_id: str, catalog: Dict) -> Optional[Dict]:
     """Get SAP metadata from catalog"""
+    if isinstance(catalog, SAPCatalog):
+        return catalog.get_sap(sap_id)
+
     for sap in catalog.get('saps', []):
         if sap['id'] == sap_id:
             return sap
@@ -250,7 +271,7 @@ def get_sap_set(set_id: str, catalog: Dict, target_dir: Path) -> Optional[Dict]:
 
     return None
 
-def install_sap_set(set_id: str, source_dir: Path, target_dir: Path, catalog: Dict, dry_run: bool = False, configure: bool = False) -> bool:
+def install_sap_set(set_id: str, source_dir: Path, target_dir: Path, catalog: Dict, dry_run: bool = False, configure: bool = False, jobs: int = DEFAULT_JOBS) -> bool:
     """Install a SAP set (multiple SAPs)"""
     sap_set = get_sap_set(set_id, catalog, target_dir)
 
@@ -278,33 +299,21 @@ def install_sap_set(set_id: str, source_dir: Path, target_dir: Path, catalog: Di
             print(f"  - {warning}")
         print()
 
-    # Initialize progress tracking
-    stats.total_saps = len(sap_set['saps'])
-    stats.start_time = time.time()
-    stats.current_sap_index = 0
+    # Resolve the full dependency closure up front, then install level by level
+    plan = plan_installation(sap_set['saps'], catalog)
+    print_install_plan(plan, jobs)
 
-    # Install each SAP in the set
-    success = True
-    for idx, sap_id in enumerate(sap_set['saps']):
-        stats.current_sap_index = idx
-
-        if not install_sap(sap_id, source_dir, target_dir, catalog, dry_run, indent=True, configure=configure):
-            success = False
-            # Continue with other SAPs even if one fails
-
-        # Show progress bar (after installation)
-        if not dry_run and stats.total_saps > 1:
-            print_progress_bar(idx, stats.total_saps)
-
-    return success
+    return install_planned(plan, source_dir, target_dir, catalog, dry_run, configure, jobs)
 
 #############################################################################
 # Installation Functions
 #############################################################################
 
-def check_sap_installed(sap_id: str, target_dir: Path) -> bool:
+def check_sap_installed(sap_id: str, target_dir: Path, catalog: Optional[Dict] = None) -> bool:
     """Check if SAP is already installed"""
-    sap = get_sap(sap_id, load_catalog(Path.cwd()))  # This is a simplification
+    if catalog is None:
+        catalog = load_catalog(Path.cwd())  # This is a simplification
+    sap = get_sap(sap_id, catalog)
     if not sap or 'location' not in sap:
         return False
 
@@ -341,7 +350,7 @@ def install_dependencies(sap: Dict, source_dir: Path, target_dir: Path, catalog:
 
     success = True
     for dep_id in dependencies:
-        if check_sap_installed(dep_id, target_dir):
+        if check_sap_installed(dep_id, target_dir, catalog):
             print_info(f"{prefix}  ✓ {dep_id} already installed")
             continue
 
@@ -352,8 +361,12 @@ def install_dependencies(sap: Dict, source_dir: Path, target_dir: Path, catalog:
 
     return success
 
-def install_sap(sap_id: str, source_dir: Path, target_dir: Path, catalog: Dict, dry_run: bool = False, indent: bool = False, configure: bool = False) -> bool:
-    """Install a single SAP with dependency resolution"""
+def install_sap(sap_id: str, source_dir: Path, target_dir: Path, catalog: Dict, dry_run: bool = False, indent: bool = False, configure: bool = False, resolve_dependencies: bool = True) -> bool:
+    """Install a single SAP with dependency resolution
+
+    Planned installs pass resolve_dependencies=False: the planner has
+    already installed every dependency in an earlier level.
+    """
     prefix = "  " if indent else ""
 
     # Get SAP metadata
@@ -368,13 +381,13 @@ def install_sap(sap_id: str, source_dir: Path, target_dir: Path, catalog: Dict,
 
     if already_installed:
         print_info(f"{prefix}✓ {sap_id} ({sap['name']}) already installed - skipping")
-        stats.saps_skipped += 1
+        stats.add('saps_skipped')
 
         # If --configure flag is set, still run configuration even if already installed
         if configure and not dry_run:
             configure_success = configure_sap(sap_id, sap, target_dir, dry_run, indent)
             if not configure_success:
-                stats.config_failed += 1
+                stats.add('config_failed')
 
         return True
 
@@ -387,7 +400,7 @@ def install_sap(sap_id: str, source_dir: Path, target_dir: Path, catalog: Dict,
 
     if dry_run:
         print_info(f"{prefix}[DRY RUN] Would install {sap_id}")
-        stats.saps_installed += 1
+        stats.add('saps_installed')
 
         if configure:
             print_info(f"{prefix}[DRY RUN] Would configure {sap_id} to Level 1")
@@ -395,7 +408,7 @@ def install_sap(sap_id: str, source_dir: Path, target_dir: Path, catalog: Dict,
         return True
 
     # Install dependencies first
-    if not install_dependencies(sap, source_dir, target_dir, catalog, dry_run, indent, configure):
+    if resolve_dependencies and not install_dependencies(sap, source_dir, target_dir, catalog, dry_run, indent, configure):
         print_warning(f"{prefix}Some dependencies failed, continuing anyway")
 
     # Copy SAP directory
@@ -413,29 +426,30 @@ def install_sap(sap_id: str, source_dir: Path, target_dir: Path, catalog: Dict,
 
     # Copy system files
     system_files = sap.get('system_files', [])
-    for sys_file in system_files:
-        src = source_dir / sys_file
-        dest = target_dir / sys_file
-
-        if not src.exists():
-            print_warning(f"{prefix}System file not found: {sys_file}")
-            continue
-
-        try:
-            # Create parent directory if needed
-            dest.parent.mkdir(parents=True, exist_ok=True)
-
-            if src.is_dir():
-                if dest.exists():
-                    print_info(f"{prefix}System directory already exists: {sys_file} - skipping")
+    with _system_files_lock:
+        for sys_file in system_files:
+            src = source_dir / sys_file
+            dest = target_dir / sys_file
+
+            if not src.exists():
+                print_warning(f"{prefix}System file not found: {sys_file}")
+                continue
+
+            try:
+                # Create parent directory if needed
+                dest.parent.mkdir(parents=True, exist_ok=True)
+
+                if src.is_dir():
+                    if dest.exists():
+                        print_info(f"{prefix}System directory already exists: {sys_file} - skipping")
+                    else:
+                        shutil.copytree(src, dest)
+                        print_success(f"{prefix}Copied system directory: {sys_file}")
                 else:
-                    shutil.copytree(src, dest)
-                    print_success(f"{prefix}Copied system directory: {sys_file}")
-            else:
-                shutil.copy2(src, dest)
-                print_success(f"{prefix}Copied system file: {sys_file}")
-        except Exception as e:
-            print_warning(f"{prefix}Failed to copy system file {sys_file}: {e}")
+                    shutil.copy2(src, dest)
+                    print_success(f"{prefix}Copied system file: {sys_file}")
+            except Exception as e:
+                print_warning(f"{prefix}Failed to copy system file {sys_file}: {e}")
 
     # Validate installation
     if not validate_sap_installation(sap_id, sap, target_dir):
@@ -443,16 +457,214 @@ def install_sap(sap_id: str, source_dir: Path, target_dir: Path, catalog: Dict,
         return False
 
     print_success(f"{prefix}{sap['name']} installed successfully!")
-    stats.saps_installed += 1
+    stats.add('saps_installed')
 
     # Configure SAP to Level 1 if --configure flag is set
     if configure:
         configure_success = configure_sap(sap_id, sap, target_dir, dry_run, indent)
         if not configure_success:
-            stats.config_failed += 1
+            stats.add('config_failed')
 
     return True
 
+#############################################################################
+# Installation Planning
+#############################################################################
+
+class InstallPlan:
+    """SAPs to install, grouped into dependency levels
+
+    Every SAP in a level depends only on SAPs in earlier levels, so the SAPs
+    of one level can be installed concurrently.
+    """
+    def __init__(self):
+        self.levels: List[List[str]] = []
+        self.dependencies: Dict[str, List[str]] = {}  # SAP -> dependencies in the plan
+        self.missing: List[str] = []                  # IDs not found in the catalog
+        self.cycles: List[Tuple[str, str]] = []       # (sap, dependency) edges ignored to break cycles
+
+    @property
+    def sap_ids(self) -> List[str]:
+        """All planned SAPs, dependencies first"""
+        return [sap_id for level in self.levels for sap_id in level]
+
+    def critical_path(self) -> List[str]:
+        """Longest dependency chain; bounds the time of a parallel install"""
+        longest: Dict[str, List[str]] = {}
+        for sap_id in self.sap_ids:
+            chains = [longest[dep] for dep in self.dependencies[sap_id] if dep in longest]
+            longest[sap_id] = max(chains, key=len, default=[]) + [sap_id]
+        return max(longest.values(), key=len, default=[])
+
+def plan_installation(sap_ids: List[str], catalog: Dict) -> InstallPlan:
+    """Compute the transitive dependency closure of sap_ids and its topological levels
+
+    A SAP's level is one more than the highest level of its dependencies.
+    Within a level, SAPs keep the order a depth-first install would use.
+    """
+    plan = InstallPlan()
+    order: List[str] = []
+    visiting: Set[str] = set()
+    visited: Set[str] = set()
+
+    def visit(sap_id: str) -> None:
+        visited.add(sap_id)
+        sap = get_sap(sap_id, catalog)
+        if not sap:
+            plan.missing.append(sap_id)
+            return
+
+        visiting.add(sap_id)
+        dependencies = []
+        for dep_id in sap.get('dependencies') or []:
+            if dep_id in visiting:
+                plan.cycles.append((sap_id, dep_id))
+                continue
+            if dep_id not in visited:
+                visit(dep_id)
+            if dep_id not in plan.missing:
+                dependencies.append(dep_id)
+        visiting.discard(sap_id)
+
+        plan.dependencies[sap_id] = dependencies
+        order.append(sap_id)
+
+    for sap_id in sap_ids:
+        if sap_id not in visited:
+            visit(sap_id)
+
+    level_of: Dict[str, int] = {}
+    for sap_id in order:
+        level = 1 + max((level_of[dep] for dep in plan.dependencies[sap_id]), default=-1)
+        level_of[sap_id] = level
+        if level == len(plan.levels):
+            plan.levels.append([])
+        plan.levels[level].append(sap_id)
+
+    return plan
+
+def print_install_plan(plan: InstallPlan, jobs: int = DEFAULT_JOBS) -> None:
+    """Print the installation DAG, one line per level"""
+    total = len(plan.sap_ids)
+    print_info(f"Install plan: {total} SAPs in {len(plan.levels)} levels (up to {max(1, jobs)} in parallel)")
+    for number, level in enumerate(plan.levels, 1):
+        entries = []
+        for sap_id in level:
+            deps = plan.dependencies[sap_id]
+            entries.append(f"{sap_id} ← {', '.join(deps)}" if deps else sap_id)
+        print(f"  Level {number}: {'; '.join(entries)}")
+
+    critical_path = plan.critical_path()
+    if len(critical_path) > 1:
+        print_info(f"Critical path: {' → '.join(critical_path)}")
+    for sap_id, dep_id in plan.cycles:
+        print_warning(f"Dependency cycle: {sap_id} → {dep_id} (ignored for ordering)")
+    print()
+
+class _WorkerOutput:
+    """sys.stdout proxy that buffers output per install worker thread
+
+    Parallel installs would otherwise interleave their lines; each SAP's
+    output is printed in one piece once it finishes.
+    """
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def capture(self) -> None:
+        self._local.buffer = []
+
+    def release(self) -> str:
+        text = ''.join(self._local.buffer)
+        self._local.buffer = None
+        return text
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            return self.stream.write(text)
+        buffer.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, 'buffer', None) is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def _install_worker(output: _WorkerOutput, sap_id: str, source_dir: Path, target_dir: Path, catalog: Dict, configure: bool) -> Tuple[bool, str]:
+    """Install one planned SAP in a worker thread, returning (success, output)"""
+    output.capture()
+    try:
+        success = install_sap(sap_id, source_dir, target_dir, catalog, indent=True,
+                              configure=configure, resolve_dependencies=False)
+    except Exception as e:
+        print_error(f"  Failed to install {sap_id}: {e}")
+        success = False
+    finally:
+        text = output.release()
+    return success, text
+
+def install_planned(plan: InstallPlan, source_dir: Path, target_dir: Path, catalog: Dict, dry_run: bool = False, configure: bool = False, jobs: int = DEFAULT_JOBS) -> bool:
+    """Install a plan level by level, up to `jobs` SAPs of a level at a time"""
+    success = True
+    for sap_id in plan.missing:
+        print_error(f"  SAP {sap_id} not found in catalog")
+        success = False
+
+    # Initialize progress tracking
+    stats.total_saps = len(plan.sap_ids)
+    stats.start_time = time.time()
+    stats.current_sap_index = 0
+
+    failed: Set[str] = set()
+    completed = 0
+
+    def finish(sap_id: str, installed: bool) -> None:
+        nonlocal completed, success
+        if not installed:
+            failed.add(sap_id)
+            success = False
+        stats.current_sap_index = completed
+        completed += 1
+        # Show progress bar (after installation)
+        if not dry_run and stats.total_saps > 1:
+            print_progress_bar(completed - 1, stats.total_saps)
+
+    for number, level in enumerate(plan.levels, 1):
+        for sap_id in level:
+            failed_deps = [dep for dep in plan.dependencies[sap_id] if dep in failed]
+            if failed_deps:
+                print_warning(f"  {sap_id}: dependencies failed ({', '.join(failed_deps)}), continuing anyway")
+
+        workers = min(max(1, jobs), len(level))
+        if dry_run or workers == 1:
+            for sap_id in level:
+                finish(sap_id, install_sap(sap_id, source_dir, target_dir, catalog, dry_run, indent=True,
+                                           configure=configure, resolve_dependencies=False))
+            continue
+
+        if completed and stats.total_saps > 1:
+            print()  # End the progress bar line
+        print_info(f"Level {number}/{len(plan.levels)}: installing {len(level)} SAPs with {workers} workers")
+        output = _WorkerOutput(sys.stdout)
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(_install_worker, output, sap_id, source_dir, target_dir, catalog, configure): sap_id
+                    for sap_id in level
+                }
+                for future in as_completed(futures):
+                    installed, text = future.result()
+                    print(text, end='')
+                    finish(futures[future], installed)
+        finally:
+            sys.stdout = output.stream
+
+    return success
+
 #############################################################################
 # Configuration Functions (Level 1 Maturity)
 #############################################################################
@@ -646,7 +858,7 @@ def configure_sap(sap_id: str, sap: Dict, target_dir: Path, dry_run: bool = Fals
             print(f"{prefix}  • {note}")
 
     print_success(f"{prefix}{sap['name']} configured to Level 1!")
-    stats.saps_configured += 1
+    stats.add('saps_configured')
 
     return True
 
@@ -734,9 +946,12 @@ def main():
   python scripts/install-sap.py --set ecosystem --set domain-mcp --configure
   python scripts/install-sap.py --set ecosystem --set domain-react --configure
 
-  # Preview without installing
+  # Preview without installing (shows the dependency-level plan)
   python scripts/install-sap.py --set ecosystem --configure --dry-run
 
+  # Install one SAP at a time
+  python scripts/install-sap.py --set ecosystem --jobs 1
+
   # List available options
   python scripts/install-sap.py --list
   python scripts/install-sap.py --list-sets
@@ -754,9 +969,13 @@ def main():
     parser.add_argument('--list', action='store_true', help='List all available SAPs')
     parser.add_argument('--list-sets', action='store_true', help='List all available SAP sets')
     parser.add_argument('--dry-run', action='store_true', help='Preview without installing')
+    parser.add_argument('--jobs', '-j', type=int, default=DEFAULT_JOBS, help=f'Max SAPs installed in parallel within a dependency level (default: {DEFAULT_JOBS})')
 
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
     # Validate arguments
     if not any([args.sap_id, args.set_ids, args.list, args.list_sets]):
         parser.print_help()
@@ -793,7 +1012,7 @@ def main():
         # Install each set
         overall_success = True
         for set_id in args.set_ids:
-            success = install_sap_set(set_id, args.source, args.target, catalog, args.dry_run, args.configure)
+            success = install_sap_set(set_id, args.source, args.target, catalog, args.dry_run, args.configure, args.jobs)
             if not success:
                 overall_success = False
             print()
@@ -812,7 +1031,12 @@ def main():
             print_info("Configuration mode enabled - SAP will be configured to Level 1")
             print()
 
-        success = install_sap(args.sap_id, args.source, args.target, catalog, args.dry_run, configure=args.configure)
+        plan = plan_installation([args.sap_id], catalog)
+        if len(plan.sap_ids) > 1:
+            print_install_plan(plan, args.jobs)
+            success = install_planned(plan, args.source, args.target, catalog, args.dry_run, args.configure, args.jobs)
+        else:
+            success = install_sap(args.sap_id, args.source, args.target, catalog, args.dry_run, configure=args.configure)
         print()
         print_summary(args.dry_run, args.configure)
 
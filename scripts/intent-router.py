@@ -15,11 +15,17 @@
 - Confidence scoring for disambiguation
 - Clarification prompts when ambiguous
 - Pattern learning from usage
+
+Triggers are compiled into an inverted index and an Aho-Corasick automaton
+(see intent_matcher.py), so routing cost does not grow with the number of
+learned patterns.
 """
 
 import argparse
 import json
 import re
+import sys
+import time
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
@@ -27,6 +33,17 @@
 
 import yaml
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from intent_matcher import CompiledIntentMatcher
+
+# Identifiers extracted from user input: (parameter, regex, formatter)
+ID_PATTERNS = [
+    ("sap_id", re.compile(r"sap[- ]?(\d+)"), lambda m: f"SAP-{m.group(1).zfill(3)}"),
+    ("task_id", re.compile(r"task[- ]?(\d+)"), lambda m: f"task-{m.group(1).zfill(3)}"),
+    ("coord_id", re.compile(r"coord[- ]?(\d+)"), lambda m: f"coord-{m.group(1).zfill(3)}"),
+    ("trace_id", re.compile(r"trace[- ]?id:?\s*([a-z0-9-]+)"), lambda m: m.group(1)),
+]
 
 
 # Configure UTF-8 output for Windows console compatibility
@@ -65,7 +82,31 @@ def __init__(self, patterns_file: Path):
         """Initialize router with pattern database."""
         self.patterns_file = patterns_file
         self.patterns = self._load_patterns()
-        self.usage_log: list[dict] = []
+        self._matcher: Optional[CompiledIntentMatcher] = None
+        self._usage_log: list[dict] = []
+        self._pending_usage: list[tuple] = []
+
+    @property
+    def matcher(self) -> CompiledIntentMatcher:
+        """Compiled triggers (rebuilt after learn_pattern)."""
+        if self._matcher is None:
+            self._matcher = CompiledIntentMatcher(p.triggers for p in self.patterns)
+        return self._matcher
+
+    @property
+    def usage_log(self) -> list[dict]:
+        """Usage entries; route() buffers raw entries and they are formatted here."""
+        for timestamp, user_input, top_match, match_count in self._pending_usage:
+            self._usage_log.append(
+                {
+                    "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+                    "user_input": user_input,
+                    "top_match": asdict(top_match) if top_match else None,
+                    "all_matches": match_count,
+                }
+            )
+        self._pending_usage.clear()
+        return self._usage_log
 
     def _load_patterns(self) -> list[IntentPattern]:
         """Load intent patterns from YAML database."""
@@ -240,97 +281,49 @@ def _create_default_patterns(self) -> list[IntentPattern]:
             ),
         ]
 
-    def route(self, user_input: str) -> list[IntentMatch]:
+    def route(self, user_input: str, top_k: Optional[int] = None) -> list[IntentMatch]:
         """
         Route natural language input to structured actions.
 
-        Returns list of matches sorted by confidence (highest first).
+        Returns list of matches sorted by confidence (highest first),
+        limited to the top_k best when given. Parameters are only extracted
+        for the returned matches.
         """
         user_input_lower = user_input.lower().strip()
-        matches: list[IntentMatch] = []
+        scores = self.matcher.score(user_input_lower)
 
-        for pattern in self.patterns:
-            confidence = self._calculate_confidence(user_input_lower, pattern)
-            if confidence > 0:
-                match = IntentMatch(
+        # Sort by confidence descending (ties keep pattern order)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if top_k is not None:
+            ranked = ranked[:top_k]
+
+        extracted = self._extract_ids(user_input) if ranked else {}
+        matches: list[IntentMatch] = []
+        for pattern_index, confidence in ranked:
+            pattern = self.patterns[pattern_index]
+            matches.append(
+                IntentMatch(
                     action=pattern.action,
                     confidence=confidence,
-                    parameters=self._extract_parameters(user_input, pattern),
+                    parameters={**pattern.parameters, **extracted},
                     pattern_id=pattern.pattern_id,
                     clarification=self._generate_clarification(confidence, pattern),
                 )
-                matches.append(match)
-
-        # Sort by confidence descending
-        matches.sort(key=lambda m: m.confidence, reverse=True)
+            )
 
         # Log usage
-        self._log_usage(user_input, matches)
+        self._log_usage(user_input, matches, len(scores))
 
         return matches
 
-    def _calculate_confidence(self, user_input: str, pattern: IntentPattern) -> float:
-        """Calculate confidence score for pattern match (0.0 to 1.0)."""
-        max_score = 0.0
-
-        for trigger in pattern.triggers:
-            trigger_lower = trigger.lower()
-
-            # Exact match: 1.0
-            if user_input == trigger_lower:
-                return 1.0
-
-            # Contains full trigger: 0.9
-            if trigger_lower in user_input:
-                max_score = max(max_score, 0.9)
-                continue
-
-            # Word overlap scoring
-            user_words = set(user_input.split())
-            trigger_words = set(trigger_lower.split())
-
-            if not trigger_words:
-                continue
-
-            overlap = len(user_words & trigger_words)
-            overlap_ratio = overlap / len(trigger_words)
-
-            # High overlap: 0.7-0.85
-            if overlap_ratio >= 0.8:
-                max_score = max(max_score, 0.85)
-            elif overlap_ratio >= 0.6:
-                max_score = max(max_score, 0.75)
-            elif overlap_ratio >= 0.4:
-                max_score = max(max_score, 0.65)
-            elif overlap_ratio >= 0.2:
-                max_score = max(max_score, 0.5)
-
-        return max_score
-
-    def _extract_parameters(self, user_input: str, pattern: IntentPattern) -> dict:
-        """Extract parameters from user input based on pattern."""
-        params = pattern.parameters.copy()
-
-        # Extract SAP ID if mentioned
-        sap_match = re.search(r"sap[- ]?(\d+)", user_input.lower())
-        if sap_match:
-            params["sap_id"] = f"SAP-{sap_match.group(1).zfill(3)}"
-
-        # Extract task ID if mentioned
-        task_match = re.search(r"task[- ]?(\d+)", user_input.lower())
-        if task_match:
-            params["task_id"] = f"task-{task_match.group(1).zfill(3)}"
-
-        # Extract coordination ID if mentioned
-        coord_match = re.search(r"coord[- ]?(\d+)", user_input.lower())
-        if coord_match:
-            params["coord_id"] = f"coord-{coord_match.group(1).zfill(3)}"
-
-        # Extract trace ID if mentioned
-        trace_match = re.search(r"trace[- ]?id:?\s*([a-z0-9-]+)", user_input.lower())
-        if trace_match:
-            params["trace_id"] = trace_match.group(1)
-
+    def _extract_ids(self, user_input: str) -> dict:
+        """Extract SAP, task, coordination and trace IDs mentioned in user input."""
+        text = user_input.lower()
+        params = {}
+        for name, regex, format_id in ID_PATTERNS:
+            match = regex.search(text)
+            if match:
+                params[name] = format_id(match)
         return params
 
     def _generate_clarification(self, confidence: float, pattern: IntentPattern) -> Optional[str]:
@@ -339,16 +332,9 @@ def _generate_clarification(self, confidence: float, pattern: IntentPattern) ->
             return f"Did you mean: {pattern.description}? (Confidence: {confidence:.0%})"
         return None
 
-    def _log_usage(self, user_input: str, matches: list[IntentMatch]) -> None:
-        """Log usage for pattern learning."""
-        self.usage_log.append(
-            {
-                "timestamp": datetime.now().isoformat(),
-                "user_input": user_input,
-                "top_match": asdict(matches[0]) if matches else None,
-                "all_matches": len(matches),
-            }
-        )
+    def _log_usage(self, user_input: str, matches: list[IntentMatch], match_count: int) -> None:
+        """Log usage for pattern learning (buffered until usage_log is read)."""
+        self._pending_usage.append((time.time(), user_input, matches[0] if matches else None, match_count))
 
     def learn_pattern(self, user_input: str, action: str) -> None:
         """Learn new pattern from user feedback."""
@@ -359,6 +345,7 @@ def learn_pattern(self, user_input: str, action: str) -> None:
             # Add trigger if not already present
             if user_input.lower() not in [t.lower() for t in pattern.triggers]:
                 pattern.triggers.append(user_input.lower())
+                self._matcher = None
                 self._save_patterns()
         else:
             print(f"Warning: Action '{action}' not found in pattern database")
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Compiled trigger matcher for the intent router.
+
+IntentRouter scores a user input against every trigger of every pattern:
+exact match, full-trigger containment, then word-overlap ratio. This module
+compiles the triggers once so a route only touches triggers that can score:
+
+- exact matches are a dict lookup
+- full-trigger containment is found in one pass over the input with an
+  Aho-Corasick automaton over all triggers
+- word overlap comes from a token -> trigger inverted index, with each
+  trigger's word set precomputed
+
+Scores are identical to the naive loop; the cost of a route depends on the
+input and the triggers it touches, not on the size of the pattern database.
+
+Usage:
+    from intent_matcher import CompiledIntentMatcher
+
+    matcher = CompiledIntentMatcher([["show inbox", "inbox status"], ["what next"]])
+    matcher.score("show inbox please")   # {0: 0.9}
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Sequence, Set
+
+# Confidence by match kind (word overlap scores below both)
+EXACT_SCORE = 1.0
+CONTAINS_SCORE = 0.9
+
+
+def overlap_score(overlap_ratio: float) -> float:
+    """Confidence for the fraction of a trigger's words found in the input."""
+    if overlap_ratio >= 0.8:
+        return 0.85
+    if overlap_ratio >= 0.6:
+        return 0.75
+    if overlap_ratio >= 0.4:
+        return 0.65
+    if overlap_ratio >= 0.2:
+        return 0.5
+    return 0.0
+
+
+class AhoCorasick:
+    """Multi-string matcher: all keywords contained in a text in one pass."""
+
+    def __init__(self, keywords: Sequence[str]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: Strings to search for; find() reports their indexes.
+                Empty keywords are contained in every text.
+        """
+        goto: List[Dict[str, int]] = [{}]
+        output: Dict[int, List[int]] = {}
+        self._always: List[int] = []
+
+        for index, keyword in enumerate(keywords):
+            if not keyword:
+                self._always.append(index)
+                continue
+            state = 0
+            for char in keyword:
+                edges = goto[state]
+                next_state = edges.get(char)
+                if next_state is None:
+                    next_state = edges[char] = len(goto)
+                    goto.append({})
+                state = next_state
+            output.setdefault(state, []).append(index)
+
+        # Breadth-first failure links, plus for each state the nearest state
+        # on its failure chain that ends a keyword (dictionary suffix link)
+        fail = [0] * len(goto)
+        dict_link = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[next_state] = target
+                dict_link[next_state] = target if target in output else dict_link[target]
+
+        self._goto = goto
+        self._fail = fail
+        self._dict_link = dict_link
+        self._output = output
+
+    def find(self, text: str) -> Set[int]:
+        """Indexes of all keywords that occur in text."""
+        found = set(self._always)
+        goto, fail, dict_link, output = self._goto, self._fail, self._dict_link, self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            match = state if state in output else dict_link[state]
+            while match:
+                found.update(output[match])
+                match = dict_link[match]
+        return found
+
+
+class CompiledIntentMatcher:
+    """Trigger indexes for scoring an input against many patterns at once."""
+
+    def __init__(self, pattern_triggers: Iterable[Sequence[str]]):
+        """
+        Compile triggers.
+
+        Args:
+            pattern_triggers: For each pattern (in pattern order), its triggers
+        """
+        self.trigger_pattern: List[int] = []          # trigger index -> pattern index
+        self.trigger_sizes: List[int] = []            # trigger index -> distinct word count
+        self.exact: Dict[str, List[int]] = {}         # lowercased trigger -> pattern indexes
+        self.token_index: Dict[str, List[int]] = {}   # word -> trigger indexes
+        triggers: List[str] = []
+
+        for pattern_index, pattern in enumerate(pattern_triggers):
+            for trigger in pattern:
+                trigger_lower = trigger.lower()
+                trigger_index = len(triggers)
+                triggers.append(trigger_lower)
+                self.trigger_pattern.append(pattern_index)
+                self.exact.setdefault(trigger_lower, []).append(pattern_index)
+
+                words = set(trigger_lower.split())
+                self.trigger_sizes.append(len(words))
+                for word in words:
+                    self.token_index.setdefault(word, []).append(trigger_index)
+
+        self.automaton = AhoCorasick(triggers)
+
+    def score(self, user_input: str) -> Dict[int, float]:
+        """
+        Confidence per pattern for a lowercased, stripped input.
+
+        Returns:
+            pattern index -> confidence, for patterns scoring above zero
+        """
+        scores: Dict[int, float] = {}
+
+        for trigger_index in self.automaton.find(user_input):
+            pattern_index = self.trigger_pattern[trigger_index]
+            scores[pattern_index] = CONTAINS_SCORE
+
+        overlaps: Dict[int, int] = {}
+        for word in set(user_input.split()):
+            for trigger_index in self.token_index.get(word, ()):
+                overlaps[trigger_index] = overlaps.get(trigger_index, 0) + 1
+
+        for trigger_index, overlap in overlaps.items():
+            score = overlap_score(overlap / self.trigger_sizes[trigger_index])
+            pattern_index = self.trigger_pattern[trigger_index]
+            if score > scores.get(pattern_index, 0.0):
+                scores[pattern_index] = score
+
+        for pattern_index in self.exact.get(user_input, ()):
+            scores[pattern_index] = EXACT_SCORE
+
+        return scores
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""Streaming link graph storage with memory-mapped queries.
+
+link-graph.json holds the whole graph in one pretty-printed document, so
+writing it means building every node and edge in memory first, and every
+consumer has to parse all of it. The JSON Lines layout used here is written
+while files are scanned and is split into sorted sections, so a reader can
+answer neighbor and broken-link queries by binary search over an mmap:
+
+    {"type": "header", "metadata": {...}}
+    {"type": "edge", "source": ..., ...}            edges, sorted by source
+    {"type": "broken", "source": ..., ...}          broken links, sorted by source
+    {"type": "inbound", "target": ..., ...}         reverse edges, sorted by target
+    {"type": "node", "path": ..., ...}              nodes, sorted by path
+    {"type": "summary", "statistics": {...}, ...}   orphaned files and top hubs
+    {"type": "index", "sections": {...}, ...}       byte ranges of each section
+
+The index is always the last line. Edge, broken and node records keep the
+fields of link-graph.json (the reader returns them without "type"); the writer holds one small node dict per file
+and one (target, source, line) triple per internal link, never full edges.
+
+Usage:
+    from link_graph_store import LinkGraphReader, LinkGraphWriter
+
+    with LinkGraphWriter("scripts/link-graph.jsonl", metadata) as writer:
+        for result in scan_results:         # scan_markdown_file() output, sorted by path
+            writer.add_file(result)
+
+    with LinkGraphReader("scripts/link-graph.jsonl") as graph:
+        graph.neighbors("docs/README.md")
+        graph.inbound("docs/README.md")
+        list(graph.broken_links("docs/skilled-awareness"))
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Number of hub files kept in the summary
+TOP_HUBS = 10
+
+
+def summarize_nodes(nodes: Dict[str, Dict[str, Any]]) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """
+    Orphaned files and top hubs of a graph.
+
+    Args:
+        nodes: path -> node dict with inbound_links counted
+
+    Returns:
+        (orphaned file paths, top hubs as {path, inbound_links})
+    """
+    orphaned = [path for path, node in nodes.items() if node['inbound_links'] == 0]
+    hubs = sorted(
+        [(path, node['inbound_links']) for path, node in nodes.items()],
+        key=lambda x: -x[1]
+    )[:TOP_HUBS]
+    return orphaned, [{'path': path, 'inbound_links': count} for path, count in hubs]
+
+
+def _dump(record: Dict[str, Any]) -> bytes:
+    return json.dumps(record, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+class LinkGraphWriter:
+    """Writes a link graph section by section as scan results arrive."""
+
+    def __init__(self, output_path, metadata: Dict[str, Any]):
+        """
+        Start a graph file (written to a temporary file, renamed on close).
+
+        Args:
+            output_path: Destination .jsonl path
+            metadata: Header metadata (same keys as link-graph.json)
+        """
+        self.output_path = Path(output_path)
+        self._tmp_path = self.output_path.with_name(self.output_path.name + ".tmp")
+        self._file = open(self._tmp_path, 'wb')
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        self._inbound: List[Tuple[str, str, int]] = []
+        self._broken: List[Dict[str, Any]] = []
+        self._last_source: Optional[str] = None
+        self.statistics = {
+            'total_files': 0,
+            'total_links': 0,
+            'internal_links': 0,
+            'external_links': 0,
+            'broken_links': 0,
+            'orphaned_files': 0
+        }
+
+        self._file.write(_dump({'type': 'header', 'metadata': metadata}))
+        self._edges_start = self._file.tell()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            self._tmp_path.unlink(missing_ok=True)
+
+    def add_file(self, result: Dict[str, Any]):
+        """
+        Write one file's edges (a scan_markdown_file() result).
+
+        Files must be added in ascending path order.
+        """
+        node = result['node']
+        path = node['path']
+        if self._last_source is not None and path <= self._last_source:
+            raise ValueError(f"Files must be added in sorted path order: {path} after {self._last_source}")
+        self._last_source = path
+        self._nodes[path] = dict(node)
+
+        for edge in result['edges']:
+            self._file.write(_dump({'type': 'edge', **edge}))
+            if edge.get('external', False):
+                self.statistics['external_links'] += 1
+            else:
+                self.statistics['internal_links'] += 1
+                self._inbound.append((edge['target'], edge['source'], edge['line_number']))
+        self.statistics['total_links'] += len(result['edges'])
+        self._broken.extend(result['broken_links'])
+
+    def close(self):
+        """Write the remaining sections, the summary and the index."""
+        sections = {'edges': [self._edges_start, self._file.tell()]}
+
+        def write_section(name: str, records) -> None:
+            start = self._file.tell()
+            for record in records:
+                self._file.write(_dump(record))
+            sections[name] = [start, self._file.tell()]
+
+        write_section('broken', ({'type': 'broken', **broken} for broken in self._broken))
+
+        self._inbound.sort()
+        for target, _, _ in self._inbound:
+            if target in self._nodes:
+                self._nodes[target]['inbound_links'] += 1
+        write_section('inbound', (
+            {'type': 'inbound', 'target': target, 'source': source, 'line_number': line_number}
+            for target, source, line_number in self._inbound
+        ))
+
+        write_section('nodes', ({'type': 'node', **node} for node in self._nodes.values()))
+
+        orphaned, top_hubs = summarize_nodes(self._nodes)
+        self.statistics['total_files'] = len(self._nodes)
+        self.statistics['broken_links'] = len(self._broken)
+        self.statistics['orphaned_files'] = len(orphaned)
+        summary_offset = self._file.tell()
+        self._file.write(_dump({
+            'type': 'summary',
+            'statistics': self.statistics,
+            'orphaned_files': orphaned,
+            'top_hubs': top_hubs
+        }))
+
+        self._file.write(_dump({'type': 'index', 'sections': sections, 'summary': summary_offset}))
+        self._file.close()
+        os.replace(self._tmp_path, self.output_path)
+
+
+class LinkGraphReader:
+    """Queries a streamed link graph through mmap without loading it."""
+
+    def __init__(self, path):
+        """
+        Open a graph written by LinkGraphWriter.
+
+        Raises:
+            ValueError: If the file isn't a streamed link graph
+        """
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{self.path} is empty")
+
+        try:
+            index = self._record_at(self._mm.rfind(b'\n', 0, len(self._mm) - 1) + 1)
+        except json.JSONDecodeError:
+            index = {}
+        if not isinstance(index, dict) or index.get('type') != 'index':
+            self.close()
+            raise ValueError(f"{self.path} is not a streamed link graph (no index record)")
+        self.sections: Dict[str, Tuple[int, int]] = {
+            name: tuple(span) for name, span in index['sections'].items()
+        }
+        self._summary_offset = index['summary']
+        self.metadata: Dict[str, Any] = self._record_at(0)['metadata']
+        self._summary: Optional[Dict[str, Any]] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if getattr(self, '_mm', None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def _line_end(self, offset: int) -> int:
+        end = self._mm.find(b'\n', offset)
+        return len(self._mm) if end == -1 else end
+
+    def _record_at(self, offset: int) -> Dict[str, Any]:
+        return json.loads(self._mm[offset:self._line_end(offset)])
+
+    def _iter_section(self, name: str, start: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Records of a section, optionally from a line offset inside it."""
+        offset, end = self.sections[name]
+        if start is not None:
+            offset = start
+        while offset < end:
+            line_end = self._line_end(offset)
+            record = json.loads(self._mm[offset:line_end])
+            del record['type']
+            yield record
+            offset = line_end + 1
+
+    def _lower_bound(self, name: str, field: str, key: str) -> int:
+        """Offset of the first line in a section whose field is >= key."""
+        start, end = self.sections[name]
+        lo, hi = start, end
+        while lo < hi:
+            mid = (lo + hi) // 2
+            line_start = max(start, self._mm.rfind(b'\n', start, mid) + 1)
+            line_end = self._line_end(line_start)
+            if json.loads(self._mm[line_start:line_end])[field] < key:
+                lo = line_end + 1
+            else:
+                hi = line_start
+        return lo
+
+    def _iter_prefix(self, name: str, field: str, prefix: str) -> Iterator[Dict[str, Any]]:
+        """Records of a section whose field starts with prefix."""
+        for record in self._iter_section(name, self._lower_bound(name, field, prefix)):
+            if not record[field].startswith(prefix):
+                return
+            yield record
+
+    def _iter_equal(self, name: str, field: str, key: str) -> Iterator[Dict[str, Any]]:
+        for record in self._iter_prefix(name, field, key):
+            if record[field] != key:
+                return
+            yield record
+
+    def _iter_under(self, name: str, field: str, path: str) -> Iterator[Dict[str, Any]]:
+        """Records for a file path, or for every file under a directory."""
+        path = os.path.normpath(path)
+        if path == '.':
+            yield from self._iter_section(name)
+            return
+        for record in self._iter_prefix(name, field, path):
+            value = record[field]
+            if value == path or value.startswith(path + '/'):
+                yield record
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """Statistics, orphaned files and top hubs."""
+        if self._summary is None:
+            self._summary = self._record_at(self._summary_offset)
+        return self._summary
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        return self.summary['statistics']
+
+    def node(self, path: str) -> Optional[Dict[str, Any]]:
+        """Node record for a file, or None if it wasn't scanned."""
+        for record in self._iter_equal('nodes', 'path', path):
+            return record
+        return None
+
+    def nodes(self, under: str = '.') -> Iterator[Dict[str, Any]]:
+        """Node records for a file or every file under a directory."""
+        return self._iter_under('nodes', 'path', under)
+
+    def outbound(self, path: str) -> List[Dict[str, Any]]:
+        """Edges (internal and external) from a file, in line order."""
+        return list(self._iter_equal('edges', 'source', path))
+
+    def inbound(self, path: str) -> List[Dict[str, Any]]:
+        """Internal links pointing at a file, as {target, source, line_number}."""
+        return list(self._iter_equal('inbound', 'target', path))
+
+    def neighbors(self, path: str) -> List[str]:
+        """Distinct internal link targets of a file, in first-seen order."""
+        targets = (edge['target'] for edge in self.outbound(path) if not edge.get('external', False))
+        return list(dict.fromkeys(targets))
+
+    def broken_links(self, under: str = '.') -> Iterator[Dict[str, Any]]:
+        """Broken links from a file or every file under a directory."""
+        return self._iter_under('broken', 'source', under)
+
+    def edges(self) -> Iterator[Dict[str, Any]]:
+        """All edges, in source order."""
+        return self._iter_section('edges')
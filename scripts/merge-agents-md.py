@@ -17,7 +17,6 @@
 """
 
 import argparse
-import re
 import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -28,6 +27,14 @@
     print("Error: PyYAML required. Install with: pip install PyYAML")
     sys.exit(1)
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.markdown_structure import MarkdownStructure, read_markdown
+
+# Configure UTF-8 output for Windows console compatibility
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
 class Section:
     """Represents a markdown section"""
     def __init__(self, title: str, level: int, content: List[str], line_start: int):
@@ -50,31 +57,27 @@ def parse_agents_md(file_path: str) -> Tuple[List[str], Dict[str, Section]]:
     if not Path(file_path).exists():
         return [], {}
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    return split_sections(read_markdown(Path(file_path)))
 
+def split_sections(structure: MarkdownStructure) -> Tuple[List[str], Dict[str, Section]]:
+    """Split parsed markdown into preamble and ## / ### sections (see parse_agents_md)"""
     preamble = []
     sections = {}
     current_section = None
-    current_content = []
-    line_num = 0
 
-    # Pattern for section headers (## or ###)
-    header_pattern = re.compile(r'^(#{2,3})\s+(.+)$')
+    # Section headers (## or ###), keyed by 0-based line index
+    headers = {h.line - 1: h for h in structure.headings if h.level in (2, 3)}
 
-    for i, line in enumerate(lines):
-        match = header_pattern.match(line.strip())
+    for i, line in enumerate(structure.lines_with_endings()):
+        header = headers.get(i)
 
-        if match:
+        if header:
             # Save previous section
             if current_section:
                 sections[current_section.title] = current_section
 
             # Start new section
-            level = len(match.group(1))
-            title = match.group(2).strip()
-            current_section = Section(title, level, [line], i)
-            current_content = [line]
+            current_section = Section(header.title, header.level, [line], i)
         elif current_section:
             # Add to current section
             current_section.content.append(line)
@@ -259,20 +262,7 @@ def main():
         print("  Falling back to current file only")
         upstream_sections = {}
     else:
-        # Write to temp file for parsing
-        import tempfile
-
-# Configure UTF-8 output for Windows console compatibility
-if sys.platform == 'win32':
-    sys.stdout.reconfigure(encoding='utf-8')
-    sys.stderr.reconfigure(encoding='utf-8')
-
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md') as tmp:
-            tmp.write(upstream_content)
-            tmp_path = tmp.name
-
-        _, upstream_sections = parse_agents_md(tmp_path)
-        Path(tmp_path).unlink()  # Clean up
+        _, upstream_sections = split_sections(MarkdownStructure(upstream_content))
 
         print(f"✓ Parsed upstream AGENTS.md")
         print(f"  - Sections found: {len(upstream_sections)}")
@@ -22,11 +22,16 @@
 import re
 import glob
 import argparse
+import sys
 from pathlib import Path
 from typing import Dict, List, Set, Any, Optional
 from datetime import datetime, timezone, timedelta
 from collections import Counter
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from event_archive import iter_archived_events
+from event_columns import EventTable, load_event_table
 
 
 # Configure UTF-8 output for Windows console compatibility
@@ -102,6 +107,46 @@ def find_event_files(
     return sorted(event_files)
 
 
+def find_archive_files(events_dir: str = ".chora/memory/events") -> List[str]:
+    """Find all segmented event archives (*-archive.jsonl.gz)."""
+    archive_files = []
+
+    for root, dirs, files in os.walk(events_dir):
+        for file in files:
+            if file.endswith('-archive.jsonl.gz'):
+                archive_files.append(os.path.join(root, file))
+
+    return sorted(archive_files)
+
+
+def read_all_events(
+    events_dir: str = ".chora/memory/events",
+    days: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Read events from live logs and compressed archives.
+
+    Archives are modified on every compaction, so instead of filtering them
+    by mtime only the segments overlapping the last N days are read.
+
+    Args:
+        events_dir: Root events directory
+        days: If specified, only include recent files / archived events
+
+    Returns:
+        List of events (archived events first)
+    """
+    since = datetime.now(timezone.utc) - timedelta(days=days) if days is not None else None
+
+    all_events = []
+    for archive_path in find_archive_files(events_dir):
+        all_events.extend(iter_archived_events(Path(archive_path), since=since))
+    for file_path in find_event_files(events_dir=events_dir, days=days):
+        all_events.extend(read_events_from_file(file_path))
+
+    return all_events
+
+
 def read_events_from_file(file_path: str) -> List[Dict[str, Any]]:
     """Read all events from a JSONL file."""
     events = []
@@ -176,6 +221,29 @@ def count_events_by_tag(events: List[Dict[str, Any]]) -> Counter:
     return tag_counts
 
 
+def count_tags_columnar(
+    events_dir: str = ".chora/memory/events",
+    days: Optional[int] = None
+) -> Counter:
+    """
+    Count events by tag using columnar event tables (see event_columns.py).
+
+    Equivalent to count_events_by_tag(read_all_events(...)) without parsing
+    compacted logs.
+    """
+    tag_counts = Counter()
+
+    for file_path in find_event_files(events_dir=events_dir, days=days):
+        tag_counts.update(load_event_table(Path(file_path)).count_by('metadata.tags'))
+
+    since = datetime.now(timezone.utc) - timedelta(days=days) if days is not None else None
+    for archive_path in find_archive_files(events_dir):
+        archived = EventTable.from_events(iter_archived_events(Path(archive_path), since=since))
+        tag_counts.update(archived.count_by('metadata.tags'))
+
+    return tag_counts
+
+
 def list_all_tags_in_use(events: List[Dict[str, Any]]) -> Set[str]:
     """Extract all unique tags currently in use."""
     tags_in_use = set()
@@ -255,14 +323,8 @@ def query_events(
     Returns:
         List of matching events
     """
-    # Find event files
-    event_files = find_event_files(events_dir=events_dir, days=days)
-
-    # Read all events
-    all_events = []
-    for file_path in event_files:
-        events = read_events_from_file(file_path)
-        all_events.extend(events)
+    # Read all events (live logs and archives)
+    all_events = read_all_events(events_dir=events_dir, days=days)
 
     # Apply filters
     filtered_events = all_events
@@ -332,10 +394,7 @@ def main():
 
     # List tags command
     if args.list_tags:
-        event_files = find_event_files(events_dir=args.events_dir)
-        all_events = []
-        for file_path in event_files:
-            all_events.extend(read_events_from_file(file_path))
+        all_events = read_all_events(events_dir=args.events_dir)
 
         tags_in_use = sorted(list_all_tags_in_use(all_events))
 
@@ -347,12 +406,7 @@ def main():
 
     # Count by tag command
     if args.count_by_tag:
-        event_files = find_event_files(events_dir=args.events_dir, days=args.days)
-        all_events = []
-        for file_path in event_files:
-            all_events.extend(read_events_from_file(file_path))
-
-        tag_counts = count_events_by_tag(all_events)
+        tag_counts = count_tags_columnar(events_dir=args.events_dir, days=args.days)
 
         print(f"📊 Event Counts by Tag:\n")
         for tag, count in tag_counts.most_common():
@@ -362,10 +416,7 @@ def main():
 
     # Validate tags command
     if args.validate_tags:
-        event_files = find_event_files(events_dir=args.events_dir)
-        all_events = []
-        for file_path in event_files:
-            all_events.extend(read_events_from_file(file_path))
+        all_events = read_all_events(events_dir=args.events_dir)
 
         validation = validate_tags_against_taxonomy(all_events, taxonomy)
 
@@ -38,11 +38,9 @@
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
-try:
-    import yaml
-except ImportError:
-    print("ERROR: PyYAML not installed. Run: pip install PyYAML", file=sys.stderr)
-    sys.exit(2)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from registry_snapshot import load_registry_snapshot
 
 
 class RegistryLookup:
@@ -71,9 +69,8 @@ def load_manifests(self) -> bool:
             )
             return False
 
-        yaml_files = list(self.capabilities_dir.glob("*.yaml")) + list(
-            self.capabilities_dir.glob("*.yml")
-        )
+        snapshot = load_registry_snapshot(self.capabilities_dir)
+        yaml_files = snapshot.paths()
 
         if not yaml_files:
             print(
@@ -83,9 +80,17 @@ def load_manifests(self) -> bool:
             return False
 
         for yaml_file in yaml_files:
+            entry = snapshot.entry(yaml_file)
+            if entry["error"]:
+                action = "parse" if entry["error"]["kind"] == "yaml" else "load"
+                print(
+                    f"ERROR: Failed to {action} {yaml_file.name}: {entry['error']['message']}",
+                    file=sys.stderr,
+                )
+                continue
+
             try:
-                with open(yaml_file, "r", encoding="utf-8") as f:
-                    manifest = yaml.safe_load(f)
+                manifest = entry["manifest"]
 
                 # Validate manifest structure
                 if not manifest or "metadata" not in manifest:
@@ -128,11 +133,6 @@ def load_manifests(self) -> bool:
                 elif cap_type == "Pattern":
                     self.stats["pattern_type"] += 1
 
-            except yaml.YAMLError as e:
-                print(
-                    f"ERROR: Failed to parse {yaml_file.name}: {e}", file=sys.stderr
-                )
-                continue
             except Exception as e:
                 print(
                     f"ERROR: Failed to load {yaml_file.name}: {e}", file=sys.stderr
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""Compiled snapshot of the capability registry.
+
+Registry tooling (registry-lookup, validate-cross-type-deps,
+validate-namespaces, update-dependency-namespaces, gitops-sync-registry)
+needs every manifest in capabilities/ parsed. Parsing YAML dominates their
+startup, so this module keeps the parsed manifests, the namespace and
+legacy-ID indexes and the dependency graph in a single JSON snapshot
+(capabilities/.registry-snapshot.json). Each manifest is fingerprinted by
+mtime/size and SHA-256; a refresh only re-parses manifests whose content
+changed. Parse failures are kept under the same fingerprint, so a broken
+manifest does not force a rebuild on every run.
+
+Usage:
+    from registry_snapshot import RegistrySnapshot
+
+    snapshot = RegistrySnapshot(Path("capabilities"))
+    snapshot.refresh()
+    for path in snapshot.paths():
+        entry = snapshot.entry(path)   # {"manifest", "error", "sha256", ...}
+    snapshot.namespace_index["chora.devex.registry"]   # manifest file name
+    snapshot.legacy_index["SAP-044"]                   # modern namespace
+    snapshot.dependency_graph["chora.devex.registry"]  # normalized requires
+"""
+
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+SNAPSHOT_VERSION = 1
+
+SNAPSHOT_NAME = ".registry-snapshot.json"
+
+# Manifest file patterns, in the order registry tools have always globbed them
+MANIFEST_PATTERNS = ("*.yaml", "*.yml")
+
+# libyaml is several times faster than the pure-Python loader when available
+_FAST_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def parse_manifest_text(text: str, name: str) -> Any:
+    """
+    Parse manifest YAML.
+
+    Uses libyaml when available. On a parse error the pure-Python loader is
+    re-run so error messages match yaml.safe_load() on the open file.
+    """
+    try:
+        return yaml.load(text, Loader=_FAST_LOADER)
+    except yaml.YAMLError:
+        if _FAST_LOADER is yaml.SafeLoader:
+            raise
+    stream = io.StringIO(text)
+    stream.name = name
+    return yaml.safe_load(stream)
+
+
+def normalize_requires(manifest: Any) -> List[Dict[str, Any]]:
+    """
+    Normalize manifest dc_relation.requires into dependency edges.
+
+    String dependencies become {"capability", "relationship": "prerequisite",
+    "version": "*"}; dict dependencies keep their fields with the same
+    defaults. Entries of any other type are kept as {"invalid": str(dep)} so
+    validators can report them.
+    """
+    if not isinstance(manifest, dict):
+        return []
+    dc_relation = manifest.get("dc_relation") or {}
+    requires = dc_relation.get("requires") if isinstance(dc_relation, dict) else None
+    if not isinstance(requires, list):
+        return []
+
+    edges = []
+    for dep in requires:
+        if isinstance(dep, str):
+            edges.append({"capability": dep, "relationship": "prerequisite", "version": "*"})
+        elif isinstance(dep, dict):
+            edges.append({
+                "capability": dep.get("capability"),
+                "relationship": dep.get("relationship", "prerequisite"),
+                "version": dep.get("version", "*"),
+            })
+        else:
+            edges.append({"invalid": str(dep)})
+    return edges
+
+
+def _manifest_identity(manifest: Any):
+    """(namespace, legacy_id) of a structurally valid manifest, else (None, None)."""
+    if not manifest or not isinstance(manifest, dict) or "metadata" not in manifest:
+        return None, None
+    metadata = manifest["metadata"]
+    if not isinstance(metadata, dict) or not metadata.get("dc_identifier"):
+        return None, None
+    return metadata["dc_identifier"], metadata.get("dc_identifier_legacy")
+
+
+def _json_round_trips(manifest: Any) -> bool:
+    """Whether the manifest survives JSON unchanged (no dates, non-str keys...)."""
+    try:
+        return json.loads(json.dumps(manifest)) == manifest
+    except (TypeError, ValueError):
+        return False
+
+
+class RegistrySnapshot:
+    """Incrementally maintained parse of every manifest in a capabilities directory."""
+
+    def __init__(self, capabilities_dir: Path, snapshot_file: Optional[Path] = None):
+        """
+        Initialize snapshot.
+
+        Args:
+            capabilities_dir: Directory containing capability manifests
+            snapshot_file: Path to persisted snapshot (default:
+                .registry-snapshot.json in capabilities_dir)
+        """
+        self.capabilities_dir = capabilities_dir
+        self.snapshot_file = snapshot_file or capabilities_dir / SNAPSHOT_NAME
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.namespace_index: Dict[str, str] = {}
+        self.legacy_index: Dict[str, str] = {}
+        self.dependency_graph: Dict[str, List[Dict[str, Any]]] = {}
+        self.parsed = 0
+
+    def _load(self) -> Dict[str, Any]:
+        """Load persisted snapshot state, if compatible."""
+        try:
+            with open(self.snapshot_file, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if state.get("version") != SNAPSHOT_VERSION:
+            return {}
+        return state
+
+    def _save(self):
+        """Persist snapshot atomically (best effort; read-only checkouts still work)."""
+        entries = {}
+        for name, entry in self.entries.items():
+            # Entries without a fingerprint (stat/read failed) are transient
+            if entry.get("mtime_ns") is None:
+                continue
+            entries[name] = entry if entry.get("cacheable", True) else dict(entry, manifest=None)
+
+        state = {
+            "version": SNAPSHOT_VERSION,
+            "entries": entries,
+            "namespace_index": self.namespace_index,
+            "legacy_index": self.legacy_index,
+            "dependency_graph": self.dependency_graph,
+        }
+        tmp_file = self.snapshot_file.with_name(self.snapshot_file.name + ".tmp")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, separators=(',', ':'), default=str)
+            os.replace(tmp_file, self.snapshot_file)
+        except OSError:
+            pass
+
+    def _scan(self) -> List[Path]:
+        paths = []
+        for pattern in MANIFEST_PATTERNS:
+            paths.extend(self.capabilities_dir.glob(pattern))
+        return paths
+
+    def _parse(self, path: Path, data: bytes) -> Dict[str, Any]:
+        """Parse manifest bytes into a snapshot entry."""
+        self.parsed += 1
+        entry = {"sha256": hashlib.sha256(data).hexdigest(), "manifest": None, "error": None}
+        try:
+            manifest = parse_manifest_text(data.decode("utf-8"), str(path))
+        except yaml.YAMLError as e:
+            # YAML messages name the file, so remember which path was parsed
+            entry["error"] = {"kind": "yaml", "message": str(e), "source": str(path)}
+            return entry
+        except Exception as e:
+            entry["error"] = {"kind": "read", "message": str(e)}
+            return entry
+
+        entry["manifest"] = manifest
+        entry["cacheable"] = _json_round_trips(manifest)
+        namespace, legacy_id = _manifest_identity(manifest)
+        entry["namespace"] = namespace
+        entry["legacy_id"] = legacy_id
+        return entry
+
+    def refresh(self) -> int:
+        """
+        Bring the snapshot up to date with the capabilities directory.
+
+        Unchanged manifests (same mtime and size, or same SHA-256 after a
+        touch) are taken from the persisted snapshot, including the error of
+        a manifest that failed to parse (re-parsed only if it was reached
+        through a different path, so messages name the file as given).
+
+        Returns:
+            Number of manifests parsed
+        """
+        self.parsed = 0
+        state = self._load()
+        previous = state.get("entries", {})
+        entries: Dict[str, Dict[str, Any]] = {}
+
+        for path in self._scan():
+            name = path.name
+            old = previous.get(name)
+            try:
+                stat = path.stat()
+            except OSError as e:
+                entries[name] = {"sha256": None, "manifest": None, "error": {"kind": "read", "message": str(e)}}
+                continue
+
+            error = (old or {}).get("error")
+            if error and error.get("source", str(path)) != str(path):
+                old = None
+
+            if old and old.get("mtime_ns") == stat.st_mtime_ns and old.get("size") == stat.st_size:
+                entries[name] = old
+                continue
+
+            try:
+                data = path.read_bytes()
+            except OSError as e:
+                entries[name] = {"sha256": None, "manifest": None, "error": {"kind": "read", "message": str(e)}}
+                continue
+
+            if old and old.get("sha256") == hashlib.sha256(data).hexdigest():
+                entry = dict(old)
+            else:
+                entry = self._parse(path, data)
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            entries[name] = entry
+
+        self.entries = entries
+        dirty = list(entries) != list(previous) or any(
+            entries[name] is not previous.get(name) for name in entries
+        )
+
+        if not dirty and "namespace_index" in state:
+            self.namespace_index = state["namespace_index"]
+            self.legacy_index = state["legacy_index"]
+            self.dependency_graph = state["dependency_graph"]
+            return 0
+
+        self._build_indexes()
+        self._save()
+        return self.parsed
+
+    def _build_indexes(self):
+        """Rebuild namespace/legacy indexes and dependency graph (scan order, last wins)."""
+        self.namespace_index = {}
+        self.legacy_index = {}
+        self.dependency_graph = {}
+        for name, entry in self.entries.items():
+            namespace = entry.get("namespace")
+            if not namespace:
+                continue
+            self.namespace_index[namespace] = name
+            if entry.get("legacy_id"):
+                self.legacy_index[entry["legacy_id"]] = namespace
+            self.dependency_graph[namespace] = normalize_requires(self._manifest(name, entry))
+
+    def _manifest(self, name: str, entry: Dict[str, Any]) -> Any:
+        """Manifest for an entry, re-parsing YAML the snapshot cannot hold as JSON."""
+        if entry.get("cacheable", True) or entry.get("error"):
+            return entry["manifest"]
+        path = self.capabilities_dir / name
+        return parse_manifest_text(path.read_text(encoding="utf-8"), str(path))
+
+    def paths(self, pattern: Optional[str] = None) -> List[Path]:
+        """Manifest paths in scan order, optionally filtered by a glob pattern."""
+        paths = [self.capabilities_dir / name for name in self.entries]
+        if pattern:
+            paths = [path for path in paths if path.match(pattern)]
+        return paths
+
+    def entry(self, path: Path) -> Dict[str, Any]:
+        """
+        Snapshot entry for a manifest path.
+
+        Returns a dict with "manifest" (parsed YAML, or None), "error"
+        ({"kind": "yaml"|"read", "message"} or None) and "sha256". Paths
+        outside the snapshot are parsed directly.
+        """
+        entry = self.entries.get(path.name)
+        if entry is None or path.parent.resolve() != self.capabilities_dir.resolve():
+            try:
+                data = path.read_bytes()
+            except OSError as e:
+                return {"sha256": None, "manifest": None, "error": {"kind": "read", "message": str(e)}}
+            entry = self._parse(path, data)
+            entry["cacheable"] = True
+            return entry
+
+        if entry.get("cacheable", True):
+            return entry
+        try:
+            manifest = self._manifest(path.name, entry)
+        except yaml.YAMLError as e:
+            return dict(entry, error={"kind": "yaml", "message": str(e)})
+        except Exception as e:
+            return dict(entry, error={"kind": "read", "message": str(e)})
+        return dict(entry, manifest=manifest)
+
+    def manifest(self, namespace: str) -> Optional[Dict[str, Any]]:
+        """Manifest for a namespace, or None if no valid manifest defines it."""
+        name = self.namespace_index.get(namespace)
+        if name is None:
+            return None
+        return self.entry(self.capabilities_dir / name)["manifest"]
+
+
+def load_registry_snapshot(capabilities_dir: Path) -> RegistrySnapshot:
+    """Create and refresh the snapshot for a capabilities directory."""
+    snapshot = RegistrySnapshot(capabilities_dir)
+    snapshot.refresh()
+    return snapshot
@@ -39,6 +39,10 @@
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+import event_sink
+
 VERSION = "1.0.0"
 
 
@@ -105,7 +109,8 @@ def emit_event(
     notes: Optional[str] = None
 ):
     """
-    Emit event to coordination log.
+    Emit event to coordination log (buffered; written by the shared event
+    sink in the background and at exit).
 
     Args:
         inbox_path: Path to inbox directory
@@ -115,7 +120,6 @@ def emit_event(
         notes: Optional notes
     """
     events_file = inbox_path / "coordination" / "events.jsonl"
-    events_file.parent.mkdir(parents=True, exist_ok=True)
 
     event = {
         "timestamp": datetime.now().isoformat(),
@@ -127,8 +131,7 @@ def emit_event(
     if notes:
         event["notes"] = notes
 
-    with open(events_file, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(event) + "\n")
+    event_sink.emit(events_file, event)
 
 
 def main():
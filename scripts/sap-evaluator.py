@@ -49,6 +49,7 @@
 sys.path.insert(0, str(repo_root))
 
 from utils.sap_evaluation import (
+    DEFAULT_JOBS,
     SAPEvaluator,
     EvaluationResult,
     AdoptionRoadmap,
@@ -586,6 +587,17 @@ def main():
         type=int,
         help="Only include evaluations from last N days (for --export-history)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"SAPs evaluated concurrently for --quick all and --strategic (default: {DEFAULT_JOBS})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run deep dives instead of reusing results for unchanged SAPs"
+    )
     parser.add_argument(
         "--evaluation-type",
         choices=["quick", "deep", "strategic"],
@@ -595,7 +607,7 @@ def main():
     args = parser.parse_args()
 
     # Initialize evaluator
-    evaluator = SAPEvaluator(repo_root=repo_root)
+    evaluator = SAPEvaluator(repo_root=repo_root, jobs=args.jobs, use_cache=not args.no_cache)
 
     try:
         if args.export_history:
@@ -15,8 +15,10 @@
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from event_columns import EventTable, load_event_table
 
 
 # Configure UTF-8 output for Windows console compatibility
@@ -24,20 +26,9 @@
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
-def load_events(events_dir: Path, event_log: str) -> List[dict]:
-    """Load events from a JSONL file"""
-    log_path = events_dir / event_log
-
-    if not log_path.exists():
-        return []
-
-    events = []
-    with open(log_path, "r", encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                events.append(json.loads(line))
-
-    return events
+def load_events(events_dir: Path, event_log: str) -> EventTable:
+    """Load an event log as a columnar table (compacted partitions + new events)"""
+    return load_event_table(events_dir / event_log)
 
 
 def calculate_setup_metrics(events_dir: Path) -> dict:
@@ -53,17 +44,18 @@ def calculate_setup_metrics(events_dir: Path) -> dict:
             "meets_target": False
         }
 
-    end_events = [e for e in events if e.get("action") == "end"]
-    successful = [e for e in end_events if e.get("success")]
+    end_events = events.where_eq("action", "end")
+    successful = events.where("success", bool, rows=end_events)
+    successful_count = events.count(successful)
 
     avg_time = (
-        sum(e.get("setup_time_minutes", 0) for e in successful) / len(successful)
-        if successful else 0.0
+        events.sum("setup_time_minutes", rows=successful) / successful_count
+        if successful_count else 0.0
     )
 
     return {
-        "total_setups": len(end_events),
-        "successful_setups": len(successful),
+        "total_setups": events.count(end_events),
+        "successful_setups": successful_count,
         "avg_setup_time_minutes": avg_time,
         "target": 30.0,
         "meets_target": avg_time <= 30.0
@@ -87,17 +79,19 @@ def calculate_context_metrics(events_dir: Path) -> dict:
             "meets_target": False
         }
 
-    baseline_events = [e for e in events if e.get("session_type") == "baseline"]
-    beads_events = [e for e in events if e.get("session_type") == "beads"]
+    baseline_events = events.where_eq("session_type", "baseline")
+    beads_events = events.where_eq("session_type", "beads")
+    baseline_count = events.count(baseline_events)
+    beads_count = events.count(beads_events)
 
     baseline_avg = (
-        sum(e.get("context_time_minutes", 0) for e in baseline_events) / len(baseline_events)
-        if baseline_events else 0.0
+        events.sum("context_time_minutes", rows=baseline_events) / baseline_count
+        if baseline_count else 0.0
     )
 
     beads_avg = (
-        sum(e.get("context_time_minutes", 0) for e in beads_events) / len(beads_events)
-        if beads_events else 0.0
+        events.sum("context_time_minutes", rows=beads_events) / beads_count
+        if beads_count else 0.0
     )
 
     time_saved = baseline_avg - beads_avg if baseline_avg > 0 else 0.0
@@ -105,8 +99,8 @@ def calculate_context_metrics(events_dir: Path) -> dict:
 
     return {
         "total_sessions": len(events),
-        "baseline_sessions": len(baseline_events),
-        "beads_sessions": len(beads_events),
+        "baseline_sessions": baseline_count,
+        "beads_sessions": beads_count,
         "baseline_avg_minutes": baseline_avg,
         "beads_avg_minutes": beads_avg,
         "time_saved_minutes": time_saved,
@@ -130,7 +124,7 @@ def calculate_task_metrics(events_dir: Path) -> dict:
 
     total_tasks = len(events)
     avg_time = (
-        sum(e.get("completion_time_hours", 0) for e in events) / len(events)
+        events.sum("completion_time_hours") / len(events)
         if events else 0.0
     )
 
@@ -140,7 +134,7 @@ def calculate_task_metrics(events_dir: Path) -> dict:
         "total_tasks": total_tasks,
         "avg_completion_time_hours": avg_time,
         "velocity_tasks_per_week": velocity,
-        "tasks_with_blockers": sum(1 for e in events if e.get("had_blockers"))
+        "tasks_with_blockers": events.count(events.where("had_blockers", bool))
     }
 
 
@@ -156,21 +150,23 @@ def calculate_dependency_metrics(events_dir: Path) -> dict:
             "currently_blocked": 0
         }
 
-    blocked_events = [e for e in events if e.get("action") == "blocked"]
-    unblocked_events = [e for e in events if e.get("action") == "unblocked"]
+    blocked_count = events.count(events.where_eq("action", "blocked"))
+    unblocked_events = events.where_eq("action", "unblocked")
+    unblocked_count = events.count(unblocked_events)
 
-    blocked_times = [e.get("blocked_hours", 0) for e in unblocked_events if e.get("blocked_hours", 0) > 0]
+    blocked_times = events.where("blocked_hours", lambda hours: hours > 0, rows=unblocked_events, default=0)
+    blocked_times_count = events.count(blocked_times)
 
     avg_blocked = (
-        sum(blocked_times) / len(blocked_times)
-        if blocked_times else 0.0
+        events.sum("blocked_hours", rows=blocked_times) / blocked_times_count
+        if blocked_times_count else 0.0
     )
 
-    currently_blocked = len(blocked_events) - len(unblocked_events)
+    currently_blocked = blocked_count - unblocked_count
 
     return {
-        "total_blocks": len(blocked_events),
-        "total_unblocks": len(unblocked_events),
+        "total_blocks": blocked_count,
+        "total_unblocks": unblocked_count,
         "avg_blocked_hours": avg_blocked,
         "currently_blocked": max(0, currently_blocked)
     }
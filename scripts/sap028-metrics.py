@@ -15,8 +15,10 @@
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from event_columns import EventTable, load_event_table
 
 
 # Configure UTF-8 output for Windows console compatibility
@@ -24,20 +26,9 @@
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
-def load_events(events_dir: Path, event_log: str) -> List[dict]:
-    """Load events from a JSONL file"""
-    log_path = events_dir / event_log
-
-    if not log_path.exists():
-        return []
-
-    events = []
-    with open(log_path, "r", encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                events.append(json.loads(line))
-
-    return events
+def load_events(events_dir: Path, event_log: str) -> EventTable:
+    """Load an event log as a columnar table (compacted partitions + new events)"""
+    return load_event_table(events_dir / event_log)
 
 
 def calculate_setup_metrics(events_dir: Path) -> dict:
@@ -52,17 +43,18 @@ def calculate_setup_metrics(events_dir: Path) -> dict:
             "meets_target": False
         }
 
-    end_events = [e for e in events if e.get("action") == "end"]
-    successful = [e for e in end_events if e.get("success")]
+    end_events = events.where_eq("action", "end")
+    successful = events.where("success", bool, rows=end_events)
+    successful_count = events.count(successful)
 
     avg_time = (
-        sum(e.get("setup_time_minutes", 0) for e in successful) / len(successful)
-        if successful else 0.0
+        events.sum("setup_time_minutes", rows=successful) / successful_count
+        if successful_count else 0.0
     )
 
     return {
-        "total_setups": len(end_events),
-        "successful_setups": len(successful),
+        "total_setups": events.count(end_events),
+        "successful_setups": successful_count,
         "avg_setup_time_minutes": avg_time,
         "target": 5.0,
         "meets_target": avg_time <= 5.0
@@ -82,19 +74,20 @@ def calculate_migration_metrics(events_dir: Path) -> dict:
             "total_secrets_removed": 0
         }
 
-    end_events = [e for e in events if e.get("action") == "end"]
-    successful = [e for e in end_events if e.get("success")]
+    end_events = events.where_eq("action", "end")
+    successful = events.where("success", bool, rows=end_events)
+    successful_count = events.count(successful)
 
     avg_time = (
-        sum(e.get("migration_time_minutes", 0) for e in successful) / len(successful)
-        if successful else 0.0
+        events.sum("migration_time_minutes", rows=successful) / successful_count
+        if successful_count else 0.0
     )
 
-    total_secrets = sum(e.get("secrets_removed", 0) for e in successful)
+    total_secrets = events.sum("secrets_removed", rows=successful)
 
     return {
-        "total_migrations": len(end_events),
-        "successful_migrations": len(successful),
+        "total_migrations": events.count(end_events),
+        "successful_migrations": successful_count,
         "avg_migration_time_minutes": avg_time,
         "target": 15.0,
         "meets_target": avg_time <= 15.0,
@@ -106,19 +99,19 @@ def calculate_security_metrics(events_dir: Path) -> dict:
     """Calculate security incident metrics"""
     events = load_events(events_dir, "sap028-security.jsonl")
 
-    incidents = [e for e in events if e.get("event_type") == "sap028_security_incident"]
-    audits = [e for e in events if e.get("event_type") == "sap028_secret_audit"]
+    incidents = events.where_eq("event_type", "sap028_security_incident")
+    audits = events.where_eq("event_type", "sap028_secret_audit")
 
-    unresolved = [i for i in incidents if not i.get("resolved")]
-    compliant = [a for a in audits if a.get("compliant")]
+    unresolved = events.count(events.where("resolved", lambda resolved: not resolved, rows=incidents))
+    compliant = events.count(events.where("compliant", bool, rows=audits))
 
     return {
-        "total_incidents": len(incidents),
-        "unresolved_incidents": len(unresolved),
-        "total_audits": len(audits),
-        "compliant_projects": len(compliant),
+        "total_incidents": events.count(incidents),
+        "unresolved_incidents": unresolved,
+        "total_audits": events.count(audits),
+        "compliant_projects": compliant,
         "target_incidents": 0,
-        "meets_target": len(unresolved) == 0
+        "meets_target": unresolved == 0
     }
 
 
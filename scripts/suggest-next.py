@@ -13,14 +13,21 @@
     python scripts/suggest-next.py
     python scripts/suggest-next.py --context task-005
     python scripts/suggest-next.py --mode proactive  # Check without being asked
+    python scripts/suggest-next.py --watch           # Keep the context snapshot fresh
+    python scripts/suggest-next.py --mode proactive --cached  # Never block on slow checks
+
+Project signals (events, inbox, coverage, quality gates) are cached in
+.chora/cache/suggest-context.json and re-collected concurrently only when
+their TTL expires or the files they depend on change.
 """
 
 import argparse
 import json
 import subprocess
 import sys
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -35,8 +42,25 @@
 repo_root = Path(__file__).parent.parent
 sys.path.insert(0, str(repo_root / "scripts"))
 
+from context_snapshot import DEFAULT_JOBS, ContextSignal, ContextSnapshot, SignalUnavailable
 from usage_tracker import track_usage
 
+# Longest event window the suggestion engine asks for (1 week)
+EVENT_WINDOW_HOURS = 168
+
+# Files whose changes invalidate cached test, lint and type check results
+QUALITY_INPUTS = ("src", "tests", "pyproject.toml", "pytest.ini", "setup.cfg", "ruff.toml", "mypy.ini")
+
+# Seconds before a cached signal is re-collected even if its inputs are unchanged
+INBOX_TTL = 60        # Directory listings (empty directories aren't fingerprinted)
+FILE_TTL = 3600       # Signals parsed from a single file
+QUALITY_TTL = 600     # Coverage and quality gate commands
+
+QUALITY_GATES = ("tests_passing", "lint_clean", "type_check_clean")
+
+# Seconds between context refreshes in --watch mode
+DEFAULT_WATCH_INTERVAL = 5.0
+
 
 @dataclass
 class Suggestion:
@@ -51,6 +75,27 @@ class Suggestion:
     context_signals: list[str] = field(default_factory=list)
 
 
+def filter_recent_events(events: list[dict], hours: int) -> list[dict]:
+    """Events whose timestamp falls within the last N hours."""
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+    recent = []
+
+    for event in events:
+        try:
+            timestamp_str = event.get("timestamp", "")
+            # Parse ISO format with timezone
+            event_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        except ValueError:
+            continue
+        # Ensure event_time is timezone-aware
+        if event_time.tzinfo is None:
+            event_time = event_time.replace(tzinfo=timezone.utc)
+        if event_time > cutoff:
+            recent.append(event)
+
+    return recent
+
+
 class ProjectContext:
     """Analyzes current project state for suggestions."""
 
@@ -66,27 +111,15 @@ def get_recent_events(self, hours: int = 24) -> list[dict]:
         if not self.event_log.exists():
             return []
 
-        from datetime import timezone
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-        recent = []
-
+        events = []
         with open(self.event_log, encoding='utf-8') as f:
             for line in f:
                 try:
-                    event = json.loads(line)
-                    timestamp_str = event.get("timestamp", "")
-                    # Parse ISO format with timezone
-                    event_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    # Ensure event_time is timezone-aware
-                    if event_time.tzinfo is None:
-                        from datetime import timezone
-                        event_time = event_time.replace(tzinfo=timezone.utc)
-                    if event_time > cutoff:
-                        recent.append(event)
-                except (json.JSONDecodeError, ValueError):
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
                     continue
 
-        return recent
+        return filter_recent_events(events, hours)
 
     def get_active_work(self) -> list[str]:
         """Get list of active work items."""
@@ -169,21 +202,33 @@ def get_blockers(self) -> list[str]:
         chora_base = ecosystem.get("repositories", {}).get("chora-base", {})
         return chora_base.get("blockers", [])
 
-    def check_test_coverage(self) -> Optional[float]:
-        """Check current test coverage percentage."""
-        # Check if pytest is already running to avoid spawning duplicates
+    def _pytest_running(self, pattern: str) -> bool:
+        """Whether a pytest process matching pattern is already running."""
         try:
             ps_check = subprocess.run(
-                ["pgrep", "-f", "pytest.*--cov"],
+                ["pgrep", "-f", pattern],
                 capture_output=True,
                 timeout=5,
             )
-            if ps_check.returncode == 0:
-                # pytest already running, skip to avoid duplicates
-                return None
+            return ps_check.returncode == 0
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+            return False
 
+    def _gate_passes(self, command: list[str]) -> bool:
+        """Run a quality gate command; it passes if it exits cleanly."""
+        try:
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                timeout=30,
+                cwd=self.project_root,
+            )
+            return result.returncode == 0
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return False
+
+    def measure_test_coverage(self) -> Optional[float]:
+        """Run pytest with coverage and parse the TOTAL percentage."""
         try:
             result = subprocess.run(
                 ["pytest", "--cov=src", "--cov-report=term", "--quiet"],
@@ -205,6 +250,25 @@ def check_test_coverage(self) -> Optional[float]:
 
         return None
 
+    def check_test_coverage(self) -> Optional[float]:
+        """Check current test coverage percentage."""
+        # Check if pytest is already running to avoid spawning duplicates
+        if self._pytest_running("pytest.*--cov"):
+            return None
+        return self.measure_test_coverage()
+
+    def check_tests_passing(self) -> bool:
+        """Quality gate: test suite passes."""
+        return self._gate_passes(["pytest", "--quiet"])
+
+    def check_lint_clean(self) -> bool:
+        """Quality gate: ruff reports no errors."""
+        return self._gate_passes(["ruff", "check", "."])
+
+    def check_type_check_clean(self) -> bool:
+        """Quality gate: mypy reports no errors."""
+        return self._gate_passes(["mypy", "src/"])
+
     def check_quality_gates(self) -> dict[str, bool]:
         """Check if quality gates would pass."""
         gates = {
@@ -214,54 +278,12 @@ def check_quality_gates(self) -> dict[str, bool]:
         }
 
         # Check if pytest is already running to avoid spawning duplicates
-        try:
-            ps_check = subprocess.run(
-                ["pgrep", "-f", "pytest"],
-                capture_output=True,
-                timeout=5,
-            )
-            if ps_check.returncode == 0:
-                # pytest already running, skip tests check
-                return gates
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-
-        # Check tests
-        try:
-            result = subprocess.run(
-                ["pytest", "--quiet"],
-                capture_output=True,
-                timeout=30,
-                cwd=self.project_root,
-            )
-            gates["tests_passing"] = result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-
-        # Check linting
-        try:
-            result = subprocess.run(
-                ["ruff", "check", "."],
-                capture_output=True,
-                timeout=30,
-                cwd=self.project_root,
-            )
-            gates["lint_clean"] = result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-
-        # Check type checking
-        try:
-            result = subprocess.run(
-                ["mypy", "src/"],
-                capture_output=True,
-                timeout=30,
-                cwd=self.project_root,
-            )
-            gates["type_check_clean"] = result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        if self._pytest_running("pytest"):
+            return gates
 
+        gates["tests_passing"] = self.check_tests_passing()
+        gates["lint_clean"] = self.check_lint_clean()
+        gates["type_check_clean"] = self.check_type_check_clean()
         return gates
 
     def detect_phase(self, context_item: Optional[str] = None) -> Optional[str]:
@@ -289,6 +311,131 @@ def detect_phase(self, context_item: Optional[str] = None) -> Optional[str]:
         return None
 
 
+class CachedProjectContext(ProjectContext):
+    """Project context served from a snapshot that is refreshed concurrently.
+
+    Each signal is cached until its TTL expires or its input files change,
+    so repeated suggestions only re-run the checks whose inputs moved.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        jobs: int = DEFAULT_JOBS,
+        allow_stale: bool = False,
+        cache_file: Optional[Path] = None,
+    ):
+        """
+        Initialize cached context.
+
+        Args:
+            project_root: Project root directory
+            jobs: Maximum signal collectors run concurrently
+            allow_stale: Use any cached value, only collecting missing signals
+            cache_file: Snapshot file (default: .chora/cache/suggest-context.json)
+        """
+        super().__init__(project_root)
+        self.allow_stale = allow_stale
+        self.snapshot = ContextSnapshot(project_root, self._signals(), cache_file=cache_file, jobs=jobs)
+        self.values: dict = {}
+
+    def _signals(self) -> list[ContextSignal]:
+        """Signals backing the cached getters."""
+        live = super()
+        return [
+            ContextSignal(
+                "events", lambda: live.get_recent_events(EVENT_WINDOW_HOURS), ttl=FILE_TTL,
+                inputs=("inbox/coordination/events.jsonl",), default=[],
+            ),
+            ContextSignal(
+                "active_work", live.get_active_work, ttl=INBOX_TTL,
+                inputs=("inbox/active",), default=[],
+            ),
+            ContextSignal(
+                "inbox_status", live.get_inbox_status, ttl=INBOX_TTL,
+                inputs=("inbox/incoming/coordination", "inbox/incoming/tasks", "inbox/active"),
+            ),
+            ContextSignal(
+                "ecosystem_work", self._collect_ecosystem_work, ttl=FILE_TTL,
+                inputs=("inbox/coordination/ECOSYSTEM_STATUS.yaml",),
+                default={"coordination_requests": [], "blockers": []},
+            ),
+            # Both run pytest, so they share a worker and never overlap
+            ContextSignal(
+                "test_coverage", self._collect_test_coverage, ttl=QUALITY_TTL,
+                inputs=QUALITY_INPUTS, group="pytest",
+            ),
+            ContextSignal(
+                "tests_passing", self._collect_tests_passing, ttl=QUALITY_TTL,
+                inputs=QUALITY_INPUTS, group="pytest", default=False,
+            ),
+            ContextSignal(
+                "lint_clean", self.check_lint_clean, ttl=QUALITY_TTL,
+                inputs=QUALITY_INPUTS + ("scripts",), default=False,
+            ),
+            ContextSignal(
+                "type_check_clean", self.check_type_check_clean, ttl=QUALITY_TTL,
+                inputs=QUALITY_INPUTS, default=False,
+            ),
+        ]
+
+    def _collect_ecosystem_work(self) -> dict:
+        """Coordination requests and blockers from ECOSYSTEM_STATUS.yaml."""
+        return {
+            "coordination_requests": ProjectContext.get_coordination_requests(self),
+            "blockers": ProjectContext.get_blockers(self),
+        }
+
+    def _collect_test_coverage(self) -> Optional[float]:
+        if self._pytest_running("pytest.*--cov"):
+            raise SignalUnavailable("pytest --cov already running")
+        return self.measure_test_coverage()
+
+    def _collect_tests_passing(self) -> bool:
+        if self._pytest_running("pytest"):
+            raise SignalUnavailable("pytest already running")
+        return self.check_tests_passing()
+
+    def refresh(self) -> None:
+        """Re-collect every stale signal concurrently."""
+        self.values = self.snapshot.collect(allow_stale=self.allow_stale)
+
+    def _value(self, name: str):
+        if name not in self.values:
+            self.values.update(self.snapshot.collect([name], allow_stale=self.allow_stale))
+        return self.values[name]
+
+    def get_recent_events(self, hours: int = 24) -> list[dict]:
+        """Get events from the last N hours (cached events, filtered now)."""
+        if hours > EVENT_WINDOW_HOURS:
+            return super().get_recent_events(hours)
+        return filter_recent_events(self._value("events"), hours)
+
+    def get_active_work(self) -> list[str]:
+        """Get list of active work items."""
+        return self._value("active_work")
+
+    def get_inbox_status(self) -> dict:
+        """Get inbox status summary."""
+        return self._value("inbox_status")
+
+    def get_coordination_requests(self) -> list[dict]:
+        """Get active coordination requests with details from ECOSYSTEM_STATUS.yaml."""
+        return self._value("ecosystem_work")["coordination_requests"]
+
+    def get_blockers(self) -> list[str]:
+        """Get list of blockers from ECOSYSTEM_STATUS.yaml."""
+        return self._value("ecosystem_work")["blockers"]
+
+    def check_test_coverage(self) -> Optional[float]:
+        """Check current test coverage percentage."""
+        return self._value("test_coverage")
+
+    def check_quality_gates(self) -> dict[str, bool]:
+        """Check if quality gates would pass."""
+        return {gate: self._value(gate) for gate in QUALITY_GATES}
+
+
 class SuggestionEngine:
     """Generate context-aware next action suggestions."""
 
@@ -624,6 +771,65 @@ def display_suggestions(suggestions: list[Suggestion]) -> None:
         print()
 
 
+def print_suggestions(suggestions: list[Suggestion], output_format: str) -> None:
+    """Print suggestions in the requested output format."""
+    if output_format == "json":
+        output = [
+            {
+                "action": s.action,
+                "rationale": s.rationale,
+                "priority": s.priority,
+                "category": s.category,
+                "command": s.command,
+                "estimated_time": s.estimated_time,
+            }
+            for s in suggestions
+        ]
+        print(json.dumps(output, indent=2))
+    elif output_format == "markdown":
+        print("# Suggested Next Actions\n")
+        for i, s in enumerate(suggestions, 1):
+            print(f"## {i}. {s.action}\n")
+            print(f"**Priority:** {s.priority.capitalize()}")
+            print(f"**Category:** {s.category.capitalize()}\n")
+            print(f"{s.rationale}\n")
+            if s.command:
+                print(f"**Command:**\n```bash\n{s.command}\n```\n")
+    else:
+        display_suggestions(suggestions)
+
+
+def watch_suggestions(
+    context: ProjectContext,
+    engine: SuggestionEngine,
+    mode: str,
+    output_format: str,
+    interval: float,
+) -> None:
+    """
+    Refresh context every interval seconds, printing suggestions when they change.
+
+    Only signals whose TTL expired or whose input files changed are
+    re-collected, so other processes can read fresh values with --cached.
+    """
+    previous = None
+    try:
+        while True:
+            if isinstance(context, CachedProjectContext):
+                context.refresh()
+            suggestions = engine.suggest(mode=mode)
+            current = [asdict(s) for s in suggestions]
+            if current != previous:
+                if output_format != "json":
+                    print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Suggestions updated")
+                print_suggestions(suggestions, output_format)
+                sys.stdout.flush()
+                previous = current
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
 @track_usage
 def main():
     """CLI entry point."""
@@ -652,41 +858,60 @@ def main():
         default="terminal",
         help="Output format",
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep refreshing the context snapshot and print suggestions when they change",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_WATCH_INTERVAL,
+        help=f"Seconds between refreshes in --watch mode (default: {DEFAULT_WATCH_INTERVAL:g})",
+    )
+    parser.add_argument(
+        "--cached",
+        action="store_true",
+        help="Use cached signals even if stale (never blocks on slow checks)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Collect every signal live, sequentially, without the snapshot cache",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Signals collected concurrently (default: {DEFAULT_JOBS})",
+    )
 
     args = parser.parse_args()
+    if args.interval <= 0:
+        parser.error("--interval must be positive")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     # Create context and engine
-    context = ProjectContext(args.project_root)
+    if args.no_cache:
+        context = ProjectContext(args.project_root)
+    else:
+        context = CachedProjectContext(
+            args.project_root,
+            jobs=args.jobs,
+            allow_stale=args.cached and not args.watch,
+        )
     engine = SuggestionEngine(context)
 
+    if args.watch:
+        watch_suggestions(context, engine, args.mode, args.format, args.interval)
+        return
+
     # Generate suggestions
+    if isinstance(context, CachedProjectContext):
+        context.refresh()
     suggestions = engine.suggest(mode=args.mode)
-
-    # Display based on format
-    if args.format == "json":
-        output = [
-            {
-                "action": s.action,
-                "rationale": s.rationale,
-                "priority": s.priority,
-                "category": s.category,
-                "command": s.command,
-                "estimated_time": s.estimated_time,
-            }
-            for s in suggestions
-        ]
-        print(json.dumps(output, indent=2))
-    elif args.format == "markdown":
-        print("# Suggested Next Actions\n")
-        for i, s in enumerate(suggestions, 1):
-            print(f"## {i}. {s.action}\n")
-            print(f"**Priority:** {s.priority.capitalize()}")
-            print(f"**Category:** {s.category.capitalize()}\n")
-            print(f"{s.rationale}\n")
-            if s.command:
-                print(f"**Command:**\n```bash\n{s.command}\n```\n")
-    else:
-        display_suggestions(suggestions)
+    print_suggestions(suggestions, args.format)
 
 
 if __name__ == "__main__":
@@ -47,6 +47,10 @@
     print("ERROR: PyYAML not installed. Run: pip install PyYAML", file=sys.stderr)
     sys.exit(2)
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from registry_snapshot import load_registry_snapshot
+
 
 # Legacy dependency pattern: chora.SAP-XXX or SAP-XXX
 LEGACY_PATTERN = re.compile(r"^(chora\.)?SAP-\d+$")
@@ -76,6 +80,7 @@ def __init__(
         }
         self.changes: List[Dict] = []
         self.unresolved: Set[str] = set()
+        self.snapshot = None  # RegistrySnapshot, loaded on first use
 
     def load_aliases(self) -> bool:
         """Load SAP-XXX -> modern namespace alias mapping"""
@@ -149,10 +154,23 @@ def update_manifest_dependencies(
         Returns:
             Tuple of (updated, num_changes)
         """
+        if self.snapshot is None:
+            self.snapshot = load_registry_snapshot(self.capabilities_dir)
+
+        entry = self.snapshot.entry(manifest_path)
+        if entry["error"]:
+            action = "parse" if entry["error"]["kind"] == "yaml" else "update"
+            print(
+                f"ERROR: Failed to {action} {manifest_path.name}: {entry['error']['message']}",
+                file=sys.stderr,
+            )
+            self.stats["errors"] += 1
+            return False, 0
+
         try:
-            # Read manifest
-            with open(manifest_path, "r", encoding="utf-8") as f:
-                manifest = yaml.safe_load(f)
+            # Manifests are read from the registry snapshot; updates are
+            # written back as YAML and re-parsed on the next refresh
+            manifest = entry["manifest"]
 
             if not manifest or "metadata" not in manifest:
                 print(
@@ -244,12 +262,6 @@ def update_manifest_dependencies(
             self.stats["skipped_manifests"] += 1
             return False, 0
 
-        except yaml.YAMLError as e:
-            print(
-                f"ERROR: Failed to parse {manifest_path.name}: {e}", file=sys.stderr
-            )
-            self.stats["errors"] += 1
-            return False, 0
         except Exception as e:
             print(
                 f"ERROR: Failed to update {manifest_path.name}: {e}", file=sys.stderr
@@ -267,9 +279,8 @@ def update_all(self) -> bool:
             return False
 
         # Get all YAML files
-        yaml_files = list(self.capabilities_dir.glob("*.yaml")) + list(
-            self.capabilities_dir.glob("*.yml")
-        )
+        self.snapshot = load_registry_snapshot(self.capabilities_dir)
+        yaml_files = self.snapshot.paths()
 
         # Filter out template files
         yaml_files = [f for f in yaml_files if "template" not in f.name.lower()]
@@ -11,6 +11,12 @@
 - Dry-run mode for preview
 - Detailed change reporting
 
+All aliased IDs are matched by one compiled pattern, so files without any
+candidate are skipped after a single search. Files are processed across a
+process pool and rewritten atomically (temp file + rename) only when their
+content changes. References already in the "namespace (SAP-XXX)" form are
+left alone, so re-running the updater is a no-op.
+
 Usage:
     # Dry-run (preview changes)
     python scripts/update-doc-links.py --docs docs/ --dry-run
@@ -20,18 +26,163 @@
 
     # Update specific file
     python scripts/update-doc-links.py --file docs/README.md
+
+    # Sequential run (default: 4 worker processes)
+    python scripts/update-doc-links.py --docs docs/ --jobs 1
 """
 
 import argparse
 import json
+import os
 import re
+import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # SAP-XXX pattern (matches SAP-000 through SAP-999)
 SAP_PATTERN = re.compile(r'\bSAP-(\d{3})\b')
 
+DEFAULT_JOBS = 4
+
+
+def should_skip_line(line: str) -> bool:
+    """
+    Determine if a line should be skipped (don't update SAP-XXX)
+
+    Skip:
+    - Code blocks (```)
+    - Example commands
+    - File paths
+    - Assessment report titles (preserve for historical records)
+    """
+    # Skip if in code fence
+    if line.strip().startswith("```"):
+        return True
+
+    # Skip if it's a file path reference
+    if "/SAP-" in line or "\\SAP-" in line:
+        return True
+
+    # Skip assessment report titles (historical records)
+    if line.strip().startswith("# SAP-") and "assessment" in line.lower():
+        return True
+
+    return False
+
+
+class ReferenceRewriter:
+    """Rewrites aliased SAP-XXX references using one compiled pattern"""
+
+    def __init__(self, aliases: Dict[str, str]):
+        """
+        Args:
+            aliases: SAP-XXX -> modern namespace
+        """
+        self.aliases = aliases
+        numbers = sorted(match.group(1) for match in map(SAP_PATTERN.fullmatch, aliases) if match)
+        # Alternation over the aliased IDs only, behind the literal "SAP-"
+        # prefix the regex engine scans for (None: nothing can match)
+        self.pattern: Optional[re.Pattern] = None
+        if numbers:
+            self.pattern = re.compile(r'\bSAP-(?:' + '|'.join(numbers) + r')\b')
+
+    def has_candidates(self, content: str) -> bool:
+        """Whether content mentions any aliased SAP-XXX ID at all"""
+        return self.pattern is not None and self.pattern.search(content) is not None
+
+    def rewrite(self, content: str) -> Tuple[str, List[Tuple[str, str]]]:
+        """
+        Replace references outside code fences and skipped lines.
+
+        Format: SAP-015 -> chora.awareness.task_tracking (SAP-015)
+
+        Returns:
+            Tuple of (new_content, [(original line stripped, sap_id), ...])
+        """
+        if not self.has_candidates(content):
+            return content, []
+
+        lines = content.split("\n")
+        replacements: List[Tuple[str, str]] = []
+        in_code_block = False
+
+        def replace(match: re.Match) -> str:
+            sap_id = match.group(0)
+            prefix = f"{self.aliases[sap_id]} ("
+            start = match.start() - len(prefix)
+            line = match.string
+            # Already migrated: "namespace (SAP-XXX)"
+            if start >= 0 and line.startswith(prefix, start) and line.startswith(")", match.end()):
+                return sap_id
+            replacements.append((line.strip(), sap_id))
+            return f"{prefix}{sap_id})"
+
+        for i, line in enumerate(lines):
+            # Track code blocks (fence lines themselves are never rewritten)
+            if "```" in line and line.strip().startswith("```"):
+                in_code_block = not in_code_block
+                continue
+
+            if in_code_block or "SAP-" not in line or should_skip_line(line):
+                continue
+
+            lines[i] = self.pattern.sub(replace, line)
+
+        if not replacements:
+            return content, []
+        return "\n".join(lines), replacements
+
+
+def write_text_atomic(path: Path, content: str) -> None:
+    """Write via a temp file + rename so readers never see a partial file."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def process_file(file_path: Path, rewriter: ReferenceRewriter, dry_run: bool) -> Dict[str, Any]:
+    """
+    Rewrite one file (writing it only if it changed and not dry_run).
+
+    Returns:
+        Dict with file, replacements, new_content and error ("read"/"write", message) if any
+    """
+    result: Dict[str, Any] = {"file": file_path, "replacements": [], "new_content": "", "error": None}
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        new_content, result["replacements"] = rewriter.rewrite(content)
+        result["new_content"] = new_content
+    except Exception as e:
+        result["error"] = ("read", str(e))
+        return result
+
+    if result["replacements"] and not dry_run:
+        try:
+            write_text_atomic(file_path, new_content)
+        except Exception as e:
+            result["error"] = ("write", str(e))
+    return result
+
+
+def _process_chunk(chunk: List[Path], aliases: Dict[str, str], dry_run: bool) -> List[Dict[str, Any]]:
+    """Worker entry point: process a contiguous chunk of files"""
+    rewriter = ReferenceRewriter(aliases)
+    results = []
+    for file_path in chunk:
+        result = process_file(file_path, rewriter, dry_run)
+        result["new_content"] = ""  # Not needed by the parent; don't ship it back
+        results.append(result)
+    return results
+
 
 class DocLinkUpdater:
     """Updates SAP-XXX references to modern namespaces in documentation"""
@@ -52,6 +203,14 @@ def __init__(
             "errors": 0,
         }
         self.changes: List[Dict] = []
+        self._rewriter: Optional[ReferenceRewriter] = None
+
+    @property
+    def rewriter(self) -> ReferenceRewriter:
+        """Rewriter compiled for the loaded aliases"""
+        if self._rewriter is None or self._rewriter.aliases != self.aliases:
+            self._rewriter = ReferenceRewriter(self.aliases)
+        return self._rewriter
 
     def load_aliases(self) -> bool:
         """Load SAP-XXX -> modern namespace alias mapping"""
@@ -87,116 +246,62 @@ def load_aliases(self) -> bool:
             return False
 
     def should_skip_line(self, line: str) -> bool:
-        """
-        Determine if a line should be skipped (don't update SAP-XXX)
-
-        Skip:
-        - Code blocks (```)
-        - Example commands
-        - File paths
-        - Assessment report titles (preserve for historical records)
-        """
-        # Skip if in code fence
-        if line.strip().startswith("```"):
-            return True
-
-        # Skip if it's a file path reference
-        if "/SAP-" in line or "\\SAP-" in line:
-            return True
-
-        # Skip assessment report titles (historical records)
-        if line.strip().startswith("# SAP-") and "assessment" in line.lower():
-            return True
-
-        return False
+        """Determine if a line should be skipped (see should_skip_line())"""
+        return should_skip_line(line)
 
     def update_file_content(self, file_path: Path) -> Tuple[bool, int, str]:
         """
-        Update SAP-XXX references in a file
+        Update SAP-XXX references in a file (without writing it)
 
         Returns:
             Tuple of (updated, num_replacements, new_content)
         """
-        try:
-            # Read file
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            lines = content.split("\n")
-            updated_lines = []
-            in_code_block = False
-            num_replacements = 0
-
-            for line in lines:
-                # Track code blocks
-                if line.strip().startswith("```"):
-                    in_code_block = not in_code_block
-
-                # Skip certain lines
-                if in_code_block or self.should_skip_line(line):
-                    updated_lines.append(line)
-                    continue
-
-                # Find and replace SAP-XXX references
-                original_line = line
-                for match in SAP_PATTERN.finditer(line):
-                    sap_id = match.group(0)  # e.g., "SAP-015"
-
-                    if sap_id in self.aliases:
-                        modern_namespace = self.aliases[sap_id]
-
-                        # Replace with modern namespace
-                        # Format: SAP-015 -> chora.awareness.task_tracking (SAP-015)
-                        replacement = f"{modern_namespace} ({sap_id})"
-                        line = line.replace(sap_id, replacement, 1)
-
-                        # Record change
-                        self.changes.append({
-                            "file": str(file_path),
-                            "line": original_line.strip(),
-                            "sap_id": sap_id,
-                            "namespace": modern_namespace,
-                        })
-
-                        num_replacements += 1
-
-                updated_lines.append(line)
-
-            # Check if anything changed
-            new_content = "\n".join(updated_lines)
-            updated = new_content != content
-
-            return updated, num_replacements, new_content
-
-        except Exception as e:
-            print(
-                f"ERROR: Failed to update {file_path.name}: {e}", file=sys.stderr
-            )
-            self.stats["errors"] += 1
+        result = process_file(file_path, self.rewriter, dry_run=True)
+        if result["error"]:
+            self._record_error(result)
             return False, 0, ""
 
+        self._record_changes(result)
+        return bool(result["replacements"]), len(result["replacements"]), result["new_content"]
+
     def update_file(self, file_path: Path) -> bool:
         """Update a single markdown file"""
+        return self._record(process_file(file_path, self.rewriter, self.dry_run))
+
+    def _record_error(self, result: Dict[str, Any]) -> None:
+        stage, message = result["error"]
+        action = "update" if stage == "read" else "write"
+        print(
+            f"ERROR: Failed to {action} {result['file'].name}: {message}", file=sys.stderr
+        )
+        self.stats["errors"] += 1
+
+    def _record_changes(self, result: Dict[str, Any]) -> None:
+        for line, sap_id in result["replacements"]:
+            self.changes.append({
+                "file": str(result["file"]),
+                "line": line,
+                "sap_id": sap_id,
+                "namespace": self.aliases[sap_id],
+            })
+
+    def _record(self, result: Dict[str, Any]) -> bool:
+        """Fold one process_file() result into stats and changes"""
         self.stats["total_files"] += 1
+        file_path = result["file"]
+        num_replacements = len(result["replacements"])
 
-        # Update content
-        updated, num_replacements, new_content = self.update_file_content(file_path)
+        if result["error"] and result["error"][0] == "read":
+            self._record_error(result)
 
-        if not updated:
+        if not num_replacements:
             self.stats["skipped_files"] += 1
             return False
 
-        # Write updated content (if not dry-run)
-        if not self.dry_run:
-            try:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(new_content)
-            except Exception as e:
-                print(
-                    f"ERROR: Failed to write {file_path.name}: {e}", file=sys.stderr
-                )
-                self.stats["errors"] += 1
-                return False
+        self._record_changes(result)
+        if result["error"]:
+            self._record_error(result)
+            return False
 
         mode = "[DRY-RUN]" if self.dry_run else "[UPDATED]"
         print(f"{mode} {file_path.relative_to(file_path.parent.parent)}: {num_replacements} replacement(s)")
@@ -205,7 +310,38 @@ def update_file(self, file_path: Path) -> bool:
         self.stats["total_replacements"] += num_replacements
         return True
 
-    def update_directory(self, docs_dir: Path) -> bool:
+    def update_files(self, md_files: List[Path], jobs: int = DEFAULT_JOBS) -> None:
+        """
+        Update files, optionally across a process pool.
+
+        Files are split into contiguous chunks and results are recorded in
+        submission order, so output matches a sequential run.
+
+        Args:
+            md_files: Files to update
+            jobs: Worker processes (1 = sequential, 0 = one per CPU core)
+        """
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+
+        if jobs == 1 or len(md_files) < 2:
+            for md_file in md_files:
+                self.update_file(md_file)
+            return
+
+        # Several chunks per worker keeps the pool balanced without paying
+        # per-file IPC overhead
+        chunk_size = max(1, len(md_files) // (jobs * 4))
+        chunks = [md_files[i:i + chunk_size] for i in range(0, len(md_files), chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for results in executor.map(
+                _process_chunk, chunks, [self.aliases] * len(chunks), [self.dry_run] * len(chunks)
+            ):
+                for result in results:
+                    self._record(result)
+
+    def update_directory(self, docs_dir: Path, jobs: int = DEFAULT_JOBS) -> bool:
         """Update all markdown files in directory"""
         if not docs_dir.exists():
             print(
@@ -235,8 +371,7 @@ def update_directory(self, docs_dir: Path) -> bool:
         print("=" * 80 + "\n")
 
         # Update each file
-        for md_file in sorted(md_files):
-            self.update_file(md_file)
+        self.update_files(sorted(md_files), jobs=jobs)
 
         return self.stats["errors"] == 0
 
@@ -302,6 +437,12 @@ def main():
         action="store_true",
         help="Dry-run mode (preview changes without modifying files)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Worker processes for --docs (1 = sequential, 0 = one per CPU core; default: {DEFAULT_JOBS})",
+    )
 
     args = parser.parse_args()
 
@@ -317,7 +458,7 @@ def main():
 
     # Update documentation
     if args.docs:
-        success = updater.update_directory(args.docs)
+        success = updater.update_directory(args.docs, jobs=args.jobs)
     else:
         success = updater.update_file(args.file)
 
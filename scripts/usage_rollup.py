@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""Incrementally maintained rollups of the script usage log.
+
+get_usage_stats() used to read and filter the whole usage log on every
+call. This module keeps per-day, per-script tables instead:
+
+- invocations, successes and failures
+- total duration and a duration histogram (DURATION_BUCKETS)
+- the byte span of the log that holds each day's events
+
+The rollup remembers how far into the log it has read and only parses
+lines appended since (a truncated or replaced log is re-read from the
+start). It is persisted as JSON next to the other caches, so its size
+grows with days x scripts, not with the number of events.
+
+A query for the last N days adds up whole days from the tables. Only the
+day the cutoff falls in is re-read from the log (using its recorded span),
+so window boundaries stay exact to the second.
+
+Usage:
+    from usage_rollup import UsageRollup
+
+    rollup = UsageRollup.load(log_path, rollup_file)
+    rollup.update()      # Parse events appended since the last update
+    rollup.save()
+    stats = rollup.stats(days=30)
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+ROLLUP_VERSION = 1
+
+# Upper bounds (seconds) of the duration histogram buckets; the last bucket is open-ended
+DURATION_BUCKETS = (0.1, 1.0, 10.0, 60.0, 600.0)
+
+DURATION_LABELS = [f"<{bound:g}s" for bound in DURATION_BUCKETS] + [f">={DURATION_BUCKETS[-1]:g}s"]
+
+# Bytes hashed at the start of the log to notice it being replaced
+HEAD_BYTES = 4096
+
+
+def _new_bucket() -> Dict[str, Any]:
+    return {
+        "invocations": 0,
+        "successes": 0,
+        "failures": 0,
+        "duration_centis": 0,   # Sum of durations in hundredths of a second (exact)
+        "durations": 0,         # Events that recorded a duration
+        "histogram": [0] * len(DURATION_LABELS),
+    }
+
+
+def _add_event(bucket: Dict[str, Any], event: Dict[str, Any]) -> None:
+    bucket["invocations"] += 1
+    if event.get("outcome") == "success":
+        bucket["successes"] += 1
+    elif event.get("outcome") == "failure":
+        bucket["failures"] += 1
+    if "duration_seconds" in event:
+        duration = event["duration_seconds"]
+        bucket["duration_centis"] += round(duration * 100)
+        bucket["durations"] += 1
+        slot = len(DURATION_BUCKETS)
+        for i, bound in enumerate(DURATION_BUCKETS):
+            if duration < bound:
+                slot = i
+                break
+        bucket["histogram"][slot] += 1
+
+
+def _merge(into: Dict[str, Any], bucket: Dict[str, Any]) -> None:
+    for key in ("invocations", "successes", "failures", "duration_centis", "durations"):
+        into[key] += bucket[key]
+    into["histogram"] = [a + b for a, b in zip(into["histogram"], bucket["histogram"])]
+
+
+def _local_day(timestamp: str) -> str:
+    """Local calendar day of an isoformat() timestamp (naive ones are already local)"""
+    if len(timestamp) > 19 and timestamp[19:].lstrip(".0123456789"):
+        return datetime.fromisoformat(timestamp).astimezone().date().isoformat()
+    return timestamp[:10]
+
+
+def _parse(line: bytes) -> Optional[Tuple[Dict[str, Any], str, str]]:
+    """(event, local day, script) for a usage log line, None for blank or malformed lines"""
+    if not line.strip():
+        return None
+    try:
+        event = json.loads(line)
+        day = _local_day(event["timestamp"])
+        script = event["metadata"]["script"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    return event, day, script
+
+
+class UsageRollup:
+    """Per-day, per-script usage tables kept in step with a JSONL usage log"""
+
+    def __init__(self, log_path: Path, rollup_file: Optional[Path] = None):
+        """
+        Initialize an empty rollup (use load() to resume a saved one).
+
+        Args:
+            log_path: Usage log (.chora/memory/events/script-usage.jsonl)
+            rollup_file: Where save() persists the tables (None: not persisted)
+        """
+        self.log_path = log_path
+        self.rollup_file = rollup_file
+        self.offset = 0          # Bytes of the log already rolled up
+        self.head = ""           # Hash of the log's first min(offset, HEAD_BYTES) bytes
+        self.days: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, log_path: Path, rollup_file: Optional[Path]) -> "UsageRollup":
+        """Resume the rollup saved for log_path, or start an empty one."""
+        rollup = cls(log_path, rollup_file)
+        if rollup_file is None:
+            return rollup
+        try:
+            with open(rollup_file, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return rollup
+        if (isinstance(state, dict) and state.get("version") == ROLLUP_VERSION
+                and state.get("log") == str(log_path)):
+            rollup.offset = state["offset"]
+            rollup.head = state["head"]
+            rollup.days = state["days"]
+        return rollup
+
+    def save(self) -> None:
+        """Write the tables atomically (best effort; read-only checkouts still work)"""
+        if self.rollup_file is None or not self._dirty:
+            return
+        state = {
+            "version": ROLLUP_VERSION,
+            "log": str(self.log_path),
+            "offset": self.offset,
+            "head": self.head,
+            "days": self.days,
+        }
+        tmp_file = self.rollup_file.with_name(self.rollup_file.name + ".tmp")
+        try:
+            self.rollup_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(state, f, separators=(",", ":"))
+            os.replace(tmp_file, self.rollup_file)
+            self._dirty = False
+        except OSError:
+            pass
+
+    def _head_hash(self, f) -> str:
+        f.seek(0)
+        return hashlib.sha1(f.read(min(self.offset, HEAD_BYTES))).hexdigest()
+
+    def update(self) -> int:
+        """
+        Roll up events appended to the log since the last update.
+
+        A trailing line without a newline (still being written) is left for
+        the next update.
+
+        Returns:
+            Number of log lines processed
+        """
+        try:
+            f = open(self.log_path, "rb")
+        except FileNotFoundError:
+            if self.offset or self.days:
+                self._reset()
+            return 0
+
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            if self.offset and (size < self.offset or self._head_hash(f) != self.head):
+                self._reset()
+
+            f.seek(self.offset)
+            position = self.offset
+            processed = 0
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                start, position = position, position + len(line)
+                processed += 1
+                parsed = _parse(line)
+                if parsed is None:
+                    continue
+                event, day, script = parsed
+                table = self.days.get(day)
+                if table is None:
+                    table = self.days[day] = {"span": [start, position], "scripts": {}}
+                else:
+                    table["span"][0] = min(table["span"][0], start)
+                    table["span"][1] = max(table["span"][1], position)
+                bucket = table["scripts"].get(script)
+                if bucket is None:
+                    bucket = table["scripts"][script] = _new_bucket()
+                _add_event(bucket, event)
+
+            if processed:
+                hashed_all_of_head = self.offset >= HEAD_BYTES
+                self.offset = position
+                if not hashed_all_of_head:
+                    self.head = self._head_hash(f)
+                self._dirty = True
+        return processed
+
+    def _reset(self) -> None:
+        self.offset = 0
+        self.head = ""
+        self.days = {}
+        self._dirty = True
+
+    def _read_span(self, start: int, end: int) -> Iterator[Tuple[Dict[str, Any], str, str]]:
+        with open(self.log_path, "rb") as f:
+            f.seek(start)
+            position = start
+            for line in f:
+                position += len(line)
+                if position > end:
+                    break
+                parsed = _parse(line)
+                if parsed is not None:
+                    yield parsed
+
+    def window(self, days: int, script_name: Optional[str] = None,
+               now: Optional[datetime] = None) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Buckets for events at most `days` days old (to the second).
+
+        Args:
+            days: Window length
+            script_name: Only this script (None for all scripts)
+            now: End of the window (default: current time)
+
+        Returns:
+            (per-script buckets, per-day buckets)
+        """
+        cutoff = (now or datetime.now()).timestamp() - days * 86400
+        cutoff_day = datetime.fromtimestamp(cutoff).date().isoformat()
+
+        scripts: Dict[str, Dict[str, Any]] = {}
+        daily: Dict[str, Dict[str, Any]] = {}
+
+        def bucket_for(table: Dict[str, Dict[str, Any]], key: str) -> Dict[str, Any]:
+            if key not in table:
+                table[key] = _new_bucket()
+            return table[key]
+
+        for day, table in self.days.items():
+            if day > cutoff_day:
+                for script, bucket in table["scripts"].items():
+                    if script_name is None or script == script_name:
+                        _merge(bucket_for(scripts, script), bucket)
+                        _merge(bucket_for(daily, day), bucket)
+
+        # The cutoff falls inside its day: that day is checked event by event
+        if cutoff_day in self.days:
+            for event, day, script in self._read_span(*self.days[cutoff_day]["span"]):
+                if day != cutoff_day or (script_name is not None and script != script_name):
+                    continue
+                try:
+                    timestamp = datetime.fromisoformat(event["timestamp"]).timestamp()
+                except (ValueError, TypeError):
+                    continue
+                if timestamp >= cutoff:
+                    _add_event(bucket_for(scripts, script), event)
+                    _add_event(bucket_for(daily, day), event)
+
+        return scripts, dict(sorted(daily.items()))
+
+    def stats(self, days: int = 30, script_name: Optional[str] = None,
+              now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Usage statistics in the get_usage_stats() format."""
+        scripts, daily = self.window(days, script_name, now)
+
+        totals = _new_bucket()
+        for bucket in scripts.values():
+            _merge(totals, bucket)
+        total = totals["invocations"]
+        success = totals["successes"]
+
+        return {
+            "total_invocations": total,
+            "success_count": success,
+            "failure_count": totals["failures"],
+            "success_rate": round(success / total, 3) if total > 0 else 0.0,
+            "scripts": {script: _script_stats(bucket) for script, bucket in scripts.items()},
+            "daily": {
+                day: {
+                    "invocations": bucket["invocations"],
+                    "successes": bucket["successes"],
+                    "failures": bucket["invocations"] - bucket["successes"],
+                }
+                for day, bucket in daily.items()
+            },
+        }
+
+
+def _script_stats(bucket: Dict[str, Any]) -> Dict[str, Any]:
+    avg_duration = 0.0
+    if bucket["durations"]:
+        # Mean rounded half-up to whole hundredths, from the exact sum
+        count = bucket["durations"]
+        avg_duration = (2 * bucket["duration_centis"] + count) // (2 * count) / 100
+    return {
+        "invocations": bucket["invocations"],
+        "successes": bucket["successes"],
+        "failures": bucket["invocations"] - bucket["successes"],
+        "avg_duration": avg_duration,
+        "duration_histogram": dict(zip(DURATION_LABELS, bucket["histogram"])),
+    }
@@ -14,15 +14,29 @@ def main():
 
     if __name__ == "__main__":
         main()
+
+Events go through the shared buffered sink (event_sink.py): the wrapped
+call only queues its event, and a background thread appends it to the log
+(flushed at exit, and immediately when the call fails).
 """
 
-import json
+import os
 import sys
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Any, Callable
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from event_sink import emit, flush
+from usage_rollup import UsageRollup
+
+USAGE_LOG_PATH = Path(__file__).parent.parent / ".chora" / "memory" / "events" / "script-usage.jsonl"
+
+# Per-day, per-script tables behind get_usage_stats() (see usage_rollup.py)
+USAGE_ROLLUP_PATH = Path(__file__).parent.parent / ".chora" / "cache" / "usage-rollup.json"
+
 
 def get_usage_log_path() -> Path:
     """Get path to usage tracking log file.
@@ -30,10 +44,18 @@ def get_usage_log_path() -> Path:
     Returns:
         Path to .chora/memory/events/script-usage.jsonl
     """
-    repo_root = Path(__file__).parent.parent
-    log_dir = repo_root / ".chora" / "memory" / "events"
-    log_dir.mkdir(parents=True, exist_ok=True)
-    return log_dir / "script-usage.jsonl"
+    USAGE_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    return USAGE_LOG_PATH
+
+
+@lru_cache(maxsize=None)
+def _script_name(argv0: str) -> str:
+    return Path(argv0).name
+
+
+def _event_id_time(timestamp: str) -> str:
+    """'%Y%m%d-%H%M%S' from an isoformat() timestamp (cheaper than strftime)."""
+    return f"{timestamp[0:4]}{timestamp[5:7]}{timestamp[8:10]}-{timestamp[11:13]}{timestamp[14:16]}{timestamp[17:19]}"
 
 
 def track_usage(func: Callable) -> Callable:
@@ -58,19 +80,20 @@ def main():
     """
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        script_name = Path(sys.argv[0]).name
+        script_name = _script_name(sys.argv[0])
         start_time = datetime.now()
+        timestamp = start_time.isoformat()
 
         # Build event record
         event = {
-            "event_id": f"script-{script_name}-{start_time.strftime('%Y%m%d-%H%M%S')}",
-            "timestamp": start_time.isoformat(),
+            "event_id": f"script-{script_name}-{_event_id_time(timestamp)}",
+            "timestamp": timestamp,
             "actor": "automation-script",
             "action": f"script_invocation_{script_name}",
             "metadata": {
                 "script": script_name,
                 "arguments": sys.argv[1:],
-                "cwd": str(Path.cwd())
+                "cwd": os.getcwd()
             }
         }
 
@@ -84,10 +107,8 @@ def wrapper(*args: Any, **kwargs: Any) -> Any:
             event["outcome"] = "success"
             event["duration_seconds"] = round(duration, 2)
 
-            # Log the event
-            log_path = get_usage_log_path()
-            with log_path.open("a") as f:
-                f.write(json.dumps(event) + "\n")
+            # Log the event (written by the sink's background thread)
+            emit(USAGE_LOG_PATH, event)
 
             return result
 
@@ -100,10 +121,9 @@ def wrapper(*args: Any, **kwargs: Any) -> Any:
             event["metadata"]["error"] = str(e)
             event["metadata"]["error_type"] = type(e).__name__
 
-            # Log the event
-            log_path = get_usage_log_path()
-            with log_path.open("a") as f:
-                f.write(json.dumps(event) + "\n")
+            # Log the event, written now in case the process dies with it
+            emit(USAGE_LOG_PATH, event)
+            flush()
 
             # Re-raise the exception
             raise
@@ -114,78 +134,27 @@ def wrapper(*args: Any, **kwargs: Any) -> Any:
 def get_usage_stats(script_name: str | None = None, days: int = 30) -> dict:
     """Get usage statistics for scripts.
 
+    Served from the usage rollup, which parses only events logged since the
+    previous call.
+
     Args:
         script_name: Specific script to analyze (None for all scripts)
         days: Number of days to look back (default: 30)
 
     Returns:
-        Dictionary with usage statistics
+        Dictionary with usage statistics (including per-day counts and
+        per-script duration histograms)
     """
-    log_path = get_usage_log_path()
-
-    if not log_path.exists():
-        return {
-            "total_invocations": 0,
-            "success_count": 0,
-            "failure_count": 0,
-            "scripts": {}
-        }
-
-    # Read all events
-    events = []
-    with log_path.open("r") as f:
-        for line in f:
-            if line.strip():
-                events.append(json.loads(line))
-
-    # Filter by script name if specified
-    if script_name:
-        events = [e for e in events if e["metadata"]["script"] == script_name]
-
-    # Filter by date range
-    cutoff_date = datetime.now().timestamp() - (days * 86400)
-    events = [
-        e for e in events
-        if datetime.fromisoformat(e["timestamp"]).timestamp() >= cutoff_date
-    ]
-
-    # Calculate statistics
-    total = len(events)
-    success = len([e for e in events if e["outcome"] == "success"])
-    failure = len([e for e in events if e["outcome"] == "failure"])
-
-    # Per-script breakdown
-    scripts = {}
-    for event in events:
-        script = event["metadata"]["script"]
-        if script not in scripts:
-            scripts[script] = {
-                "invocations": 0,
-                "successes": 0,
-                "failures": 0,
-                "avg_duration": 0.0
-            }
-
-        scripts[script]["invocations"] += 1
-        if event["outcome"] == "success":
-            scripts[script]["successes"] += 1
-        else:
-            scripts[script]["failures"] += 1
+    flush()  # Include events still buffered in this process
+    rollup = UsageRollup.load(get_usage_log_path(), USAGE_ROLLUP_PATH)
+    rollup.update()
+    rollup.save()
+    return rollup.stats(days=days, script_name=script_name)
 
-    # Calculate average durations
-    for script in scripts:
-        script_events = [e for e in events if e["metadata"]["script"] == script]
-        durations = [e["duration_seconds"] for e in script_events if "duration_seconds" in e]
-        if durations:
-            scripts[script]["avg_duration"] = round(sum(durations) / len(durations), 2)
 
-    return {
-        "total_invocations": total,
-        "success_count": success,
-        "failure_count": failure,
-        "success_rate": round(success / total, 3) if total > 0 else 0.0,
-        "scripts": scripts
-    }
+def _format_histogram(histogram: dict) -> str:
+    counts = [f"{label} {count}" for label, count in histogram.items() if count]
+    return ", ".join(counts) if counts else "n/a"
 
 
 def generate_usage_report(days: int = 30) -> str:
@@ -234,6 +203,7 @@ def generate_usage_report(days: int = 30) -> str:
     Invocations: {script_stats['invocations']}
     Success Rate: {success_rate:.1%}
     Avg Duration: {script_stats['avg_duration']}s
+    Durations: {_format_histogram(script_stats['duration_histogram'])}
 """
 
     return report
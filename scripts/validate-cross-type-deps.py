@@ -40,11 +40,9 @@
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
-try:
-    import yaml
-except ImportError:
-    print("ERROR: PyYAML not installed. Run: pip install PyYAML", file=sys.stderr)
-    sys.exit(2)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from registry_snapshot import load_registry_snapshot, normalize_requires
 
 
 # Valid relationship types
@@ -70,6 +68,7 @@ class DependencyValidator:
     def __init__(self, capabilities_dir: Path = Path("capabilities")):
         self.capabilities_dir = capabilities_dir
         self.capabilities: Dict[str, Dict] = {}  # namespace -> manifest
+        self.snapshot = None  # RegistrySnapshot, set by load_capabilities()
         self.dependency_graph: Dict[str, List[Dict]] = defaultdict(list)
         self.reverse_graph: Dict[str, List[str]] = defaultdict(list)
         self.errors: List[str] = []
@@ -97,9 +96,8 @@ def load_capabilities(self) -> bool:
             )
             return False
 
-        yaml_files = list(self.capabilities_dir.glob("*.yaml")) + list(
-            self.capabilities_dir.glob("*.yml")
-        )
+        self.snapshot = load_registry_snapshot(self.capabilities_dir)
+        yaml_files = self.snapshot.paths()
 
         if not yaml_files:
             print(
@@ -109,9 +107,17 @@ def load_capabilities(self) -> bool:
             return False
 
         for yaml_file in yaml_files:
+            entry = self.snapshot.entry(yaml_file)
+            if entry["error"]:
+                action = "parse" if entry["error"]["kind"] == "yaml" else "load"
+                print(
+                    f"ERROR: Failed to {action} {yaml_file.name}: {entry['error']['message']}",
+                    file=sys.stderr,
+                )
+                continue
+
             try:
-                with open(yaml_file, "r", encoding="utf-8") as f:
-                    manifest = yaml.safe_load(f)
+                manifest = entry["manifest"]
 
                 if not manifest or "metadata" not in manifest:
                     print(
@@ -140,11 +146,6 @@ def load_capabilities(self) -> bool:
                 elif cap_type == "Pattern":
                     self.stats["pattern_type"] += 1
 
-            except yaml.YAMLError as e:
-                print(
-                    f"ERROR: Failed to parse {yaml_file.name}: {e}", file=sys.stderr
-                )
-                continue
             except Exception as e:
                 print(
                     f"ERROR: Failed to load {yaml_file.name}: {e}", file=sys.stderr
@@ -160,25 +161,21 @@ def load_capabilities(self) -> bool:
     def build_dependency_graph(self):
         """Build dependency graph from all capabilities"""
         for namespace, manifest in self.capabilities.items():
-            metadata = manifest["metadata"]
-            dc_relation = manifest.get("dc_relation", {})
-            requires = dc_relation.get("requires", [])
-
-            if not requires:
-                continue
+            # Edges come pre-normalized from the registry snapshot
+            if self.snapshot is not None:
+                requires = self.snapshot.dependency_graph.get(namespace, [])
+            else:
+                requires = normalize_requires(manifest)
 
             for dep in requires:
-                if isinstance(dep, str):
-                    # Simple string dependency (convert to dict)
-                    dep = {"capability": dep, "relationship": "prerequisite"}
-                elif not isinstance(dep, dict):
+                if "invalid" in dep:
                     self.warnings.append(
-                        f"[{namespace}] Invalid dependency format: {dep}"
+                        f"[{namespace}] Invalid dependency format: {dep['invalid']}"
                     )
                     continue
 
-                dep_namespace = dep.get("capability")
-                relationship = dep.get("relationship", "prerequisite")
+                dep_namespace = dep["capability"]
+                relationship = dep["relationship"]
 
                 if not dep_namespace:
                     self.warnings.append(
@@ -191,7 +188,7 @@ def build_dependency_graph(self):
                     {
                         "dependency": dep_namespace,
                         "relationship": relationship,
-                        "version": dep.get("version", "*"),
+                        "version": dep["version"],
                     }
                 )
 
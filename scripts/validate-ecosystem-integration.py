@@ -46,11 +46,16 @@
 import json
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
 # Paths (relative to repo root)
 REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from utils.sap_catalog import load_sap_catalog
+
 INDEX_PATH = REPO_ROOT / "docs" / "skilled-awareness" / "INDEX.md"
 CATALOG_PATH = REPO_ROOT / "sap-catalog.json"
 COPIER_PATH = REPO_ROOT / "copier.yml"
@@ -132,20 +137,35 @@ def validate_sap_id(sap_id: str) -> bool:
     return SAP_ID_PATTERN.match(sap_id) is not None
 
 
-def get_sap_directory(sap_id: str) -> Optional[Path]:
-    """Find SAP directory by searching for capability-charter.md."""
+@lru_cache(maxsize=None)
+def read_text_cached(path: Path) -> str:
+    """Read a file once per run (INDEX.md, copier.yml and charters are shared by every check)."""
+    return path.read_text()
+
+
+@lru_cache(maxsize=None)
+def list_charters() -> Tuple[Tuple[Path, str], ...]:
+    """(SAP directory, capability-charter.md content) for every SAP directory, in scan order."""
+    charters = []
     for sap_dir in SAP_DIR.iterdir():
         if not sap_dir.is_dir():
             continue
         charter = sap_dir / "capability-charter.md"
         if charter.exists():
-            content = charter.read_text()
-            # Support both "SAP ID" and "Capability ID" formats
-            if (f"**SAP ID**: {sap_id}" in content or
-                f"SAP ID: {sap_id}" in content or
-                f"**Capability ID**: {sap_id}" in content or
-                f"Capability ID: {sap_id}" in content):
-                return sap_dir
+            charters.append((sap_dir, read_text_cached(charter)))
+    return tuple(charters)
+
+
+@lru_cache(maxsize=None)
+def get_sap_directory(sap_id: str) -> Optional[Path]:
+    """Find SAP directory by searching for capability-charter.md."""
+    for sap_dir, content in list_charters():
+        # Support both "SAP ID" and "Capability ID" formats
+        if (f"**SAP ID**: {sap_id}" in content or
+            f"SAP ID: {sap_id}" in content or
+            f"**Capability ID**: {sap_id}" in content or
+            f"Capability ID: {sap_id}" in content):
+            return sap_dir
     return None
 
 
@@ -155,7 +175,7 @@ def extract_sap_metadata(sap_dir: Path) -> Dict:
     if not charter.exists():
         return {}
 
-    content = charter.read_text()
+    content = read_text_cached(charter)
     metadata = {}
 
     # Extract frontmatter if present
@@ -200,7 +220,7 @@ def check_index_md(sap_id: str) -> IntegrationCheck:
             None
         )
 
-    content = INDEX_PATH.read_text()
+    content = read_text_cached(INDEX_PATH)
 
     # Check for SAP entry (#### or ### followed by SAP-XXX)
     pattern = re.compile(rf'####+\s+{re.escape(sap_id)}:\s+', re.MULTILINE)
@@ -231,7 +251,7 @@ def check_catalog_json(sap_id: str) -> IntegrationCheck:
         )
 
     try:
-        catalog = json.loads(CATALOG_PATH.read_text())
+        catalog = load_sap_catalog(CATALOG_PATH)
     except json.JSONDecodeError as e:
         return IntegrationCheck(
             "sap-catalog.json",
@@ -240,18 +260,8 @@ def check_catalog_json(sap_id: str) -> IntegrationCheck:
             None
         )
 
-    # Search for SAP in catalog (handle various catalog structures)
-    sap_found = False
-    if isinstance(catalog, dict):
-        # Check if SAP exists as key or in "saps" array
-        if sap_id in catalog:
-            sap_found = True
-        elif "saps" in catalog:
-            saps = catalog["saps"]
-            if isinstance(saps, list):
-                sap_found = any(sap.get("id") == sap_id for sap in saps if isinstance(sap, dict))
-            elif isinstance(saps, dict):
-                sap_found = sap_id in saps
+    # Check if SAP exists as key or in "saps" (list or dict; indexed by the catalog)
+    sap_found = sap_id in catalog or catalog.get_sap(sap_id) is not None
 
     if sap_found:
         return IntegrationCheck(
@@ -290,7 +300,7 @@ def check_copier_yml(sap_id: str, metadata: Dict) -> IntegrationCheck:
             "Copier configuration missing - distribution not possible"
         )
 
-    content = COPIER_PATH.read_text()
+    content = read_text_cached(COPIER_PATH)
 
     # Convert SAP-053 → sap_053, SAP-053 → include_sap_053
     sap_var = sap_id.lower().replace('-', '_')  # sap_053
@@ -334,16 +344,9 @@ def check_progressive_adoption_path(sap_id: str, metadata: Dict) -> IntegrationC
             None
         )
 
-    content = INDEX_PATH.read_text()
-
-    # Find "Progressive Adoption Path" section
-    adoption_section_match = re.search(
-        r'##\s+Progressive Adoption Path(.*?)(?=^##\s|\Z)',
-        content,
-        re.DOTALL | re.MULTILINE
-    )
+    adoption_section = find_adoption_section(read_text_cached(INDEX_PATH))
 
-    if not adoption_section_match:
+    if adoption_section is None:
         return IntegrationCheck(
             "Progressive Adoption Path",
             False,
@@ -351,8 +354,6 @@ def check_progressive_adoption_path(sap_id: str, metadata: Dict) -> IntegrationC
             None
         )
 
-    adoption_section = adoption_section_match.group(1)
-
     # Check if SAP is mentioned in adoption paths
     if sap_id in adoption_section:
         return IntegrationCheck(
@@ -371,6 +372,17 @@ def check_progressive_adoption_path(sap_id: str, metadata: Dict) -> IntegrationC
         )
 
 
+@lru_cache(maxsize=None)
+def find_adoption_section(content: str) -> Optional[str]:
+    """Body of the "Progressive Adoption Path" section of INDEX.md, if present."""
+    adoption_section_match = re.search(
+        r'##\s+Progressive Adoption Path(.*?)(?=^##\s|\Z)',
+        content,
+        re.DOTALL | re.MULTILINE
+    )
+    return adoption_section_match.group(1) if adoption_section_match else None
+
+
 def check_dependencies(sap_id: str, metadata: Dict) -> IntegrationCheck:
     """Check that all dependencies reference valid SAPs."""
     dependencies = metadata.get('dependencies', [])
@@ -459,7 +471,7 @@ def validate_all_saps(verbose: bool = False) -> Dict[str, ValidationResult]:
         print(f"ERROR: INDEX.md not found at {INDEX_PATH}", file=sys.stderr)
         return results
 
-    content = INDEX_PATH.read_text()
+    content = read_text_cached(INDEX_PATH)
     sap_entries = SAP_ENTRY_PATTERN.findall(content)
 
     for sap_id, title in sap_entries:
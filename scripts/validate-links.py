@@ -10,17 +10,24 @@
     python scripts/validate-links.py [PATH]
     python scripts/validate-links.py docs/
     python scripts/validate-links.py --json  # JSON output
+    python scripts/validate-links.py docs/ --graph=scripts/link-graph.jsonl  # Use an exported graph
 
 Exit codes:
     0 - All links valid
     1 - Broken links found
+    2 - Link graph could not be read (--graph)
 """
 
 import json
+import os
 import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from link_graph_store import LinkGraphReader
+
 
 # Link extraction pattern
 MARKDOWN_LINK_PATTERN = r'\[([^\]]+)\]\(([^)]+)\)'
@@ -201,6 +208,63 @@ def validate_links(search_path='.'):
     }
 
 
+def validate_links_from_graph(graph_path, search_path='.'):
+    """Report broken links recorded in a streamed link graph instead of rescanning.
+
+    The graph must come from `export-link-graph.py --format jsonl --validate`,
+    run from the current directory (its paths are relative to it). Only the
+    files under search_path are read from it (by binary search).
+
+    Args:
+        graph_path: Path to the .jsonl link graph
+        search_path: File or directory to report on (absolute or relative)
+
+    Returns:
+        dict with the same keys as validate_links(); results only list
+        files with broken links
+
+    Raises:
+        ValueError: search_path lies outside the graph's root, or the graph
+            was exported without validation
+    """
+    relative = os.path.relpath(os.path.abspath(search_path))
+    if relative == '..' or relative.startswith('..' + os.sep):
+        raise ValueError(f"{search_path} is outside the link graph root ({os.getcwd()})")
+    search_path = relative.replace(os.sep, '/')
+
+    with LinkGraphReader(graph_path) as graph:
+        if not graph.metadata.get('validation_enabled'):
+            raise ValueError(f"{graph_path} was exported without --validate")
+
+        files_scanned = 0
+        links_checked = 0
+        for node in graph.nodes(search_path):
+            files_scanned += 1
+            links_checked += node['internal_links']
+
+        results = []
+        for broken in graph.broken_links(search_path):
+            if not results or results[-1]['file'] != broken['source']:
+                results.append({
+                    "file": broken['source'],
+                    "total_links": graph.node(broken['source'])['internal_links'],
+                    "broken_links": []
+                })
+            results[-1]['broken_links'].append({
+                "link_url": broken['target'],
+                "line_number": broken['line_number'],
+                "resolved_path": broken['normalized_target'],
+                "reason": broken['error']
+            })
+
+    return {
+        "files_scanned": files_scanned,
+        "links_checked": links_checked,
+        "broken_count": sum(len(result['broken_links']) for result in results),
+        "results": results
+    }
+
+
 def format_human_readable(data):
     """Format validation results as human-readable text.
 
@@ -252,12 +316,20 @@ def main():
     # Parse arguments
     args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
     output_json = '--json' in sys.argv
+    graph_path = next((arg.split('=', 1)[1] for arg in sys.argv[1:] if arg.startswith('--graph=')), None)
 
     # Get search path (default to current directory)
     search_path = args[0] if args else '.'
 
     # Validate links
-    results = validate_links(search_path)
+    if graph_path:
+        try:
+            results = validate_links_from_graph(graph_path, search_path)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(2)
+    else:
+        results = validate_links(search_path)
 
     # Output
     if output_json:
@@ -28,11 +28,9 @@
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
-try:
-    import yaml
-except ImportError:
-    print("ERROR: PyYAML not installed. Run: pip install PyYAML", file=sys.stderr)
-    sys.exit(2)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from registry_snapshot import load_registry_snapshot
 
 
 # Namespace format regex
@@ -71,6 +69,7 @@ def __init__(self, capabilities_dir: Path, domain_taxonomy_file: Path):
         self.errors: List[ValidationError] = []
         self.valid_domains: Set[str] = set()
         self.namespaces: Dict[str, Path] = {}  # namespace -> file_path
+        self.snapshot = None  # RegistrySnapshot, loaded on first use
 
     def load_valid_domains(self) -> bool:
         """Load valid domains from domain-taxonomy.md"""
@@ -219,24 +218,31 @@ def register_namespace(self, namespace: str, file_path: Path) -> bool:
 
     def validate_capability_file(self, file_path: Path) -> bool:
         """Validate a single capability YAML file"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
+        if self.snapshot is None:
+            self.snapshot = load_registry_snapshot(self.capabilities_dir)
+
+        entry = self.snapshot.entry(file_path)
+        if entry["error"] and entry["error"]["kind"] == "yaml":
             self.errors.append(
                 ValidationError(
-                    file_path, "YAML_PARSE_ERROR", f"Failed to parse YAML: {e}"
+                    file_path,
+                    "YAML_PARSE_ERROR",
+                    f"Failed to parse YAML: {entry['error']['message']}",
                 )
             )
             return False
-        except Exception as e:
+        if entry["error"]:
             self.errors.append(
                 ValidationError(
-                    file_path, "FILE_READ_ERROR", f"Failed to read file: {e}"
+                    file_path,
+                    "FILE_READ_ERROR",
+                    f"Failed to read file: {entry['error']['message']}",
                 )
             )
             return False
 
+        data = entry["manifest"]
+
         if not data:
             self.errors.append(
                 ValidationError(file_path, "YAML_EMPTY", "YAML file is empty")
@@ -294,9 +300,8 @@ def validate_all(self, file_paths: List[Path] = None) -> bool:
         if file_paths:
             files_to_validate = file_paths
         else:
-            files_to_validate = list(self.capabilities_dir.glob("*.yaml")) + list(
-                self.capabilities_dir.glob("*.yml")
-            )
+            self.snapshot = load_registry_snapshot(self.capabilities_dir)
+            files_to_validate = self.snapshot.paths()
 
         if not files_to_validate:
             print(
@@ -37,6 +37,9 @@
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.markdown_structure import read_markdown
+
 
 # Configure UTF-8 output for Windows console
 if sys.platform == "win32":
@@ -54,6 +57,10 @@
 AVG_TOKENS_PER_LINE = 5.6
 PHASE_1_TOKEN_TARGET = 10000  # tokens
 
+# Critical Workflows must appear within this many lines
+CRITICAL_WORKFLOWS_MAX_LINE = 300
+CRITICAL_WORKFLOWS_RE = re.compile(r'Critical Workflows', re.IGNORECASE)
+
 
 @dataclass
 class ValidationResult:
@@ -78,8 +85,7 @@ class FileValidation:
 def count_lines(file_path: Path) -> int:
     """Count lines in a file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return sum(1 for _ in f)
+        return read_markdown(file_path).line_count
     except Exception as e:
         return 0
 
@@ -91,8 +97,7 @@ def extract_frontmatter(file_path: Path) -> Optional[Dict]:
         Dict with frontmatter fields, or None if no frontmatter
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_markdown(file_path).text
 
         # Match YAML frontmatter (--- at start and end)
         # Allow for optional content before frontmatter (e.g., title line)
@@ -141,18 +146,16 @@ def check_critical_workflows_section(file_path: Path) -> Tuple[bool, int]:
         (found, line_number) tuple
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = [f.readline() for _ in range(300)]  # Check first 300 lines
-
-        for i, line in enumerate(lines, start=1):
-            if re.search(r'Critical Workflows', line, re.IGNORECASE):
-                return (True, i)
-
-        return (False, 0)
-
+        lines = read_markdown(file_path).lines[:CRITICAL_WORKFLOWS_MAX_LINE]
     except Exception as e:
         return (False, 0)
 
+    for i, line in enumerate(lines, start=1):
+        if CRITICAL_WORKFLOWS_RE.search(line):
+            return (True, i)
+
+    return (False, 0)
+
 
 def validate_file(file_path: Path) -> FileValidation:
     """Validate a single awareness file against SAP-009 v2.1.0 requirements.
@@ -25,6 +25,10 @@
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.sap_catalog import load_sap_catalog
+
 # Configure UTF-8 output for Windows console compatibility
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
@@ -341,8 +345,7 @@ def main():
     levels = get_current_adoption_levels(events)
 
     # Load SAP catalog
-    with open("sap-catalog.json", 'r', encoding='utf-8') as f:
-        catalog = json.load(f)
+    catalog = load_sap_catalog(Path("sap-catalog.json"))
 
     # Determine which SAPs to validate
     saps_to_validate = []
@@ -363,11 +366,7 @@ def main():
         claimed_level = levels[sap_id]
 
         # Find SAP in catalog
-        sap_entry = None
-        for sap in catalog["saps"]:
-            if sap["id"] == sap_id:
-                sap_entry = sap
-                break
+        sap_entry = catalog.get_sap(sap_id)
 
         if not sap_entry:
             print(f"⚠️  {sap_id} not found in sap-catalog.json", file=sys.stderr)
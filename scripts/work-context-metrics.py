@@ -20,9 +20,12 @@
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from collections import defaultdict
 import argparse
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from event_columns import EventTable, load_event_table
+
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -50,51 +53,56 @@ def parse_args():
 
 
 def load_events(events_dir: Path, since_date: datetime = None):
-    """Load all A-MEM events, optionally filtered by date."""
-    events = []
+    """
+    Load all A-MEM events as a columnar table, optionally filtered by date.
 
+    Returns:
+        (table, rows): the table of all events and the selection of events
+        at or after since_date (None = all events)
+    """
     # Find all JSONL files (YYYY-MM.jsonl)
     event_files = sorted(events_dir.glob("????-??.jsonl"))
 
+    chunks = []
     for event_file in event_files:
         try:
-            with open(event_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    try:
-                        event = json.loads(line)
-                        # Parse timestamp as naive datetime for comparison
-                        timestamp_str = event['timestamp'].replace('Z', '')
-                        event_time = datetime.fromisoformat(timestamp_str)
-
-                        # Filter by date if specified
-                        if since_date and event_time < since_date:
-                            continue
-
-                        events.append(event)
-                    except json.JSONDecodeError:
-                        # Skip malformed events
-                        continue
+            chunks.extend(load_event_table(event_file).chunks)
         except Exception as e:
             print(f"Warning: Could not read {event_file}: {e}", file=sys.stderr)
 
-    return events
+    events = EventTable(chunks)
+    rows = events.where_time(since=since_date) if since_date else None
+    return events, rows
 
 
-def calculate_metrics(events):
+def calculate_metrics(events: EventTable, rows=None):
     """Calculate work context coordination metrics."""
+    registered = events.where_eq("event_type", "work_context_registered", rows=rows)
+    auto_registered = events.where_eq("event_type", "work_context_auto_registered", rows=rows)
+    cleaned = events.where_eq("event_type", "work_contexts_cleaned", rows=rows)
+    registration_types = events.count_by("context.registration_type", rows=registered, missing="unknown")
+
+    # Track unique contexts
+    unique_contexts = {
+        ctx_id
+        for selection in (registered, auto_registered)
+        for ctx_id in events.values("context.context_id", rows=selection)
+        if ctx_id
+    }
+
     metrics = {
-        "total_events": len(events),
-        "contexts_registered_manual": 0,
-        "contexts_registered_auto": 0,
-        "contexts_updated": 0,
-        "contexts_cleaned": 0,
+        "total_events": events.count(rows),
+        "contexts_registered_manual": registration_types["manual"],
+        "contexts_registered_auto": registration_types["auto"] + events.count(auto_registered),
+        "contexts_updated": events.count(events.where_eq("event_type", "work_context_updated", rows=rows)),
+        "contexts_cleaned": events.sum("context.cleaned_count", rows=cleaned),
+        # Note: Dashboard views, conflicts and risk assessments aren't explicitly
+        # logged yet. These would need to be added to the SAP in future iterations
         "conflicts_detected": 0,
         "risk_assessments": 0,
         "dashboard_views": 0,
-        "unique_contexts": set(),
-        "event_breakdown": defaultdict(int),
+        "unique_contexts": len(unique_contexts),
+        "event_breakdown": dict(events.count_by("event_type", rows=rows, missing="")),
         "time_period": {
             "start": None,
             "end": None,
@@ -102,64 +110,15 @@ def calculate_metrics(events):
         }
     }
 
-    # Track time range
-    timestamps = []
-
-    for event in events:
-        event_type = event.get("event_type", "")
-        metrics["event_breakdown"][event_type] += 1
-
-        # Track timestamps
-        try:
-            timestamp_str = event['timestamp'].replace('Z', '')
-            event_time = datetime.fromisoformat(timestamp_str)
-            timestamps.append(event_time)
-        except:
-            pass
-
-        # Count specific work context events
-        if event_type == "work_context_registered":
-            context = event.get("context", {})
-            reg_type = context.get("registration_type", "unknown")
-
-            if reg_type == "manual":
-                metrics["contexts_registered_manual"] += 1
-            elif reg_type == "auto":
-                metrics["contexts_registered_auto"] += 1
-
-            # Track unique contexts
-            ctx_id = context.get("context_id")
-            if ctx_id:
-                metrics["unique_contexts"].add(ctx_id)
-
-        elif event_type == "work_context_auto_registered":
-            metrics["contexts_registered_auto"] += 1
-            context = event.get("context", {})
-            ctx_id = context.get("context_id")
-            if ctx_id:
-                metrics["unique_contexts"].add(ctx_id)
-
-        elif event_type == "work_context_updated":
-            metrics["contexts_updated"] += 1
-
-        elif event_type == "work_contexts_cleaned":
-            context = event.get("context", {})
-            metrics["contexts_cleaned"] += context.get("cleaned_count", 0)
-
-        # Note: Dashboard views and risk assessments aren't explicitly logged yet
-        # These would need to be added to the SAP in future iterations
-
-    # Calculate time period
-    if timestamps:
-        timestamps.sort()
-        metrics["time_period"]["start"] = timestamps[0].isoformat()
-        metrics["time_period"]["end"] = timestamps[-1].isoformat()
-        duration = timestamps[-1] - timestamps[0]
+    # Calculate time period (naive UTC, as recorded)
+    start, end = events.time_range(rows)
+    if start is not None:
+        start, end = start.replace(tzinfo=None), end.replace(tzinfo=None)
+        metrics["time_period"]["start"] = start.isoformat()
+        metrics["time_period"]["end"] = end.isoformat()
+        duration = end - start
         metrics["time_period"]["days"] = max(1, duration.days)
 
-    # Convert set to count
-    metrics["unique_contexts"] = len(metrics["unique_contexts"])
-
     return metrics
 
 
@@ -341,14 +300,14 @@ def main():
         since_date = datetime.now() - timedelta(days=30)
 
     # Load events
-    events = load_events(args.events_dir, since_date)
+    events, rows = load_events(args.events_dir, since_date)
 
-    if not events:
+    if not events.count(rows):
         print("No work context events found in the specified period.", file=sys.stderr)
         sys.exit(1)
 
     # Calculate metrics
-    metrics = calculate_metrics(events)
+    metrics = calculate_metrics(events, rows)
     roi = calculate_roi(metrics)
 
     # Output
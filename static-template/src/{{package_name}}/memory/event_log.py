@@ -2,14 +2,70 @@
 
 Provides append-only event storage with efficient querying by trace ID,
 event type, status, and time range.
+
+Monthly partitions may also hold a compressed archive written by
+``scripts/a-mem-compress.py``: ``events-archive.jsonl.gz`` made of gzip
+segments, with an ``events-archive.idx.json`` sidecar giving each segment's
+byte range and min/max timestamp. Queries read archives transparently and
+only decompress segments overlapping the requested time range.
 """
 
+import gzip
+import io
 import json
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, Literal
 
 
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp ("Z" suffix allowed; naive values are UTC)."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _iter_archive(
+    archive_file: Path,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield events from a segmented archive, skipping non-overlapping segments.
+
+    Args:
+        archive_file: Archive file (events-archive.jsonl.gz)
+        since: Skip segments whose newest event is older than this
+        until: Skip segments whose oldest event is newer than this
+
+    Yields:
+        Archived events (unfiltered within the segments read)
+    """
+    segments: list[dict[str, Any]] = []
+    index_file = archive_file.with_name("events-archive.idx.json")
+    try:
+        index = json.loads(index_file.read_text(encoding="utf-8"))
+        segments = index["segments"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        pass
+    if not segments:
+        segments = [{"offset": 0, "length": archive_file.stat().st_size}]
+
+    with archive_file.open("rb") as f:
+        for segment in segments:
+            max_ts = segment.get("max_ts")
+            min_ts = segment.get("min_ts")
+            if since and max_ts and _parse_timestamp(max_ts) < since:
+                continue
+            if until and min_ts and _parse_timestamp(min_ts) > until:
+                continue
+
+            f.seek(segment["offset"])
+            with gzip.GzipFile(fileobj=io.BytesIO(f.read(segment["length"]))) as member:
+                for line in member:
+                    if line.strip():
+                        yield json.loads(line)
+
+
 class EventLog:
     """Event log storage and query interface."""
 
@@ -93,38 +149,57 @@ def query(
             if end_month and month_name > end_month:
                 continue
 
-            events_file = month_dir / "events.jsonl"
-            if not events_file.exists():
-                continue
+            for event in self._iter_partition(month_dir, since, until):
+                # Apply filters
+                if event_type and event["event_type"] != event_type:
+                    continue
+                if status and event["status"] != status:
+                    continue
+                if source and event["source"] != source:
+                    continue
+
+                # Time range filter
+                event_time = datetime.fromisoformat(
+                    event["timestamp"].replace("Z", "+00:00")
+                )
+                if since and event_time < since:
+                    continue
+                if until and event_time > until:
+                    continue
+
+                events.append(event)
+
+                # Check limit
+                if limit and len(events) >= limit:
+                    return events
+
+        return events
 
+    def _iter_partition(
+        self,
+        month_dir: Path,
+        since: datetime | None,
+        until: datetime | None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield a monthly partition's events, archived (older) ones first.
+
+        Args:
+            month_dir: Monthly partition directory
+            since: Start of time range, used to skip archive segments
+            until: End of time range, used to skip archive segments
+
+        Yields:
+            Events from events-archive.jsonl.gz, then events.jsonl
+        """
+        archive_file = month_dir / "events-archive.jsonl.gz"
+        if archive_file.exists():
+            yield from _iter_archive(archive_file, since, until)
+
+        events_file = month_dir / "events.jsonl"
+        if events_file.exists():
             with events_file.open(encoding="utf-8") as f:
                 for line in f:
-                    event = json.loads(line)
-
-                    # Apply filters
-                    if event_type and event["event_type"] != event_type:
-                        continue
-                    if status and event["status"] != status:
-                        continue
-                    if source and event["source"] != source:
-                        continue
-
-                    # Time range filter
-                    event_time = datetime.fromisoformat(
-                        event["timestamp"].replace("Z", "+00:00")
-                    )
-                    if since and event_time < since:
-                        continue
-                    if until and event_time > until:
-                        continue
-
-                    events.append(event)
-
-                    # Check limit
-                    if limit and len(events) >= limit:
-                        return events
-
-        return events
+                    yield json.loads(line)
 
     def aggregate(
         self,
@@ -0,0 +1,174 @@
+"""
+Tests for a-mem-compress.py and event_archive.py
+
+Tests that compaction appends month-bounded gzip segments without rewriting
+existing ones, and that archived events stay queryable by time range.
+"""
+
+import sys
+import gzip
+import json
+import importlib.util
+import pytest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import event_archive
+from event_archive import SegmentWriter, iter_archived_events, load_index
+
+spec = importlib.util.spec_from_file_location("a_mem_compress", REPO_ROOT / "scripts" / "a-mem-compress.py")
+a_mem_compress = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(a_mem_compress)
+
+NOW = datetime.now(timezone.utc)
+
+
+def event(event_id: str, days_ago: float, event_type: str = "test.event") -> dict:
+    timestamp = (NOW - timedelta(days=days_ago)).isoformat().replace("+00:00", "Z")
+    return {"event_id": event_id, "event_type": event_type, "timestamp": timestamp}
+
+
+def write_log(log_path: Path, *events):
+    with open(log_path, "a", encoding="utf-8") as f:
+        for item in events:
+            f.write(json.dumps(item) + "\n")
+
+
+def read_log(log_path: Path) -> list:
+    return [json.loads(line) for line in log_path.read_text().splitlines() if line.strip()]
+
+
+@pytest.fixture
+def log_path(tmp_path) -> Path:
+    path = tmp_path / "development.jsonl"
+    write_log(path, event("old-1", 120), event("old-2", 90, "other.event"), event("new-1", 1))
+    return path
+
+
+class TestCompressEventLog:
+    """Test streaming compaction into segmented archives"""
+
+    def test_moves_old_events_to_archive(self, log_path):
+        result = a_mem_compress.compress_event_log(log_path, age_threshold_days=30)
+
+        assert result["compressed"] == 2
+        assert result["kept"] == 1
+        assert [e["event_id"] for e in read_log(log_path)] == ["new-1"]
+
+        archive_path = event_archive.archive_path_for(log_path)
+        # Still a plain gzip file for existing tooling
+        with gzip.open(archive_path, "rt") as f:
+            assert [json.loads(line)["event_id"] for line in f] == ["old-1", "old-2"]
+        # Reported after the last segment is finished
+        assert result["segments"] == len(load_index(archive_path))
+
+    def test_dry_run_changes_nothing(self, log_path):
+        before = log_path.read_text()
+        result = a_mem_compress.compress_event_log(log_path, age_threshold_days=30, dry_run=True)
+
+        assert (result["compressed"], result["kept"]) == (2, 1)
+        assert log_path.read_text() == before
+        assert not event_archive.archive_path_for(log_path).exists()
+
+    def test_nothing_to_compress_leaves_no_archive(self, log_path):
+        result = a_mem_compress.compress_event_log(log_path, age_threshold_days=365)
+
+        assert result["compressed"] == 0
+        assert len(read_log(log_path)) == 3
+        assert not event_archive.archive_path_for(log_path).exists()
+
+    def test_append_keeps_existing_segments(self, log_path):
+        a_mem_compress.compress_event_log(log_path, age_threshold_days=30)
+        archive_path = event_archive.archive_path_for(log_path)
+        first_bytes = archive_path.read_bytes()
+        first_segments = load_index(archive_path)
+
+        write_log(log_path, event("old-3", 60))
+        a_mem_compress.compress_event_log(log_path, age_threshold_days=30)
+
+        assert archive_path.read_bytes().startswith(first_bytes)
+        segments = load_index(archive_path)
+        assert segments[:len(first_segments)] == first_segments
+        assert sum(s["count"] for s in segments) == 3
+        assert [e["event_id"] for e in iter_archived_events(archive_path)] == ["old-1", "old-2", "old-3"]
+
+    def test_legacy_archive_is_indexed(self, log_path):
+        archive_path = event_archive.archive_path_for(log_path)
+        with gzip.open(archive_path, "wt") as f:
+            f.write(json.dumps(event("legacy-1", 400)) + "\n")
+
+        a_mem_compress.compress_event_log(log_path, age_threshold_days=30)
+
+        segments = load_index(archive_path)
+        assert segments[0]["offset"] == 0 and segments[0]["count"] == 1
+        assert [e["event_id"] for e in iter_archived_events(archive_path)] == ["legacy-1", "old-1", "old-2"]
+
+
+class TestSegmentedArchive:
+    """Test segment summaries and time-range reads"""
+
+    def test_segments_bounded_by_month_and_size(self, tmp_path):
+        archive_path = tmp_path / "events-archive.jsonl.gz"
+        events = [
+            {"event_type": "a", "timestamp": "2025-01-05T00:00:00Z"},
+            {"event_type": "b", "timestamp": "2025-01-20T00:00:00Z"},
+            {"event_type": "a", "timestamp": "2025-01-25T00:00:00Z"},
+            {"event_type": "a", "timestamp": "2025-02-01T00:00:00Z"},
+        ]
+        with SegmentWriter(archive_path, max_events=2) as writer:
+            for item in events:
+                writer.add(json.dumps(item), item)
+
+        segments = load_index(archive_path)
+        assert [s["count"] for s in segments] == [2, 1, 1]
+        assert segments[0]["event_types"] == {"a": 1, "b": 1}
+        assert segments[0]["min_ts"] == "2025-01-05T00:00:00+00:00"
+        assert segments[0]["max_ts"] == "2025-01-20T00:00:00+00:00"
+
+    def test_time_range_skips_segments(self, tmp_path, monkeypatch):
+        archive_path = tmp_path / "events-archive.jsonl.gz"
+        events = [
+            {"event_id": "jan", "timestamp": "2025-01-10T00:00:00Z"},
+            {"event_id": "feb", "timestamp": "2025-02-10T00:00:00Z"},
+            {"event_id": "mar", "timestamp": "2025-03-10T00:00:00Z"},
+        ]
+        with SegmentWriter(archive_path) as writer:
+            for item in events:
+                writer.add(json.dumps(item), item)
+
+        decompressed = []
+        real_gzip_file = gzip.GzipFile
+
+        def tracking_gzip_file(*args, **kwargs):
+            decompressed.append(1)
+            return real_gzip_file(*args, **kwargs)
+
+        monkeypatch.setattr(event_archive.gzip, "GzipFile", tracking_gzip_file)
+        found = list(iter_archived_events(
+            archive_path,
+            since=datetime(2025, 2, 1, tzinfo=timezone.utc),
+            until=datetime(2025, 2, 28, tzinfo=timezone.utc),
+        ))
+
+        assert [e["event_id"] for e in found] == ["feb"]
+        assert len(decompressed) == 1
+
+    def test_interrupted_append_is_discarded(self, tmp_path):
+        archive_path = tmp_path / "events-archive.jsonl.gz"
+        item = {"event_id": "kept", "timestamp": "2025-01-10T00:00:00Z"}
+        with SegmentWriter(archive_path) as writer:
+            writer.add(json.dumps(item), item)
+        indexed_size = archive_path.stat().st_size
+
+        # Simulate a crash after appending but before the index was saved
+        with open(archive_path, "ab") as f:
+            f.write(gzip.compress(b'{"event_id": "orphan"}\n'))
+        assert [e["event_id"] for e in iter_archived_events(archive_path)] == ["kept"]
+
+        with SegmentWriter(archive_path) as writer:
+            writer.add(json.dumps(item), item)
+        assert load_index(archive_path)[1]["offset"] == indexed_size
+        assert [e["event_id"] for e in iter_archived_events(archive_path)] == ["kept", "kept"]
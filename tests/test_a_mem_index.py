@@ -0,0 +1,134 @@
+"""
+Tests for a-mem-index.py incremental indexing and fs_watch.py
+
+Tests that per-note updates keep links.json/tags.json identical to a full
+rebuild, and that the directory watcher reports note changes.
+"""
+
+import sys
+import json
+import importlib.util
+import pytest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from fs_watch import DirectoryWatcher
+
+spec = importlib.util.spec_from_file_location("a_mem_index", REPO_ROOT / "scripts" / "a-mem-index.py")
+a_mem_index = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(a_mem_index)
+
+
+def write_note(knowledge_dir: Path, name: str, tags, linked_to):
+    (knowledge_dir / name).write_text(
+        f"---\nid: {name}\ntags: [{', '.join(tags)}]\nlinked_to: [{', '.join(linked_to)}]\n---\n\n# {name}\n",
+        encoding="utf-8"
+    )
+
+
+def normalized(data: dict) -> dict:
+    """Drop timestamps and order-insensitive list ordering"""
+    data = {k: v for k, v in data.items() if k != "generated"}
+    for key in ("backlinks", "tags"):
+        if key in data:
+            data[key] = {k: sorted(v) for k, v in data[key].items()}
+    data["notes"] = dict(sorted(data["notes"].items()))
+    return data
+
+
+@pytest.fixture
+def knowledge_dir(tmp_path) -> Path:
+    directory = tmp_path / "knowledge"
+    directory.mkdir()
+    write_note(directory, "a.md", ["sap-010", "memory"], ["b.md"])
+    write_note(directory, "b.md", ["sap-010"], ["a.md", "c.md"])
+    write_note(directory, "c.md", ["jinja2"], [])
+    return directory
+
+
+class TestKnowledgeIndex:
+    """Test per-note incremental updates"""
+
+    def assert_matches_full_rebuild(self, index, knowledge_dir):
+        assert normalized(index.links_data()) == normalized(a_mem_index.generate_links_json(knowledge_dir))
+        assert normalized(index.tags_data()) == normalized(a_mem_index.generate_tags_json(knowledge_dir))
+
+    def test_sync_matches_full_rebuild(self, knowledge_dir):
+        index = a_mem_index.KnowledgeIndex(knowledge_dir)
+        assert index.sync() == 3
+        self.assert_matches_full_rebuild(index, knowledge_dir)
+
+    def test_create_modify_delete(self, knowledge_dir):
+        index = a_mem_index.KnowledgeIndex(knowledge_dir)
+        index.sync()
+
+        write_note(knowledge_dir, "d.md", ["memory"], ["c.md"])
+        assert index.update_note("d.md")
+        write_note(knowledge_dir, "a.md", ["jinja2", "extra-tag"], [])
+        assert index.update_note("a.md")
+        (knowledge_dir / "b.md").unlink()
+        assert index.update_note("b.md")
+
+        self.assert_matches_full_rebuild(index, knowledge_dir)
+        assert "sap-010" not in index.tags_to_notes
+        assert index.backlinks == {"c.md": ["d.md"]}
+
+    def test_note_deleted_after_stat_is_removed(self, knowledge_dir, monkeypatch):
+        index = a_mem_index.KnowledgeIndex(knowledge_dir)
+        index.sync()
+        write_note(knowledge_dir, "a.md", ["memory"], [])
+        read_note = index._read_note
+
+        def delete_then_read(note_path):
+            note_path.unlink()
+            return read_note(note_path)
+
+        monkeypatch.setattr(index, "_read_note", delete_then_read)
+        assert index.update_note("a.md")
+        assert not index.update_note("a.md")
+
+        self.assert_matches_full_rebuild(index, knowledge_dir)
+        assert "a.md" not in index.notes
+
+    def test_unchanged_note_not_reread(self, knowledge_dir):
+        index = a_mem_index.KnowledgeIndex(knowledge_dir)
+        index.sync()
+        assert not index.update_note("a.md")
+        assert index.sync() == 0
+
+    def test_state_restored_across_runs(self, knowledge_dir):
+        index = a_mem_index.KnowledgeIndex(knowledge_dir)
+        index.sync()
+        index.write()
+
+        (knowledge_dir / "c.md").unlink()
+        restarted = a_mem_index.KnowledgeIndex(knowledge_dir)
+        restarted.load_state()
+        assert restarted.sync() == 1
+        self.assert_matches_full_rebuild(restarted, knowledge_dir)
+
+        links = json.loads((knowledge_dir / "links.json").read_text())
+        assert links["total_notes"] == 3
+        assert not list(knowledge_dir.glob(".*.tmp"))
+
+
+class TestDirectoryWatcher:
+    """Test change detection backends"""
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_reports_changed_notes(self, knowledge_dir, use_inotify):
+        with DirectoryWatcher(knowledge_dir, suffixes=(".md",), interval=0.05,
+                              use_inotify=use_inotify) as watcher:
+            write_note(knowledge_dir, "d.md", ["new"], [])
+            (knowledge_dir / "c.md").unlink()
+            (knowledge_dir / "links.json").write_text("{}")
+
+            changed = set()
+            for _ in range(20):
+                changed |= watcher.poll(timeout=0.05)
+                if {"d.md", "c.md"} <= changed:
+                    break
+
+        assert changed == {"d.md", "c.md"}
@@ -0,0 +1,96 @@
+"""
+Tests for analyze_sap_quality.py
+
+Tests that parallel and cached analysis produce the same reports as a
+sequential uncached run, and that re-runs only analyze changed artifacts.
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import analyze_sap_quality
+from analyze_sap_quality import SAPQualityAnalyzer
+
+REPO_ROOT = Path(__file__).parent.parent
+SAP_DIRS = ["sap-framework", "inbox", "testing-framework"]
+
+
+def make_repo(tmp_path: Path) -> Path:
+    """Repository with a few real SAPs plus a stub and a missing one"""
+    saps = []
+    for i, name in enumerate(SAP_DIRS):
+        location = f"docs/skilled-awareness/{name}"
+        shutil.copytree(REPO_ROOT / location, tmp_path / location)
+        saps.append({"id": f"SAP-{i:03d}", "name": name, "location": location})
+
+    stub = tmp_path / "docs" / "skilled-awareness" / "stub"
+    stub.mkdir(parents=True)
+    (stub / "capability-charter.md").write_text("# Stub\n\nWhy this exists.\n", encoding="utf-8")
+    saps.append({"id": "SAP-010", "name": "stub", "location": "docs/skilled-awareness/stub"})
+    saps.append({"id": "SAP-011", "name": "gone", "location": "docs/skilled-awareness/gone"})
+
+    (tmp_path / "sap-catalog.json").write_text(json.dumps({"saps": saps}), encoding="utf-8")
+    return tmp_path
+
+
+def dump(reports) -> str:
+    return json.dumps([report.to_dict() for report in reports], indent=2)
+
+
+class TestParallelAnalysis:
+    """Test that every mode produces the sequential reports"""
+
+    def test_parallel_and_cached_match_sequential(self, tmp_path):
+        repo = make_repo(tmp_path)
+        sap_ids = ["SAP-000", "SAP-001", "SAP-002", "SAP-010", "SAP-011", "SAP-099"]
+
+        sequential = SAPQualityAnalyzer(repo, use_cache=False)
+        expected = dump([sequential.analyze_sap(sap_id) for sap_id in sap_ids])
+
+        assert dump(SAPQualityAnalyzer(repo, use_cache=False).analyze_saps(sap_ids, jobs=2)) == expected
+        assert dump(SAPQualityAnalyzer(repo).analyze_saps(sap_ids, jobs=2)) == expected
+        assert (repo / ".chora" / "cache" / "sap-quality.json").exists()
+        assert dump(SAPQualityAnalyzer(repo).analyze_saps(sap_ids, jobs=1)) == expected
+
+    def test_stub_artifact_report(self, tmp_path):
+        repo = make_repo(tmp_path)
+        report = SAPQualityAnalyzer(repo, use_cache=False).analyze_sap("SAP-010")
+
+        charter = report.diataxis_compliance["capability-charter.md"]
+        assert charter["category"] == "Explanation"
+        assert charter["issues"] == ["Missing trade-offs or design decisions"]
+        assert "capability-charter.md: Good Explanation adherence (context, rationale)" in report.strengths
+        assert sum(1 for issue in report.issues if issue.description.startswith("Required artifact")) == 4
+
+
+class TestIncrementalAnalysis:
+    """Test the per-artifact content-hash cache"""
+
+    def test_only_changed_artifacts_reanalyzed(self, tmp_path, monkeypatch):
+        repo = make_repo(tmp_path)
+        sap_ids = ["SAP-000", "SAP-001", "SAP-002"]
+        SAPQualityAnalyzer(repo).analyze_saps(sap_ids, jobs=1)
+
+        analyzed = []
+        analyze = analyze_sap_quality.analyze_artifact_content
+
+        def counting(content, artifact_type, filename):
+            analyzed.append(filename)
+            return analyze(content, artifact_type, filename)
+
+        monkeypatch.setattr(analyze_sap_quality, "analyze_artifact_content", counting)
+
+        SAPQualityAnalyzer(repo).analyze_saps(sap_ids, jobs=1)
+        assert analyzed == []
+
+        ledger = repo / "docs" / "skilled-awareness" / "inbox" / "ledger.md"
+        ledger.write_text(ledger.read_text(encoding="utf-8") + "\n| 2.0 | Rationale added |\n", encoding="utf-8")
+        reports = SAPQualityAnalyzer(repo).analyze_saps(sap_ids, jobs=1)
+        assert analyzed == ["ledger.md"]
+
+        monkeypatch.undo()
+        assert dump(reports) == dump(SAPQualityAnalyzer(repo, use_cache=False).analyze_saps(sap_ids))
@@ -6,12 +6,14 @@
 
 import json
 import csv
+import random
+import statistics
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 
-from utils.claude_metrics import ClaudeMetric, ClaudeROICalculator
+from utils.claude_metrics import ClaudeMetric, ClaudeROICalculator, MetricStore
 
 
 # ============================================================================
@@ -1023,3 +1025,127 @@ def test_load_from_json_empty_metrics(self, calculator, temp_workspace):
 
         assert loaded_calculator.hourly_rate == 100.0
         assert loaded_calculator.metrics == []
+
+
+# ============================================================================
+# Test Columnar Metric Store
+# ============================================================================
+
+class TestMetricStore:
+    """Test the columnar store behind ClaudeROICalculator.metrics."""
+
+    def test_reads_back_metrics(self, sample_metrics):
+        """Test that stored metrics read back unchanged."""
+        store = MetricStore()
+        for metric in sample_metrics:
+            store.append(metric)
+
+        assert store == sample_metrics
+        assert store[-1] == sample_metrics[-1]
+        assert store[1:] == sample_metrics[1:]
+        assert list(store.records()) == [m.to_dict() for m in sample_metrics]
+        assert store.task_types == ["feature_implementation", "bugfix"]
+        assert list(store.task_codes) == [0, 1, 0]
+        with pytest.raises(IndexError):
+            store[3]
+
+    def test_unexpected_value_types_kept(self, sample_metric):
+        """Test that values not fitting a typed column are stored as given."""
+        store = MetricStore()
+        store.append(sample_metric)
+        fractional = ClaudeMetric.from_dict({**sample_metric.to_dict(), "time_saved_minutes": 12.5,
+                                             "documentation_quality_score": 8})
+        store.append(fractional)
+
+        assert store[0] == sample_metric
+        assert store[1].time_saved_minutes == 12.5
+        assert type(store[1].documentation_quality_score) is int
+        assert store.time_saved_minutes.total == 132.5
+
+    def test_aggregates_match_full_scan(self):
+        """Test that running aggregates equal statistics over every session."""
+        rng = random.Random(3)
+        calculator = ClaudeROICalculator(developer_hourly_rate=100.0)
+        metrics = [
+            ClaudeMetric(
+                session_id=f"session-{i}",
+                timestamp=datetime(2025, 1, 1) + timedelta(minutes=i),
+                task_type=rng.choice(["feature_implementation", "bugfix", "refactor"]),
+                lines_generated=rng.randint(0, 500),
+                time_saved_minutes=rng.randint(0, 300),
+                iterations_required=rng.randint(1, 4),
+                bugs_introduced=rng.randint(0, 2),
+                bugs_fixed=rng.randint(0, 2),
+                documentation_quality_score=rng.uniform(0, 10),
+                test_coverage=rng.random(),
+                metadata={"session_duration_minutes": rng.choice([0, 15, 60.5])},
+            )
+            for i in range(2000)
+        ]
+        for metric in metrics:
+            calculator.add_metric(metric)
+
+        quality = calculator.calculate_quality_metrics()
+        assert quality["documentation_quality"] == statistics.mean(m.documentation_quality_score for m in metrics)
+        assert quality["test_coverage"] == statistics.mean(m.test_coverage for m in metrics)
+        assert quality["first_pass_success_rate"] == sum(m.iterations_required == 1 for m in metrics) / 2000
+
+        accelerations = [
+            (m.metadata["session_duration_minutes"] + m.time_saved_minutes) / m.metadata["session_duration_minutes"]
+            for m in metrics if m.metadata["session_duration_minutes"] > 0
+        ]
+        assert calculator.calculate_time_saved()["average_acceleration"] == statistics.mean(accelerations)
+
+        bugfixes = [m for m in metrics if m.task_type == "bugfix"]
+        breakdown = calculator.calculate_task_breakdown()["bugfix"]
+        assert breakdown["count"] == len(bugfixes)
+        assert breakdown["average_iterations"] == statistics.mean(m.iterations_required for m in bugfixes)
+        assert breakdown["average_coverage"] == statistics.mean(m.test_coverage for m in bugfixes)
+        assert f"Lines Generated: {sum(m.lines_generated for m in metrics):,}" in \
+            calculator.generate_executive_summary()
+
+
+# ============================================================================
+# Test JSONL Persistence
+# ============================================================================
+
+class TestJSONLPersistence:
+    """Test append-only JSONL logging and loading."""
+
+    def test_log_appends_each_metric(self, sample_metrics, temp_workspace):
+        """Test that a log-backed calculator appends every added metric."""
+        log_path = temp_workspace / "logs" / "metrics.jsonl"
+        calculator = ClaudeROICalculator(developer_hourly_rate=100.0, log_path=log_path)
+        calculator.add_metric(sample_metrics[0])
+        calculator.add_metric(sample_metrics[1])
+
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [m.to_dict() for m in sample_metrics[:2]]
+
+        # Reopening in append mode continues the same log
+        calculator.close()
+        reopened = ClaudeROICalculator.load_from_jsonl(log_path, 100.0, append=True)
+        reopened.add_metric(sample_metrics[2])
+        reopened.close()
+
+        loaded = ClaudeROICalculator.load_from_jsonl(log_path, 100.0)
+        assert loaded.metrics == sample_metrics
+        assert loaded.calculate_task_breakdown() == reopened.calculate_task_breakdown()
+
+    def test_export_and_load_round_trip(self, calculator, sample_metrics, temp_workspace):
+        """Test export_to_jsonl / load_from_jsonl round trip."""
+        for metric in sample_metrics:
+            calculator.add_metric(metric)
+        jsonl_path = temp_workspace / "metrics.jsonl"
+        calculator.export_to_jsonl(jsonl_path)
+
+        loaded = ClaudeROICalculator.load_from_jsonl(str(jsonl_path), 100.0)
+
+        assert loaded.metrics == calculator.metrics
+        assert loaded.generate_executive_summary() == calculator.generate_executive_summary()
+        assert loaded.log_path is None
+
+    def test_load_missing_file(self, temp_workspace):
+        """Test loading a JSONL file that doesn't exist yet."""
+        loaded = ClaudeROICalculator.load_from_jsonl(temp_workspace / "missing.jsonl", 100.0)
+        assert loaded.metrics == []
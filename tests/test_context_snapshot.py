@@ -0,0 +1,168 @@
+"""
+Tests for context_snapshot.py and the cached context in suggest-next.py
+
+Tests TTL and file-change invalidation of cached signals, unavailable
+and slow signals, grouped collection, and the snapshot-backed ProjectContext.
+"""
+
+import importlib.util
+import json
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from context_snapshot import ContextSignal, ContextSnapshot, SignalUnavailable
+
+spec = importlib.util.spec_from_file_location(
+    "suggest_next",
+    Path(__file__).parent.parent / "scripts" / "suggest-next.py"
+)
+suggest_next = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(suggest_next)
+
+
+class Counter:
+    """Collector returning how many times it has been called."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.calls
+
+
+class TestContextSnapshot:
+    """Test signal caching"""
+
+    def test_cached_until_inputs_change(self, tmp_path):
+        (tmp_path / "data.txt").write_text("a")
+        collect = Counter()
+        signals = [ContextSignal("data", collect, ttl=3600, inputs=("data.txt",))]
+
+        assert ContextSnapshot(tmp_path, signals).collect() == {"data": 1}
+        # Reloaded from disk by a new snapshot
+        snapshot = ContextSnapshot(tmp_path, signals)
+        assert snapshot.collect() == {"data": 1}
+        assert snapshot.collected == []
+
+        (tmp_path / "data.txt").write_text("changed")
+        assert snapshot.collect() == {"data": 2}
+        assert snapshot.collected == ["data"]
+
+    def test_ttl_and_allow_stale(self, tmp_path):
+        collect = Counter()
+        snapshot = ContextSnapshot(tmp_path, [ContextSignal("tick", collect, ttl=0.05)])
+
+        assert snapshot.collect() == {"tick": 1}
+        time.sleep(0.1)
+        assert snapshot.collect(allow_stale=True) == {"tick": 1}
+        assert snapshot.collect() == {"tick": 2}
+
+    def test_unavailable_signal_keeps_last_value(self, tmp_path):
+        available = {"now": False}
+
+        def collect():
+            if not available["now"]:
+                raise SignalUnavailable("busy")
+            return 42
+
+        snapshot = ContextSnapshot(tmp_path, [ContextSignal("gate", collect, ttl=0, default=-1)])
+
+        assert snapshot.collect() == {"gate": -1}
+        available["now"] = True
+        assert snapshot.collect() == {"gate": 42}
+        available["now"] = False
+        assert snapshot.collect() == {"gate": 42}
+
+    def test_groups_run_sequentially(self, tmp_path):
+        active = {"pytest": 0, "max": 0}
+        lock = threading.Lock()
+
+        def pytest_run():
+            with lock:
+                active["pytest"] += 1
+                active["max"] = max(active["max"], active["pytest"])
+            time.sleep(0.05)
+            with lock:
+                active["pytest"] -= 1
+            return True
+
+        signals = [ContextSignal(f"run{i}", pytest_run, ttl=60, group="pytest") for i in range(3)]
+        signals.append(ContextSignal("other", lambda: "x", ttl=60))
+
+        values = ContextSnapshot(tmp_path, signals, jobs=4).collect()
+
+        assert values == {"run0": True, "run1": True, "run2": True, "other": "x"}
+        assert active["max"] == 1
+
+    def test_slow_collector_falls_back(self, tmp_path):
+        release = threading.Event()
+        collect = Counter()
+
+        def slow():
+            release.wait(5)
+            return "late"
+
+        signals = [
+            ContextSignal("slow", slow, ttl=0, default="fallback", timeout=0.1, group="g"),
+            ContextSignal("after", collect, ttl=0, group="g"),
+            ContextSignal("fast", lambda: "x", ttl=60),
+        ]
+        snapshot = ContextSnapshot(tmp_path, signals, jobs=2)
+
+        start = time.monotonic()
+        values = snapshot.collect()
+        release.set()
+
+        assert time.monotonic() - start < 2
+        # The rest of the group isn't run alongside the abandoned collector
+        assert values == {"slow": "fallback", "after": None, "fast": "x"}
+        assert collect.calls == 0
+        assert snapshot.timed_out == ["slow"]
+        assert snapshot.collected == ["fast"]
+        assert "slow" not in snapshot.entries
+
+    def test_timeout_keeps_last_value(self, tmp_path):
+        delay = {"seconds": 0}
+
+        def collect():
+            time.sleep(delay["seconds"])
+            return 42
+
+        snapshot = ContextSnapshot(tmp_path, [ContextSignal("gate", collect, ttl=0)], timeout=0.1)
+
+        assert snapshot.collect() == {"gate": 42}
+        delay["seconds"] = 0.5
+        assert snapshot.collect() == {"gate": 42}
+        assert snapshot.timed_out == ["gate"]
+
+
+class TestCachedProjectContext:
+    """Test suggest-next's snapshot-backed context"""
+
+    def test_matches_live_context(self, tmp_path):
+        now = datetime.now(timezone.utc)
+        events = [
+            {"timestamp": (now - timedelta(hours=2)).isoformat(), "action": "sap_evaluator"},
+            {"timestamp": (now - timedelta(hours=48)).isoformat(), "action": "other"},
+            {"timestamp": "not a date"},
+        ]
+        coordination = tmp_path / "inbox" / "coordination"
+        coordination.mkdir(parents=True)
+        (coordination / "events.jsonl").write_text("\n".join(json.dumps(e) for e in events) + "\n")
+        (tmp_path / "inbox" / "active" / "task-001").mkdir(parents=True)
+
+        live = suggest_next.ProjectContext(tmp_path)
+        cached = suggest_next.CachedProjectContext(tmp_path)
+
+        for hours in (1, 24, 168):
+            assert cached.get_recent_events(hours) == live.get_recent_events(hours)
+        assert cached.get_active_work() == live.get_active_work() == ["task-001"]
+        assert cached.get_inbox_status() == live.get_inbox_status()
+        assert cached.get_blockers() == []
+        assert set(cached.snapshot.entries) == {"events", "active_work", "inbox_status", "ecosystem_work"}
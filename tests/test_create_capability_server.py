@@ -0,0 +1,128 @@
+"""
+Tests for create-capability-server.py pipelined scaffolding
+
+Verifies that the pipelined engine (parallel template rendering, SAP
+initialization overlapping rendering, Python checks on a process pool)
+generates exactly the files a sequential run does, reports per-phase
+timings, catches syntax errors, and scaffolds several servers from a
+manifest.
+"""
+
+import sys
+import importlib.util
+import json
+import pytest
+from pathlib import Path
+
+pytest.importorskip("jinja2")
+
+REPO_ROOT = Path(__file__).parent.parent
+
+spec = importlib.util.spec_from_file_location(
+    "create_capability_server", REPO_ROOT / "scripts" / "create-capability-server.py"
+)
+create_capability_server = importlib.util.module_from_spec(spec)
+sys.modules["create_capability_server"] = create_capability_server  # Registered for pickling
+spec.loader.exec_module(create_capability_server)
+
+# Files holding creation timestamps
+TIMESTAMPED = {".beads/metadata.json", ".chora/memory/events/development.jsonl",
+               "inbox/coordination/events.jsonl"}
+
+
+def server_args(*argv):
+    return create_capability_server.build_parser().parse_args([
+        "--author", "A B", "--email", "a@b.co", "--github", "ab",
+        "--chora-base-dir", str(REPO_ROOT), *argv
+    ])
+
+
+def read_tree(root: Path) -> dict:
+    return {
+        str(path.relative_to(root)): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and str(path.relative_to(root)) not in TIMESTAMPED
+    }
+
+
+def scaffold(output_dir: Path, jobs: int):
+    args = server_args("--name", "Task Manager", "--output", str(output_dir),
+                       "--profile", "full", "--enable-memory")
+    variables = create_capability_server.resolve_variables(args)
+    with create_capability_server.ScaffoldEngine(REPO_ROOT, jobs=jobs) as engine:
+        return engine.create(output_dir, variables, skip_git=True)
+
+
+class TestPipelinedScaffold:
+    """Test the pipelined engine against a sequential run"""
+
+    def test_pipelined_matches_sequential(self, tmp_path, capsys):
+        sequential = scaffold(tmp_path / "sequential", jobs=1)
+        sequential_output = capsys.readouterr().out.replace(str(tmp_path / "sequential"), "X")
+        pipelined = scaffold(tmp_path / "pipelined", jobs=4)
+        pipelined_output = capsys.readouterr().out.replace(str(tmp_path / "pipelined"), "X")
+
+        assert read_tree(tmp_path / "pipelined") == read_tree(tmp_path / "sequential")
+        assert (tmp_path / "pipelined" / ".beads" / "metadata.json").exists()
+        assert pipelined_output.splitlines() == sequential_output.splitlines()
+        assert "✅ Generated Python compiles" in pipelined_output
+
+        assert list(pipelined.timings) == [
+            "directories", "static files", "templates", "beads", "inbox", "memory",
+            "python checks", "validation",
+        ]
+        assert list(sequential.timings) == list(pipelined.timings)
+        assert pipelined.validation_passed == sequential.validation_passed
+
+    def test_syntax_errors_detected(self, tmp_path):
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "good.py").write_text("x = 1\n")
+        (tmp_path / "pkg" / "bad.py").write_text("def broken(:\n    pass\n")
+        (tmp_path / "pkg" / "raw.py").write_text("name = '{{ package_name }}'\n")
+
+        with create_capability_server.ScaffoldEngine(REPO_ROOT, jobs=2) as engine:
+            pooled = create_capability_server.check_generated_python(tmp_path, engine._process_pool, 2)
+        local = create_capability_server.check_generated_python(tmp_path)
+
+        assert sorted(pooled.syntax_errors) == sorted(local.syntax_errors) == ["pkg/bad.py:1: invalid syntax"]
+        assert pooled.unsubstituted_files == local.unsubstituted_files == ["pkg/raw.py"]
+
+
+class TestManifest:
+    """Test batch creation from a manifest"""
+
+    def test_manifest_entry_argv(self):
+        entry = {"name": "Task Manager", "enable_mcp": True, "skip-git": True,
+                 "enable_beads": False, "namespace": None}
+        assert create_capability_server.manifest_entry_argv(entry) == [
+            "--name", "Task Manager", "--enable-mcp", "--skip-git"
+        ]
+
+    def test_load_manifest_rejects_non_list(self, tmp_path):
+        manifest = tmp_path / "servers.json"
+        manifest.write_text(json.dumps({"servers": "alpha"}))
+        with pytest.raises(ValueError):
+            create_capability_server.load_manifest(manifest)
+
+    def test_creates_each_server(self, tmp_path, capsys):
+        servers = [
+            {"name": f"{name} Service", "output": str(tmp_path / name.lower()), "skip_git": True,
+             "skip_validation": True, "author": "A B", "email": "a@b.co", "github": "ab",
+             "chora_base_dir": str(REPO_ROOT)}
+            for name in ("Alpha", "Beta", "Gamma")
+        ]
+        manifest = tmp_path / "servers.json"
+        manifest.write_text(json.dumps({"servers": servers}))
+        parser = create_capability_server.build_parser()
+        args = server_args("--manifest", str(manifest), "--jobs", "3")
+
+        assert create_capability_server.create_from_manifest(parser, args) == 0
+
+        output = capsys.readouterr().out
+        assert "3/3 servers created" in output
+        assert output.index("Alpha Service →") < output.index("Beta Service →") < output.index("Gamma Service →")
+        for name in ("alpha", "beta", "gamma"):
+            assert (tmp_path / name / f"{name}_service" / "__init__.py").exists()
+
+        # Existing outputs are refused before anything is created
+        assert create_capability_server.create_from_manifest(parser, args) == 1
@@ -0,0 +1,153 @@
+"""
+Tests for event_columns.py
+
+Tests columnar encoding of A-MEM events, the aggregation API used by the
+metrics dashboards, and incremental monthly compaction.
+"""
+
+import sys
+import json
+import pytest
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from event_columns import ColumnarStore, EventChunk, EventTable, load_event_table, store_dir_for
+
+
+EVENTS = [
+    {"timestamp": "2025-10-30T12:00:00Z", "event_type": "start", "status": "success",
+     "duration_ms": 10, "metadata": {"tags": ["sap-010", "memory"]}},
+    {"timestamp": "2025-11-01T08:00:00Z", "event_type": "start", "status": "failure",
+     "duration_ms": 20.5, "metadata": {"tags": ["sap-010"]}},
+    {"timestamp": "2025-11-03T09:30:00.123456Z", "event_type": "end", "success": True,
+     "duration_ms": 30, "metadata": {"tags": []}},
+    {"event_type": "end", "success": False, "context": {"ids": [1, 2]}},
+]
+
+
+def write_log(log_path: Path, *events):
+    with open(log_path, "a", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+@pytest.fixture
+def table() -> EventTable:
+    return EventTable.from_events(EVENTS)
+
+
+class TestAggregations:
+    """Test the aggregation API against plain Python over the same events"""
+
+    def test_count_by(self, table):
+        assert table.count_by("event_type") == {"start": 2, "end": 2}
+        assert table.count_by("status", missing="unknown") == {"success": 1, "failure": 1, "unknown": 2}
+        assert table.count_by("metadata.tags") == {"sap-010": 2, "memory": 1}
+
+    def test_filters_compose(self, table):
+        starts = table.where_eq("event_type", "start")
+        assert table.count(starts) == 2
+        assert table.count(table.where_eq("status", "failure", rows=starts)) == 1
+        assert table.count(table.where("success", bool)) == 1
+        assert table.count(table.where_eq("metadata.tags", "memory")) == 1
+        assert table.count(table.where_eq("event_type", "missing")) == 0
+
+    def test_numeric(self, table):
+        assert table.sum("duration_ms") == 60.5
+        assert table.mean("duration_ms", rows=table.where_eq("event_type", "start")) == 15.25
+        assert table.percentiles("duration_ms", qs=(0, 50, 100)) == {0: 10, 50: 20.5, 100: 30}
+        assert table.sum("not_a_column") == 0
+
+    def test_values_round_trip(self, table):
+        assert table.values("success", default="n/a") == ["n/a", "n/a", True, False]
+        assert table.values("context.ids") == [None, None, None, [1, 2]]
+
+    def test_time(self, table):
+        start, end = table.time_range()
+        assert start == datetime(2025, 10, 30, 12, tzinfo=timezone.utc)
+        assert end == datetime(2025, 11, 3, 9, 30, 0, 123456, tzinfo=timezone.utc)
+        assert table.time_buckets("month") == {"2025-10": 1, "2025-11": 2}
+        assert table.time_buckets("week") == {"2025-W44": 2, "2025-W45": 1}
+        since = table.where_time(since=datetime(2025, 11, 1))
+        assert table.count(since) == 2
+
+
+class TestChunkStorage:
+    """Test binary round trip and chunk concatenation"""
+
+    def test_save_load_round_trip(self, tmp_path, table):
+        path = tmp_path / "chunk.evcol"
+        table.chunks[0].save(path)
+        loaded = EventTable([EventChunk.load(path)])
+
+        for column in ("event_type", "status", "duration_ms", "success", "metadata.tags", "context.ids"):
+            assert loaded.values(column) == table.values(column)
+        assert loaded.time_range() == table.time_range()
+
+    def test_concat_promotes_and_merges(self):
+        left = EventChunk.from_events([{"n": 1, "kind": "a"}, {"kind": "b"}])
+        right = EventChunk.from_events([{"n": 2.5, "kind": "b", "extra": "x"}])
+        merged = EventTable([left.concat(right)])
+
+        assert merged.values("n") == [1, None, 2.5]
+        assert merged.values("kind") == ["a", "b", "b"]
+        assert merged.values("extra") == [None, None, "x"]
+        assert merged.count_by("kind") == {"a": 1, "b": 2}
+
+
+class TestColumnarStore:
+    """Test incremental compaction of a JSONL log"""
+
+    def test_load_matches_events(self, tmp_path):
+        log_path = tmp_path / "events.jsonl"
+        write_log(log_path, *EVENTS)
+        expected = EventTable.from_events(EVENTS).count_by("event_type")
+
+        assert load_event_table(log_path).count_by("event_type") == expected  # no store yet
+        stats = ColumnarStore(log_path).compact()
+        assert stats["events"] == 4 and stats["partitions"] == 3
+        assert sorted(p.name for p in store_dir_for(log_path).glob("*.evcol")) == \
+            ["2025-10.evcol", "2025-11.evcol", "undated.evcol"]
+        assert load_event_table(log_path).count_by("event_type") == expected
+
+    def test_appended_events_visible_before_and_after_compaction(self, tmp_path):
+        log_path = tmp_path / "events.jsonl"
+        write_log(log_path, *EVENTS[:2])
+        store = ColumnarStore(log_path)
+        store.compact()
+
+        write_log(log_path, *EVENTS[2:])
+        assert len(load_event_table(log_path)) == 4
+
+        assert store.compact()["events"] == 2
+        assert len(load_event_table(log_path)) == 4
+        assert store.compact()["events"] == 0
+
+    def test_closed_months_untouched(self, tmp_path):
+        log_path = tmp_path / "events.jsonl"
+        write_log(log_path, *EVENTS[:2])
+        store = ColumnarStore(log_path)
+        store.compact()
+        october = store_dir_for(log_path) / "2025-10.evcol"
+        before = october.stat().st_mtime_ns
+
+        write_log(log_path, EVENTS[2])
+        assert store.compact()["partitions"] == 1
+        assert october.stat().st_mtime_ns == before
+
+    def test_rewritten_log_rebuilds(self, tmp_path):
+        log_path = tmp_path / "events.jsonl"
+        write_log(log_path, *EVENTS)
+        store = ColumnarStore(log_path)
+        store.compact()
+
+        log_path.write_text("")
+        write_log(log_path, EVENTS[1])
+        assert len(load_event_table(log_path)) == 1
+
+        stats = store.compact()
+        assert stats["rebuilt"]
+        assert stats["total_events"] == 1
+        assert not (store_dir_for(log_path) / "2025-10.evcol").exists()
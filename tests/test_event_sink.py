@@ -0,0 +1,177 @@
+"""
+Tests for event_sink.py and its users
+
+Tests size- and time-based batching, ordering, exit/crash flushing, and the
+buffered @track_usage decorator, coordination events and benchmark.
+"""
+
+import importlib.util
+import json
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import event_sink
+import usage_tracker
+from event_sink import EventSink
+
+spec = importlib.util.spec_from_file_location(
+    "respond_to_coordination", SCRIPTS_DIR / "respond-to-coordination.py"
+)
+respond_to_coordination = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(respond_to_coordination)
+
+spec = importlib.util.spec_from_file_location(
+    "benchmark_usage_tracking", SCRIPTS_DIR / "benchmark-usage-tracking.py"
+)
+benchmark_usage_tracking = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(benchmark_usage_tracking)
+
+
+def read_events(path: Path) -> list:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for the writer thread"
+        time.sleep(0.01)
+
+
+class TestBatching:
+    """Test when and how the writer thread writes"""
+
+    def test_full_batch_written_in_one_write(self, tmp_path):
+        sink = EventSink(max_batch=10, flush_interval=60)
+        log = tmp_path / "nested" / "events.jsonl"
+        for i in range(10):
+            sink.emit(log, {"n": i})
+
+        wait_for(lambda: log.exists() and len(read_events(log)) == 10)
+        assert [event["n"] for event in read_events(log)] == list(range(10))
+        assert sink.batches_written == 1
+        sink.close()
+
+    def test_partial_batch_written_after_interval(self, tmp_path):
+        sink = EventSink(max_batch=100, flush_interval=0.1)
+        log = tmp_path / "events.jsonl"
+        sink.emit(log, {"n": 1})
+        assert not log.exists()
+
+        wait_for(log.exists)
+        assert read_events(log) == [{"n": 1}]
+
+        # A later partial batch is written on the same schedule
+        sink.emit(log, {"n": 2})
+        start = time.monotonic()
+        wait_for(lambda: len(read_events(log)) == 2, timeout=2.0)
+        assert time.monotonic() - start < 1.0
+        assert read_events(log) == [{"n": 1}, {"n": 2}]
+        assert sink.batches_written == 2
+        sink.close()
+
+    def test_flush_keeps_emit_order_per_log(self, tmp_path):
+        sink = EventSink(max_batch=1000, flush_interval=60)
+        logs = [tmp_path / "a.jsonl", tmp_path / "b.jsonl"]
+        for i in range(50):
+            sink.emit(logs[i % 2], {"n": i})
+
+        assert sink.flush() == 50
+        assert [event["n"] for event in read_events(logs[0])] == list(range(0, 50, 2))
+        assert [event["n"] for event in read_events(logs[1])] == list(range(1, 50, 2))
+        assert sink.flush() == 0
+
+    def test_unwritable_log_does_not_drop_other_logs(self, tmp_path):
+        sink = EventSink(max_batch=1000, flush_interval=60)
+        (tmp_path / "blocked").write_text("a file, not a directory")
+        bad = tmp_path / "blocked" / "events.jsonl"
+        good = tmp_path / "events.jsonl"
+        sink.emit(bad, {"n": 1})
+        sink.emit(good, {"n": 2})
+
+        with pytest.raises(OSError):
+            sink.flush()
+        assert read_events(good) == [{"n": 2}]
+
+    def test_emit_after_close_writes_immediately(self, tmp_path):
+        sink = EventSink(flush_interval=60)
+        log = tmp_path / "events.jsonl"
+        sink.emit(log, {"n": 1})
+        sink.close()
+        assert read_events(log) == [{"n": 1}]
+
+        sink.emit(log, {"n": 2})
+        assert read_events(log) == [{"n": 1}, {"n": 2}]
+
+
+class TestExitFlush:
+    """Test that buffered events survive interpreter exit"""
+
+    @pytest.mark.parametrize("ending, returncode", [("pass", 0), ("raise RuntimeError('boom')", 1)])
+    def test_pending_events_written_at_exit(self, tmp_path, ending, returncode):
+        log = tmp_path / "events.jsonl"
+        script = textwrap.dedent(f"""
+            import sys
+            from pathlib import Path
+            sys.path.insert(0, {str(SCRIPTS_DIR)!r})
+            from event_sink import emit
+            for i in range(3):
+                emit(Path({str(log)!r}), {{"n": i}})
+            {ending}
+        """)
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+
+        assert result.returncode == returncode
+        assert read_events(log) == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+
+class TestTrackUsage:
+    """Test the sink's callers"""
+
+    def test_success_and_failure_events(self, tmp_path, monkeypatch):
+        log = tmp_path / "script-usage.jsonl"
+        monkeypatch.setattr(usage_tracker, "USAGE_LOG_PATH", log)
+        monkeypatch.setattr(sys, "argv", ["/repo/scripts/demo-script.py", "--flag"])
+
+        @usage_tracker.track_usage
+        def succeed():
+            return "ok"
+
+        @usage_tracker.track_usage
+        def fail():
+            raise ValueError("bad input")
+
+        assert succeed() == "ok"
+        with pytest.raises(ValueError):
+            fail()
+
+        # The failure path flushes immediately, taking the success event with it
+        success, failure = read_events(log)
+        assert success["outcome"] == "success"
+        assert success["metadata"] == {"script": "demo-script.py", "arguments": ["--flag"],
+                                       "cwd": str(Path.cwd())}
+        assert success["event_id"] == "script-demo-script.py-" + \
+            success["timestamp"][:19].replace("-", "").replace(":", "").replace("T", "-")
+        assert failure["outcome"] == "failure"
+        assert failure["metadata"]["error_type"] == "ValueError"
+
+    def test_coordination_events_buffered(self, tmp_path):
+        events_file = tmp_path / "coordination" / "events.jsonl"
+        respond_to_coordination.emit_event(tmp_path, "coord-001", "response", "accepted", notes="ok")
+        event_sink.flush()
+
+        (event,) = read_events(events_file)
+        assert event["request_id"] == "coord-001"
+        assert event["notes"] == "ok"
+
+    def test_benchmark_runs(self):
+        results = benchmark_usage_tracking.run_benchmark(calls=50, repeat=2)
+        assert set(results) == {"bare", "synchronous", "buffered", "final flush (ms)"}
@@ -0,0 +1,83 @@
+"""
+Tests for export-link-graph.py and export-awareness-index.py file scanning
+
+Verifies that the process-pool scanning mode (--jobs) produces exactly the
+same graph/index as a sequential scan.
+"""
+
+import sys
+import importlib.util
+import pytest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def load_script(module_name: str, filename: str):
+    """Import a hyphenated script as a module (registered for pickling)"""
+    spec = importlib.util.spec_from_file_location(
+        module_name, REPO_ROOT / "scripts" / filename
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+export_link_graph = load_script("export_link_graph", "export-link-graph.py")
+export_awareness_index = load_script("export_awareness_index", "export-awareness-index.py")
+
+
+@pytest.fixture
+def docs_tree(tmp_path, monkeypatch):
+    """Small docs tree with internal, external and broken links"""
+    docs = tmp_path / "docs"
+    for i in range(12):
+        sap_dir = docs / f"sap-{i:02d}"
+        sap_dir.mkdir(parents=True)
+        (sap_dir / "AGENTS.md").write_text(
+            f"---\nsap_id: SAP-{i:03d}\ncomplexity: low\n---\n"
+            f"# SAP {i}\n\n"
+            f"See [next](../sap-{(i + 1) % 12:02d}/AGENTS.md) and "
+            f"[missing](../nowhere-{i}.md).\n"
+            f"External [site](https://example.com/{i})\n",
+            encoding="utf-8"
+        )
+        (sap_dir / "CLAUDE.md").write_text(f"# Claude {i}\n\n[agents](AGENTS.md)\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestParallelLinkGraph:
+    """Test build_link_graph with a process pool"""
+
+    def test_parallel_matches_sequential(self, docs_tree):
+        """Verify --jobs output is identical to a sequential scan"""
+        sequential = export_link_graph.build_link_graph(paths=["docs/"], validate=True)
+        parallel = export_link_graph.build_link_graph(paths=["docs/"], validate=True, jobs=3)
+
+        sequential.pop("metadata")
+        parallel.pop("metadata")
+        assert parallel == sequential
+        assert sequential["statistics"]["total_files"] == 24
+        assert sequential["statistics"]["broken_links"] == 12
+
+    def test_all_cores(self, docs_tree):
+        """Verify jobs=0 uses all cores and still preserves node order"""
+        graph = export_link_graph.build_link_graph(paths=["docs/"], jobs=0)
+        assert list(graph["nodes"]) == sorted(graph["nodes"])
+
+
+class TestParallelAwarenessIndex:
+    """Test build_awareness_index with a process pool"""
+
+    def test_parallel_matches_sequential(self, docs_tree):
+        """Verify --jobs output is identical to a sequential scan"""
+        sequential = export_awareness_index.build_awareness_index(extract_metadata=True)
+        parallel = export_awareness_index.build_awareness_index(extract_metadata=True, jobs=4)
+
+        sequential.pop("metadata")
+        parallel.pop("metadata")
+        assert parallel == sequential
+        assert sequential["statistics"]["total_files"] == 24
+        assert sequential["complexity_breakdown"] == {"low": 12}
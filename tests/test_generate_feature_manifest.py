@@ -0,0 +1,185 @@
+"""
+Tests for generate-feature-manifest.py --incremental
+
+Tests that incremental runs only rescan changed test/doc files, report
+links dropped by edited or deleted files, write the delta file, and keep
+files that failed to parse out of the recorded state.
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import yaml
+
+REPO_ROOT = Path(__file__).parent.parent
+SCRIPT = REPO_ROOT / "docs" / "skilled-awareness" / "lifecycle-traceability" / "scripts" / "generate-feature-manifest.py"
+
+spec = importlib.util.spec_from_file_location("generate_feature_manifest", SCRIPT)
+generate_feature_manifest = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(generate_feature_manifest)
+
+ManifestGenerator = generate_feature_manifest.ManifestGenerator
+load_state = generate_feature_manifest.load_state
+
+
+def write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def marker_source(feature_id: str) -> str:
+    return f'import pytest\n\n@pytest.mark.feature("{feature_id}")\ndef test_it():\n    pass\n'
+
+
+def doc_source(feature_id: str) -> str:
+    return f"---\nfeature_id: {feature_id}\ncode_references:\n  - src/app.py\n---\n# Guide\n"
+
+
+def make_project(root: Path) -> Path:
+    write(root / "tests" / "test_alpha.py", marker_source("FEAT-001"))
+    write(root / "tests" / "test_beta.py", marker_source("FEAT-002"))
+    write(root / "docs" / "guide.md", doc_source("FEAT-001"))
+    write(root / "README.md", "# Project\n")
+    return root
+
+
+def seed_state(root: Path) -> dict:
+    """State recorded by a full scan"""
+    generator = ManifestGenerator(root)
+    generator.scan_all()
+    state = load_state(root / "missing-state.json")
+    generator.record_full_scan_state(state, generator.contributions)
+    return state
+
+
+def incremental(root: Path, state: dict):
+    generator = ManifestGenerator(root)
+    delta = generator.scan_incremental(state)
+    return generator, delta
+
+
+class TestScanIncremental:
+    """Test the per-file delta"""
+
+    def test_unchanged_tree_is_noop(self, tmp_path):
+        root = make_project(tmp_path)
+        state = seed_state(root)
+        files_before = yaml.safe_load(yaml.safe_dump(state["files"]))
+
+        generator, delta = incremental(root, state)
+
+        assert generator.features == {}
+        assert delta["changed_files"] == []
+        assert delta["removed_files"] == []
+        assert delta["unlinked"] == {}
+        assert state["files"] == files_before
+
+    def test_modified_file_rescanned(self, tmp_path):
+        root = make_project(tmp_path)
+        state = seed_state(root)
+
+        write(root / "tests" / "test_alpha.py", marker_source("FEAT-003") + "# moved to FEAT-003\n")
+        generator, delta = incremental(root, state)
+
+        assert delta["changed_files"] == ["tests/test_alpha.py"]
+        assert delta["unlinked"] == {"tests/test_alpha.py": ["FEAT-001"]}
+        assert list(generator.features) == ["FEAT-003"]
+        assert generator.features["FEAT-003"].test_files == {"tests/test_alpha.py"}
+        assert state["files"]["tests/test_alpha.py"]["features"] == ["FEAT-003"]
+
+    def test_touched_identical_file_not_rescanned(self, tmp_path):
+        root = make_project(tmp_path)
+        state = seed_state(root)
+
+        path = root / "tests" / "test_beta.py"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        _, delta = incremental(root, state)
+        assert delta["changed_files"] == []
+        assert state["files"]["tests/test_beta.py"]["fingerprint"][0] == stat.st_mtime_ns + 10**9
+
+    def test_deleted_file_unlinked(self, tmp_path):
+        root = make_project(tmp_path)
+        state = seed_state(root)
+
+        (root / "docs" / "guide.md").unlink()
+        _, delta = incremental(root, state)
+
+        assert delta["removed_files"] == ["docs/guide.md"]
+        assert delta["unlinked"] == {"docs/guide.md": ["FEAT-001"]}
+        assert "docs/guide.md" not in state["files"]
+
+    def test_unparseable_file_not_marked_up_to_date(self, tmp_path):
+        root = make_project(tmp_path)
+        state = seed_state(root)
+        previous = dict(state["files"]["docs/guide.md"])
+
+        write(root / "docs" / "guide.md", "---\nfeature_id: [unclosed\n---\n# Guide\n")
+        write(root / "docs" / "new.md", "---\nfeature_id: [unclosed\n---\n")
+        _, delta = incremental(root, state)
+
+        assert delta["changed_files"] == []
+        assert state["files"]["docs/guide.md"] == previous
+        assert "docs/new.md" not in state["files"]
+
+        # Still picked up once fixed
+        write(root / "docs" / "guide.md", doc_source("FEAT-004"))
+        generator, delta = incremental(root, state)
+        assert delta["changed_files"] == ["docs/guide.md"]
+        assert delta["unlinked"] == {"docs/guide.md": ["FEAT-001"]}
+        assert "FEAT-004" in generator.features
+
+    def test_full_scan_state_skips_unparseable_files(self, tmp_path):
+        root = make_project(tmp_path)
+        write(root / "docs" / "broken.md", "---\nfeature_id: [unclosed\n---\n")
+
+        state = seed_state(root)
+        assert "docs/broken.md" not in state["files"]
+        assert state["files"]["docs/guide.md"]["features"] == ["FEAT-001"]
+
+
+class TestIncrementalCli:
+    """Test --incremental --delta end to end"""
+
+    def run(self, root: Path, *args: str) -> None:
+        subprocess.run(
+            [sys.executable, str(SCRIPT), "--incremental", *args],
+            cwd=root, check=True, capture_output=True, text=True
+        )
+
+    def test_delta_output(self, tmp_path):
+        root = make_project(tmp_path)
+        self.run(root)
+        manifest = yaml.safe_load((root / "feature-manifest.yaml").read_text(encoding="utf-8"))
+        assert [f["id"] for f in manifest["features"]] == ["FEAT-001", "FEAT-002"]
+        assert (root / ".chora" / "feature-manifest-state.json").exists()
+
+        # No changes: empty delta, manifest unchanged
+        self.run(root, "--delta", "delta.yaml")
+        delta = yaml.safe_load((root / "delta.yaml").read_text(encoding="utf-8"))
+        assert delta["changed_files"] == []
+        assert delta["removed_files"] == []
+        assert delta["features"] == []
+        assert yaml.safe_load((root / "feature-manifest.yaml").read_text(encoding="utf-8")) == manifest
+
+        # Move a test to another feature and delete the doc
+        write(root / "tests" / "test_alpha.py", marker_source("FEAT-002") + "# now FEAT-002\n")
+        (root / "docs" / "guide.md").unlink()
+        self.run(root, "--delta", "delta.yaml")
+
+        delta = yaml.safe_load((root / "delta.yaml").read_text(encoding="utf-8"))
+        assert delta["changed_files"] == ["tests/test_alpha.py"]
+        assert delta["removed_files"] == ["docs/guide.md"]
+        assert delta["unlinked"] == {"docs/guide.md": ["FEAT-001"], "tests/test_alpha.py": ["FEAT-001"]}
+        assert [f["id"] for f in delta["features"]] == ["FEAT-002"]
+
+        features = {
+            f["id"]: f for f in yaml.safe_load((root / "feature-manifest.yaml").read_text(encoding="utf-8"))["features"]
+        }
+        assert features["FEAT-001"]["tests"] == []
+        assert features["FEAT-001"]["documentation"] == []
+        assert [t["path"] for t in features["FEAT-002"]["tests"]] == ["tests/test_alpha.py", "tests/test_beta.py"]
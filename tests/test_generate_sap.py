@@ -0,0 +1,127 @@
+"""
+Tests for generate-sap.py batch generation
+
+Verifies that rendering SAPs across a process pool produces exactly the
+same artifacts as rendering them one by one, and that a batch updates
+INDEX.md once with every new SAP.
+"""
+
+import sys
+import importlib.util
+import json
+import pytest
+from pathlib import Path
+
+pytest.importorskip("jinja2")
+
+REPO_ROOT = Path(__file__).parent.parent
+
+spec = importlib.util.spec_from_file_location(
+    "generate_sap", REPO_ROOT / "scripts" / "generate-sap.py"
+)
+generate_sap = importlib.util.module_from_spec(spec)
+sys.modules["generate_sap"] = generate_sap  # Registered for pickling
+spec.loader.exec_module(generate_sap)
+
+TEMPLATE_DIR = REPO_ROOT / "templates" / "sap"
+
+INDEX = """# SAP Index
+
+This index tracks all **2 capabilities** organized across domains.
+
+**Last Updated**: 2025-01-01
+
+| SAP ID | Name | Version | Status | Phase | Awareness | Location | Dependencies |
+|--------|------|---------|--------|-------|-----------|----------|--------------|
+| SAP-000 | sap-framework | 1.0.0 | Active | Production | 5 | [sap-framework/](sap-framework/) | None (foundational) |
+
+**Awareness Score Legend**: 5 = complete
+
+**Current Coverage**: 2/2 SAPs (100%)
+
+## Changelog
+
+| Date | Change | Author |
+|------|--------|--------|
+| 2025-01-01 | Initial index | Team |
+"""
+
+
+def sap_entry(sap_id: str, location: str) -> dict:
+    return {
+        "id": sap_id,
+        "name": f"name-{sap_id.lower()}",
+        "full_name": f"Full {sap_id}",
+        "version": "1.0.0",
+        "status": "pilot",
+        "location": location,
+        "dependencies": ["SAP-000"],
+        "tags": ["test"],
+        "description": f"Description of {sap_id}",
+        "generation": {"capabilities": [f"Capability of {sap_id}"]},
+    }
+
+
+class TestBatchRendering:
+    """Test shared-environment, process-pool rendering"""
+
+    def test_pool_matches_sequential(self, tmp_path):
+        catalog = generate_sap.load_catalog(REPO_ROOT / "sap-catalog.json")
+        sap_datas = [generate_sap.prepare_sap_data(sap) for sap in catalog.saps[:12]]
+        cache_dir = tmp_path / "bytecode"
+
+        pooled = list(generate_sap.iter_rendered_saps(
+            sap_datas, jobs=3, template_dir=TEMPLATE_DIR, cache_dir=cache_dir
+        ))
+        sequential = [
+            generate_sap.render_artifacts(sap_data, TEMPLATE_DIR, None) for sap_data in sap_datas
+        ]
+
+        assert pooled == sequential
+        assert all(error is None for rendered in pooled for _, _, _, error in rendered)
+        assert len(list(cache_dir.iterdir())) == len(generate_sap.ARTIFACTS)
+
+    def test_generate_saps_writes_each_sap(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "sap").symlink_to(TEMPLATE_DIR)
+        saps = [sap_entry(f"SAP-9{i:02d}", f"docs/sap-9{i:02d}") for i in range(3)]
+        (tmp_path / "catalog.json").write_text(json.dumps({"saps": saps}))
+
+        results = generate_sap.generate_saps(
+            ["SAP-900", "SAP-902"], catalog_path="catalog.json", skip_validation=True, jobs=2
+        )
+
+        assert sorted(results) == ["SAP-900", "SAP-902"]
+        assert all(len(files) == 5 for files in results.values())
+        assert "Capability of SAP-902" in (tmp_path / "docs" / "sap-902" / "ledger.md").read_text()
+        assert not (tmp_path / "docs" / "sap-901").exists()
+
+        # Existing artifacts are kept without --force
+        again = generate_sap.generate_saps(
+            ["SAP-900", "SAP-902"], catalog_path="catalog.json", skip_validation=True, jobs=2
+        )
+        assert again == {"SAP-900": [], "SAP-902": []}
+
+        with pytest.raises(ValueError):
+            generate_sap.generate_saps(["SAP-999"], catalog_path="catalog.json", skip_validation=True)
+
+
+class TestIndexUpdate:
+    """Test the consolidated INDEX.md update"""
+
+    def test_batch_adds_rows_once(self, tmp_path):
+        index = tmp_path / "INDEX.md"
+        index.write_text(INDEX)
+        saps = [sap_entry("SAP-100", "docs/skilled-awareness/one"), sap_entry("SAP-000", "x"),
+                sap_entry("SAP-101", "docs/skilled-awareness/two")]
+
+        assert generate_sap.update_index_batch(saps, index_path=index)
+
+        content = index.read_text()
+        assert content.count("| SAP-100 |") == 1 and content.count("| SAP-101 |") == 1
+        assert content.index("| SAP-100 |") < content.index("| SAP-101 |") < content.index("**Awareness Score")
+        assert "**Current Coverage**: 4/4 SAPs (100%)" in content
+        assert "**4 capabilities**" in content
+        assert content.count("generated - Description of") == 2
+        assert not generate_sap.update_index_batch(saps, index_path=index)
@@ -0,0 +1,194 @@
+"""
+Tests for gitops-sync-registry.py
+
+Runs GitOpsSync against an in-memory etcd stand-in: batched transactions,
+delta sync of unchanged manifests, pruning of deleted manifests (and
+only those this sync wrote), and change-driven watch mode.
+"""
+
+import importlib.util
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "gitops_sync_registry",
+    Path(__file__).parent.parent / "scripts" / "gitops-sync-registry.py"
+)
+gitops_sync = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(gitops_sync)
+
+
+class LocalEtcd:
+    """In-memory stand-in for an etcd3 client (the calls GitOpsSync makes)"""
+
+    class transactions:
+        @staticmethod
+        def put(key, value):
+            return ("put", key, value)
+
+        @staticmethod
+        def delete(key, range_end=None):
+            return ("delete", key, range_end)
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+
+    def transaction(self, compare, success, failure):
+        self.round_trips += 1
+        assert len(success) <= gitops_sync.MAX_TXN_OPS
+        for op, key, value in success:
+            if op == "put":
+                self.data[key] = value
+            elif value is None:
+                self.data.pop(key, None)
+            else:
+                for existing in [k for k in self.data if key <= k < value]:
+                    del self.data[existing]
+        return True, []
+
+    def get_prefix(self, prefix, keys_only=False):
+        self.round_trips += 1
+        return [(key.encode("utf-8"), None) for key in sorted(self.data) if key.startswith(prefix)]
+
+    def namespaces(self):
+        return {key.split("/")[3] for key in self.data if key.startswith(gitops_sync.KEY_PREFIX)}
+
+
+def write_manifest(capabilities: Path, index: int, body: str = None):
+    path = capabilities / f"chora.test.cap_{index:03d}.yaml"
+    path.write_text(body or (
+        "metadata:\n"
+        f"  dc_identifier: chora.test.cap_{index:03d}\n"
+        f"  dc_title: Capability {index}\n"
+        "  dc_date: '2025-01-01'\n"
+        "chora_service:\n"
+        "  interface: cli\n"
+        "dc_relation:\n"
+        "  requires:\n"
+        "    - chora.test.cap_000\n"
+    ), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def registry(tmp_path):
+    capabilities = tmp_path / "capabilities"
+    capabilities.mkdir()
+    for i in range(70):
+        write_manifest(capabilities, i)
+    sync = gitops_sync.GitOpsSync(capabilities)
+    sync.etcd = LocalEtcd()
+    return sync
+
+
+class TestBatchedSync:
+    """Test transactional batched writes"""
+
+    def test_one_transaction_per_batch(self, registry):
+        assert registry.sync_all()
+
+        assert registry.stats["synced"] == 70
+        assert registry.stats["transactions"] == 3  # 25 + 25 + 20 capabilities
+        assert registry.etcd.round_trips == 4     # plus one key listing for prune
+        assert len(registry.etcd.data) == 70 * 5
+        assert registry.etcd.data["/chora/capabilities/chora.test.cap_005/type"] == "service"
+        assert registry.etcd.data["/chora/capabilities/chora.test.cap_005/managed_by"] == "gitops-sync"
+        dependencies = json.loads(registry.etcd.data["/chora/capabilities/chora.test.cap_005/dependencies"])
+        assert [dep["capability"] for dep in dependencies] == ["chora.test.cap_000"]
+
+    def test_unchanged_manifests_skip_etcd(self, registry):
+        registry.sync_all()
+        write_manifest(registry.capabilities_dir, 3, body=(
+            "metadata:\n  dc_identifier: chora.test.cap_003\n  dc_date: '2.0.0'\nchora_pattern: {}\n"
+        ))
+
+        assert registry.sync_all()
+        assert registry.stats["synced"] == 1
+        assert registry.stats["skipped"] == 69
+        assert registry.stats["transactions"] == 1
+        assert registry.etcd.data["/chora/capabilities/chora.test.cap_003/type"] == "pattern"
+
+
+class TestPrune:
+    """Test removal of keys for deleted manifests"""
+
+    def test_deleted_manifest_is_pruned(self, registry):
+        registry.etcd.data["/chora/other/key"] = "kept"
+        registry.sync_all()
+        (registry.capabilities_dir / "chora.test.cap_010.yaml").unlink()
+
+        assert registry.sync_all()
+
+        assert registry.stats["pruned"] == 1
+        assert "chora.test.cap_010" not in registry.etcd.namespaces()
+        assert len(registry.etcd.namespaces()) == 69
+        assert registry.etcd.data["/chora/other/key"] == "kept"
+
+    def test_keys_of_other_tools_are_kept(self, registry):
+        # Heartbeat health of a capability without a manifest, and an e2e fixture
+        foreign = {
+            "/chora/capabilities/chora.heartbeat.only/health": "ok",
+            "/chora/capabilities/chora.test.e2e/metadata": "{}",
+        }
+        registry.etcd.data.update(foreign)
+        registry.sync_all()
+        registry.etcd.data["/chora/capabilities/chora.test.cap_010/health"] = "ok"
+        (registry.capabilities_dir / "chora.test.cap_010.yaml").unlink()
+
+        assert registry.sync_all()
+
+        assert registry.stats["pruned"] == 1
+        for key, value in foreign.items():
+            assert registry.etcd.data[key] == value
+        # Only the keys the sync wrote are removed
+        assert [key for key in registry.etcd.data if "cap_010" in key] == [
+            "/chora/capabilities/chora.test.cap_010/health"
+        ]
+
+    def test_parse_errors_block_prune(self, registry):
+        registry.sync_all()
+        (registry.capabilities_dir / "chora.test.cap_010.yaml").unlink()
+        write_manifest(registry.capabilities_dir, 11, body="metadata: [unclosed\n")
+
+        assert not registry.sync_all()
+
+        assert registry.stats["pruned"] == 0
+        assert {"chora.test.cap_010", "chora.test.cap_011"} <= registry.etcd.namespaces()
+
+
+class TestWatch:
+    """Test change-driven watch mode"""
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_new_manifest_synced(self, registry, use_inotify):
+        timer = threading.Timer(0.2, write_manifest, args=(registry.capabilities_dir, 200))
+        timer.start()
+        try:
+            registry.watch(interval=0.3, use_inotify=use_inotify, max_cycles=4)
+        finally:
+            timer.cancel()
+
+        assert "chora.test.cap_200" in registry.etcd.namespaces()
+        assert len(registry.etcd.namespaces()) == 71
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_change_during_initial_sync_synced(self, registry, use_inotify):
+        sync_all = registry.sync_all
+        syncs = []
+
+        def initial_sync_then_write():
+            result = sync_all()
+            if not syncs:
+                write_manifest(registry.capabilities_dir, 201)
+            syncs.append(result)
+            return result
+
+        registry.sync_all = initial_sync_then_write
+        registry.watch(interval=0.3, use_inotify=use_inotify, max_cycles=2)
+
+        assert len(syncs) == 2
+        assert "chora.test.cap_201" in registry.etcd.namespaces()
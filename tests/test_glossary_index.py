@@ -0,0 +1,135 @@
+"""
+Tests for chora-search.py and glossary_index.py
+
+Tests that the compiled glossary index scores exactly like the per-entry
+loops it replaces, and that the persisted index is rebuilt only when the
+glossary changes.
+"""
+
+import difflib
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from glossary_index import GlossaryIndex, parse_glossary, trigrams
+
+spec = importlib.util.spec_from_file_location(
+    "chora_search",
+    Path(__file__).parent.parent / "scripts" / "chora-search.py"
+)
+chora_search = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(chora_search)
+
+GLOSSARY = Path(__file__).parent.parent / "docs" / "GLOSSARY.md"
+
+
+def naive_search(entries, query: str, fuzzy: bool) -> list[tuple[str, float]]:
+    """Reference forward scoring: every entry checked in turn."""
+    query_lower = query.lower()
+    results = []
+    for entry in entries:
+        aliases = [alias.lower() for alias in entry.aliases]
+        score = 0.0
+        if entry.term.lower() == query_lower or query_lower in aliases:
+            score = 1.0
+        elif query_lower in entry.term.lower():
+            score = 0.8
+        elif any(query_lower in alias for alias in aliases):
+            score = 0.7
+        elif query_lower in entry.definition.lower():
+            score = 0.6
+        elif fuzzy:
+            similarity = difflib.SequenceMatcher(None, query_lower, entry.term.lower()).ratio()
+            if similarity > 0.6:
+                score = 0.4 + (similarity - 0.6) * 0.5
+        if score > 0:
+            results.append((entry.term, score))
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results
+
+
+def naive_reverse(entries, description: str) -> dict[str, float]:
+    """Reference reverse scoring: word overlap with every definition and example."""
+    desc_words = set(description.lower().split())
+    results = {}
+    for entry in entries:
+        score = len(desc_words & set(entry.definition.lower().split())) / len(desc_words)
+        for example in entry.examples:
+            score = max(score, len(desc_words & set(example.lower().split())) / len(desc_words) * 1.2)
+        if score > 0.2:
+            results[entry.term] = score
+    return results
+
+
+class TestIndexedScoring:
+    """Test that indexed lookups match per-entry scoring"""
+
+    def test_forward_matches_naive(self):
+        entries = parse_glossary(GLOSSARY.read_text(encoding="utf-8"))
+        index = GlossaryIndex(entries)
+        queries = [entry.term for entry in entries] + [alias for entry in entries for alias in entry.aliases]
+        queries += ["coordenation", "awarness guide", "Capabilty charter", "memry", "sap", "ad", "x", ""]
+
+        for query in queries:
+            for fuzzy in (False, True):
+                indexed = [(entries[entry_id].term, score) for entry_id, score in index.search(query, fuzzy)]
+                assert indexed == naive_search(entries, query, fuzzy), (query, fuzzy)
+
+    def test_reverse_matches_naive(self):
+        entries = parse_glossary(GLOSSARY.read_text(encoding="utf-8"))
+        index = GlossaryIndex(entries)
+        descriptions = ["I want to suggest a big change", "record architecture decision",
+                        "test first development", "coordinate work between repos"]
+        descriptions += [entry.definition for entry in entries]
+
+        for description in descriptions:
+            results = index.reverse_search(description)
+            assert {entries[entry_id].term: score for entry_id, score in results} == \
+                naive_reverse(entries, description)
+            assert [score for _, score in results] == sorted((score for _, score in results), reverse=True)
+        assert index.reverse_search("   ") == []
+
+    def test_padded_trigrams_share_word_edges(self):
+        assert trigrams("abcd") == {"abc", "bcd"}
+        assert trigrams("abcd", padded=True) & trigrams("abxd", padded=True) == {"  a", " ab"}
+
+
+class TestPersistedIndex:
+    """Test the on-disk index and its invalidation"""
+
+    def test_rebuilt_only_when_glossary_changes(self, tmp_path, monkeypatch):
+        glossary = tmp_path / "GLOSSARY.md"
+        glossary.write_text(GLOSSARY.read_text(encoding="utf-8"), encoding="utf-8")
+        cache_file = tmp_path / "cache" / "glossary-index.json"
+
+        first = chora_search.GlossarySearch(glossary, cache_file=cache_file)
+        assert cache_file.exists()
+
+        def fail_build(*args, **kwargs):
+            raise AssertionError("index rebuilt for an unchanged glossary")
+
+        monkeypatch.setattr(GlossaryIndex, "build", fail_build)
+        cached = chora_search.GlossarySearch(glossary, cache_file=cache_file)
+        assert cached.entries == first.entries
+        assert [entry.term for entry in cached.get_related("RFC")] == \
+            [entry.term for entry in first.get_related("RFC")]
+        monkeypatch.undo()
+
+        glossary.write_text(
+            glossary.read_text(encoding="utf-8")
+            + "\n### Zettel\nA single atomic note.\n\n**Aliases:** note card\n",
+            encoding="utf-8"
+        )
+        os.utime(glossary, ns=(0, 0))
+        updated = chora_search.GlossarySearch(glossary, cache_file=cache_file)
+        assert updated.search("note card")[0][0].term == "Zettel"
+        assert len(updated.entries) == len(first.entries) + 1
+
+    def test_missing_glossary(self, tmp_path, capsys):
+        search = chora_search.GlossarySearch(tmp_path / "missing.md", cache_file=tmp_path / "index.json")
+        assert search.entries == []
+        assert search.search("anything", fuzzy=True) == []
+        assert "Glossary not found" in capsys.readouterr().out
@@ -0,0 +1,185 @@
+"""
+Tests for the inbox_generator package
+
+Tests the shared compiled-template cache and concurrent, dependency-aware
+artifact assembly, with AI-augmented fields served by a local fake model
+server.
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("jinja2")
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from inbox_generator.core.assembler import ArtifactAssembler
+from inbox_generator.core.config_loader import ConfigLoader, ContentElement
+from inbox_generator.generators import TemplateGenerator, compile_template, template_variables
+
+MODEL_DELAY = 0.4
+
+CONTEXT = {
+    "title": "Add dark mode",
+    "description": "Support a dark colour scheme",
+    "to_repo": "github.com/liminalcommons/chora-workspace",
+    "priority": "P2",
+    "urgency": "next_sprint",
+    "from_repo": "github.com/liminalcommons/chora-base",
+}
+
+
+class FakeMessagesHandler(BaseHTTPRequestHandler):
+    """Anthropic Messages API stand-in: answers after MODEL_DELAY with a JSON list"""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][0]["content"]
+        time.sleep(MODEL_DELAY)
+        self.server.prompts.append(prompt)
+        answer = json.dumps([f"item for {prompt.splitlines()[-1][:40]}"])
+        payload = json.dumps({
+            "id": "msg_test",
+            "type": "message",
+            "role": "assistant",
+            "model": body["model"],
+            "content": [{"type": "text", "text": f"```json\n{answer}\n```"}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 1, "output_tokens": 1},
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def model_server():
+    pytest.importorskip("anthropic")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeMessagesHandler)
+    server.prompts = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_assembler(content_dir: Path, server, **kwargs) -> ArtifactAssembler:
+    return ArtifactAssembler(
+        ConfigLoader(content_dir),
+        ai_model="claude-test",
+        ai_api_key="test-key",
+        ai_base_url=f"http://127.0.0.1:{server.server_address[1]}",
+        **kwargs
+    )
+
+
+def write_configs(content_dir: Path, elements_by_block: dict) -> None:
+    """Write content configs and an artifact config referencing them in order"""
+    content_dir.mkdir()
+    children = []
+    for order, (block_id, elements) in enumerate(elements_by_block.items(), start=1):
+        (content_dir / f"{block_id}.json").write_text(json.dumps({
+            "type": "content", "id": block_id, "metadata": {"version": "1.0"}, "elements": elements
+        }))
+        children.append({"id": block_id, "path": f"blocks/{block_id}.json", "order": order})
+    (content_dir / "test-artifact.json").write_text(json.dumps({
+        "type": "artifact",
+        "id": "test-artifact",
+        "metadata": {"outputs": [{"file": "out.json"}]},
+        "content": {"children": children},
+    }))
+
+
+class TestTemplateCache:
+    """Test compiled template reuse"""
+
+    def test_compiled_once_per_text(self):
+        source = "COORD-{{year}}-{{number}}"
+        assert compile_template(source) is compile_template(source)
+        assert template_variables("{% set now = metadata.today %}{{ title }}{{ now }}") == {"metadata", "title"}
+
+        generator = TemplateGenerator()
+        element = ContentElement(id="request_id_field", generation_pattern="template_fill", template=source)
+        assert generator.generate(element, {"year": "2025", "number": "005"}) == "COORD-2025-005"
+        assert not generator.validate_template("{{ unclosed")
+
+
+class TestConcurrentAssembly:
+    """Test concurrent generation against the fake model server"""
+
+    def test_ai_fields_take_slowest_field_time(self, model_server):
+        content_dir = REPO_ROOT / "inbox" / "content-blocks"
+        assembler = make_assembler(content_dir, model_server)
+
+        start = time.perf_counter()
+        artifact = assembler.assemble("coordination-request-artifact", CONTEXT, dry_run=True)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 2 * MODEL_DELAY
+        assert len(model_server.prompts) == 2
+        sequential = assembler.assemble("coordination-request-artifact", CONTEXT, dry_run=True, concurrency=1)
+        assert artifact == sequential
+        assert list(artifact) == list(sequential)
+        assert artifact["title"] == "Add dark mode"
+        assert isinstance(artifact["deliverables"], list)
+
+    def test_dependent_element_waits_for_its_input(self, tmp_path, model_server):
+        write_configs(tmp_path / "blocks", {
+            "summary": [{
+                "id": "summary_field",
+                "generation_pattern": "template_fill",
+                "template": "{{ title }}: {{ risks | join(', ') }}",
+            }],
+            "risks": [{
+                "id": "risks_field",
+                "generation_pattern": "ai_augmented",
+                "prompt_template": "List risks of {{ title }}",
+                "example_output": "[]",
+            }],
+            "title": [{"id": "title_field", "generation_pattern": "user_input"}],
+        })
+        assembler = make_assembler(tmp_path / "blocks", model_server)
+
+        artifact = assembler.assemble("test-artifact", {"title": "Dark mode"}, dry_run=True)
+
+        assert list(artifact) == ["summary", "risks", "title"]
+        assert artifact["risks"] == ["item for List risks of Dark mode"]
+        assert artifact["summary"] == "Dark mode: item for List risks of Dark mode"
+
+    def test_dependency_cycle_rejected(self, tmp_path, model_server):
+        write_configs(tmp_path / "blocks", {
+            "a": [{"id": "a_field", "generation_pattern": "template_fill", "template": "{{ b }}"}],
+            "b": [{"id": "b_field", "generation_pattern": "template_fill", "template": "{{ a }}"}],
+        })
+        assembler = make_assembler(tmp_path / "blocks", model_server)
+
+        with pytest.raises(ValueError, match="Circular"):
+            assembler.assemble("test-artifact", {}, dry_run=True)
+        # A value supplied in the context breaks the dependency
+        assert assembler.assemble("test-artifact", {"a": "x"}, dry_run=True) == {"a": "x", "b": "x"}
+
+    def test_required_failure_and_optional_failure(self, tmp_path, model_server, capsys):
+        write_configs(tmp_path / "blocks", {
+            "note": [{"id": "note_field", "generation_pattern": "user_input", "required": False}],
+            "title": [{"id": "title_field", "generation_pattern": "user_input"}],
+        })
+        assembler = make_assembler(tmp_path / "blocks", model_server)
+
+        assert assembler.assemble("test-artifact", {"title": "T"}, dry_run=True) == {"title": "T"}
+        assert "optional element 'note_field'" in capsys.readouterr().out
+        with pytest.raises(RuntimeError, match="required element 'title_field'"):
+            assembler.assemble("test-artifact", {}, dry_run=True)
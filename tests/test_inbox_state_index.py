@@ -0,0 +1,132 @@
+"""
+Tests for inbox_state_index.py
+
+Tests the materialized item_id -> status/ack projection of the coordination
+event log and its incremental refresh.
+"""
+
+import sys
+import json
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from inbox_state_index import InboxStateIndex, RECENT_EVENTS_LIMIT
+
+
+def append_events(events_file: Path, *events):
+    """Append events to a JSONL log"""
+    with open(events_file, "a", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+@pytest.fixture
+def events_file(tmp_path) -> Path:
+    coordination = tmp_path / "inbox" / "coordination"
+    coordination.mkdir(parents=True)
+    return coordination / "events.jsonl"
+
+
+class TestFolding:
+    """Test status and acknowledgment projection"""
+
+    def test_latest_status_wins(self, events_file):
+        append_events(
+            events_file,
+            {"event_type": "coordination_request_created", "request_id": "COORD-1", "timestamp": "2025-01-01T00:00:00"},
+            {"event_type": "accepted", "request_id": "COORD-1", "timestamp": "2025-01-02T00:00:00"},
+            {"event_type": "checkpoint", "request_id": "COORD-1", "timestamp": "2025-01-03T00:00:00"},
+            {"event_type": "in_progress", "request_id": "COORD-1", "timestamp": "2025-01-04T00:00:00"},
+        )
+        index = InboxStateIndex(events_file)
+
+        assert index.get_status("COORD-1") == "in_progress"
+        assert index.is_acknowledged("COORD-1")
+        assert index.get_item("COORD-1")["event_count"] == 4
+
+    def test_unknown_item(self, events_file):
+        append_events(events_file, {"event_type": "created", "request_id": "COORD-1"})
+        index = InboxStateIndex(events_file)
+
+        assert index.get_status("COORD-404") == "unknown"
+        assert not index.is_acknowledged("COORD-404")
+
+    def test_missing_log(self, events_file):
+        index = InboxStateIndex(events_file)
+        assert index.get_status("COORD-1") == "unknown"
+        assert index.recent_events() == []
+
+
+class TestIncrementalRefresh:
+    """Test offset-based incremental updates"""
+
+    def test_only_new_events_applied(self, events_file):
+        append_events(events_file, {"event_type": "acknowledged", "request_id": "COORD-1"})
+        assert InboxStateIndex(events_file).refresh() == 1
+
+        append_events(events_file, {"event_type": "blocked", "request_id": "COORD-1"})
+        index = InboxStateIndex(events_file)  # reloads persisted offset
+        assert index.refresh() == 1
+        assert index.get_status("COORD-1") == "blocked"
+        assert index.refresh() == 0
+
+    def test_partial_line_deferred(self, events_file):
+        append_events(events_file, {"event_type": "accepted", "request_id": "COORD-1"})
+        with open(events_file, "a", encoding="utf-8") as f:
+            f.write('{"event_type": "completed", "request_id": "COO')
+
+        index = InboxStateIndex(events_file)
+        assert index.get_status("COORD-1") == "accepted"
+
+        with open(events_file, "a", encoding="utf-8") as f:
+            f.write('RD-1"}\n')
+        assert index.get_status("COORD-1") == "completed"
+
+    def test_truncated_log_rebuilds(self, events_file):
+        append_events(events_file, {"event_type": "accepted", "request_id": "COORD-1"})
+        InboxStateIndex(events_file).refresh()
+
+        events_file.write_text("")
+        append_events(events_file, {"event_type": "declined", "request_id": "COORD-2"})
+        index = InboxStateIndex(events_file)
+
+        assert index.get_item("COORD-1") is None
+        assert index.get_status("COORD-2") == "declined"
+
+    def test_log_growing_past_prefix_stays_incremental(self, events_file):
+        append_events(events_file, {"event_type": "accepted", "request_id": "COORD-1", "pad": "x" * 3000})
+        InboxStateIndex(events_file).refresh()
+
+        append_events(events_file, {"event_type": "blocked", "request_id": "COORD-1", "pad": "x" * 3000})
+        assert InboxStateIndex(events_file).refresh() == 1
+
+        append_events(events_file, {"event_type": "completed", "request_id": "COORD-1"})
+        index = InboxStateIndex(events_file)
+        assert index.refresh() == 1
+        assert index.get_item("COORD-1")["event_count"] == 3
+
+
+class TestRecentEvents:
+    """Test the newest-events window used by inbox-status"""
+
+    def test_newest_first(self, events_file):
+        append_events(
+            events_file,
+            {"event_type": "a", "timestamp": "2025-01-02T00:00:00"},
+            {"event_type": "b", "timestamp": "2025-01-03T00:00:00"},
+            {"event_type": "c", "timestamp": "2025-01-01T00:00:00"},
+        )
+        recent = InboxStateIndex(events_file).recent_events(last_n=2)
+        assert [e["event_type"] for e in recent] == ["b", "a"]
+
+    def test_window_exceeded_falls_back(self, events_file):
+        append_events(events_file, *[
+            {"event_type": "tick", "timestamp": f"2025-01-01T00:{i // 60:02d}:{i % 60:02d}"}
+            for i in range(RECENT_EVENTS_LIMIT + 5)
+        ])
+        index = InboxStateIndex(events_file)
+
+        assert len(index.recent_events(last_n=RECENT_EVENTS_LIMIT)) == RECENT_EVENTS_LIMIT
+        assert index.recent_events(last_n=RECENT_EVENTS_LIMIT + 1) is None
@@ -820,6 +820,51 @@ def test_colors_class_attributes(self):
         assert hasattr(install_sap.Colors, 'NC')
 
 
+#############################################################################
+# Installation Planning Tests
+#############################################################################
+
+@pytest.mark.sets
+class TestInstallPlanning:
+    """Tests for dependency-level planning and parallel installation."""
+
+    def test_plan_levels_include_transitive_dependencies(self, mock_catalog):
+        """Test that dependencies outside the requested SAPs are planned first."""
+        plan = install_sap.plan_installation(['SAP-004', 'SAP-001'], mock_catalog)
+
+        assert plan.levels == [['SAP-000', 'SAP-001'], ['SAP-004']]
+        assert plan.dependencies['SAP-004'] == ['SAP-000']
+        assert plan.critical_path() == ['SAP-000', 'SAP-004']
+        assert plan.missing == []
+
+    def test_plan_reports_missing_and_cycles(self):
+        """Test that unknown SAPs and dependency cycles don't break planning."""
+        catalog = {'saps': [
+            {'id': 'SAP-A', 'dependencies': ['SAP-B', 'SAP-X']},
+            {'id': 'SAP-B', 'dependencies': ['SAP-A']},
+        ]}
+
+        plan = install_sap.plan_installation(['SAP-A'], catalog)
+
+        assert plan.levels == [['SAP-B'], ['SAP-A']]
+        assert plan.missing == ['SAP-X']
+        assert plan.cycles == [('SAP-B', 'SAP-A')]
+
+    def test_parallel_set_install(self, temp_source_dir, temp_target_dir, captured_output):
+        """Test installing independent SAPs of a level concurrently."""
+        install_sap.stats = InstallStats()
+        catalog = load_catalog(temp_source_dir)
+
+        success = install_sap_set('test-minimal', temp_source_dir, temp_target_dir, catalog, jobs=2)
+
+        assert success is True
+        assert install_sap.stats.saps_installed == 2
+        assert (temp_target_dir / 'docs/skilled-awareness/sap-framework').exists()
+        assert (temp_target_dir / 'inbox/INBOX_PROTOCOL.md').exists()
+        output = ' '.join(captured_output)
+        assert 'Install plan' in output
+        assert '2 workers' in output
+
 #############################################################################
 # Pytest Configuration
 #############################################################################
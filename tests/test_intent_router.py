@@ -0,0 +1,104 @@
+"""
+Tests for intent-router.py and intent_matcher.py
+
+Tests that the compiled trigger matcher scores exactly like the per-trigger
+loop it replaces, plus top-k routing and buffered usage logging.
+"""
+
+import importlib.util
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from intent_matcher import AhoCorasick, CompiledIntentMatcher, overlap_score
+
+spec = importlib.util.spec_from_file_location(
+    "intent_router",
+    Path(__file__).parent.parent / "scripts" / "intent-router.py"
+)
+intent_router = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(intent_router)
+
+
+def naive_confidence(user_input: str, triggers: list[str]) -> float:
+    """Reference scoring: every trigger checked in turn."""
+    max_score = 0.0
+    for trigger in triggers:
+        trigger_lower = trigger.lower()
+        if user_input == trigger_lower:
+            return 1.0
+        if trigger_lower in user_input:
+            max_score = max(max_score, 0.9)
+            continue
+        trigger_words = set(trigger_lower.split())
+        if trigger_words:
+            overlap = len(set(user_input.split()) & trigger_words)
+            max_score = max(max_score, overlap_score(overlap / len(trigger_words)))
+    return max_score
+
+
+@pytest.fixture
+def router(tmp_path):
+    """Router with the built-in default patterns."""
+    return intent_router.IntentRouter(tmp_path / "INTENT_PATTERNS.yaml")
+
+
+class TestAhoCorasick:
+    """Test multi-keyword containment"""
+
+    def test_matches_substring_search(self):
+        keywords = ["he", "she", "his", "hers", "", "s h"]
+        automaton = AhoCorasick(keywords)
+
+        for text in ["ushers", "this is h", "", "s he", "xyz"]:
+            assert automaton.find(text) == {i for i, k in enumerate(keywords) if k in text}
+
+
+class TestCompiledMatcher:
+    """Test compiled scoring against the naive loop"""
+
+    def test_scores_match_naive_loop(self, router):
+        triggers = [p.triggers for p in router.patterns]
+        matcher = CompiledIntentMatcher(triggers)
+        vocab = sorted({w for ts in triggers for t in ts for w in t.split()}) + ["sap-4", "please", "i"]
+        rng = random.Random(7)
+        inputs = [t for ts in triggers for t in ts] + [
+            " ".join(rng.choice(vocab) for _ in range(rng.randint(1, 6))) for _ in range(500)
+        ]
+
+        for user_input in inputs:
+            expected = {i: naive_confidence(user_input, ts) for i, ts in enumerate(triggers)}
+            assert matcher.score(user_input) == {i: s for i, s in expected.items() if s > 0}
+
+
+class TestRouting:
+    """Test IntentRouter on top of the compiled matcher"""
+
+    def test_route_ranks_and_extracts_parameters(self, router):
+        matches = router.route("Deep dive SAP 4")
+
+        assert matches[0].action == "run_sap_evaluator_deep"
+        assert matches[0].confidence == 0.9
+        assert matches[0].parameters == {"mode": "deep", "sap_id": "SAP-004"}
+        assert [m.confidence for m in matches] == sorted((m.confidence for m in matches), reverse=True)
+
+    def test_top_k_and_usage_log(self, router):
+        full = router.route("check sap status")
+        top = router.route("check sap status", top_k=1)
+
+        assert top == full[:1]
+        log = router.usage_log
+        assert len(log) == 2
+        assert log[1]["all_matches"] == len(full)
+        assert log[1]["top_match"]["action"] == top[0].action
+
+    def test_learned_trigger_recompiles(self, router):
+        assert router.route("ping the inbox please")[0].confidence < 1.0
+
+        router.learn_pattern("ping the inbox please", "run_inbox_status")
+
+        assert router.route("ping the inbox please")[0].confidence == 1.0
@@ -0,0 +1,134 @@
+"""
+Tests for link_graph_store.py
+
+Tests that the streamed JSON Lines graph holds exactly what
+build_link_graph() produces, and the memory-mapped neighbor, inbound and
+broken-link queries used by validate-links.py --graph.
+"""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from link_graph_store import LinkGraphReader, LinkGraphWriter
+
+
+def load_script(module_name: str, filename: str):
+    """Import a hyphenated script as a module"""
+    spec = importlib.util.spec_from_file_location(module_name, REPO_ROOT / "scripts" / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+export_link_graph = load_script("link_graph_export", "export-link-graph.py")
+validate_links = load_script("validate_links", "validate-links.py")
+
+
+@pytest.fixture
+def docs_tree(tmp_path, monkeypatch):
+    """Docs tree with a hub, broken links and a sibling directory sharing a prefix"""
+    docs = tmp_path / "docs"
+    (docs / "guide").mkdir(parents=True)
+    (docs / "guide-old").mkdir()
+    (docs / "README.md").write_text("# Hub\n\n[guide](guide/a.md)\n", encoding="utf-8")
+    (docs / "guide" / "a.md").write_text(
+        "[home](../README.md)\n[b](b.md) [b again](./b.md)\n[gone](missing.md)\n"
+        "[site](https://example.com)\n",
+        encoding="utf-8"
+    )
+    (docs / "guide" / "b.md").write_text("[home](../README.md)\n", encoding="utf-8")
+    (docs / "guide-old" / "c.md").write_text("[gone](nowhere.md)\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestStreamedExport:
+    """Test stream_link_graph against the in-memory graph"""
+
+    def test_matches_build_link_graph(self, docs_tree):
+        graph = export_link_graph.build_link_graph(paths=["docs/"], validate=True)
+        summary = export_link_graph.stream_link_graph("graph.jsonl", paths=["docs/"], validate=True)
+
+        assert summary["statistics"] == graph["statistics"]
+        assert summary["broken_links"] == graph["broken_links"]
+        with LinkGraphReader("graph.jsonl") as reader:
+            assert reader.metadata["validation_enabled"] is True
+            assert list(reader.edges()) == graph["edges"]
+            assert {node["path"]: node for node in reader.nodes()} == graph["nodes"]
+            assert reader.summary["top_hubs"] == graph["top_hubs"]
+            assert reader.summary["orphaned_files"] == graph["orphaned_files"]
+
+    def test_broken_links_none_without_validation(self, docs_tree):
+        graph = export_link_graph.build_link_graph(paths=["docs/"])
+        summary = export_link_graph.stream_link_graph("graph.jsonl", paths=["docs/"])
+
+        assert summary["broken_links"] is None
+        assert summary["broken_links"] == graph["broken_links"]
+
+
+class TestQueries:
+    """Test memory-mapped lookups"""
+
+    def test_neighbors_inbound_and_broken(self, docs_tree):
+        export_link_graph.stream_link_graph("graph.jsonl", paths=["docs/"], validate=True)
+
+        with LinkGraphReader("graph.jsonl") as graph:
+            assert graph.neighbors("docs/guide/a.md") == ["docs/README.md", "docs/guide/b.md", "docs/guide/missing.md"]
+            assert [e["source"] for e in graph.inbound("docs/README.md")] == ["docs/guide/a.md", "docs/guide/b.md"]
+            assert graph.node("docs/guide/b.md")["inbound_links"] == 2
+            assert graph.node("docs/nope.md") is None
+            assert graph.outbound("docs/nope.md") == []
+
+            assert [b["source"] for b in graph.broken_links("docs/guide")] == ["docs/guide/a.md"]
+            assert [b["source"] for b in graph.broken_links()] == ["docs/guide-old/c.md", "docs/guide/a.md"]
+            assert [n["path"] for n in graph.nodes("docs/guide/")] == ["docs/guide/a.md", "docs/guide/b.md"]
+
+    def test_writer_order_and_legacy_file(self, docs_tree):
+        result = {"node": {"path": "b.md", "inbound_links": 0}, "edges": [], "broken_links": []}
+        with pytest.raises(ValueError):
+            with LinkGraphWriter("graph.jsonl", {}) as writer:
+                writer.add_file(result)
+                writer.add_file(dict(result, node={"path": "a.md", "inbound_links": 0}))
+        assert not Path("graph.jsonl").exists()
+        assert not Path("graph.jsonl.tmp").exists()
+
+        Path("link-graph.json").write_text(json.dumps({"nodes": {}}, indent=2))
+        with pytest.raises(ValueError):
+            LinkGraphReader("link-graph.json")
+
+
+class TestValidateLinksFromGraph:
+    """Test validate-links.py --graph"""
+
+    def test_reports_broken_links_under_path(self, docs_tree):
+        export_link_graph.stream_link_graph("graph.jsonl", paths=["docs/"], validate=True)
+
+        data = validate_links.validate_links_from_graph("graph.jsonl", "docs/guide")
+
+        assert data["files_scanned"] == 2
+        assert data["links_checked"] == 5
+        assert data["broken_count"] == 1
+        assert data["results"][0]["broken_links"][0]["link_url"] == "missing.md"
+
+    def test_absolute_search_path(self, docs_tree):
+        export_link_graph.stream_link_graph("graph.jsonl", paths=["docs/"], validate=True)
+
+        data = validate_links.validate_links_from_graph("graph.jsonl", str(docs_tree / "docs" / "guide"))
+        assert data["files_scanned"] == 2
+        assert data["broken_count"] == 1
+
+        with pytest.raises(ValueError, match="outside the link graph root"):
+            validate_links.validate_links_from_graph("graph.jsonl", str(docs_tree.parent))
+
+    def test_requires_validated_graph(self, docs_tree):
+        export_link_graph.stream_link_graph("graph.jsonl", paths=["docs/"])
+
+        with pytest.raises(ValueError):
+            validate_links.validate_links_from_graph("graph.jsonl")
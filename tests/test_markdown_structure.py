@@ -0,0 +1,146 @@
+"""
+Tests for utils/markdown_structure.py
+
+Tests the single-pass parse (frontmatter, headings, outline, line counts),
+the per-file cache, and that the awareness validators share one read.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import markdown_structure
+from utils.awareness_validation import AwarenessFileValidator
+from utils.markdown_structure import MarkdownStructure, clear_cache, read_markdown
+
+DOCUMENT = """---
+sap_id: SAP-009
+# not a heading
+---
+
+# Title
+
+Intro text.
+
+## Quick Start
+
+### Workflow 1: Install
+
+```bash
+# a shell comment
+```
+
+### Workflow 2: Validate
+
+## Reference
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+class TestMarkdownStructure:
+    """Test what a single pass records"""
+
+    def test_frontmatter(self):
+        structure = MarkdownStructure(DOCUMENT)
+        assert structure.frontmatter == {"sap_id": "SAP-009"}
+        assert MarkdownStructure("# No frontmatter\n").frontmatter is None
+        assert MarkdownStructure("---\n- a list\n---\n").frontmatter is None
+
+    def test_frontmatter_closing_line(self):
+        # Trailing whitespace on the closing line, or no newline after it
+        structure = MarkdownStructure("---\nkey: v\n--- \n# T\n")
+        assert structure.frontmatter == {"key": "v"}
+        assert [(h.title, h.fenced) for h in structure.headings] == [("T", False)]
+        assert MarkdownStructure("---\nkey: v\n---").frontmatter == {"key": "v"}
+        assert MarkdownStructure("---\nkey: v\n").frontmatter is None
+
+    def test_invalid_frontmatter_raises(self):
+        with pytest.raises(yaml.YAMLError):
+            MarkdownStructure("---\nkey: [unclosed\n---\n# Title\n").frontmatter
+
+    def test_headings_flag_frontmatter_and_fences(self):
+        structure = MarkdownStructure(DOCUMENT)
+        assert [(h.level, h.title, h.fenced) for h in structure.headings] == [
+            (1, "not a heading", True),
+            (1, "Title", False),
+            (2, "Quick Start", False),
+            (3, "Workflow 1: Install", False),
+            (1, "a shell comment", True),
+            (3, "Workflow 2: Validate", False),
+            (2, "Reference", False),
+        ]
+        assert structure.headings[1].line == 6
+
+    def test_outline_nests_body_headings(self):
+        outline = MarkdownStructure(DOCUMENT).outline
+        assert [h.title for h in outline] == ["Title"]
+        assert [h.title for h in outline[0].children] == ["Quick Start", "Reference"]
+        assert [h.title for h in outline[0].children[0].children] == [
+            "Workflow 1: Install", "Workflow 2: Validate"
+        ]
+
+    def test_line_counts(self):
+        structure = MarkdownStructure(DOCUMENT)
+        assert structure.line_count == len(DOCUMENT.splitlines())
+        assert structure.nonblank_line_count == sum(1 for line in DOCUMENT.splitlines() if line.strip())
+        assert structure.token_estimate == len(DOCUMENT) // 4
+        assert "".join(structure.lines_with_endings()) == DOCUMENT
+        assert MarkdownStructure("a\nb").lines_with_endings() == ["a\n", "b"]
+
+
+class TestReadMarkdown:
+    """Test the per-file cache"""
+
+    def test_unchanged_file_reused(self, tmp_path):
+        path = tmp_path / "AGENTS.md"
+        path.write_text(DOCUMENT, encoding="utf-8")
+        assert read_markdown(path) is read_markdown(path)
+
+    def test_changed_file_reparsed(self, tmp_path):
+        path = tmp_path / "AGENTS.md"
+        path.write_text(DOCUMENT, encoding="utf-8")
+        first = read_markdown(path)
+
+        path.write_text(DOCUMENT + "\n## Appendix\n", encoding="utf-8")
+        second = read_markdown(path)
+        assert second is not first
+        assert second.headings[-1].title == "Appendix"
+
+    def test_cache_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(markdown_structure, "MAX_CACHED_FILES", 2)
+        paths = []
+        for i in range(3):
+            paths.append(tmp_path / f"{i}.md")
+            paths[-1].write_text(f"# {i}\n", encoding="utf-8")
+            read_markdown(paths[-1])
+        assert list(markdown_structure._cache) == [p.resolve() for p in paths[1:]]
+
+    def test_validators_share_one_read(self, tmp_path, monkeypatch):
+        path = tmp_path / "AGENTS.md"
+        path.write_text(DOCUMENT, encoding="utf-8")
+
+        reads = []
+        read_text = Path.read_text
+
+        def counting(self, *args, **kwargs):
+            reads.append(self)
+            return read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting)
+
+        validator = AwarenessFileValidator(tmp_path)
+        assert validator.extract_yaml_frontmatter(path) == {"sap_id": "SAP-009"}
+        assert validator.extract_sections(path) == ["Quick Start", "Reference"]
+        assert validator.extract_workflows(path) == ["Install", "Validate"]
+        assert validator.count_lines(path) == 13
+        assert reads == [path]
@@ -0,0 +1,133 @@
+"""
+Tests for registry_snapshot.py
+
+Tests the compiled capability registry snapshot: indexes, normalized
+dependency graph, and incremental re-parsing of changed manifests.
+"""
+
+import sys
+import os
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from registry_snapshot import RegistrySnapshot, load_registry_snapshot, normalize_requires
+
+
+REGISTRY_MANIFEST = """\
+metadata:
+  dc_identifier: chora.devex.registry
+  dc_identifier_legacy: SAP-044
+  dc_type: Service
+dc_relation:
+  requires:
+    - chora.devex.bootstrap
+    - capability: chora.infrastructure.etcd
+      relationship: runtime
+      version: ">=3.5"
+"""
+
+BOOTSTRAP_MANIFEST = """\
+metadata:
+  dc_identifier: chora.devex.bootstrap
+  dc_type: Pattern
+"""
+
+
+@pytest.fixture
+def capabilities_dir(tmp_path) -> Path:
+    capabilities = tmp_path / "capabilities"
+    capabilities.mkdir()
+    (capabilities / "chora.devex.registry.yaml").write_text(REGISTRY_MANIFEST)
+    (capabilities / "chora.devex.bootstrap.yml").write_text(BOOTSTRAP_MANIFEST)
+    return capabilities
+
+
+class TestIndexes:
+    """Test indexes and dependency graph built from manifests"""
+
+    def test_indexes(self, capabilities_dir):
+        snapshot = load_registry_snapshot(capabilities_dir)
+
+        assert [p.name for p in snapshot.paths()] == ["chora.devex.registry.yaml", "chora.devex.bootstrap.yml"]
+        assert snapshot.namespace_index["chora.devex.bootstrap"] == "chora.devex.bootstrap.yml"
+        assert snapshot.legacy_index == {"SAP-044": "chora.devex.registry"}
+        assert snapshot.manifest("chora.devex.registry")["metadata"]["dc_type"] == "Service"
+
+    def test_dependency_graph_normalized(self, capabilities_dir):
+        snapshot = load_registry_snapshot(capabilities_dir)
+
+        assert snapshot.dependency_graph["chora.devex.registry"] == [
+            {"capability": "chora.devex.bootstrap", "relationship": "prerequisite", "version": "*"},
+            {"capability": "chora.infrastructure.etcd", "relationship": "runtime", "version": ">=3.5"},
+        ]
+        assert snapshot.dependency_graph["chora.devex.bootstrap"] == []
+        assert normalize_requires({"dc_relation": {"requires": [42, {}]}}) == [
+            {"invalid": "42"},
+            {"capability": None, "relationship": "prerequisite", "version": "*"},
+        ]
+
+
+class TestIncrementalRefresh:
+    """Test that only changed manifests are re-parsed"""
+
+    def test_unchanged_manifests_not_reparsed(self, capabilities_dir):
+        assert RegistrySnapshot(capabilities_dir).refresh() == 2
+
+        snapshot = RegistrySnapshot(capabilities_dir)
+        assert snapshot.refresh() == 0
+        assert snapshot.legacy_index == {"SAP-044": "chora.devex.registry"}
+
+    def test_touched_manifest_matched_by_hash(self, capabilities_dir):
+        load_registry_snapshot(capabilities_dir)
+        path = capabilities_dir / "chora.devex.bootstrap.yml"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert RegistrySnapshot(capabilities_dir).refresh() == 0
+
+    def test_changed_and_removed_manifests(self, capabilities_dir):
+        load_registry_snapshot(capabilities_dir)
+        (capabilities_dir / "chora.devex.registry.yaml").write_text(
+            REGISTRY_MANIFEST.replace("SAP-044", "SAP-045") + "# edited\n"
+        )
+        (capabilities_dir / "chora.devex.bootstrap.yml").unlink()
+
+        snapshot = RegistrySnapshot(capabilities_dir)
+        assert snapshot.refresh() == 1
+        assert snapshot.legacy_index == {"SAP-045": "chora.devex.registry"}
+        assert "chora.devex.bootstrap" not in snapshot.namespace_index
+
+    def test_parse_errors_reported_every_refresh(self, capabilities_dir):
+        (capabilities_dir / "broken.yaml").write_text("metadata: [unclosed\n")
+
+        parsed = []
+        messages = []
+        for _ in range(2):
+            snapshot = RegistrySnapshot(capabilities_dir)
+            parsed.append(snapshot.refresh())
+            entry = snapshot.entry(capabilities_dir / "broken.yaml")
+            assert entry["manifest"] is None
+            assert entry["error"]["kind"] == "yaml"
+            messages.append(entry["error"]["message"])
+
+        # The failure is cached under the manifest's fingerprint
+        assert parsed == [3, 0]
+        assert messages[0] == messages[1]
+        assert str(capabilities_dir / "broken.yaml") in messages[0]
+
+        (capabilities_dir / "broken.yaml").write_text("metadata:\n  dc_identifier: chora.devex.fixed\n")
+        snapshot = RegistrySnapshot(capabilities_dir)
+        assert snapshot.refresh() == 1
+        assert snapshot.namespace_index["chora.devex.fixed"] == "broken.yaml"
+
+    def test_non_json_manifest_reparsed_from_yaml(self, capabilities_dir):
+        path = capabilities_dir / "chora.devex.dated.yaml"
+        path.write_text("metadata:\n  dc_identifier: chora.devex.dated\n  dc_date: 2025-11-15\n")
+        load_registry_snapshot(capabilities_dir)
+
+        snapshot = RegistrySnapshot(capabilities_dir)
+        assert snapshot.refresh() == 0
+        assert str(snapshot.entry(path)["manifest"]["metadata"]["dc_date"]) == "2025-11-15"
+        assert snapshot.manifest("chora.devex.dated")["metadata"]["dc_date"].year == 2025
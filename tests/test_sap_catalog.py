@@ -0,0 +1,94 @@
+"""
+Tests for utils/sap_catalog.py
+
+Tests the indexed SAP catalog: lookups, derived dependency views, and
+memoized loading of sap-catalog.json.
+"""
+
+import json
+import os
+import pytest
+from pathlib import Path
+
+from utils.sap_catalog import SAPCatalog, load_sap_catalog
+
+
+CATALOG = {
+    "version": "5.0.0",
+    "saps": [
+        {"id": "SAP-000", "name": "sap-framework", "domain": "Foundation", "dependencies": []},
+        {"id": "SAP-010", "name": "memory-system", "domain": "Developer Experience", "dependencies": ["SAP-000"]},
+        {"id": "SAP-015", "name": "task-tracking", "domain": "Developer Experience",
+         "dependencies": ["SAP-000", "SAP-010"]},
+        {"id": "SAP-098", "name": "cycle-a", "dependencies": ["SAP-099"]},
+        {"id": "SAP-099", "name": "cycle-b", "dependencies": ["SAP-098", "SAP-404"]},
+    ],
+    "synergies": [
+        {"name": "memory-tasks", "saps": ["SAP-010", "SAP-015"]},
+    ],
+}
+
+
+@pytest.fixture
+def catalog_path(tmp_path) -> Path:
+    path = tmp_path / "sap-catalog.json"
+    path.write_text(json.dumps(CATALOG))
+    aliases = tmp_path / "capabilities" / "alias-mapping.json"
+    aliases.parent.mkdir()
+    aliases.write_text(json.dumps({"aliases": {"SAP-010": {"namespace": "chora.awareness.memory_system"}}}))
+    return path
+
+
+class TestIndexes:
+    """Test hash-indexed lookups"""
+
+    def test_lookups(self, catalog_path):
+        catalog = load_sap_catalog(catalog_path)
+
+        assert catalog["version"] == "5.0.0"
+        assert catalog.get_sap("SAP-015")["name"] == "task-tracking"
+        assert catalog.get_sap("SAP-404") is None
+        assert catalog.lookup("memory-system")["id"] == "SAP-010"
+        assert catalog.lookup("chora.awareness.memory_system")["id"] == "SAP-010"
+        assert [sap["id"] for sap in catalog.by_domain["Developer Experience"]] == ["SAP-010", "SAP-015"]
+        assert [s["name"] for s in catalog.members_of("synergies", "SAP-015")] == ["memory-tasks"]
+
+    def test_dependency_views(self, catalog_path):
+        catalog = load_sap_catalog(catalog_path)
+
+        assert catalog.dependents_of("SAP-000") == ["SAP-010", "SAP-015"]
+        assert catalog.transitive_dependencies("SAP-015") == ["SAP-000", "SAP-010"]
+        assert catalog.transitive_dependencies("SAP-098") == ["SAP-404", "SAP-099"]
+
+    def test_legacy_formats(self):
+        by_key = SAPCatalog({"SAP-001": {"name": "inbox"}})
+        assert by_key.get_sap("SAP-001") == {"name": "inbox"}
+        assert SAPCatalog({"saps": {"SAP-002": {"name": "x"}}}).get_sap("SAP-002") == {"name": "x"}
+
+
+class TestLoading:
+    """Test memoized loading"""
+
+    def test_reused_until_file_changes(self, catalog_path):
+        first = load_sap_catalog(catalog_path)
+        assert load_sap_catalog(catalog_path) is first
+
+        updated = dict(CATALOG, version="5.1.0")
+        catalog_path.write_text(json.dumps(updated) + "\n")
+        stat = catalog_path.stat()
+        os.utime(catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = load_sap_catalog(catalog_path)
+        assert second is not first
+        assert second["version"] == "5.1.0"
+
+    def test_array_format_and_errors(self, tmp_path):
+        path = tmp_path / "sap-catalog.json"
+        path.write_text(json.dumps([{"id": "SAP-001"}]))
+        assert load_sap_catalog(path).get_sap("SAP-001") == {"id": "SAP-001"}
+
+        path.write_text("{not json")
+        with pytest.raises(json.JSONDecodeError):
+            load_sap_catalog(path)
+        with pytest.raises(FileNotFoundError):
+            load_sap_catalog(tmp_path / "missing.json")
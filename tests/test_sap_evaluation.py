@@ -645,6 +645,59 @@ def test_deep_dive_well_integrated(self, evaluator, temp_workspace, mock_sap_art
         assert result.current_level == 2  # No P0 gaps
 
 
+# ============================================================================
+# Evaluation Engine Tests
+# ============================================================================
+
+class TestEvaluationEngine:
+    """Test concurrent evaluation and the deep-dive result cache."""
+
+    @patch.object(SAPEvaluator, 'run_validation_command')
+    def test_deep_dive_cached_until_sap_changes(self, mock_cmd, evaluator, temp_workspace, mock_sap_artifacts):
+        """Test that unchanged SAPs are served from cache across evaluators."""
+        mock_cmd.return_value = (True, "TOTAL  50%")
+        first = evaluator.deep_dive("SAP-004")
+        assert mock_cmd.call_count == 1
+
+        cached = SAPEvaluator(repo_root=temp_workspace).deep_dive("SAP-004")
+        assert mock_cmd.call_count == 1
+        assert cached == first
+
+        (mock_sap_artifacts / "ledger.md").write_text("# ledger.md\n\nUpdated content")
+        SAPEvaluator(repo_root=temp_workspace).deep_dive("SAP-004")
+        assert mock_cmd.call_count == 2
+
+        SAPEvaluator(repo_root=temp_workspace, use_cache=False).deep_dive("SAP-004")
+        assert mock_cmd.call_count == 3
+
+    @patch.object(SAPEvaluator, 'run_validation_command')
+    def test_evaluate_many_keeps_order(self, mock_cmd, evaluator, mock_sap_artifacts):
+        """Test that concurrent results come back in input order."""
+        mock_cmd.return_value = (True, "TOTAL  90%")
+
+        results = evaluator.evaluate_many(["SAP-009", "SAP-004", "SAP-404"])
+
+        assert [r.sap_id for r in results] == ["SAP-009", "SAP-004", "SAP-404"]
+        assert results[1].evaluation_type == "deep"
+        with pytest.raises(ValueError):
+            evaluator.evaluate_many(["SAP-004"], mode="strategic")
+
+    def test_evaluate_many_return_exceptions(self, evaluator):
+        """Test that one failing SAP does not abort the batch."""
+        with patch.object(SAPEvaluator, 'quick_check', side_effect=[RuntimeError("boom")] * 2):
+            results = evaluator.evaluate_many(["SAP-004", "SAP-009"], mode="quick", return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_evaluate_many_async(self, evaluator, mock_sap_artifacts):
+        """Test the async API matches the synchronous one."""
+        import asyncio
+
+        results = asyncio.run(evaluator.evaluate_many_async(["SAP-004", "SAP-009"], mode="quick"))
+
+        assert [r.is_installed for r in results] == [True, False]
+
+
 # ============================================================================
 # Strategic Analysis Tests
 # ============================================================================
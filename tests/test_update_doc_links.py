@@ -0,0 +1,131 @@
+"""
+Tests for update-doc-links.py
+
+Tests the compiled SAP-XXX rewriter (code fences, skipped lines, repeated
+and already-migrated references), that unchanged files are never written,
+and that a parallel run matches a sequential one.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent
+
+spec = importlib.util.spec_from_file_location("update_doc_links", REPO_ROOT / "scripts" / "update-doc-links.py")
+update_doc_links = importlib.util.module_from_spec(spec)
+sys.modules["update_doc_links"] = update_doc_links  # Worker processes unpickle by module name
+spec.loader.exec_module(update_doc_links)
+
+from update_doc_links import DocLinkUpdater, ReferenceRewriter
+
+ALIASES = {
+    "SAP-009": "chora.awareness.agent_awareness",
+    "SAP-015": "chora.awareness.task_tracking",
+}
+
+
+@pytest.fixture
+def alias_file(tmp_path):
+    path = tmp_path / "alias-mapping.json"
+    path.write_text(json.dumps({
+        "aliases": {sap_id: {"namespace": namespace} for sap_id, namespace in ALIASES.items()}
+    }), encoding="utf-8")
+    return path
+
+
+def make_updater(alias_file: Path, dry_run: bool = False) -> DocLinkUpdater:
+    updater = DocLinkUpdater(alias_file, dry_run=dry_run)
+    assert updater.load_aliases()
+    return updater
+
+
+class TestReferenceRewriter:
+    """Test which references are rewritten"""
+
+    def test_rewrites_outside_fences_and_skipped_lines(self):
+        content = "\n".join([
+            "See SAP-015 and SAP-009.",
+            "```bash",
+            "grep SAP-015",
+            "```",
+            "Path docs/SAP-015/README.md",
+            "# SAP-015 Assessment",
+            "Unknown SAP-123, not SAP-0150 or XSAP-015.",
+        ])
+        new_content, replacements = ReferenceRewriter(ALIASES).rewrite(content)
+
+        lines = new_content.split("\n")
+        assert lines[0] == ("See chora.awareness.task_tracking (SAP-015) and "
+                            "chora.awareness.agent_awareness (SAP-009).")
+        assert lines[1:] == content.split("\n")[1:]
+        assert replacements == [("See SAP-015 and SAP-009.", "SAP-015"), ("See SAP-015 and SAP-009.", "SAP-009")]
+
+    def test_repeated_reference_each_rewritten_once(self):
+        new_content, replacements = ReferenceRewriter(ALIASES).rewrite("SAP-015 then SAP-015\n")
+        assert new_content == "chora.awareness.task_tracking (SAP-015) then chora.awareness.task_tracking (SAP-015)\n"
+        assert len(replacements) == 2
+
+    def test_rewrite_is_idempotent(self):
+        rewriter = ReferenceRewriter(ALIASES)
+        once, _ = rewriter.rewrite("Use SAP-009 (see SAP-015).\n")
+        assert rewriter.rewrite(once) == (once, [])
+
+    def test_no_candidates(self):
+        content = "# Title\n\nNothing to see, SAP-123.\n"
+        assert not ReferenceRewriter(ALIASES).has_candidates(content)
+        assert ReferenceRewriter(ALIASES).rewrite(content) == (content, [])
+        assert ReferenceRewriter({}).rewrite("SAP-015\n") == ("SAP-015\n", [])
+
+
+class TestDocLinkUpdater:
+    """Test file updates"""
+
+    def test_only_changed_files_written(self, tmp_path, alias_file):
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        plain = docs / "plain.md"
+        plain.write_text("# Plain\n", encoding="utf-8")
+        linked = docs / "linked.md"
+        linked.write_text("Uses SAP-015.\n", encoding="utf-8")
+        os.chmod(linked, 0o640)
+        os.utime(plain, ns=(0, 0))
+
+        updater = make_updater(alias_file)
+        assert updater.update_directory(docs, jobs=1)
+
+        assert plain.stat().st_mtime_ns == 0
+        assert linked.read_text(encoding="utf-8") == "Uses chora.awareness.task_tracking (SAP-015).\n"
+        assert linked.stat().st_mode & 0o777 == 0o640
+        assert sorted(p.name for p in docs.iterdir()) == ["linked.md", "plain.md"]
+        assert updater.stats["updated_files"] == 1
+        assert updater.stats["skipped_files"] == 1
+
+        rerun = make_updater(alias_file)
+        rerun.update_directory(docs, jobs=1)
+        assert rerun.stats["updated_files"] == 0
+
+    def test_parallel_matches_sequential(self, tmp_path, alias_file, capsys):
+        trees = {}
+        for jobs in (1, 2):
+            docs = tmp_path / f"docs-{jobs}"
+            for i in range(12):
+                sub = docs / f"section-{i % 3}"
+                sub.mkdir(parents=True, exist_ok=True)
+                body = f"# Doc {i}\n\nSee SAP-015.\n" if i % 2 else f"# Doc {i}\n"
+                (sub / f"doc-{i}.md").write_text(body, encoding="utf-8")
+
+            updater = make_updater(alias_file, dry_run=jobs == 2)
+            capsys.readouterr()
+            assert updater.update_directory(docs, jobs=jobs)
+            trees[jobs] = (updater.stats, updater.changes, capsys.readouterr().out.replace(f"docs-{jobs}", "docs"))
+
+        sequential, parallel = trees[1], trees[2]
+        assert parallel[0] == sequential[0]
+        assert [c["line"] for c in parallel[1]] == [c["line"] for c in sequential[1]]
+        assert parallel[2].replace("[DRY-RUN]", "[UPDATED]").replace("DRY RUN", "EXECUTING") == sequential[2]
+        assert "See SAP-015." in (tmp_path / "docs-2" / "section-1" / "doc-1.md").read_text(encoding="utf-8")
@@ -0,0 +1,178 @@
+"""
+Tests for usage_rollup.py and get_usage_stats()
+
+Tests that rolled-up statistics match a full scan of the usage log, and
+that only lines appended since the last update are parsed.
+"""
+
+import json
+import math
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from fractions import Fraction
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import usage_tracker
+from usage_rollup import DURATION_LABELS, UsageRollup
+
+NOW = datetime(2025, 11, 20, 15, 30, 0)
+
+
+def make_events(count: int, seed: int) -> list:
+    rnd = random.Random(seed)
+    events = []
+    for _ in range(count):
+        timestamp = NOW - timedelta(seconds=rnd.uniform(-3600, 40 * 86400))
+        stamp = timestamp.isoformat()
+        if rnd.random() < 0.2:
+            stamp = timestamp.astimezone(timezone(timedelta(hours=rnd.choice([-9, 5])))).isoformat()
+        event = {
+            "timestamp": stamp,
+            "metadata": {"script": f"script-{rnd.randint(0, 4)}.py"},
+            "outcome": rnd.choice(["success", "failure"]),
+        }
+        if rnd.random() < 0.9:
+            event["duration_seconds"] = round(rnd.expovariate(0.2), 2)
+        events.append(event)
+    return events
+
+
+def append(log: Path, events: list) -> None:
+    with log.open("a", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def mean_half_up(values: list) -> int:
+    mean = Fraction(sum(values), len(values))
+    return math.floor(mean + Fraction(1, 2))
+
+
+def full_scan(log: Path, days: int, script_name=None) -> dict:
+    """Reference: read and filter every event (the previous get_usage_stats, with exact averages)"""
+    events = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines() if line.strip()]
+    cutoff = NOW.timestamp() - days * 86400
+    events = [e for e in events if datetime.fromisoformat(e["timestamp"]).timestamp() >= cutoff
+              and script_name in (None, e["metadata"]["script"])]
+    scripts = {}
+    for event in events:
+        stats = scripts.setdefault(event["metadata"]["script"], {"invocations": 0, "successes": 0, "durations": []})
+        stats["invocations"] += 1
+        stats["successes"] += event["outcome"] == "success"
+        if "duration_seconds" in event:
+            stats["durations"].append(round(event["duration_seconds"] * 100))
+    return {
+        "total": len(events),
+        "failures": sum(e["outcome"] == "failure" for e in events),
+        "scripts": {
+            script: (s["invocations"], s["successes"],
+                     mean_half_up(s["durations"]) / 100 if s["durations"] else 0.0)
+            for script, s in scripts.items()
+        },
+    }
+
+
+def summarize(stats: dict) -> dict:
+    return {
+        "total": stats["total_invocations"],
+        "failures": stats["failure_count"],
+        "scripts": {
+            script: (s["invocations"], s["successes"], s["avg_duration"])
+            for script, s in stats["scripts"].items()
+        },
+    }
+
+
+class TestRollupStats:
+    """Test that rolled-up windows match a full scan"""
+
+    def test_matches_full_scan_across_appends(self, tmp_path):
+        log = tmp_path / "script-usage.jsonl"
+        rollup_file = tmp_path / "rollup.json"
+
+        for seed in (1, 2):
+            append(log, make_events(2000, seed))
+            rollup = UsageRollup.load(log, rollup_file)
+            rollup.update()
+            rollup.save()
+
+            for days in (0, 1, 7, 30, 365):
+                for script_name in (None, "script-3.py"):
+                    stats = rollup.stats(days=days, script_name=script_name, now=NOW)
+                    assert summarize(stats) == full_scan(log, days, script_name), (seed, days, script_name)
+                    assert sum(day["invocations"] for day in stats["daily"].values()) == stats["total_invocations"]
+
+    def test_histogram_counts_events_with_durations(self, tmp_path):
+        log = tmp_path / "script-usage.jsonl"
+        append(log, [
+            {"timestamp": NOW.isoformat(), "metadata": {"script": "a.py"}, "outcome": "success", "duration_seconds": d}
+            for d in (0.0, 0.5, 0.5, 12.0, 900.0)
+        ])
+        rollup = UsageRollup(log)
+        rollup.update()
+
+        histogram = rollup.stats(days=1, now=NOW)["scripts"]["a.py"]["duration_histogram"]
+        assert list(histogram) == DURATION_LABELS
+        assert list(histogram.values()) == [1, 2, 0, 1, 0, 1]
+
+
+class TestIncrementalUpdate:
+    """Test which parts of the log an update reads"""
+
+    def test_only_new_complete_lines_parsed(self, tmp_path):
+        log = tmp_path / "script-usage.jsonl"
+        append(log, make_events(10, 1))
+        rollup = UsageRollup(log)
+        assert rollup.update() == 10
+        assert rollup.update() == 0
+
+        partial = json.dumps(make_events(1, 2)[0])
+        with log.open("a", encoding="utf-8") as f:
+            f.write(partial[:20])
+        assert rollup.update() == 0
+
+        with log.open("a", encoding="utf-8") as f:
+            f.write(partial[20:] + "\n")
+        assert rollup.update() == 1
+        assert rollup.stats(days=365, now=NOW)["total_invocations"] == 11
+
+    def test_replaced_log_rebuilt(self, tmp_path):
+        log = tmp_path / "script-usage.jsonl"
+        rollup_file = tmp_path / "rollup.json"
+        append(log, make_events(50, 1))
+        rollup = UsageRollup.load(log, rollup_file)
+        rollup.update()
+        rollup.save()
+
+        log.unlink()
+        append(log, make_events(60, 2))
+        rollup = UsageRollup.load(log, rollup_file)
+        assert rollup.update() == 60
+        assert summarize(rollup.stats(days=365, now=NOW)) == full_scan(log, 365)
+
+
+class TestUsageReport:
+    """Test get_usage_stats() and the report built on it"""
+
+    def test_report_uses_rollup(self, tmp_path, monkeypatch):
+        log = tmp_path / "script-usage.jsonl"
+        rollup_file = tmp_path / "cache" / "usage-rollup.json"
+        monkeypatch.setattr(usage_tracker, "USAGE_LOG_PATH", log)
+        monkeypatch.setattr(usage_tracker, "USAGE_ROLLUP_PATH", rollup_file)
+
+        assert usage_tracker.get_usage_stats()["total_invocations"] == 0
+
+        now = datetime.now()
+        append(log, [
+            {"timestamp": (now - timedelta(hours=1)).isoformat(), "metadata": {"script": "a.py"},
+             "outcome": "success", "duration_seconds": 0.04},
+            {"timestamp": (now - timedelta(days=60)).isoformat(), "metadata": {"script": "a.py"},
+             "outcome": "failure", "duration_seconds": 2.0},
+        ])
+        report = usage_tracker.generate_usage_report(days=30)
+        assert rollup_file.exists()
+        assert "Total Invocations: 1" in report
+        assert "Durations: <0.1s 1" in report
@@ -0,0 +1,162 @@
+"""
+Tests for validate-traceability.py
+
+Tests the shared filesystem snapshot (build_context) and the rules that
+read it instead of the disk.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+import yaml
+
+REPO_ROOT = Path(__file__).parent.parent
+SCRIPT = REPO_ROOT / "docs" / "skilled-awareness" / "lifecycle-traceability" / "scripts" / "validate-traceability.py"
+
+spec = importlib.util.spec_from_file_location("validate_traceability", SCRIPT)
+validate_traceability = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(validate_traceability)
+
+TraceabilityValidator = validate_traceability.TraceabilityValidator
+
+
+def write_doc(root: Path, path: str, frontmatter=None, raw: str = None) -> None:
+    doc = root / path
+    doc.parent.mkdir(parents=True, exist_ok=True)
+    if raw is None:
+        raw = f"---\n{yaml.safe_dump(frontmatter)}---\n# Doc\n" if frontmatter is not None else "# Doc\n"
+    doc.write_text(raw, encoding="utf-8")
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Manifest with linked, unlinked, null, malformed and missing documentation"""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("", encoding="utf-8")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_app.py").write_text("", encoding="utf-8")
+
+    write_doc(tmp_path, "docs/linked.md", {"code_references": ["src/app.py"]})
+    write_doc(tmp_path, "docs/unlinked.md", {"code_references": ["src/other.py"]})
+    write_doc(tmp_path, "docs/null.md", {"code_references": None})
+    write_doc(tmp_path, "docs/plain.md")
+    write_doc(tmp_path, "docs/broken.md", raw="---\nkey: [unclosed\n---\n")
+
+    manifest = {
+        "features": [
+            {
+                "id": "FEAT-001",
+                "vision_ref": "outcome-1",
+                "code": [{"path": "src/app.py"}, {"path": "/usr/lib/ext.so"}],
+                "tests": [
+                    {"path": "tests/test_app.py::test_a", "requirement": "REQ-1"},
+                    {"path": "manual", "type": "manual"},
+                ],
+                "requirements": [{"id": "REQ-1"}, {"id": "REQ-2"}],
+                "documentation": [{"path": p} for p in (
+                    "docs/linked.md", "docs/unlinked.md", "docs/null.md", "docs/plain.md", "docs/broken.md"
+                )],
+            },
+            {
+                "id": "FEAT-002",
+                "tests": [{"path": "tests/test_missing.py"}],
+                "documentation": [{"path": "docs/missing.md"}],
+            },
+        ]
+    }
+    manifest_path = tmp_path / "feature-manifest.yaml"
+    manifest_path.write_text(yaml.safe_dump(manifest), encoding="utf-8")
+    return tmp_path
+
+
+def make_validator(project: Path) -> TraceabilityValidator:
+    return TraceabilityValidator(str(project / "feature-manifest.yaml"), jobs=2)
+
+
+class TestBuildContext:
+    """Test the filesystem snapshot"""
+
+    def test_snapshot(self, project):
+        validator = make_validator(project)
+        ctx = validator.build_context(validator.manifest["features"])
+
+        assert ctx.existing_paths == {
+            "src/app.py", "tests/test_app.py",
+            "docs/linked.md", "docs/unlinked.md", "docs/null.md", "docs/plain.md", "docs/broken.md",
+        }
+        assert ctx.doc_code_refs == {
+            "docs/linked.md": ["src/app.py"],
+            "docs/unlinked.md": ["src/other.py"],
+            "docs/null.md": None,
+        }
+        assert set(ctx.doc_frontmatter) == set(ctx.doc_code_refs)
+        assert list(ctx.doc_errors) == ["docs/broken.md"]
+        assert ctx.code_to_docs["src/app.py"] == {
+            "docs/linked.md", "docs/unlinked.md", "docs/null.md", "docs/plain.md", "docs/broken.md"
+        }
+
+    def test_rules_do_not_touch_disk(self, project, monkeypatch):
+        validator = make_validator(project)
+        ctx = validator.build_context(validator.manifest["features"])
+
+        def no_disk(*args, **kwargs):
+            raise AssertionError("rule touched the filesystem")
+
+        monkeypatch.setattr(Path, "exists", no_disk)
+        monkeypatch.setattr("builtins.open", no_disk)
+        validator.rule_2_bidirectional_linkage(ctx)
+        validator.rule_7_reference_integrity(ctx)
+
+
+class TestRules:
+    """Test the rules that read the snapshot"""
+
+    def test_rule_2_bidirectional_linkage(self, project):
+        validator = make_validator(project)
+        result = validator.rule_2_bidirectional_linkage(validator.build_context(validator.manifest["features"]))
+
+        assert result.total_items == 3
+        assert result.passed_items == 1
+        assert result.failures == [
+            "docs/unlinked.md references src/other.py, but manifest doesn't list this linkage"
+        ]
+        assert result.warnings[0] == "Failed to parse frontmatter in docs/null.md: code_references is null"
+        assert result.warnings[1].startswith("Failed to parse frontmatter in docs/broken.md: ")
+        assert len(result.warnings) == 2
+
+    def test_rule_2_without_frontmatter(self, tmp_path):
+        write_doc(tmp_path, "docs/plain.md")
+        (tmp_path / "feature-manifest.yaml").write_text(yaml.safe_dump(
+            {"features": [{"id": "FEAT-001", "documentation": [{"path": "docs/plain.md"}]}]}
+        ), encoding="utf-8")
+        validator = make_validator(tmp_path)
+        result = validator.rule_2_bidirectional_linkage(validator.build_context(validator.manifest["features"]))
+
+        assert result.total_items == 0
+        assert result.warnings == ["No documentation with frontmatter found (Rule 2 not applicable)"]
+
+    def test_rule_7_reference_integrity(self, project):
+        validator = make_validator(project)
+        result = validator.rule_7_reference_integrity(validator.build_context(validator.manifest["features"]))
+
+        assert result.total_items == 11
+        assert result.passed_items == 9
+        assert result.failures == [
+            "FEAT-002: Test file not found: tests/test_missing.py",
+            "FEAT-002: Documentation file not found: docs/missing.md",
+        ]
+
+    def test_validate_all_runs_rules_in_order(self, project):
+        report = make_validator(project).validate_all()
+
+        assert [rule.rule_number for rule in report.rules] == list(range(1, 11))
+        assert report.rules[0].failures == ["FEAT-002: Missing vision_ref"]
+        assert report.rules[7].failures == ["FEAT-001/REQ-2: No test found"]
+
+    def test_feature_filter_limits_snapshot(self, project):
+        report = make_validator(project).validate_all(feature_filter="FEAT-002")
+
+        assert report.total_features == 1
+        assert report.rules[1].total_items == 0
+        assert report.rules[6].passed_items == 0
@@ -4,6 +4,9 @@
 Validates AGENTS.md and CLAUDE.md files against SAP-009 protocol requirements.
 Supports structural validation, content equivalence, and source artifact coverage.
 
+Files are parsed by utils.markdown_structure, so the frontmatter, section,
+workflow and line-count checks on one file share a single read.
+
 Usage:
     from utils.awareness_validation import AwarenessFileValidator
 
@@ -14,10 +17,17 @@
 """
 
 import re
-import yaml
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+from utils.markdown_structure import read_markdown
+
+# ## Section Name (but not ###), matched against the stripped heading line
+SECTION_RE = re.compile(r'^##\s+([^#].*)$')
+
+# ### Workflow N: Name
+WORKFLOW_RE = re.compile(r'^###\s+Workflow\s+\d+:\s+(.+)$')
+
 
 class AwarenessFileValidator:
     """Validate AGENTS.md and CLAUDE.md files against SAP-009 spec"""
@@ -36,29 +46,7 @@ def extract_yaml_frontmatter(self, file_path: Path) -> Optional[Dict[str, Any]]:
             return None
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Check for YAML frontmatter (--- at start and end)
-            if not content.startswith('---\n'):
-                return None
-
-            # Find the closing ---
-            end_marker = content.find('\n---\n', 4)
-            if end_marker == -1:
-                # Try alternative ending (--- at end of file)
-                end_marker = content.find('\n---', 4)
-                if end_marker == -1:
-                    return None
-
-            # Extract frontmatter
-            frontmatter_text = content[4:end_marker]
-
-            # Parse YAML
-            frontmatter = yaml.safe_load(frontmatter_text)
-
-            return frontmatter if isinstance(frontmatter, dict) else None
-
+            return read_markdown(file_path).frontmatter
         except Exception:
             return None
 
@@ -74,15 +62,15 @@ def extract_sections(self, file_path: Path) -> List[str]:
 
         sections = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    # Match ## Section Name (but not ###)
-                    match = re.match(r'^##\s+([^#].*)$', line.strip())
-                    if match:
-                        sections.append(match.group(1).strip())
+            headings = read_markdown(file_path).headings
         except Exception:
             return []
 
+        for heading in headings:
+            match = SECTION_RE.match(heading.text) if heading.level == 2 else None
+            if match:
+                sections.append(match.group(1).strip())
+
         return sections
 
     def extract_workflows(self, file_path: Path) -> List[str]:
@@ -97,15 +85,15 @@ def extract_workflows(self, file_path: Path) -> List[str]:
 
         workflows = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    # Match ### Workflow N: Name
-                    match = re.match(r'^###\s+Workflow\s+\d+:\s+(.+)$', line.strip())
-                    if match:
-                        workflows.append(match.group(1).strip())
+            headings = read_markdown(file_path).headings
         except Exception:
             return []
 
+        for heading in headings:
+            match = WORKFLOW_RE.match(heading.text) if heading.level == 3 else None
+            if match:
+                workflows.append(match.group(1).strip())
+
         return workflows
 
     def count_lines(self, file_path: Path) -> int:
@@ -114,8 +102,7 @@ def count_lines(self, file_path: Path) -> int:
             return 0
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return sum(1 for line in f if line.strip())
+            return read_markdown(file_path).nonblank_line_count
         except Exception:
             return 0
 
@@ -183,8 +170,7 @@ def check_source_artifact_mentioned(
             return False
 
         try:
-            with open(awareness_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = read_markdown(awareness_file).text
 
             # Check for source artifact filename
             artifact_name = source_artifact.name
@@ -20,15 +20,25 @@
     ... )
     >>> calculator.add_metric(metric)
     >>> print(calculator.generate_report())
+
+Session metrics are kept in a columnar MetricStore (typed arrays per field,
+dictionary-encoded task types) that maintains running aggregates as metrics
+are added, so reports cost the same for ten sessions or a million. With a
+JSONL log, every added metric is also appended to disk:
+
+    >>> calculator = ClaudeROICalculator.load_from_jsonl("metrics.jsonl", 100, append=True)
+    >>> calculator.add_metric(metric)  # appended to metrics.jsonl
 """
 
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
+from fractions import Fraction
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, TextIO
 import csv
 import json
-import statistics
 import sys
 
 
@@ -188,6 +198,200 @@ def tokens_remaining(self) -> int:
         return max(0, self.tokens_available - self.tokens_used)
 
 
+class _ExactSum:
+    """Exact running sum of ints and floats.
+
+    Floats are binary fractions, so the total is kept as an integer over a
+    power of two. Means come out exactly as statistics.mean() computes them
+    (an int for whole means of int data, otherwise the correctly rounded
+    float), at the cost of a few integer operations per value.
+    """
+
+    __slots__ = ("numerator", "shift", "integral")
+
+    def __init__(self) -> None:
+        self.numerator = 0
+        self.shift = 0          # Total is numerator / 2**shift
+        self.integral = True    # Every value so far was an int
+
+    def add(self, value: int | float) -> None:
+        if type(value) is int:
+            numerator, shift = value, 0
+        else:
+            self.integral = False
+            numerator, denominator = value.as_integer_ratio()
+            shift = denominator.bit_length() - 1
+            if denominator != 1 << shift:
+                raise TypeError(f"metric values must be int or float, not {type(value).__name__}")
+        if shift > self.shift:
+            self.numerator <<= shift - self.shift
+            self.shift = shift
+        self.numerator += numerator << (self.shift - shift)
+
+    @property
+    def total(self) -> int | Fraction:
+        if self.integral:
+            return self.numerator
+        return Fraction(self.numerator, 1 << self.shift)
+
+    def mean(self, count: int) -> int | float:
+        mean = Fraction(self.numerator, count << self.shift)
+        if self.integral and mean.denominator == 1:
+            return int(mean)
+        return float(mean)
+
+
+class _TaskAggregate:
+    """Running totals for one task type."""
+
+    __slots__ = ("count", "time_saved", "iterations", "coverage")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.time_saved = _ExactSum()
+        self.iterations = _ExactSum()
+        self.coverage = _ExactSum()
+
+
+class MetricStore(Sequence):
+    """Columnar store of ClaudeMetric sessions with running aggregates.
+
+    Numeric fields are kept in typed arrays (int64 / double), task types are
+    dictionary-encoded into an array of codes, and the totals reports need
+    (sums, exact sums behind means, first-pass and per-task counts) are
+    updated on every append. Reading an item rebuilds the ClaudeMetric.
+
+    A column falls back to a plain list if a value doesn't fit its array
+    type (e.g. fractional minutes), so every metric reads back unchanged.
+
+    Example:
+        >>> store = MetricStore()
+        >>> store.append(metric)
+        >>> store.time_saved_minutes.total, store.task_types
+        (120, ['feature_implementation'])
+        >>> store[0] == metric
+        True
+    """
+
+    # Field -> array typecode ("q" holds ints, "d" floats)
+    NUMERIC_FIELDS = {
+        "lines_generated": "q",
+        "time_saved_minutes": "q",
+        "iterations_required": "q",
+        "bugs_introduced": "q",
+        "bugs_fixed": "q",
+        "documentation_quality_score": "d",
+        "test_coverage": "d",
+    }
+    _TYPES = {"q": int, "d": float}
+
+    def __init__(self) -> None:
+        self.session_ids: list[str] = []
+        self.timestamps: list[datetime] = []
+        self.task_codes = array("l")
+        self.task_types: list[str] = []            # code -> task type
+        self._task_lookup: dict[str, int] = {}     # task type -> code
+        self.columns: dict[str, Any] = {
+            name: array(typecode) for name, typecode in self.NUMERIC_FIELDS.items()
+        }
+        self.metadata: list[dict[str, Any] | None] = []  # None for empty metadata
+
+        # Running aggregates
+        self.lines_generated = _ExactSum()
+        self.time_saved_minutes = _ExactSum()
+        self.iterations_required = _ExactSum()
+        self.bugs_introduced = _ExactSum()
+        self.documentation_quality = _ExactSum()
+        self.test_coverage = _ExactSum()
+        self.first_pass_count = 0
+        self.accelerations = _ExactSum()           # Over sessions with a duration
+        self.acceleration_count = 0
+        self.task_aggregates: list[_TaskAggregate] = []  # by task code
+
+    def __len__(self) -> int:
+        return len(self.session_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("metric index out of range")
+        values = {name: column[index] for name, column in self.columns.items()}
+        return ClaudeMetric(
+            session_id=self.session_ids[index],
+            timestamp=self.timestamps[index],
+            task_type=self.task_types[self.task_codes[index]],
+            metadata=self.metadata[index] or {},
+            **values,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (MetricStore, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MetricStore({len(self)} sessions, {len(self.task_types)} task types)"
+
+    def _append_value(self, name: str, value: Any) -> None:
+        column = self.columns[name]
+        if isinstance(column, array) and type(value) is not self._TYPES[column.typecode]:
+            column = self.columns[name] = list(column)
+        column.append(value)
+
+    def append(self, metric: "ClaudeMetric") -> None:
+        """Add a session and update the running aggregates."""
+        code = self._task_lookup.get(metric.task_type)
+        if code is None:
+            code = self._task_lookup[metric.task_type] = len(self.task_types)
+            self.task_types.append(metric.task_type)
+            self.task_aggregates.append(_TaskAggregate())
+
+        self.session_ids.append(metric.session_id)
+        self.timestamps.append(metric.timestamp)
+        self.task_codes.append(code)
+        for name in self.NUMERIC_FIELDS:
+            self._append_value(name, getattr(metric, name))
+        self.metadata.append(metric.metadata or None)
+
+        self.lines_generated.add(metric.lines_generated)
+        self.time_saved_minutes.add(metric.time_saved_minutes)
+        self.iterations_required.add(metric.iterations_required)
+        self.bugs_introduced.add(metric.bugs_introduced)
+        self.documentation_quality.add(metric.documentation_quality_score)
+        self.test_coverage.add(metric.test_coverage)
+        if metric.iterations_required == 1:
+            self.first_pass_count += 1
+
+        session_duration = metric.metadata.get("session_duration_minutes", 0)
+        if session_duration > 0:
+            manual_time = session_duration + metric.time_saved_minutes
+            self.accelerations.add(manual_time / session_duration)
+            self.acceleration_count += 1
+
+        task = self.task_aggregates[code]
+        task.count += 1
+        task.time_saved.add(metric.time_saved_minutes)
+        task.iterations.add(metric.iterations_required)
+        task.coverage.add(metric.test_coverage)
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """Serialized metrics (as ClaudeMetric.to_dict()), straight from the columns."""
+        columns = list(self.columns.items())
+        for index, session_id in enumerate(self.session_ids):
+            record = {
+                "session_id": session_id,
+                "timestamp": self.timestamps[index].isoformat(),
+                "task_type": self.task_types[self.task_codes[index]],
+            }
+            for name, column in columns:
+                record[name] = column[index]
+            record["metadata"] = self.metadata[index] or {}
+            yield record
+
+
 class ClaudeROICalculator:
     """Calculate return on investment for Claude usage.
 
@@ -205,16 +409,19 @@ class ClaudeROICalculator:
         >>> calculator.export_to_csv("metrics.csv")
     """
 
-    def __init__(self, developer_hourly_rate: float):
+    def __init__(self, developer_hourly_rate: float, log_path: str | Path | None = None):
         """Initialize ROI calculator.
 
         Args:
             developer_hourly_rate: Developer's hourly rate in dollars
+            log_path: Optional JSONL file every added metric is appended to
         """
         self.hourly_rate = developer_hourly_rate
-        self.metrics: list[ClaudeMetric] = []
+        self.metrics = MetricStore()
         self.sap_adoption_metrics: list[SAPAdoptionMetric] = []
         self.token_usage_metrics: list[TokenUsageMetric] = []
+        self.log_path = Path(log_path) if log_path is not None else None
+        self._log: TextIO | None = None
 
     def add_metric(self, metric: ClaudeMetric) -> None:
         """Add a metric to the calculator.
@@ -223,6 +430,18 @@ def add_metric(self, metric: ClaudeMetric) -> None:
             metric: ClaudeMetric to track
         """
         self.metrics.append(metric)
+        if self.log_path is not None:
+            if self._log is None:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._log = self.log_path.open("a", encoding="utf-8")
+            self._log.write(json.dumps(metric.to_dict()) + "\n")
+            self._log.flush()
+
+    def close(self) -> None:
+        """Close the JSONL log, if one is open."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
 
     def calculate_time_saved(self) -> dict[str, float]:
         """Calculate time and cost savings metrics.
@@ -237,8 +456,8 @@ def calculate_time_saved(self) -> dict[str, float]:
                 "average_acceleration": 0.0,
             }
 
-        total_time_saved = sum(m.time_saved_minutes for m in self.metrics)
-        hours_saved = total_time_saved / 60
+        store = self.metrics
+        hours_saved = float(store.time_saved_minutes.total / 60)
         cost_savings = hours_saved * self.hourly_rate
 
         # Calculate acceleration factor
@@ -247,16 +466,8 @@ def calculate_time_saved(self) -> dict[str, float]:
         # For simplicity, assume claude_time = time_saved / 2 (meaning 2x faster)
         # More accurate: track actual session duration
         average_acceleration = 2.0  # Default assumption
-        if self.metrics and "session_duration_minutes" in self.metrics[0].metadata:
-            accelerations = []
-            for m in self.metrics:
-                session_duration = m.metadata.get("session_duration_minutes", 0)
-                if session_duration > 0:
-                    manual_time = session_duration + m.time_saved_minutes
-                    acceleration = manual_time / session_duration
-                    accelerations.append(acceleration)
-            if accelerations:
-                average_acceleration = statistics.mean(accelerations)
+        if "session_duration_minutes" in (store.metadata[0] or {}) and store.acceleration_count:
+            average_acceleration = store.accelerations.mean(store.acceleration_count)
 
         return {
             "hours_saved": hours_saved,
@@ -279,26 +490,22 @@ def calculate_quality_metrics(self) -> dict[str, float]:
                 "first_pass_success_rate": 0.0,
             }
 
-        total_iterations = sum(m.iterations_required for m in self.metrics)
-        total_lines = sum(m.lines_generated for m in self.metrics)
-        total_bugs = sum(m.bugs_introduced for m in self.metrics)
+        store = self.metrics
+        count = len(store)
+        total_lines = store.lines_generated.total
+        total_bugs = store.bugs_introduced.total
 
         # Bug rate per 1000 lines
-        bug_rate = (total_bugs / total_lines * 1000) if total_lines > 0 else 0.0
+        bug_rate = float(total_bugs / total_lines * 1000) if total_lines > 0 else 0.0
 
         # First-pass success rate (1 iteration = success)
-        first_pass_successes = sum(1 for m in self.metrics if m.iterations_required == 1)
-        first_pass_rate = (
-            first_pass_successes / len(self.metrics) if self.metrics else 0.0
-        )
+        first_pass_rate = store.first_pass_count / count
 
         return {
-            "average_iterations": total_iterations / len(self.metrics),
+            "average_iterations": float(store.iterations_required.total / count),
             "bug_introduction_rate": bug_rate,
-            "documentation_quality": statistics.mean(
-                m.documentation_quality_score for m in self.metrics
-            ),
-            "test_coverage": statistics.mean(m.test_coverage for m in self.metrics),
+            "documentation_quality": store.documentation_quality.mean(count),
+            "test_coverage": store.test_coverage.mean(count),
             "first_pass_success_rate": first_pass_rate,
         }
 
@@ -308,22 +515,13 @@ def calculate_task_breakdown(self) -> dict[str, dict[str, Any]]:
         Returns:
             Dictionary mapping task_type to metrics for that type
         """
-        task_types: dict[str, list[ClaudeMetric]] = {}
-        for metric in self.metrics:
-            if metric.task_type not in task_types:
-                task_types[metric.task_type] = []
-            task_types[metric.task_type].append(metric)
-
         breakdown = {}
-        for task_type, metrics in task_types.items():
-            total_time_saved = sum(m.time_saved_minutes for m in metrics)
+        for task_type, task in zip(self.metrics.task_types, self.metrics.task_aggregates):
             breakdown[task_type] = {
-                "count": len(metrics),
-                "hours_saved": total_time_saved / 60,
-                "average_iterations": statistics.mean(
-                    m.iterations_required for m in metrics
-                ),
-                "average_coverage": statistics.mean(m.test_coverage for m in metrics),
+                "count": task.count,
+                "hours_saved": float(task.time_saved.total / 60),
+                "average_iterations": task.iterations.mean(task.count),
+                "average_coverage": task.coverage.mean(task.count),
             }
 
         return breakdown
@@ -409,7 +607,7 @@ def generate_executive_summary(self) -> str:
 Sessions: {len(self.metrics)}
 Time Saved: {time_metrics['hours_saved']:.1f} hours
 Acceleration: {time_metrics['average_acceleration']:.1f}x faster than manual
-Lines Generated: {sum(m.lines_generated for m in self.metrics):,}
+Lines Generated: {self.metrics.lines_generated.total:,}
 
 QUALITY METRICS
 ---------------
@@ -616,8 +814,7 @@ def export_to_csv(self, filepath: str | Path) -> None:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
 
-            for metric in self.metrics:
-                row = metric.to_dict()
+            for row in self.metrics.records():
                 # Remove metadata for CSV export
                 row.pop("metadata", None)
                 writer.writerow(row)
@@ -633,7 +830,7 @@ def export_to_json(self, filepath: str | Path) -> None:
         with filepath.open("w") as f:
             data = {
                 "hourly_rate": self.hourly_rate,
-                "metrics": [m.to_dict() for m in self.metrics],
+                "metrics": list(self.metrics.records()),
                 "summary": {
                     "time_saved": self.calculate_time_saved(),
                     "quality": self.calculate_quality_metrics(),
@@ -662,3 +859,42 @@ def load_from_json(cls, filepath: str | Path) -> "ClaudeROICalculator":
             calculator.add_metric(ClaudeMetric.from_dict(metric_data))
 
         return calculator
+
+    def export_to_jsonl(self, filepath: str | Path) -> None:
+        """Export metrics to a JSON Lines file (one metric per line).
+
+        Args:
+            filepath: Path to JSONL file to create/overwrite
+        """
+        filepath = Path(filepath)
+
+        with filepath.open("w", encoding="utf-8") as f:
+            for record in self.metrics.records():
+                f.write(json.dumps(record) + "\n")
+
+    @classmethod
+    def load_from_jsonl(
+        cls, filepath: str | Path, developer_hourly_rate: float, append: bool = False
+    ) -> "ClaudeROICalculator":
+        """Load calculator from a JSON Lines file, one metric at a time.
+
+        Args:
+            filepath: Path to JSONL file to load (missing file: no metrics)
+            developer_hourly_rate: Developer's hourly rate in dollars
+            append: Keep appending metrics added later to the same file
+
+        Returns:
+            ClaudeROICalculator with loaded metrics
+        """
+        filepath = Path(filepath)
+        calculator = cls(developer_hourly_rate=developer_hourly_rate)
+
+        if filepath.exists():
+            with filepath.open("r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        calculator.add_metric(ClaudeMetric.from_dict(json.loads(line)))
+
+        if append:
+            calculator.log_path = filepath
+        return calculator
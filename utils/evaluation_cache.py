@@ -0,0 +1,132 @@
+"""
+SAP Evaluation Result Cache
+
+Persists evaluation results keyed by a fingerprint of everything the
+evaluation read: the SAP directory, repo files the analyzers inspect, the
+catalog entry and the evaluator's own source. A rerun reuses the stored
+result for every SAP whose inputs are unchanged.
+
+Fingerprints are built from file paths, mtimes and sizes (not contents),
+so checking a SAP directory costs one stat per file.
+
+Usage:
+    from utils.evaluation_cache import EvaluationCache, fingerprint_paths
+
+    cache = EvaluationCache(repo_root / ".chora" / "cache" / "sap-evaluations.json")
+    fingerprint = fingerprint_paths(repo_root, ["docs/skilled-awareness/testing-framework", "AGENTS.md"])
+    data = cache.get("deep:SAP-004", fingerprint)   # dict or None
+    cache.put("deep:SAP-004", fingerprint, data)
+    cache.save()
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+CACHE_VERSION = 1
+
+# Default cache location, relative to the repository root
+CACHE_PATH = Path(".chora") / "cache" / "sap-evaluations.json"
+
+# Directories never fingerprinted (bytecode and tool caches change on every run)
+SKIP_DIRS = {"__pycache__", "node_modules"}
+
+
+def _stat_entries(root: Path, relative: str) -> list[str]:
+    """'path:mtime_ns:size' lines for a file, or every file under a directory."""
+    path = root / relative
+    try:
+        stat = path.stat()
+    except OSError:
+        return [f"{relative}:missing"]
+
+    if not path.is_dir():
+        return [f"{relative}:{stat.st_mtime_ns}:{stat.st_size}"]
+
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith("."))
+        for filename in sorted(filenames):
+            file_path = Path(dirpath) / filename
+            try:
+                file_stat = file_path.stat()
+            except OSError:
+                continue
+            rel = file_path.relative_to(root).as_posix()
+            entries.append(f"{rel}:{file_stat.st_mtime_ns}:{file_stat.st_size}")
+    return entries
+
+
+def fingerprint_paths(root: Path, paths: Iterable[str], extra: str = "") -> str:
+    """
+    Fingerprint files and directory trees (relative to root).
+
+    Args:
+        root: Base directory for relative paths
+        paths: Files or directories to include (missing paths are recorded as such)
+        extra: Additional text to mix in (e.g. serialized catalog metadata)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256(extra.encode("utf-8"))
+    for relative in paths:
+        for entry in _stat_entries(root, relative):
+            digest.update(entry.encode("utf-8"))
+            digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class EvaluationCache:
+    """Thread-safe key -> (fingerprint, result dict) store persisted as JSON"""
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._entries: Optional[dict[str, dict[str, Any]]] = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.cache_file, encoding="utf-8") as f:
+                    state = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                state = {}
+            if not isinstance(state, dict) or state.get("version") != CACHE_VERSION:
+                state = {}
+            self._entries = state.get("entries", {})
+        return self._entries
+
+    def get(self, key: str, fingerprint: str) -> Optional[dict[str, Any]]:
+        """Cached result for key if it was stored under the same fingerprint"""
+        with self._lock:
+            entry = self._load().get(key)
+        if entry and entry.get("fingerprint") == fingerprint:
+            return entry["result"]
+        return None
+
+    def put(self, key: str, fingerprint: str, result: dict[str, Any]) -> None:
+        """Store a result (persisted by save())"""
+        with self._lock:
+            self._load()[key] = {"fingerprint": fingerprint, "result": result}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write pending results atomically (best effort; read-only checkouts still work)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            state = {"version": CACHE_VERSION, "entries": self._entries}
+            tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(state, f, separators=(",", ":"), default=str)
+                os.replace(tmp_file, self.cache_file)
+                self._dirty = False
+            except OSError:
+                pass
@@ -0,0 +1,194 @@
+"""
+Markdown Structure Parser
+
+Reads a markdown file once and records everything the awareness tools
+need from it:
+
+- YAML frontmatter (text, parsed on demand)
+- every ATX heading line, with its level, title and line number
+- a heading tree of the document body (frontmatter and code fences skipped)
+- line counts and a character-based token estimate
+
+Parsed files are kept in a per-process cache keyed by path and checked
+against the file's mtime/size, so validators that each need a different
+view of the same AGENTS.md/CLAUDE.md share a single read.
+
+Usage:
+    from utils.markdown_structure import read_markdown
+
+    structure = read_markdown(Path("AGENTS.md"))
+    structure.frontmatter              # dict or None
+    [h.title for h in structure.headings if h.level == 2]
+    structure.outline                  # top-level Heading nodes with children
+    structure.line_count, structure.token_estimate
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+# Parsed files kept in the per-process cache
+MAX_CACHED_FILES = 1024
+
+# Rough approximation: 4 characters = 1 token
+CHARS_PER_TOKEN = 4
+
+# ATX heading, matched against the stripped line
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+
+# Opening/closing code fence
+FENCE_RE = re.compile(r'^(`{3,}|~{3,})')
+
+
+@dataclass
+class Heading:
+    """An ATX heading line"""
+    level: int
+    title: str
+    line: int           # 1-based line number
+    text: str           # The stripped heading line
+    fenced: bool        # Inside frontmatter or a code fence (not part of the outline)
+    children: List["Heading"] = field(default_factory=list)
+
+
+class MarkdownStructure:
+    """Structure of one markdown document, built in a single pass"""
+
+    def __init__(self, text: str, path: Optional[Path] = None):
+        self.path = path
+        self.text = text
+
+        lines = text.split('\n')
+        if lines[-1] == '':
+            lines.pop()
+        self.lines = lines                  # Without line endings
+        self.line_count = len(lines)
+        self.nonblank_line_count = 0
+
+        self.frontmatter_text, frontmatter_lines = self._find_frontmatter(lines)
+
+        self.headings: List[Heading] = []
+        self.outline: List[Heading] = []
+        open_headings: List[Heading] = []
+        fence: Optional[str] = None
+
+        for number, line in enumerate(lines, start=1):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            self.nonblank_line_count += 1
+
+            in_body = number > frontmatter_lines
+            fence_match = FENCE_RE.match(stripped) if in_body else None
+            if fence_match:
+                marker = fence_match.group(1)
+                if fence is None:
+                    fence = marker
+                    continue
+                if marker[0] == fence[0] and len(marker) >= len(fence) and stripped == marker:
+                    fence = None
+                    continue
+
+            if stripped[0] != '#':
+                continue
+            match = HEADING_RE.match(stripped)
+            if not match:
+                continue
+
+            heading = Heading(
+                level=len(match.group(1)),
+                title=match.group(2).strip(),
+                line=number,
+                text=stripped,
+                fenced=not in_body or fence is not None
+            )
+            self.headings.append(heading)
+
+            if not heading.fenced:
+                while open_headings and open_headings[-1].level >= heading.level:
+                    open_headings.pop()
+                (open_headings[-1].children if open_headings else self.outline).append(heading)
+                open_headings.append(heading)
+
+    @staticmethod
+    def _find_frontmatter(lines: List[str]) -> Tuple[Optional[str], int]:
+        """
+        Text between a leading '---' line and the next '---' line
+
+        The closing line may carry trailing whitespace.
+
+        Returns:
+            (frontmatter text or None, lines spanned including both markers)
+        """
+        if len(lines) < 2 or lines[0] != '---':
+            return None, 0
+        for number in range(1, len(lines)):
+            if lines[number].strip() == '---':
+                return '\n'.join(lines[1:number]), number + 1
+        return None, 0
+
+    @cached_property
+    def frontmatter(self) -> Optional[Dict[str, Any]]:
+        """Parsed YAML frontmatter (None if absent or not a mapping)
+
+        Raises:
+            yaml.YAMLError: The frontmatter is not valid YAML
+        """
+        if self.frontmatter_text is None:
+            return None
+        data = yaml.safe_load(self.frontmatter_text)
+        return data if isinstance(data, dict) else None
+
+    @property
+    def token_estimate(self) -> int:
+        """Estimated tokens (CHARS_PER_TOKEN characters per token)"""
+        return len(self.text) // CHARS_PER_TOKEN
+
+    def lines_with_endings(self) -> List[str]:
+        """Lines including their '\\n' (the last one only if the file has it)"""
+        lines = [line + '\n' for line in self.lines]
+        if lines and not self.text.endswith('\n'):
+            lines[-1] = lines[-1][:-1]
+        return lines
+
+
+_cache: "OrderedDict[Path, Tuple[int, int, MarkdownStructure]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def read_markdown(path: Path) -> MarkdownStructure:
+    """
+    Parse a markdown file, reusing the cached structure while it is unchanged.
+
+    Raises:
+        OSError: The file can't be read
+        UnicodeDecodeError: The file is not UTF-8
+    """
+    path = Path(path)
+    stat = path.stat()
+    key = path.resolve()
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _cache.move_to_end(key)
+            return cached[2]
+
+    structure = MarkdownStructure(path.read_text(encoding='utf-8'), path)
+    with _cache_lock:
+        _cache[key] = (stat.st_mtime_ns, stat.st_size, structure)
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHED_FILES:
+            _cache.popitem(last=False)
+    return structure
+
+
+def clear_cache() -> None:
+    """Forget every parsed file"""
+    with _cache_lock:
+        _cache.clear()
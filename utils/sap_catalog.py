@@ -0,0 +1,208 @@
+"""
+SAP Catalog Access Layer
+
+Loads sap-catalog.json once per process and serves lookups from hash
+indexes instead of scanning the `saps` array. Derived views (id, name,
+namespace, domain, dependency and reverse-dependency indexes) are built on
+first use and memoized on the catalog instance.
+
+Usage:
+    from utils.sap_catalog import load_sap_catalog
+
+    catalog = load_sap_catalog(repo_root / "sap-catalog.json")
+    catalog.get_sap("SAP-004")                  # SAP entry or None
+    catalog.by_domain["Developer Experience"]   # SAP entries in a domain
+    catalog.dependents_of("SAP-000")            # IDs of SAPs that depend on it
+    catalog.transitive_dependencies("SAP-015")  # dependencies first, cycle-safe
+
+The returned catalog is shared between callers loading the same file, so it
+must be treated as read-only; deepcopy it before editing.
+"""
+
+import json
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Legacy SAP-XXX -> chora.domain.capability mapping, relative to the catalog
+ALIAS_MAPPING_PATH = Path("capabilities") / "alias-mapping.json"
+
+# Loaded catalogs keyed by resolved path: ((mtime_ns, size), SAPCatalog)
+_catalog_cache: Dict[Path, Tuple[Tuple[int, int], "SAPCatalog"]] = {}
+
+
+class SAPCatalog(dict):
+    """sap-catalog.json contents (a plain dict) with memoized indexes"""
+
+    def __init__(self, data: Optional[dict] = None, path: Optional[Path] = None):
+        super().__init__(data or {})
+        self.path = path
+        self._transitive: Dict[str, List[str]] = {}
+        self._member_indexes: Dict[str, Dict[str, List[dict]]] = {}
+
+    @property
+    def saps(self) -> List[dict]:
+        """SAP entries in catalog order"""
+        saps = self.get("saps")
+        if isinstance(saps, list):
+            return [sap for sap in saps if isinstance(sap, dict)]
+        if isinstance(saps, dict):
+            return list(saps.values())
+        return []
+
+    @cached_property
+    def by_id(self) -> Dict[str, dict]:
+        """SAP ID -> entry (first entry wins, matching a linear scan)"""
+        if "saps" not in self:
+            # Legacy format: the catalog itself is a dict of SAPs
+            return {sap_id: sap for sap_id, sap in self.items() if isinstance(sap, dict)}
+        if isinstance(self["saps"], dict):
+            return dict(self["saps"])
+        index: Dict[str, dict] = {}
+        for sap in self.saps:
+            if "id" in sap:
+                index.setdefault(sap["id"], sap)
+        return index
+
+    @cached_property
+    def by_name(self) -> Dict[str, dict]:
+        """Short name (e.g. "sap-framework") -> entry"""
+        index: Dict[str, dict] = {}
+        for sap in self.by_id.values():
+            if sap.get("name"):
+                index.setdefault(sap["name"], sap)
+        return index
+
+    @cached_property
+    def by_namespace(self) -> Dict[str, dict]:
+        """Modern chora.domain.capability namespace -> entry (from alias-mapping.json)"""
+        index: Dict[str, dict] = {}
+        for sap_id, namespace in self.namespaces.items():
+            if sap_id in self.by_id:
+                index.setdefault(namespace, self.by_id[sap_id])
+        return index
+
+    @cached_property
+    def namespaces(self) -> Dict[str, str]:
+        """SAP ID -> modern namespace, when the capability registry maps it"""
+        if self.path is None:
+            return {}
+        alias_file = self.path.parent / ALIAS_MAPPING_PATH
+        try:
+            with open(alias_file, encoding="utf-8") as f:
+                aliases = json.load(f).get("aliases", {})
+        except (OSError, json.JSONDecodeError, AttributeError):
+            return {}
+        return {
+            sap_id: info["namespace"]
+            for sap_id, info in aliases.items()
+            if isinstance(info, dict) and info.get("namespace")
+        }
+
+    @cached_property
+    def by_domain(self) -> Dict[str, List[dict]]:
+        """Domain -> entries in catalog order"""
+        index: Dict[str, List[dict]] = {}
+        for sap in self.by_id.values():
+            index.setdefault(sap.get("domain", "Unknown"), []).append(sap)
+        return index
+
+    @cached_property
+    def dependents(self) -> Dict[str, List[str]]:
+        """SAP ID -> IDs of SAPs that list it as a dependency"""
+        index: Dict[str, List[str]] = {}
+        for sap_id in self.by_id:
+            for dep_id in self.dependencies_of(sap_id):
+                index.setdefault(dep_id, []).append(sap_id)
+        return index
+
+    def get_sap(self, sap_id: str) -> Optional[dict]:
+        """SAP entry by ID, or None"""
+        return self.by_id.get(sap_id)
+
+    def lookup(self, identifier: str) -> Optional[dict]:
+        """SAP entry by ID, short name or modern namespace"""
+        return self.by_id.get(identifier) or self.by_name.get(identifier) or self.by_namespace.get(identifier)
+
+    def dependencies_of(self, sap_id: str) -> List[str]:
+        """Direct dependency IDs declared by a SAP"""
+        sap = self.by_id.get(sap_id)
+        if not sap:
+            return []
+        return [dep for dep in sap.get("dependencies") or [] if isinstance(dep, str)]
+
+    def dependents_of(self, sap_id: str) -> List[str]:
+        """IDs of SAPs that directly depend on a SAP"""
+        return self.dependents.get(sap_id, [])
+
+    def transitive_dependencies(self, sap_id: str) -> List[str]:
+        """
+        All dependencies of a SAP, each listed after its own dependencies.
+
+        Unknown IDs are included (callers report them); cycles are broken at
+        the first repeated SAP. Results are memoized per SAP.
+        """
+        cached = self._transitive.get(sap_id)
+        if cached is not None:
+            return cached
+
+        order: List[str] = []
+        seen = {sap_id}
+
+        def visit(current: str):
+            for dep_id in self.dependencies_of(current):
+                if dep_id in seen:
+                    continue
+                seen.add(dep_id)
+                visit(dep_id)
+                order.append(dep_id)
+
+        visit(sap_id)
+        self._transitive[sap_id] = order
+        return order
+
+    def members_of(self, key: str, sap_id: str) -> List[dict]:
+        """Entries of a catalog-level list (e.g. "synergies") whose `saps` include sap_id"""
+        return list(self._members_index(key).get(sap_id, []))
+
+    def _members_index(self, key: str) -> Dict[str, List[dict]]:
+        indexes = self._member_indexes
+        if key not in indexes:
+            index: Dict[str, List[dict]] = {}
+            for item in self.get(key) or []:
+                if not isinstance(item, dict):
+                    continue
+                for member in dict.fromkeys(item.get("saps") or []):
+                    index.setdefault(member, []).append(item)
+            indexes[key] = index
+        return indexes[key]
+
+
+def load_sap_catalog(catalog_path: Path) -> SAPCatalog:
+    """
+    Load sap-catalog.json, reusing the parsed catalog while the file is unchanged.
+
+    Raises:
+        FileNotFoundError: catalog does not exist
+        json.JSONDecodeError: catalog is not valid JSON
+    """
+    key = Path(catalog_path).resolve()
+    stat = key.stat()
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _catalog_cache.get(key)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+
+    with open(key, encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        # Array-of-SAPs format
+        data = {"saps": data}
+    elif not isinstance(data, dict):
+        data = {}
+
+    catalog = SAPCatalog(data, path=key)
+    _catalog_cache[key] = (fingerprint, catalog)
+    return catalog
+
@@ -10,10 +10,16 @@
     evaluator = SAPEvaluator(repo_root=Path.cwd())
     result = evaluator.quick_check("SAP-004")
     print(result.current_level)
+
+    # Many SAPs at once: evaluated concurrently, unchanged SAPs served from cache
+    results = evaluator.evaluate_many(["SAP-004", "SAP-009"], mode="deep")
+    results = await evaluator.evaluate_many_async(["SAP-004", "SAP-009"])
 """
 
+import asyncio
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone, date
 from pathlib import Path
@@ -22,6 +28,16 @@
 
 # Import awareness file validator
 from utils.awareness_validation import AwarenessFileValidator
+from utils.evaluation_cache import CACHE_PATH, EvaluationCache, fingerprint_paths
+from utils.sap_catalog import load_sap_catalog
+
+# Default number of SAPs evaluated concurrently (checks are I/O and subprocess bound)
+DEFAULT_JOBS = 8
+
+# Evaluator source files; editing them invalidates cached results
+_ANALYZER_FINGERPRINT = fingerprint_paths(
+    Path(__file__).parent, ["sap_evaluation.py", "awareness_validation.py"]
+)
 
 
 @dataclass
@@ -156,8 +172,24 @@ class AdoptionRoadmap:
 class SAPEvaluator:
     """Core SAP evaluation engine"""
 
-    def __init__(self, repo_root: Path):
+    # Repo paths read by SAP-specific deep-dive analyzers (besides the SAP
+    # directory and root AGENTS.md); changes to them invalidate cached results
+    DEEP_DIVE_INPUTS = {
+        "SAP-004": ("src", "tests", "pytest.ini", "pyproject.toml", "setup.cfg"),
+        "SAP-009": ("tests/AGENTS.md",),
+        "SAP-013": ("utils/claude_metrics.py",),
+    }
+
+    def __init__(self, repo_root: Path, jobs: int = DEFAULT_JOBS, use_cache: bool = True):
+        """
+        Args:
+            repo_root: Repository to evaluate
+            jobs: Maximum SAPs evaluated concurrently by evaluate_many()
+            use_cache: Reuse deep-dive results for SAPs whose inputs are unchanged
+        """
         self.repo_root = repo_root
+        self.jobs = max(1, jobs)
+        self.cache = EvaluationCache(repo_root / CACHE_PATH) if use_cache else None
         self.catalog = self.load_catalog()
         self.awareness_validator = AwarenessFileValidator(repo_root)
 
@@ -168,18 +200,8 @@ def load_catalog(self) -> dict:
             print(f"Warning: sap-catalog.json not found at {catalog_path}", file=sys.stderr)
             return {}
 
-        with open(catalog_path, encoding='utf-8') as f:
-            data = json.load(f)
-            # Handle different catalog formats
-            if isinstance(data, list):
-                # Array of SAPs
-                return {sap["id"]: sap for sap in data}
-            elif isinstance(data, dict) and "saps" in data:
-                # Object with 'saps' array (current format)
-                return {sap["id"]: sap for sap in data["saps"]}
-            else:
-                # Assume it's already a dict of SAPs
-                return data
+        # Shared, indexed catalog (array, 'saps' and dict-of-SAPs formats)
+        return load_sap_catalog(catalog_path).by_id
 
     def get_sap_metadata(self, sap_id: str) -> Optional[dict]:
         """Get SAP metadata from catalog"""
@@ -304,11 +326,62 @@ def quick_check(self, sap_id: str) -> EvaluationResult:
 
     def quick_check_all(self) -> list[EvaluationResult]:
         """Run quick check on all SAPs in catalog"""
-        results = []
-        for sap_id in self.catalog.keys():
-            result = self.quick_check(sap_id)
-            results.append(result)
-        return results
+        return self.evaluate_many(self.catalog.keys(), mode="quick")
+
+    def evaluate(self, sap_id: str, mode: str = "deep") -> EvaluationResult:
+        """Evaluate one SAP: mode "quick" (quick_check) or "deep" (cached deep_dive)"""
+        if mode == "quick":
+            return self.quick_check(sap_id)
+        if mode == "deep":
+            return self._deep_dive_cached(sap_id)
+        raise ValueError(f"Unknown evaluation mode: {mode}")
+
+    def evaluate_many(self, sap_ids, mode: str = "deep", return_exceptions: bool = False) -> list:
+        """
+        Evaluate SAPs concurrently on a pool of up to self.jobs threads.
+
+        Returns:
+            Results in the order of sap_ids. With return_exceptions=True, a
+            SAP whose evaluation raised gets the exception in its slot
+            (like asyncio.gather) instead of aborting the batch.
+        """
+        if mode not in ("quick", "deep"):
+            raise ValueError(f"Unknown evaluation mode: {mode}")
+        sap_ids = list(sap_ids)
+
+        def run(sap_id: str):
+            try:
+                return self.evaluate(sap_id, mode)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        try:
+            workers = min(self.jobs, len(sap_ids))
+            if workers <= 1:
+                return [run(sap_id) for sap_id in sap_ids]
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(run, sap_ids))
+        finally:
+            if self.cache:
+                self.cache.save()
+
+    async def evaluate_many_async(self, sap_ids, mode: str = "deep", return_exceptions: bool = False) -> list:
+        """Async variant of evaluate_many() (at most self.jobs evaluations in flight)"""
+        if mode not in ("quick", "deep"):
+            raise ValueError(f"Unknown evaluation mode: {mode}")
+        semaphore = asyncio.Semaphore(self.jobs)
+
+        async def run(sap_id: str):
+            async with semaphore:
+                return await asyncio.to_thread(self.evaluate, sap_id, mode)
+
+        try:
+            return await asyncio.gather(*(run(sap_id) for sap_id in sap_ids), return_exceptions=return_exceptions)
+        finally:
+            if self.cache:
+                await asyncio.to_thread(self.cache.save)
 
     def read_file_safe(self, file_path: Path) -> Optional[str]:
         """Safely read file, return None if doesn't exist"""
@@ -561,6 +634,42 @@ def deep_dive(self, sap_id: str) -> EvaluationResult:
         """
         Level 2: Rule-based content analysis (5 minutes)
 
+        Returns the cached result when the SAP's inputs are unchanged since
+        the last evaluation (see deep_dive_fingerprint).
+        """
+        result = self._deep_dive_cached(sap_id)
+        if self.cache:
+            self.cache.save()
+        return result
+
+    def deep_dive_fingerprint(self, sap_id: str) -> str:
+        """Fingerprint of everything a deep dive of sap_id reads"""
+        sap = self.get_sap_metadata(sap_id) or {}
+        paths = [sap["location"]] if sap.get("location") else []
+        paths.extend(self.DEEP_DIVE_INPUTS.get(sap_id, ()))
+        paths.append("AGENTS.md")
+        extra = json.dumps(sap, sort_keys=True, default=str) + _ANALYZER_FINGERPRINT
+        return fingerprint_paths(self.repo_root, paths, extra)
+
+    def _deep_dive_cached(self, sap_id: str) -> EvaluationResult:
+        """Deep dive through the result cache (not saved until cache.save())"""
+        if self.cache is None:
+            return self._analyze_deep(sap_id)
+
+        key = f"deep:{sap_id}"
+        fingerprint = self.deep_dive_fingerprint(sap_id)
+        cached = self.cache.get(key, fingerprint)
+        if cached is not None:
+            return result_from_dict(cached)
+
+        result = self._analyze_deep(sap_id)
+        self.cache.put(key, fingerprint, result_to_dict(result))
+        return result
+
+    def _analyze_deep(self, sap_id: str) -> EvaluationResult:
+        """
+        Uncached deep dive
+
         Process:
         1. Run quick check first
         2. Analyze SAP-specific integration patterns
@@ -668,13 +777,13 @@ def strategic_analysis(self) -> AdoptionRoadmap:
 
         # 2. Deep dive on installed SAPs to get comprehensive gap analysis
         all_gaps = []
-        for result in installed_results:
-            if result.current_level < 3:  # Only analyze SAPs not yet at L3
-                try:
-                    deep_result = self.deep_dive(result.sap_id)
-                    all_gaps.extend(deep_result.gaps)
-                except Exception as e:
-                    print(f"Warning: Failed to deep dive {result.sap_id}: {e}", file=sys.stderr)
+        pending = [r.sap_id for r in installed_results if r.current_level < 3]  # Only analyze SAPs not yet at L3
+        deep_results = self.evaluate_many(pending, mode="deep", return_exceptions=True)
+        for sap_id, deep_result in zip(pending, deep_results):
+            if isinstance(deep_result, Exception):
+                print(f"Warning: Failed to deep dive {sap_id}: {deep_result}", file=sys.stderr)
+            else:
+                all_gaps.extend(deep_result.gaps)
 
         # 3. Calculate aggregate metrics
         level_distribution = {
@@ -909,6 +1018,25 @@ def calculate_next_quarter(self) -> str:
         return f"Q{next_q}-{next_year}"
 
 
+def result_to_dict(result: EvaluationResult) -> dict:
+    """Serialize an EvaluationResult to JSON-compatible data"""
+    data = asdict(result)
+    data["timestamp"] = result.timestamp.isoformat()
+    return data
+
+
+def result_from_dict(data: dict) -> EvaluationResult:
+    """Rebuild an EvaluationResult serialized by result_to_dict()"""
+    data = dict(data)
+    data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+    data["gaps"] = [
+        Gap(**dict(gap, actions=[Action(**action) for action in gap.get("actions", [])]))
+        for gap in data.get("gaps", [])
+    ]
+    data["recommended_actions"] = [Action(**action) for action in data.get("recommended_actions", [])]
+    return EvaluationResult(**data)
+
+
 def format_quick_results(results: list[EvaluationResult] | EvaluationResult) -> str:
     """Format quick check results for terminal output"""
     if isinstance(results, EvaluationResult):